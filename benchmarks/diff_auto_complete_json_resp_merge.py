@@ -0,0 +1,59 @@
+import copy
+
+from benchmarks.diff_use_pait.run import run_and_calculate_time
+from pait.plugin.auto_complete_json_resp import gen_merge_func
+
+ITEM_CNT: int = 300
+
+default_response_dict: dict = {
+    "code": 0,
+    "msg": "success",
+    "data": {
+        "uid": 0,
+        "user_name": "",
+        "music_list": [{"name": "", "url": "", "singer": "", "tag_list": [], "ext": {"duration": 0, "album": ""}}],
+        "image_list": [{}],
+    },
+}
+response_dict: dict = {
+    "code": 0,
+    "data": {
+        "uid": 100,
+        "music_list": [{"name": f"music{i}", "url": f"http://music{i}.com"} for i in range(ITEM_CNT)],
+        "image_list": [{"url": f"http://image{i}.com"} for i in range(ITEM_CNT)],
+    },
+}
+
+
+def _merge(source_dict: dict, target_dict: dict) -> None:
+    # The implementation before the merge plan is compiled
+    for key, value in source_dict.items():
+        if isinstance(value, dict) and key in target_dict:
+            _merge(value, target_dict[key])
+        elif value and isinstance(value, list) and key in target_dict:
+            raw_value = value.pop()
+            for item in target_dict[key]:
+                new_value = copy.deepcopy(raw_value)
+                _merge(new_value, item)
+                value.append(new_value)
+        else:
+            source_dict[key] = target_dict.get(key, value)
+
+
+def deepcopy_merge_demo() -> dict:
+    result_dict: dict = copy.deepcopy(default_response_dict)
+    _merge(result_dict, response_dict)
+    return result_dict
+
+
+merge_func = gen_merge_func(default_response_dict)
+
+
+def compiled_merge_demo() -> dict:
+    return merge_func(response_dict)
+
+
+if __name__ == "__main__":
+    assert deepcopy_merge_demo() == compiled_merge_demo()
+    print(f"deepcopy merge({ITEM_CNT} items) duration:", run_and_calculate_time(deepcopy_merge_demo))
+    print(f"compiled merge({ITEM_CNT} items) duration:", run_and_calculate_time(compiled_merge_demo))
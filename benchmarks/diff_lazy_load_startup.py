@@ -0,0 +1,76 @@
+import time
+from typing import Callable, List, Optional
+
+from pydantic import BaseModel, Field
+
+from pait import field
+from pait.app.flask import Pait
+from pait.g import pait_data
+from pait.model.response import JsonResponseModel
+from pait.plugin.auto_complete_json_resp import AutoCompleteJsonRespPlugin
+from pait.plugin.required import RequiredPlugin
+
+ROUTE_CNT_LIST: List[int] = [100, 500, 1000, 2000]
+
+
+class UserModel(BaseModel):
+    uid: int = Field(description="user id", example=10086)
+    user_name: str = Field(description="user name", example="so1n")
+    email: Optional[str] = Field(default=None, description="user email", example="so1n@example.com")
+
+
+class UserResponseModel(JsonResponseModel):
+    class ResponseModel(BaseModel):
+        code: int = Field(0)
+        msg: str = Field("")
+        data: UserModel
+
+    response_data = ResponseModel
+
+
+def gen_route(index: int, pait: Pait) -> Callable:
+    # The routes of the same func are distinguished by feature code
+    @pait(
+        feature_code=str(index),
+        response_model_list=[UserResponseModel],
+        plugin_list=[AutoCompleteJsonRespPlugin.build()],
+        post_plugin_list=[RequiredPlugin.build(required_dict={"email": ["user_name"]})],
+    )
+    def demo(
+        uid: int = field.Query.i(description="user id", gt=10, lt=1000, example=100),
+        user_name: str = field.Query.i(description="user name", min_length=2, max_length=4, example="so1n"),
+        email: Optional[str] = field.Query.i(default="example@xxx.com", description="user email"),
+        user_agent: str = field.Header.i(alias="User-Agent", description="user agent"),
+        body: UserModel = field.Body.i(),
+    ) -> dict:
+        return {}
+
+    return demo
+
+
+def declare_routes(route_cnt: int, lazy_load: bool) -> float:
+    pait: Pait = Pait(lazy_load=lazy_load)
+    s_t = time.perf_counter()
+    for index in range(route_cnt):
+        gen_route(index, pait)
+    return time.perf_counter() - s_t
+
+
+def warm_up() -> float:
+    s_t = time.perf_counter()
+    error_dict = pait_data.warm_up()
+    assert not error_dict, error_dict
+    return time.perf_counter() - s_t
+
+
+if __name__ == "__main__":
+    for route_cnt in ROUTE_CNT_LIST:
+        pait_data.pait_id_dict.clear()
+        eager_duration = declare_routes(route_cnt, lazy_load=False)
+        pait_data.pait_id_dict.clear()
+        lazy_duration = declare_routes(route_cnt, lazy_load=True)
+        warm_up_duration = warm_up()
+        print(
+            f"{route_cnt} routes, eager declare duration: {eager_duration:.4f}s,"
+            f" lazy declare duration: {lazy_duration:.4f}s, lazy warm up duration: {warm_up_duration:.4f}s"
+        )
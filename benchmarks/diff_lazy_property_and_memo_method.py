@@ -0,0 +1,77 @@
+import asyncio
+
+from benchmarks.diff_use_pait.run import run_and_calculate_time
+from pait.util import LazyProperty, MemoMethod
+
+ACCESS_CNT: int = 10
+
+
+class LazyPropertyRequest(object):
+    def __init__(self, query: dict) -> None:
+        self._query = query
+
+    @LazyProperty()
+    def query(self) -> dict:
+        return dict(self._query)
+
+    @LazyProperty()
+    async def body(self) -> dict:
+        return dict(self._query)
+
+
+class MemoMethodRequest(object):
+    __slots__ = ("_query", "_memo_cache")
+
+    def __init__(self, query: dict) -> None:
+        self._query = query
+
+    @MemoMethod
+    def query(self) -> dict:
+        return dict(self._query)
+
+    @MemoMethod
+    async def body(self) -> dict:
+        return dict(self._query)
+
+
+def first_access_demo(request_class: type) -> None:
+    request_class({"uid": "10086", "name": "John Doe"}).query()
+
+
+def hot_access_demo(request: object) -> None:
+    for _ in range(ACCESS_CNT):
+        request.query()  # type: ignore[attr-defined]
+
+
+async def async_hot_access_demo(request: object) -> None:
+    # The cost of running the event loop is much greater than the access, so access more times in one loop
+    for _ in range(ACCESS_CNT * 100):
+        await request.body()  # type: ignore[attr-defined]
+
+
+if __name__ == "__main__":
+    from functools import partial
+
+    loop = asyncio.new_event_loop()
+    lazy_property_request = LazyPropertyRequest({"uid": "10086", "name": "John Doe"})
+    memo_method_request = MemoMethodRequest({"uid": "10086", "name": "John Doe"})
+    # warm up, the following access will hit the cache
+    lazy_property_request.query()
+    memo_method_request.query()
+    loop.run_until_complete(lazy_property_request.body())
+    loop.run_until_complete(memo_method_request.body())
+
+    print(
+        "lazy property first access duration:", run_and_calculate_time(partial(first_access_demo, LazyPropertyRequest))
+    )
+    print("memo method first access duration:", run_and_calculate_time(partial(first_access_demo, MemoMethodRequest)))
+    print("lazy property hot access duration:", run_and_calculate_time(partial(hot_access_demo, lazy_property_request)))
+    print("memo method hot access duration:", run_and_calculate_time(partial(hot_access_demo, memo_method_request)))
+    print(
+        "async lazy property hot access duration:",
+        run_and_calculate_time(lambda: loop.run_until_complete(async_hot_access_demo(lazy_property_request))),
+    )
+    print(
+        "async memo method hot access duration:",
+        run_and_calculate_time(lambda: loop.run_until_complete(async_hot_access_demo(memo_method_request))),
+    )
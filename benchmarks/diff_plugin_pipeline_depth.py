@@ -0,0 +1,83 @@
+import asyncio
+import time
+from typing import Any, Callable, List
+
+from pait.app.base import BaseAppHelper
+from pait.model.context import PluginContext
+from pait.model.core import PaitCoreModel
+from pait.param_handle import ParamHandler
+from pait.plugin import PluginManager, PostPluginProtocol, fuse_plugin
+
+DEPTH_LIST: List[int] = list(range(11))
+CALL_CNT: int = 100000
+
+
+class HookPlugin(PostPluginProtocol):
+    """The plugin only declares hooks, it is fused with the other hook plugins"""
+
+    def before_call(self, context: PluginContext) -> None:
+        pass
+
+    def after_call(self, context: PluginContext, result: Any) -> Any:
+        return result
+
+
+class WrapPlugin(PostPluginProtocol):
+    """The plugin that does the same thing as `HookPlugin` by wrapping the next plugin"""
+
+    def _sync_call(self, context: PluginContext) -> Any:
+        return super().__call__(context)
+
+    async def _async_call(self, context: PluginContext) -> Any:
+        return await super().__call__(context)
+
+    def __call__(self, context: PluginContext) -> Any:
+        if self._is_async_func:
+            return self._async_call(context)
+        else:
+            return self._sync_call(context)
+
+
+def sync_demo(a: int) -> int:
+    return a
+
+
+async def async_demo(a: int) -> int:
+    return a
+
+
+def build_main_plugin(func: Callable, depth: int, is_fused: bool) -> Any:
+    core_model: PaitCoreModel = PaitCoreModel(func, BaseAppHelper, ParamHandler)
+    plugin_manager_list: List[PluginManager] = [(HookPlugin if is_fused else WrapPlugin).build() for _ in range(depth)]
+    return core_model, fuse_plugin(plugin_manager_list, func, core_model)
+
+
+def run_sync(depth: int, is_fused: bool) -> float:
+    core_model, main_plugin = build_main_plugin(sync_demo, depth, is_fused)
+    context: PluginContext = PluginContext(None, BaseAppHelper, core_model, [], {"a": 1})  # type: ignore[arg-type]
+    s_t = time.perf_counter()
+    for _ in range(CALL_CNT):
+        main_plugin(context)
+    return time.perf_counter() - s_t
+
+
+def run_async(depth: int, is_fused: bool) -> float:
+    core_model, main_plugin = build_main_plugin(async_demo, depth, is_fused)
+    context: PluginContext = PluginContext(None, BaseAppHelper, core_model, [], {"a": 1})  # type: ignore[arg-type]
+
+    async def _run() -> float:
+        s_t = time.perf_counter()
+        for _ in range(CALL_CNT):
+            await main_plugin(context)
+        return time.perf_counter() - s_t
+
+    return asyncio.run(_run())
+
+
+if __name__ == "__main__":
+    for depth in DEPTH_LIST:
+        print(
+            f"depth {depth:>2}, {CALL_CNT} calls,"
+            f" sync nested: {run_sync(depth, False):.4f}s, sync fused: {run_sync(depth, True):.4f}s,"
+            f" async nested: {run_async(depth, False):.4f}s, async fused: {run_async(depth, True):.4f}s"
+        )
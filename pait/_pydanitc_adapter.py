@@ -1,4 +1,7 @@
-from typing import Callable, Optional, Type, TypeVar, Union
+import threading
+import tracemalloc
+from functools import lru_cache
+from typing import Any, Callable, Dict, Hashable, List, Optional, Sequence, Tuple, Type, TypeVar, Union
 
 from any_api.util import pydantic_adapter as _any_api_pydantic_adapter
 from pydantic import BaseModel
@@ -9,6 +12,7 @@ __all__ = [
     "is_v1",
     "ConfigDict",
     "PaitModelField",
+    "PaitBatchModelField",
     "get_field_info",
     "get_extra_dict_by_field_info",
     "get_extra_by_field_info",
@@ -17,6 +21,9 @@ __all__ = [
     "model_fields",
     "model_validator",
     "model_json_schema",
+    "get_validate_func",
+    "ValidatorRegistry",
+    "validator_registry",
 ]
 
 _T = TypeVar("_T")
@@ -33,6 +40,70 @@ get_extra_dict_by_field_info = _any_api_pydantic_adapter.get_extra_dict_by_field
 get_extra_by_field_info = _any_api_pydantic_adapter.get_extra_by_field_info
 
 
+class ValidatorRegistry(object):
+    """Intern the compiled validator (ModelField of pydantic v1, TypeAdapter of pydantic v2) by the structural key,
+    so the fields with the same annotation and constraints share the same validator, regardless of which route
+    they belong to and their alias, description, example...
+
+    If tracemalloc is tracing, the memory allocated by creating the validator is counted in `memory_size`
+    """
+
+    def __init__(self) -> None:
+        self._validator_dict: Dict[Hashable, Any] = {}
+        self._lock: threading.Lock = threading.Lock()
+        self.hit_count: int = 0
+        self.miss_count: int = 0
+        self.memory_size: int = 0
+
+    def get(self, key: Optional[Hashable], factory: Callable[[], _T]) -> _T:
+        """Get the validator of the key, if not exist, create it by the factory.
+        If the key is None (e.g. the annotation is unhashable), the validator is created but not interned"""
+        with self._lock:
+            if key is not None:
+                try:
+                    validator = self._validator_dict[key]
+                except KeyError:
+                    pass
+                else:
+                    self.hit_count += 1
+                    return validator
+
+            self.miss_count += 1
+            if tracemalloc.is_tracing():
+                start_size: int = tracemalloc.get_traced_memory()[0]
+                validator = factory()
+                self.memory_size += max(tracemalloc.get_traced_memory()[0] - start_size, 0)
+            else:
+                validator = factory()
+            if key is not None:
+                self._validator_dict[key] = validator
+            return validator
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "size": len(self._validator_dict),
+            "hit_count": self.hit_count,
+            "miss_count": self.miss_count,
+            "memory_size": self.memory_size,
+        }
+
+    def clear(self) -> None:
+        with self._lock:
+            self._validator_dict.clear()
+            self.hit_count = self.miss_count = self.memory_size = 0
+
+
+validator_registry: ValidatorRegistry = ValidatorRegistry()
+
+
+def _hashable_key(key: Tuple[Any, ...]) -> Optional[Tuple[Any, ...]]:
+    try:
+        hash(key)
+    except TypeError:
+        return None
+    return key
+
+
 if _any_api_pydantic_adapter.is_v1:
     from pydantic import BaseConfig
     from pydantic.error_wrappers import ValidationError
@@ -41,6 +112,8 @@ if _any_api_pydantic_adapter.is_v1:
     from pydantic.schema import get_annotation_from_field_info
 
     PydanticUndefinedType = type(PydanticUndefined)
+    # The attributes of FieldInfo that affect the validation
+    _validate_attr_tuple: Tuple[str, ...] = tuple(FieldInfo.__field_constraints__) + ("const", "discriminator")
 
     class PaitModelField(object):
         def __init__(
@@ -56,18 +129,22 @@ if _any_api_pydantic_adapter.is_v1:
             self.field_info = field_info
             self.request_param = request_param
             self.base_model = base_model
-            self._model_field = ModelField(
-                name=value_name,
-                type_=get_annotation_from_field_info(annotation, field_info, value_name),
-                model_config=BaseConfig,
-                field_info=field_info,
-                class_validators={},
-                # Since the corresponding value has already been processed, there is no need to process it again
-                # default: Any = None,
-                # default_factory: Optional[NoArgAnyCallable] = None,
-                # required: 'BoolUndefined' = Undefined,
-                # final: bool = False,
-                # alias: Optional[str] = None,
+            # The loc of the error is specified at validation, so the ModelField can be shared by the same key
+            self._model_field: ModelField = validator_registry.get(
+                _gen_field_key(annotation, field_info),
+                lambda: ModelField(
+                    name=value_name,
+                    type_=get_annotation_from_field_info(annotation, field_info, value_name),
+                    model_config=BaseConfig,
+                    field_info=field_info,
+                    class_validators={},
+                    # Since the corresponding value has already been processed, there is no need to process it again
+                    # default: Any = None,
+                    # default_factory: Optional[NoArgAnyCallable] = None,
+                    # required: 'BoolUndefined' = Undefined,
+                    # final: bool = False,
+                    # alias: Optional[str] = None,
+                ),
             )
 
         def validate(self, value: _T) -> _T:
@@ -76,12 +153,31 @@ if _any_api_pydantic_adapter.is_v1:
                 raise ValidationError([e], self.base_model)
             return ok_value
 
-    def get_field_extra(field: FieldInfo) -> Union[Callable, dict]:
-        return field.extra
+    class PaitBatchModelField(object):
+        """Validate the values of multiple PaitModelField at once, and the errors will be thrown together"""
+
+        def __init__(
+            self, pait_model_field_list: List[PaitModelField], base_model: Type[BaseModel] = BaseModel
+        ) -> None:
+            self.pait_model_field_list = pait_model_field_list
+            self.base_model = base_model
+
+        def validate(self, value_tuple: Sequence[Any]) -> Tuple[Any, ...]:
+            ok_value_list: List[Any] = []
+            error_list: List[Any] = []
+            for pait_model_field, value in zip(self.pait_model_field_list, value_tuple):
+                ok_value, e = pait_model_field._model_field.validate(
+                    value, {}, loc=(pait_model_field.request_param, pait_model_field.value_name)
+                )
+                if e:
+                    error_list.append(e)
+                ok_value_list.append(ok_value)
+            if error_list:
+                raise ValidationError(error_list, self.base_model)
+            return tuple(ok_value_list)
 
 else:
-    from functools import lru_cache
-    from typing import Any, Dict, List, Sequence, Tuple, Union
+    from typing import Any, Dict, List, Sequence, Tuple
 
     from pydantic import BaseModel, ValidationError, TypeAdapter as PyTypeAdapter
     from pydantic.fields import FieldInfo, PydanticUndefined
@@ -92,30 +188,14 @@ else:
     class ErrorWrapper(Exception):
         pass
 
-    def _normalize_errors(errors: Sequence[Any]) -> List[Dict[str, Any]]:
-        use_errors: List[Any] = []
-        for error in errors:
-            if isinstance(error, ErrorWrapper):
-                new_errors = ValidationError.from_exception_data(title="", line_errors=[error]).errors()
-                use_errors.extend(new_errors)
-            elif isinstance(error, list):
-                use_errors.extend(_normalize_errors(error))
-            else:
-                use_errors.append(error)
-        return use_errors
-
-    def _regenerate_error_with_loc(
-        *, errors: Sequence[Any], loc_prefix: Tuple[Union[str, int], ...]
-    ) -> List[Dict[str, Any]]:
-        updated_loc_errors: List[Any] = [
-            {**err, "loc": loc_prefix + err.get("loc", ())} for err in _normalize_errors(errors)
-        ]
-
-        return updated_loc_errors
+    # The attributes of FieldInfo that affect the validation, the constraints of the field are stored in the metadata
+    _validate_attr_tuple = ("discriminator", "union_mode")  # type: ignore[assignment]
 
-    @lru_cache
-    def TypeAdapter(annotation: T, info: FieldInfo) -> PyTypeAdapter:
-        return pydantic.TypeAdapter(Annotated[annotation, FieldInfo])
+    def TypeAdapter(annotation: Any, info: FieldInfo) -> PyTypeAdapter:
+        """Get the TypeAdapter of the field, the fields with the same key share the same TypeAdapter"""
+        return validator_registry.get(
+            _gen_field_key(annotation, info), lambda: PyTypeAdapter(Annotated[annotation, info])  # type: ignore
+        )
 
     class PaitModelField(object):  # type: ignore[no-redef]
         def __init__(
@@ -145,9 +225,114 @@ else:
                     ),
                 )
 
+    class PaitBatchModelField(object):  # type: ignore[no-redef]
+        """Validate the values of multiple PaitModelField through a TypeAdapter,
+        so that only one call is needed to pydantic-core
+        """
+
+        def __init__(
+            self, pait_model_field_list: List[PaitModelField], base_model: Type[BaseModel] = BaseModel
+        ) -> None:
+            self.pait_model_field_list = pait_model_field_list
+            self.base_model = base_model
+            self._loc_prefix_list: List[Tuple[str, str]] = [
+                (i.request_param, i.value_name) for i in pait_model_field_list
+            ]
+            self._type_adapter: PyTypeAdapter[Any] = validator_registry.get(
+                _gen_batch_field_key(pait_model_field_list),
+                lambda: PyTypeAdapter(
+                    Tuple[tuple(Annotated[i.annotation, i.field_info] for i in pait_model_field_list)]  # type: ignore
+                ),
+            )
+
+        def validate(self, value_tuple: Sequence[Any]) -> Tuple[Any, ...]:
+            try:
+                return self._type_adapter.validate_python(value_tuple, from_attributes=True)
+            except ValidationError as exc:
+                line_errors: List[Dict[str, Any]] = []
+                # The first element of loc is the index of the value, it should be replaced with the loc of the field
+                for error in _normalize_errors(exc.errors()):
+                    index, *loc = error["loc"]
+                    line_errors.append({**error, "loc": self._loc_prefix_list[index] + tuple(loc)})
+                raise exc.from_exception_data(
+                    title=f"{self._loc_prefix_list[0][0]} Validation Error", line_errors=line_errors  # type: ignore
+                )
+
+
+def _gen_field_key(annotation: Any, field_info: FieldInfo) -> Optional[Tuple[Any, ...]]:
+    """Generate the structural key of the field's validator, only the attributes that affect the validation are used"""
+    return _hashable_key(
+        (
+            annotation,
+            tuple(getattr(field_info, attr, None) for attr in _validate_attr_tuple),
+            # The constraints of the field are stored in the metadata (pydantic v2)
+            tuple(getattr(field_info, "metadata", ())),
+            # The value must be equal to the default value if const is True (pydantic v1)
+            field_info.default if getattr(field_info, "const", None) else None,
+        )
+    )
+
+
+def _gen_batch_field_key(pait_model_field_list: List[PaitModelField]) -> Optional[Tuple[Any, ...]]:
+    key_list: List[Optional[Tuple[Any, ...]]] = [
+        _gen_field_key(i.annotation, i.field_info) for i in pait_model_field_list
+    ]
+    return None if None in key_list else ("batch", tuple(key_list))
+
+
+# The helper funcs that depend on the pydantic version
+if _any_api_pydantic_adapter.is_v1:
+
+    def get_field_extra(field: FieldInfo) -> Union[Callable, dict]:
+        return field.extra
+
+    @lru_cache(maxsize=None)
+    def get_validate_func(annotation: Any) -> Callable[[Any], Any]:
+        """Get the func that validates the value by the annotation, the ModelField is only created once"""
+        model_field = ModelField(
+            name="__root__", type_=annotation, model_config=BaseConfig, class_validators={}  # type: ignore
+        )
+        base_model = annotation if isinstance(annotation, type) and issubclass(annotation, BaseModel) else BaseModel
+
+        def _validate(value: Any) -> Any:
+            ok_value, e = model_field.validate(value, {}, loc=())
+            if e:
+                raise ValidationError([e], base_model)
+            return ok_value
+
+        return _validate
+
+else:
+
+    def _normalize_errors(errors: Sequence[Any]) -> List[Dict[str, Any]]:
+        use_errors: List[Any] = []
+        for error in errors:
+            if isinstance(error, ErrorWrapper):
+                new_errors = ValidationError.from_exception_data(title="", line_errors=[error]).errors()
+                use_errors.extend(new_errors)
+            elif isinstance(error, list):
+                use_errors.extend(_normalize_errors(error))
+            else:
+                use_errors.append(error)
+        return use_errors
+
+    def _regenerate_error_with_loc(
+        *, errors: Sequence[Any], loc_prefix: Tuple[Union[str, int], ...]
+    ) -> List[Dict[str, Any]]:
+        updated_loc_errors: List[Any] = [
+            {**err, "loc": loc_prefix + err.get("loc", ())} for err in _normalize_errors(errors)
+        ]
+
+        return updated_loc_errors
+
     def get_field_extra(field: FieldInfo) -> Union[Callable, dict]:
         return field.json_schema_extra or {}
 
+    @lru_cache(maxsize=None)
+    def get_validate_func(annotation: Any) -> Callable[[Any], Any]:
+        """Get the func that validates the value by the annotation, the TypeAdapter is only created once"""
+        return PyTypeAdapter(annotation).validate_python
+
 
 def get_field_extra_dict(field: FieldInfo, json_schema_extra_dict: Optional[dict] = None) -> dict:
     json_schema_extra = get_field_extra(field)
@@ -15,6 +15,7 @@ from pait.model.tag import Tag
 from pait.plugin.base import PluginManager, PostPluginProtocol, PrePluginProtocol
 
 if TYPE_CHECKING:
+    from pait.app.base.app_depend import AppDependContainer
     from pait.param_handle import BaseParamHandler
 
 
@@ -135,6 +136,10 @@ def pait(
     )
 
 
+def register_app_depend(app: Any, *warm_up_depend_list: Callable) -> "AppDependContainer":
+    return base_call_func("register_app_depend", app, *warm_up_depend_list, app=app)
+
+
 def set_app_attribute(app: Any, key: str, value: Any) -> None:
     base_call_func("set_app_attribute", app, key, value, app=app)
 
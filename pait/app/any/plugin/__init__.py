@@ -2,6 +2,8 @@ from pait.plugin.at_most_one_of import AtMostOneOfExtraParam, AtMostOneOfPlugin
 from pait.plugin.required import RequiredExtraParam, RequiredGroupExtraParam, RequiredPlugin
 
 from .check_json_resp import CheckJsonRespPlugin
+from .compress_response import CompressResponsePlugin
+from .conditional_get import CacheControl, ConditionalGetPlugin
 from .mock_response import MockPlugin
 from .unified_response import UnifiedResponsePlugin
 
@@ -12,6 +14,9 @@ __all__ = [
     "AtMostOneOfPlugin",
     "AtMostOneOfExtraParam",
     "CheckJsonRespPlugin",
+    "CompressResponsePlugin",
+    "CacheControl",
+    "ConditionalGetPlugin",
     "MockPlugin",
     "UnifiedResponsePlugin",
 ]
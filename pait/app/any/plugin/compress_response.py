@@ -0,0 +1,11 @@
+from importlib import import_module
+
+from pait.app.auto_load_app import auto_load_app_class
+from pait.plugin.compress_response import CompressResponsePlugin as _CompressResponsePlugin
+
+__all__ = ["CompressResponsePlugin"]
+
+pait_app_path: str = "pait.app." + auto_load_app_class().__name__.lower()
+CompressResponsePlugin: "_CompressResponsePlugin" = getattr(
+    import_module(pait_app_path + ".plugin.compress_response"), "CompressResponsePlugin"
+)
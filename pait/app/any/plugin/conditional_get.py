@@ -0,0 +1,12 @@
+from importlib import import_module
+
+from pait.app.auto_load_app import auto_load_app_class
+from pait.plugin.conditional_get import CacheControl
+from pait.plugin.conditional_get import ConditionalGetPlugin as _ConditionalGetPlugin
+
+__all__ = ["ConditionalGetPlugin", "CacheControl"]
+
+pait_app_path: str = "pait.app." + auto_load_app_class().__name__.lower()
+ConditionalGetPlugin: "_ConditionalGetPlugin" = getattr(
+    import_module(pait_app_path + ".plugin.conditional_get"), "ConditionalGetPlugin"
+)
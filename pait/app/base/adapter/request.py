@@ -4,6 +4,8 @@ RequestT = TypeVar("RequestT")
 
 
 class BaseRequestExtend(Generic[RequestT]):
+    __slots__ = ("request",)
+
     def __init__(self, request: RequestT) -> None:
         self.request: RequestT = request
 
@@ -24,6 +26,8 @@ RequestExtendT = TypeVar("RequestExtendT", bound=BaseRequestExtend)
 
 
 class BaseRequest(Generic[RequestT, RequestExtendT]):
+    # The subclass also needs to declare `__slots__`, otherwise the instance will still have `__dict__`
+    __slots__ = ("request", "args", "kwargs", "request_kwargs", "_memo_cache")
     # The class that defines the request object corresponding to the framework (consistent with Request T)
     RequestType: RequestT = type(None)  # type: ignore
     FormType = type(None)  # The class that defines the form object corresponding to the framework
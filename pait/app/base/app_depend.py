@@ -0,0 +1,227 @@
+import asyncio
+import inspect
+import threading
+from contextlib import AbstractAsyncContextManager, AbstractContextManager
+from dataclasses import MISSING
+from functools import partial
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Dict, List, Union
+
+from pait import field
+from pait.types import CallType
+from pait.util import get_func_sig, get_pait_handler
+
+if TYPE_CHECKING:
+    from pait.app.base.app_helper import BaseAppHelper
+
+__all__ = ["APP_DEPEND_KEY", "AppDependContainer", "get_app_depend_container"]
+
+APP_DEPEND_KEY: str = "_pait_app_depend_container"
+ContextManagerListType = List[Union[AbstractAsyncContextManager, AbstractContextManager]]
+_container_lock = threading.Lock()
+
+
+class AppDependContainer(object):
+    """Save the result of the app scope depends, each depend is only resolved once in the life of the app.
+
+    The app scope depend and its sub depends can not use the request param, they are checked at pre-load.
+    If the result of the depend (or its sub depends) is a context manager, it will be exited when the app is shutdown.
+    """
+
+    def __init__(self) -> None:
+        self.value_dict: Dict[CallType, Any] = {}
+        self.contextmanager_list: ContextManagerListType = []
+        self._lock = threading.RLock()
+        self._future_dict: Dict[CallType, asyncio.Future] = {}
+
+    def resolve(self, func: CallType, resolve_func: Callable[[ContextManagerListType], Any]) -> Any:
+        """Get the value of the depend, if it is not resolved, resolve it by resolve_func
+
+        :param func: depend callable
+        :param resolve_func: The func that resolve the depend, the context manager should be registered in the list
+        """
+        value = self.value_dict.get(func, MISSING)
+        if value is not MISSING:
+            return value
+        with self._lock:
+            value = self.value_dict.get(func, MISSING)
+            if value is MISSING:
+                value = resolve_func(self.contextmanager_list)
+                self.value_dict[func] = value
+            return value
+
+    async def async_resolve(
+        self, func: CallType, resolve_func: Callable[[ContextManagerListType], Awaitable[Any]]
+    ) -> Any:
+        value = self.value_dict.get(func, MISSING)
+        if value is not MISSING:
+            return value
+        future = self._future_dict.get(func)
+        if future is not None:
+            # The depend is being resolved by other request
+            return await future
+        future = asyncio.get_event_loop().create_future()
+        self._future_dict[func] = future
+        try:
+            value = await resolve_func(self.contextmanager_list)
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            future.exception()
+            raise
+        finally:
+            self._future_dict.pop(func, None)
+        self.value_dict[func] = value
+        future.set_result(value)
+        return value
+
+    @staticmethod
+    def _get_class_param_list(func: CallType) -> List[inspect.Parameter]:
+        # Avoid circular import, the param handler depends on this module
+        from pait.param_handle.util import get_parameter_list_from_class
+
+        return get_parameter_list_from_class(func)  # type: ignore[arg-type]
+
+    @staticmethod
+    def _get_depends_dict(func: CallType, param_list: List[inspect.Parameter]) -> Dict[str, field.Depends]:
+        """Get the Depends of the depend param, the depend that is warmed up can not use the request param"""
+        depends_dict: Dict[str, field.Depends] = {}
+        for parameter in param_list:
+            if parameter.name == "self":
+                continue
+            if isinstance(parameter.default, field.Depends):
+                depends_dict[parameter.name] = parameter.default
+            elif isinstance(parameter.default, field.BaseField) or parameter.default is parameter.empty:
+                raise RuntimeError(
+                    f"The app scope depend:{func} can not use the param:{parameter.name} obtained from the request"
+                )
+        return depends_dict
+
+    @classmethod
+    def check_depend(cls, func: CallType) -> None:
+        """Check that the app scope depend and its sub depends do not use the request param"""
+        param_list = get_func_sig(func).param_list
+        if inspect.isclass(func):
+            param_list = cls._get_class_param_list(func) + param_list
+        for depends in cls._get_depends_dict(func, param_list).values():
+            cls.check_depend(depends.func)
+
+    def _get_depend_pait_handler(self, func: CallType, class_value_dict: Dict[str, Any]) -> Callable:
+        if inspect.isclass(func):
+            instance = func()
+            instance.__dict__.update(class_value_dict)
+            return get_pait_handler(instance)
+        return get_pait_handler(func)
+
+    def _warm_up_depends_dict(
+        self, depends_dict: Dict[str, field.Depends], contextmanager_list: ContextManagerListType
+    ) -> Dict[str, Any]:
+        value_dict: Dict[str, Any] = {}
+        for key, depends in depends_dict.items():
+            if depends.scope == "app":
+                value_dict[key] = self.get(depends.func)
+            else:
+                value_dict[key] = self._warm_up(depends.func, contextmanager_list)
+        return value_dict
+
+    async def _async_warm_up_depends_dict(
+        self, depends_dict: Dict[str, field.Depends], contextmanager_list: ContextManagerListType
+    ) -> Dict[str, Any]:
+        value_dict: Dict[str, Any] = {}
+        for key, depends in depends_dict.items():
+            if depends.scope == "app":
+                value_dict[key] = await self.async_get(depends.func)
+            else:
+                value_dict[key] = await self._async_warm_up(depends.func, contextmanager_list)
+        return value_dict
+
+    def _warm_up(self, func: CallType, contextmanager_list: ContextManagerListType) -> Any:
+        class_value_dict: Dict[str, Any] = {}
+        if inspect.isclass(func):
+            class_value_dict = self._warm_up_depends_dict(
+                self._get_depends_dict(func, self._get_class_param_list(func)), contextmanager_list
+            )
+        pait_handler = self._get_depend_pait_handler(func, class_value_dict)
+        result = pait_handler(
+            **self._warm_up_depends_dict(
+                self._get_depends_dict(func, get_func_sig(func).param_list), contextmanager_list
+            )
+        )
+        if isinstance(result, AbstractContextManager):
+            contextmanager_list.append(result)
+            return result.__enter__()
+        return result
+
+    async def _async_warm_up(self, func: CallType, contextmanager_list: ContextManagerListType) -> Any:
+        class_value_dict: Dict[str, Any] = {}
+        if inspect.isclass(func):
+            class_value_dict = await self._async_warm_up_depends_dict(
+                self._get_depends_dict(func, self._get_class_param_list(func)), contextmanager_list
+            )
+        pait_handler = self._get_depend_pait_handler(func, class_value_dict)
+        result = pait_handler(
+            **(
+                await self._async_warm_up_depends_dict(
+                    self._get_depends_dict(func, get_func_sig(func).param_list), contextmanager_list
+                )
+            )
+        )
+        if asyncio.iscoroutine(result):
+            result = await result
+        if isinstance(result, AbstractAsyncContextManager):
+            contextmanager_list.append(result)
+            return await result.__aenter__()
+        elif isinstance(result, AbstractContextManager):
+            contextmanager_list.append(result)
+            return result.__enter__()
+        return result
+
+    def get(self, func: CallType) -> Any:
+        """Get the value of the app scope depend, resolve it if it is not resolved"""
+        return self.resolve(func, partial(self._warm_up, func))
+
+    async def async_get(self, func: CallType) -> Any:
+        return await self.async_resolve(func, partial(self._async_warm_up, func))
+
+    def warm_up(self, *depend_list: CallType) -> None:
+        """Resolve the depends before the app receives the request, these depends can not use the request param"""
+        for depend in depend_list:
+            self.get(depend)
+
+    async def async_warm_up(self, *depend_list: CallType) -> None:
+        for depend in depend_list:
+            await self.async_get(depend)
+
+    def teardown(self) -> None:
+        """Exit the context managers of the app scope depends in reverse order and clean the result"""
+        with self._lock:
+            contextmanager_list = self.contextmanager_list[::-1]
+            self.contextmanager_list.clear()
+            self.value_dict.clear()
+        for contextmanager in contextmanager_list:
+            if not isinstance(contextmanager, AbstractContextManager):
+                raise RuntimeError(f"Can not exit {contextmanager} in sync teardown, please use `async_teardown`")
+            contextmanager.__exit__(None, None, None)
+
+    async def async_teardown(self) -> None:
+        contextmanager_list = self.contextmanager_list[::-1]
+        self.contextmanager_list.clear()
+        self.value_dict.clear()
+        for contextmanager in contextmanager_list:
+            if isinstance(contextmanager, AbstractAsyncContextManager):
+                await contextmanager.__aexit__(None, None, None)
+            else:
+                contextmanager.__exit__(None, None, None)
+
+
+def get_app_depend_container(app_helper: "BaseAppHelper") -> AppDependContainer:
+    """Get the app scope depend container of the app, create it if it not exists"""
+    container: AppDependContainer = app_helper.get_attributes(APP_DEPEND_KEY, None)
+    if container is None:
+        with _container_lock:
+            container = app_helper.get_attributes(APP_DEPEND_KEY, None)
+            if container is None:
+                container = AppDependContainer()
+                app_helper.set_attributes(APP_DEPEND_KEY, container)
+    return container
@@ -9,6 +9,9 @@ __all__ = ["BaseRequest", "RequestT", "RequestExtendT", "BaseAppHelper", "BaseRe
 class BaseAppHelper(Generic[RequestT, RequestExtendT]):
     """Provide a unified framework call interface for pait"""
 
+    # The subclass also needs to declare `__slots__`, otherwise the instance will still have `__dict__`
+    __slots__ = ("cbv_instance", "raw_request", "request")
+
     # The class that defines the request object corresponding to the framework (consistent with Request T)
     CbvType: tuple = (Type,)  # The class that defines the cbv object corresponding to the framework
     app_name: str = "BaseAppHelper"  # Define the name corresponding to the framework
@@ -39,3 +42,6 @@ class BaseAppHelper(Generic[RequestT, RequestExtendT]):
 
     def get_attributes(self, key: str, default: Any = MISSING) -> Any:
         raise NotImplementedError
+
+    def set_attributes(self, key: str, value: Any) -> None:
+        raise NotImplementedError
@@ -1,3 +1,4 @@
+from ._app_depend import register_app_depend
 from ._app_helper import AppHelper
 from ._attribute import get_app_attribute, set_app_attribute
 from ._exception import http_exception
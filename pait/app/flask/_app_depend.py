@@ -0,0 +1,23 @@
+import atexit
+
+from flask import Flask
+
+from pait.app.base.app_depend import APP_DEPEND_KEY, AppDependContainer
+from pait.types import CallType
+
+from ._attribute import get_app_attribute, set_app_attribute
+
+__all__ = ["register_app_depend"]
+
+
+def register_app_depend(app: Flask, *warm_up_depend_list: CallType) -> AppDependContainer:
+    """Init the container of the app scope depends, the depends in `warm_up_depend_list` are resolved immediately,
+    and the context managers returned by the depends are exited when the process exits
+    """
+    container: AppDependContainer = get_app_attribute(app, APP_DEPEND_KEY, None)
+    if container is None:
+        container = AppDependContainer()
+        set_app_attribute(app, APP_DEPEND_KEY, container)
+        atexit.register(container.teardown)
+    container.warm_up(*warm_up_depend_list)
+    return container
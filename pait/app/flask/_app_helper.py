@@ -6,13 +6,15 @@ from flask import current_app, request
 from flask.views import View
 
 from pait.app.base import BaseAppHelper
-from pait.app.flask._attribute import get_app_attribute
+from pait.app.flask._attribute import get_app_attribute, set_app_attribute
 from pait.app.flask.adapter.request import Request, RequestExtend
 
 __all__ = ["AppHelper", "RequestExtend"]
 
 
 class AppHelper(BaseAppHelper[_Request, RequestExtend]):
+    __slots__ = ()
+
     CbvType = (View,)
     app_name = "flask"
 
@@ -23,3 +25,6 @@ class AppHelper(BaseAppHelper[_Request, RequestExtend]):
 
     def get_attributes(self, key: str, default: Any = MISSING) -> Any:
         return get_app_attribute(current_app, key, default)
+
+    def set_attributes(self, key: str, value: Any) -> None:
+        set_app_attribute(current_app, key, value)
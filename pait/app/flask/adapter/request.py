@@ -5,10 +5,12 @@ from flask import request as _request
 from werkzeug.datastructures import EnvironHeaders, ImmutableMultiDict
 
 from pait.app.base.adapter.request import BaseRequest, BaseRequestExtend
-from pait.util import LazyProperty
+from pait.util import MemoMethod
 
 
 class RequestExtend(BaseRequestExtend[FlaskRequest]):
+    __slots__ = ()
+
     @property
     def scheme(self) -> str:
         return _request.scheme
@@ -23,6 +25,8 @@ class RequestExtend(BaseRequestExtend[FlaskRequest]):
 
 
 class Request(BaseRequest[FlaskRequest, RequestExtend]):
+    __slots__ = ()
+
     RequestType = FlaskRequest
     FormType = ImmutableMultiDict
     FileType = FlaskRequest.files
@@ -52,10 +56,10 @@ class Request(BaseRequest[FlaskRequest, RequestExtend]):
     def query(self) -> Dict[str, Any]:
         return _request.args
 
-    @LazyProperty()
+    @MemoMethod
     def multiform(self) -> Dict[str, List[Any]]:
         return {key: _request.form.getlist(key) for key, _ in _request.form.items()}
 
-    @LazyProperty()
+    @MemoMethod
     def multiquery(self) -> Dict[str, List[Any]]:
         return {key: _request.args.getlist(key) for key, _ in _request.args.items()}
@@ -1,7 +1,8 @@
-from typing import Any, Type
+from typing import Any, Callable, Type
 
 from flask import Response, jsonify, make_response
 
+from pait._pydanitc_adapter import BaseModel, model_dump
 from pait.model.response import BaseResponseModel, JsonResponseModel
 
 
@@ -26,3 +27,46 @@ def set_info_to_response(resp: Response, response_model_class: Type[BaseResponse
     resp.status_code = response_model_class.status_code[0]
     if response_model_class.header:
         resp.headers.update(response_model_class.get_header_example_dict())
+
+
+def gen_response_builder(response_model_class: Type[BaseResponseModel]) -> Callable[..., Response]:
+    """Compile the func that generates the response of the response model.
+
+    The status code, headers and media type of the response model are computed once,
+    so the builder is used by the plugin that generates the response for each request (e.g. UnifiedResponsePlugin).
+    The json value is still serialized by the json provider of the Flask app (same as `jsonify`)
+    """
+    status_code: int = response_model_class.status_code[0]
+    header_dict: dict = response_model_class.get_header_example_dict() if response_model_class.header else {}
+    media_type: str = response_model_class.media_type
+
+    if issubclass(response_model_class, JsonResponseModel):
+
+        def _json_builder(response_value: Any, *args: Any, **kwargs: Any) -> Response:
+            if isinstance(response_value, Response):
+                return response_value
+            if isinstance(response_value, bytes):
+                # The pre-serialized json (e.g. the cached OpenAPI document) is sent as is
+                return Response(response_value, status=status_code, headers=header_dict, mimetype=media_type)
+            if isinstance(response_value, BaseModel):
+                # The json provider of Flask does not support the pydantic model
+                response_value = model_dump(response_value, by_alias=True)
+            resp: Response = jsonify(response_value)
+            resp.status_code = status_code
+            if header_dict:
+                resp.headers.update(header_dict)
+            return resp
+
+        return _json_builder
+
+    def _builder(response_value: Any, *args: Any, **kwargs: Any) -> Response:
+        if isinstance(response_value, Response):
+            return response_value
+        resp: Response = make_response(response_value)
+        resp.mimetype = media_type
+        resp.status_code = status_code
+        if header_dict:
+            resp.headers.update(header_dict)
+        return resp
+
+    return _builder
@@ -1,5 +1,7 @@
 from pait.app.flask.plugin.auto_complete_json_resp import AutoCompleteJsonRespPlugin
 from pait.app.flask.plugin.check_json_resp import CheckJsonRespPlugin
+from pait.app.flask.plugin.compress_response import CompressResponsePlugin
+from pait.app.flask.plugin.conditional_get import CacheControl, ConditionalGetPlugin
 from pait.app.flask.plugin.mock_response import MockPlugin
 from pait.app.flask.plugin.unified_response import UnifiedResponsePlugin, UnifiedResponsePluginProtocol
 from pait.plugin.at_most_one_of import AtMostOneOfExtraParam, AtMostOneOfPlugin
@@ -13,6 +15,9 @@ __all__ = [
     "RequiredExtraParam",
     "RequiredGroupExtraParam",
     "CheckJsonRespPlugin",
+    "CompressResponsePlugin",
+    "CacheControl",
+    "ConditionalGetPlugin",
     "MockPlugin",
     "UnifiedResponsePlugin",
     "UnifiedResponsePluginProtocol",
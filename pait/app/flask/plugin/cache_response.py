@@ -1,3 +1,23 @@
-from pait.plugin.cache_response import CacheRespExtraParam, CacheResponsePlugin
+from typing import Any, Optional
 
-__all__ = ["CacheResponsePlugin", "CacheRespExtraParam"]
+from flask import Response
+
+from pait.plugin.cache_response import CacheCodec as _CacheCodec
+from pait.plugin.cache_response import CachedResponse, CacheRespExtraParam
+from pait.plugin.cache_response import CacheResponsePlugin as _CacheResponsePlugin
+
+__all__ = ["CacheResponsePlugin", "CacheRespExtraParam", "CacheCodec"]
+
+
+class CacheCodec(_CacheCodec):
+    def dump_response(self, response: Any) -> Optional[CachedResponse]:
+        if type(response) is not Response or response.is_streamed or response.direct_passthrough:
+            return None
+        return CachedResponse(response.status_code, list(response.headers.items()), response.get_data())
+
+    def load_response(self, cached_response: CachedResponse) -> Any:
+        return Response(cached_response.body, status=cached_response.status_code, headers=cached_response.headers)
+
+
+class CacheResponsePlugin(_CacheResponsePlugin):
+    default_codec = CacheCodec()
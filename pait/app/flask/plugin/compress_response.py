@@ -0,0 +1,30 @@
+from typing import Any, Optional
+
+from flask import Response
+
+from pait.app.flask.plugin.unified_response import UnifiedResponsePluginProtocol
+from pait.model.context import ContextModel as PluginContext
+from pait.plugin.compress_response import CompressResponsePlugin as _CompressResponsePlugin
+
+__all__ = ["CompressResponsePlugin"]
+
+
+class CompressResponsePlugin(UnifiedResponsePluginProtocol, _CompressResponsePlugin):
+    def _get_body(self, response: Response, context: PluginContext) -> Optional[bytes]:
+        if (
+            response.is_streamed
+            or response.direct_passthrough
+            or response.status_code in (204, 304)
+            or "Content-Encoding" in response.headers
+        ):
+            return None
+        return response.get_data()
+
+    def _set_body(
+        self, response: Response, body: Optional[bytes], encoding: Optional[str], context: PluginContext
+    ) -> Any:
+        response.vary.add("Accept-Encoding")
+        if encoding is not None:
+            response.set_data(body)  # type: ignore[arg-type]
+            response.headers["Content-Encoding"] = encoding
+        return response
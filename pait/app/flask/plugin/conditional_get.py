@@ -0,0 +1,24 @@
+from typing import Any, Dict, Optional
+
+from flask import Response
+
+from pait.app.flask.plugin.unified_response import UnifiedResponsePluginProtocol
+from pait.model.context import ContextModel as PluginContext
+from pait.plugin.conditional_get import CacheControl
+from pait.plugin.conditional_get import ConditionalGetPlugin as _ConditionalGetPlugin
+
+__all__ = ["ConditionalGetPlugin", "CacheControl"]
+
+
+class ConditionalGetPlugin(UnifiedResponsePluginProtocol, _ConditionalGetPlugin):
+    def _get_body(self, response: Response, context: PluginContext) -> Optional[bytes]:
+        if response.status_code != 200 or response.is_streamed or response.direct_passthrough:
+            return None
+        return response.get_data()
+
+    def _set_headers(self, response: Response, headers: Dict[str, str], context: PluginContext) -> Any:
+        response.headers.update(headers)
+        return response
+
+    def _gen_not_modified_response(self, headers: Dict[str, str], context: PluginContext) -> Any:
+        return Response(status=304, headers=headers)
@@ -0,0 +1,31 @@
+from asyncio import AbstractEventLoop
+
+from sanic import Sanic
+
+from pait.app.base.app_depend import APP_DEPEND_KEY, AppDependContainer
+from pait.types import CallType
+
+from ._attribute import get_app_attribute, set_app_attribute
+
+__all__ = ["register_app_depend"]
+
+
+def register_app_depend(app: Sanic, *warm_up_depend_list: CallType) -> AppDependContainer:
+    """Init the container of the app scope depends, the depends in `warm_up_depend_list` are resolved before
+    the server start, and the context managers returned by the depends are exited after the server stop
+    """
+    container: AppDependContainer = get_app_attribute(app, APP_DEPEND_KEY, None)
+    if container is None:
+        container = AppDependContainer()
+        set_app_attribute(app, APP_DEPEND_KEY, container)
+
+        async def _teardown(_app: Sanic, _loop: AbstractEventLoop) -> None:
+            await container.async_teardown()
+
+        app.register_listener(_teardown, "after_server_stop")
+
+    async def _warm_up(_app: Sanic, _loop: AbstractEventLoop) -> None:
+        await container.async_warm_up(*warm_up_depend_list)
+
+    app.register_listener(_warm_up, "before_server_start")
+    return container
@@ -14,13 +14,15 @@ except ImportError:
 from sanic_testing.testing import SanicTestClient, TestingResponse  # type: ignore
 
 from pait.app.base import BaseAppHelper
-from pait.app.sanic._attribute import get_app_attribute
+from pait.app.sanic._attribute import get_app_attribute, set_app_attribute
 from pait.app.sanic.adapter.request import Request, RequestExtend
 
 __all__ = ["AppHelper", "RequestExtend"]
 
 
 class AppHelper(BaseAppHelper[_Request, RequestExtend]):
+    __slots__ = ()
+
     CbvType = cbv_type_tuple
     app_name = "sanic"
 
@@ -28,3 +30,6 @@ class AppHelper(BaseAppHelper[_Request, RequestExtend]):
 
     def get_attributes(self, key: str, default: Any = MISSING) -> Any:
         return get_app_attribute(self.raw_request.app, key, default)
+
+    def set_attributes(self, key: str, value: Any) -> None:
+        set_app_attribute(self.raw_request.app, key, value)
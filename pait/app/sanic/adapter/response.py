@@ -1,8 +1,10 @@
-from typing import Any, Type
+from typing import Any, Callable, Type
 
 from sanic.response import BaseHTTPResponse, HTTPResponse, json
 
+from pait.g import config
 from pait.model.response import BaseResponseModel, JsonResponseModel
+from pait.util.encoder import get_json_dumps_func
 
 
 def gen_response(
@@ -27,3 +29,36 @@ def set_info_to_response(resp: BaseHTTPResponse, response_model_class: Type[Base
     resp.status = response_model_class.status_code[0]
     if response_model_class.header:
         resp.headers.update(response_model_class.get_header_example_dict())
+
+
+def gen_response_builder(response_model_class: Type[BaseResponseModel]) -> Callable[..., BaseHTTPResponse]:
+    """Compile the func that generates the response of the response model.
+
+    The status code, headers and media type of the response model are computed once,
+    so the builder is used by the plugin that generates the response for each request (e.g. UnifiedResponsePlugin)
+    """
+    status_code: int = response_model_class.status_code[0]
+    header_dict: dict = response_model_class.get_header_example_dict() if response_model_class.header else {}
+    media_type: str = response_model_class.media_type
+
+    if issubclass(response_model_class, JsonResponseModel):
+
+        def _json_builder(response_value: Any, *args: Any, **kwargs: Any) -> BaseHTTPResponse:
+            if isinstance(response_value, BaseHTTPResponse):
+                return response_value
+            # The pre-serialized json (e.g. the cached OpenAPI document) is sent as is
+            if isinstance(response_value, bytes):
+                body: bytes = response_value
+            else:
+                # The encoder is read for each response, so the change of `config.json_encoder` takes effect
+                body = get_json_dumps_func(config.json_encoder)(response_value)
+            return HTTPResponse(body, status=status_code, headers=header_dict, content_type=media_type)
+
+        return _json_builder
+
+    def _builder(response_value: Any, *args: Any, **kwargs: Any) -> BaseHTTPResponse:
+        if isinstance(response_value, BaseHTTPResponse):
+            return response_value
+        return HTTPResponse(response_value, status=status_code, headers=header_dict, content_type=media_type)
+
+    return _builder
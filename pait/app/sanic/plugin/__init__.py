@@ -1,5 +1,7 @@
 from pait.app.sanic.plugin.auto_complete_json_resp import AutoCompleteJsonRespPlugin
 from pait.app.sanic.plugin.check_json_resp import CheckJsonRespPlugin
+from pait.app.sanic.plugin.compress_response import CompressResponsePlugin
+from pait.app.sanic.plugin.conditional_get import CacheControl, ConditionalGetPlugin
 from pait.app.sanic.plugin.mock_response import MockPlugin
 from pait.app.sanic.plugin.unified_response import UnifiedResponsePlugin
 from pait.plugin.at_most_one_of import AtMostOneOfExtraParam, AtMostOneOfPlugin
@@ -13,6 +15,9 @@ __all__ = [
     "AtMostOneOfPlugin",
     "AtMostOneOfExtraParam",
     "CheckJsonRespPlugin",
+    "CompressResponsePlugin",
+    "CacheControl",
+    "ConditionalGetPlugin",
     "MockPlugin",
     "UnifiedResponsePlugin",
 ]
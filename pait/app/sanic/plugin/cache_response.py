@@ -1,3 +1,28 @@
-from pait.plugin.cache_response import CacheRespExtraParam, CacheResponsePlugin
+from typing import Any, List, Optional, Tuple
 
-__all__ = ["CacheResponsePlugin", "CacheRespExtraParam"]
+from sanic.response import HTTPResponse
+
+from pait.plugin.cache_response import CacheCodec as _CacheCodec
+from pait.plugin.cache_response import CachedResponse, CacheRespExtraParam
+from pait.plugin.cache_response import CacheResponsePlugin as _CacheResponsePlugin
+
+__all__ = ["CacheResponsePlugin", "CacheRespExtraParam", "CacheCodec"]
+
+
+class CacheCodec(_CacheCodec):
+    def dump_response(self, response: Any) -> Optional[CachedResponse]:
+        if type(response) is not HTTPResponse:
+            return None
+        headers: List[Tuple[str, str]] = list(response.headers.items())
+        if response.content_type and "content-type" not in response.headers:
+            headers.append(("content-type", response.content_type))
+        return CachedResponse(response.status, headers, response.body or b"")
+
+    def load_response(self, cached_response: CachedResponse) -> Any:
+        return HTTPResponse(
+            cached_response.body, status=cached_response.status_code, headers=cached_response.headers  # type: ignore
+        )
+
+
+class CacheResponsePlugin(_CacheResponsePlugin):
+    default_codec = CacheCodec()
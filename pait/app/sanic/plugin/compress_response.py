@@ -0,0 +1,31 @@
+from typing import Any, Optional
+
+from sanic.response import BaseHTTPResponse, HTTPResponse
+
+from pait.app.sanic.plugin.unified_response import UnifiedResponsePluginProtocol
+from pait.model.context import ContextModel as PluginContext
+from pait.plugin.compress_response import CompressResponsePlugin as _CompressResponsePlugin
+
+__all__ = ["CompressResponsePlugin"]
+
+
+class CompressResponsePlugin(UnifiedResponsePluginProtocol, _CompressResponsePlugin):
+    def _get_body(self, response: BaseHTTPResponse, context: PluginContext) -> Optional[bytes]:
+        # The body of StreamingHTTPResponse is not generated yet
+        if (
+            not isinstance(response, HTTPResponse)
+            or response.status in (204, 304)
+            or "Content-Encoding" in response.headers
+        ):
+            return None
+        return response.body or b""
+
+    def _set_body(
+        self, response: BaseHTTPResponse, body: Optional[bytes], encoding: Optional[str], context: PluginContext
+    ) -> Any:
+        vary: Optional[str] = response.headers.get("Vary")
+        response.headers["Vary"] = f"{vary}, Accept-Encoding" if vary else "Accept-Encoding"
+        if encoding is not None:
+            response.body = body
+            response.headers["Content-Encoding"] = encoding
+        return response
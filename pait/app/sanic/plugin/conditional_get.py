@@ -0,0 +1,25 @@
+from typing import Any, Dict, Optional
+
+from sanic.response import BaseHTTPResponse, HTTPResponse
+
+from pait.app.sanic.plugin.unified_response import UnifiedResponsePluginProtocol
+from pait.model.context import ContextModel as PluginContext
+from pait.plugin.conditional_get import CacheControl
+from pait.plugin.conditional_get import ConditionalGetPlugin as _ConditionalGetPlugin
+
+__all__ = ["ConditionalGetPlugin", "CacheControl"]
+
+
+class ConditionalGetPlugin(UnifiedResponsePluginProtocol, _ConditionalGetPlugin):
+    def _get_body(self, response: BaseHTTPResponse, context: PluginContext) -> Optional[bytes]:
+        # The body of StreamingHTTPResponse is not generated yet
+        if response.status != 200 or not isinstance(response, HTTPResponse):
+            return None
+        return response.body or b""
+
+    def _set_headers(self, response: BaseHTTPResponse, headers: Dict[str, str], context: PluginContext) -> Any:
+        response.headers.update(headers)
+        return response
+
+    def _gen_not_modified_response(self, headers: Dict[str, str], context: PluginContext) -> Any:
+        return HTTPResponse(status=304, headers=headers)
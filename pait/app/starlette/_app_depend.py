@@ -0,0 +1,25 @@
+from starlette.applications import Starlette
+
+from pait.app.base.app_depend import APP_DEPEND_KEY, AppDependContainer
+from pait.types import CallType
+
+from ._attribute import get_app_attribute, set_app_attribute
+
+__all__ = ["register_app_depend"]
+
+
+def register_app_depend(app: Starlette, *warm_up_depend_list: CallType) -> AppDependContainer:
+    """Init the container of the app scope depends, the depends in `warm_up_depend_list` are resolved on startup,
+    and the context managers returned by the depends are exited on shutdown
+    """
+    container: AppDependContainer = get_app_attribute(app, APP_DEPEND_KEY, None)
+    if container is None:
+        container = AppDependContainer()
+        set_app_attribute(app, APP_DEPEND_KEY, container)
+        app.add_event_handler("shutdown", container.async_teardown)
+
+    async def _warm_up() -> None:
+        await container.async_warm_up(*warm_up_depend_list)
+
+    app.add_event_handler("startup", _warm_up)
+    return container
@@ -5,13 +5,15 @@ from starlette.endpoints import HTTPEndpoint
 from starlette.requests import Request as _Request
 
 from pait.app.base import BaseAppHelper
-from pait.app.starlette._attribute import get_app_attribute
+from pait.app.starlette._attribute import get_app_attribute, set_app_attribute
 from pait.app.starlette.adapter.request import Request, RequestExtend
 
 __all__ = ["AppHelper", "RequestExtend"]
 
 
 class AppHelper(BaseAppHelper[_Request, RequestExtend]):
+    __slots__ = ()
+
     CbvType = (HTTPEndpoint,)
     app_name = "starlette"
 
@@ -19,3 +21,6 @@ class AppHelper(BaseAppHelper[_Request, RequestExtend]):
 
     def get_attributes(self, key: str, default: Any = MISSING) -> Any:
         return get_app_attribute(self.raw_request.app, key, default)
+
+    def set_attributes(self, key: str, value: Any) -> None:
+        set_app_attribute(self.raw_request.app, key, value)
@@ -1,13 +1,15 @@
-from typing import Any, Coroutine, Dict, List, Mapping, Optional
+from typing import Any, Coroutine, Dict, List
 
 from starlette.datastructures import FormData, Headers, UploadFile
 from starlette.requests import Request as _Request
 
 from pait.app.base.adapter.request import BaseRequest, BaseRequestExtend
-from pait.util import LazyProperty
+from pait.util import MemoMethod
 
 
 class RequestExtend(BaseRequestExtend[_Request]):
+    __slots__ = ()
+
     @property
     def scheme(self) -> str:
         return self.request.url.scheme
@@ -24,44 +26,34 @@ class RequestExtend(BaseRequestExtend[_Request]):
 
 
 class Request(BaseRequest[_Request, RequestExtend]):
+    __slots__ = ()
+
     RequestType = _Request
     FormType = FormData
     FileType = UploadFile
     HeaderType = Headers
 
-    def __init__(self, request: _Request, args: List[Any], kwargs: Mapping[str, Any]):
-        super().__init__(request, args, kwargs)
-        self._form: Optional[FormData] = None
-
     def request_extend(self) -> RequestExtend:
         return RequestExtend(self.request)
 
-    def body(self) -> Coroutine[Any, Any, dict]:
-        return self.request.json()
+    @MemoMethod
+    async def body(self) -> dict:
+        return await self.request.json()
 
     def cookie(self) -> dict:
         return self.request.cookies
 
+    @MemoMethod
     async def get_form(self) -> FormData:
-        if self._form:
-            return self._form
-        form: FormData = await self.request.form()
-        self._form = form
-        return form
+        return await self.request.form()
 
     def file(self) -> Coroutine[Any, Any, FormData]:
-        async def _() -> FormData:
-            return await self.get_form()
+        return self.get_form()
 
-        return _()
-
-    def form(self) -> Coroutine[Any, Any, Dict[str, Any]]:
-        @LazyProperty(self)
-        async def _form() -> Dict[str, Any]:
-            form_data: FormData = await self.get_form()
-            return {key: form_data.getlist(key)[0] for key, _ in form_data.items()}
-
-        return _form()
+    @MemoMethod
+    async def form(self) -> Dict[str, Any]:
+        form_data: FormData = await self.get_form()
+        return {key: form_data.getlist(key)[0] for key, _ in form_data.items()}
 
     def header(self) -> Headers:
         return self.request.headers
@@ -72,17 +64,13 @@ class Request(BaseRequest[_Request, RequestExtend]):
     def query(self) -> dict:
         return dict(self.request.query_params)
 
-    def multiform(self) -> Coroutine[Any, Any, Dict[str, List[Any]]]:
-        @LazyProperty(self)
-        async def _multiform() -> Dict[str, List[Any]]:
-            form_data: FormData = await self.get_form()
-            return {
-                key: [i for i in form_data.getlist(key) if not isinstance(i, UploadFile)]
-                for key, _ in form_data.items()
-            }
-
-        return _multiform()
+    @MemoMethod
+    async def multiform(self) -> Dict[str, List[Any]]:
+        form_data: FormData = await self.get_form()
+        return {
+            key: [i for i in form_data.getlist(key) if not isinstance(i, UploadFile)] for key, _ in form_data.items()
+        }
 
-    @LazyProperty()
+    @MemoMethod
     def multiquery(self) -> Dict[str, Any]:
         return {key: self.request.query_params.getlist(key) for key, _ in self.request.query_params.items()}
@@ -1,5 +1,7 @@
 from pait.app.starlette.plugin.auto_complete_json_resp import AutoCompleteJsonRespPlugin
 from pait.app.starlette.plugin.check_json_resp import CheckJsonRespPlugin
+from pait.app.starlette.plugin.compress_response import CompressResponsePlugin
+from pait.app.starlette.plugin.conditional_get import CacheControl, ConditionalGetPlugin
 from pait.app.starlette.plugin.mock_response import MockPlugin
 from pait.app.starlette.plugin.unified_response import UnifiedResponsePlugin, UnifiedResponsePluginProtocol
 from pait.plugin.at_most_one_of import AtMostOneOfExtraParam, AtMostOneOfPlugin
@@ -13,6 +15,9 @@ __all__ = [
     "AtMostOneOfExtraParam",
     "AtMostOneOfPlugin",
     "CheckJsonRespPlugin",
+    "CompressResponsePlugin",
+    "CacheControl",
+    "ConditionalGetPlugin",
     "MockPlugin",
     "UnifiedResponsePlugin",
     "UnifiedResponsePluginProtocol",
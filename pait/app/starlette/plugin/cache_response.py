@@ -1,3 +1,34 @@
-from pait.plugin.cache_response import CacheRespExtraParam, CacheResponsePlugin
+from typing import Any, Optional
 
-__all__ = ["CacheResponsePlugin", "CacheRespExtraParam"]
+from starlette.responses import HTMLResponse, JSONResponse, PlainTextResponse, Response
+
+from pait.plugin.cache_response import CacheCodec as _CacheCodec
+from pait.plugin.cache_response import CachedResponse, CacheRespExtraParam
+from pait.plugin.cache_response import CacheResponsePlugin as _CacheResponsePlugin
+
+__all__ = ["CacheResponsePlugin", "CacheRespExtraParam", "CacheCodec"]
+
+
+class CacheCodec(_CacheCodec):
+    # The response of these classes only contains the status code, headers and body
+    response_class_tuple = (Response, HTMLResponse, JSONResponse, PlainTextResponse)
+
+    def dump_response(self, response: Any) -> Optional[CachedResponse]:
+        if type(response) not in self.response_class_tuple or response.background is not None:
+            return None
+        return CachedResponse(
+            response.status_code,
+            [(key.decode("latin-1"), value.decode("latin-1")) for key, value in response.raw_headers],
+            response.body,
+        )
+
+    def load_response(self, cached_response: CachedResponse) -> Any:
+        response = Response(cached_response.body, status_code=cached_response.status_code)
+        response.raw_headers = [
+            (key.encode("latin-1"), value.encode("latin-1")) for key, value in cached_response.headers
+        ]
+        return response
+
+
+class CacheResponsePlugin(_CacheResponsePlugin):
+    default_codec = CacheCodec()
@@ -0,0 +1,27 @@
+from typing import Any, Optional
+
+from starlette.responses import Response
+
+from pait.app.starlette.plugin.unified_response import UnifiedResponsePluginProtocol
+from pait.model.context import ContextModel as PluginContext
+from pait.plugin.compress_response import CompressResponsePlugin as _CompressResponsePlugin
+
+__all__ = ["CompressResponsePlugin"]
+
+
+class CompressResponsePlugin(UnifiedResponsePluginProtocol, _CompressResponsePlugin):
+    def _get_body(self, response: Response, context: PluginContext) -> Optional[bytes]:
+        # e.g. StreamingResponse and FileResponse have no body
+        if response.status_code in (204, 304) or "content-encoding" in response.headers:
+            return None
+        return getattr(response, "body", None)
+
+    def _set_body(
+        self, response: Response, body: Optional[bytes], encoding: Optional[str], context: PluginContext
+    ) -> Any:
+        response.headers.add_vary_header("Accept-Encoding")
+        if encoding is not None:
+            response.body = body  # type: ignore[assignment]
+            response.headers["content-encoding"] = encoding
+            response.headers["content-length"] = str(len(body))  # type: ignore[arg-type]
+        return response
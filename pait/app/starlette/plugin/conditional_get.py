@@ -0,0 +1,25 @@
+from typing import Any, Dict, Optional
+
+from starlette.responses import Response
+
+from pait.app.starlette.plugin.unified_response import UnifiedResponsePluginProtocol
+from pait.model.context import ContextModel as PluginContext
+from pait.plugin.conditional_get import CacheControl
+from pait.plugin.conditional_get import ConditionalGetPlugin as _ConditionalGetPlugin
+
+__all__ = ["ConditionalGetPlugin", "CacheControl"]
+
+
+class ConditionalGetPlugin(UnifiedResponsePluginProtocol, _ConditionalGetPlugin):
+    def _get_body(self, response: Response, context: PluginContext) -> Optional[bytes]:
+        # e.g. StreamingResponse and FileResponse have no body
+        if response.status_code != 200 or response.background is not None:
+            return None
+        return getattr(response, "body", None)
+
+    def _set_headers(self, response: Response, headers: Dict[str, str], context: PluginContext) -> Any:
+        response.headers.update(headers)
+        return response
+
+    def _gen_not_modified_response(self, headers: Dict[str, str], context: PluginContext) -> Any:
+        return Response(status_code=304, headers=headers)
@@ -0,0 +1,25 @@
+from tornado.ioloop import IOLoop
+from tornado.web import Application
+
+from pait.app.base.app_depend import APP_DEPEND_KEY, AppDependContainer
+from pait.types import CallType
+
+from ._attribute import get_app_attribute, set_app_attribute
+
+__all__ = ["register_app_depend"]
+
+
+def register_app_depend(app: Application, *warm_up_depend_list: CallType) -> AppDependContainer:
+    """Init the container of the app scope depends, the depends in `warm_up_depend_list` are resolved
+    when the IOLoop starts.
+
+    Note: Tornado Application does not provide a shutdown hook,
+        please call `await container.async_teardown()` before the IOLoop stops
+    """
+    container: AppDependContainer = get_app_attribute(app, APP_DEPEND_KEY, None)
+    if container is None:
+        container = AppDependContainer()
+        set_app_attribute(app, APP_DEPEND_KEY, container)
+    if warm_up_depend_list:
+        IOLoop.current().add_callback(container.async_warm_up, *warm_up_depend_list)
+    return container
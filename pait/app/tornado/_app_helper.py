@@ -5,13 +5,15 @@ from tornado.httputil import HTTPServerRequest
 from tornado.web import RequestHandler
 
 from pait.app.base import BaseAppHelper
-from pait.app.tornado._attribute import get_app_attribute
+from pait.app.tornado._attribute import get_app_attribute, set_app_attribute
 from pait.app.tornado.adapter.request import Request, RequestExtend
 
 __all__ = ["AppHelper", "RequestExtend"]
 
 
 class AppHelper(BaseAppHelper[HTTPServerRequest, RequestExtend]):
+    __slots__ = ()
+
     CbvType = (RequestHandler,)
     app_name = "tornado"
 
@@ -27,3 +29,6 @@ class AppHelper(BaseAppHelper[HTTPServerRequest, RequestExtend]):
 
     def get_attributes(self, key: str, default: Any = MISSING) -> Any:
         return get_app_attribute(self.cbv_instance.application, key, default)
+
+    def set_attributes(self, key: str, value: Any) -> None:
+        set_app_attribute(self.cbv_instance.application, key, value)
@@ -72,14 +72,17 @@ class TestHelper(BaseTestHelper[HTTPResponse]):
             content_type, body = self.encode_multipart_formdata(data=self.form_dict, files=self.file_dict)
             headers: dict = self.header_dict.copy()
             headers.update({"Content-Type": content_type, "content-length": str(len(body))})
-            return self.client.fetch(self.path, method="POST", headers=headers, body=body)
+            return self.client.fetch(self.path, method="POST", headers=headers, body=body, decompress_response=False)
         body_bytes = None
         if self.body_dict:
             body_bytes = json.dumps(self.body_dict).encode()
         elif method == "POST":
             # Fix, Body must not be None for method POST (unless allow_nonstandard_methods is true)
             body_bytes = b""
-        return self.client.fetch(self.path, method=method, headers=self.header_dict, body=body_bytes)
+        # Do not overwrite the `Accept-Encoding` of the header dict, and return the raw body of the response
+        return self.client.fetch(
+            self.path, method=method, headers=self.header_dict, body=body_bytes, decompress_response=False
+        )
 
     @staticmethod
     def choose_boundary() -> str:
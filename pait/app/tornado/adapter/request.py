@@ -4,10 +4,12 @@ from typing import Any, Dict, List, Mapping
 from tornado.httputil import HTTPHeaders, HTTPServerRequest
 
 from pait.app.base.adapter.request import BaseRequest, BaseRequestExtend
-from pait.util import LazyProperty
+from pait.util import MemoMethod
 
 
 class RequestExtend(BaseRequestExtend[HTTPServerRequest]):
+    __slots__ = ()
+
     @property
     def scheme(self) -> str:
         return self.request.protocol
@@ -22,6 +24,8 @@ class RequestExtend(BaseRequestExtend[HTTPServerRequest]):
 
 
 class Request(BaseRequest[HTTPServerRequest, RequestExtend]):
+    __slots__ = ()
+
     RequestType = HTTPServerRequest
     FormType = dict
     FileType = dict
@@ -30,19 +34,19 @@ class Request(BaseRequest[HTTPServerRequest, RequestExtend]):
     def request_extend(self) -> RequestExtend:
         return RequestExtend(self.request)
 
-    @LazyProperty()
+    @MemoMethod
     def body(self) -> dict:
         return json.loads(self.request.body.decode())
 
-    @LazyProperty()
+    @MemoMethod
     def cookie(self) -> dict:
         return {i.key: i.value for i in self.request.cookies.values()}
 
-    @LazyProperty()
+    @MemoMethod
     def file(self) -> dict:
         return {item["filename"]: item for item in self.request.files["file"]}
 
-    @LazyProperty()
+    @MemoMethod
     def form(self) -> dict:
         if self.request.arguments:
             form_dict: dict = {key: value[0].decode() for key, value in self.request.arguments.items()}
@@ -56,17 +60,17 @@ class Request(BaseRequest[HTTPServerRequest, RequestExtend]):
     def path(self) -> Mapping[str, Any]:
         return self.request_kwargs
 
-    @LazyProperty()
+    @MemoMethod
     def query(self) -> dict:
         return {key: value[0].decode() for key, value in self.request.query_arguments.items()}
 
-    @LazyProperty()
+    @MemoMethod
     def multiform(self) -> Dict[str, List[Any]]:
         if self.request.arguments:
             return {key: [i.decode() for i in value] for key, value in self.request.arguments.items()}
         else:
             return {key: [value] for key, value in json.loads(self.request.body.decode()).items()}  # pragma: no cover
 
-    @LazyProperty()
+    @MemoMethod
     def multiquery(self) -> Dict[str, Any]:
         return {key: [i.decode() for i in value] for key, value in self.request.query_arguments.items()}
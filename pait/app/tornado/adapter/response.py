@@ -1,8 +1,11 @@
-from typing import Any, Type
+from typing import Any, Callable, Type
 
+from pydantic import BaseModel
 from tornado.web import RequestHandler
 
-from pait.model.response import BaseResponseModel
+from pait.g import config
+from pait.model.response import BaseResponseModel, JsonResponseModel
+from pait.util.encoder import get_json_dumps_func
 
 
 def gen_response(response_value: Any, response_model_class: Type[BaseResponseModel], *args: Any, **kwargs: Any) -> Any:
@@ -23,3 +26,31 @@ def set_info_to_response(tornado_handle: RequestHandler, response_model_class: T
     if response_model_class.header is not None:
         for k, v in response_model_class.get_header_example_dict().items():
             tornado_handle.set_header(k, v)
+
+
+def gen_response_builder(response_model_class: Type[BaseResponseModel]) -> Callable[..., Any]:
+    """Compile the func that generates the response of the response model.
+
+    The status code, headers and media type of the response model are computed once,
+    so the builder is used by the plugin that generates the response for each request (e.g. UnifiedResponsePlugin)
+    """
+    status_code: int = response_model_class.status_code[0]
+    header_list: list = list(
+        (response_model_class.get_header_example_dict() if response_model_class.header else {}).items()
+    )
+    header_list.append(("Content-Type", response_model_class.media_type))
+    is_json: bool = issubclass(response_model_class, JsonResponseModel)
+
+    def _builder(response_value: Any, *args: Any, **kwargs: Any) -> Any:
+        tornado_handle: RequestHandler = args[0]
+        tornado_handle.set_status(status_code)
+        for k, v in header_list:
+            tornado_handle.set_header(k, v)
+        if is_json and isinstance(response_value, (dict, list, BaseModel)):
+            # The value is serialized by the json dumps func instead of `tornado.escape.json_encode`,
+            # the encoder is read for each response, so the change of `config.json_encoder` takes effect
+            response_value = get_json_dumps_func(config.json_encoder)(response_value)
+        tornado_handle.write(response_value)
+        return None
+
+    return _builder
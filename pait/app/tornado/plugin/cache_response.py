@@ -1,34 +1,44 @@
-from typing import Any, Dict, Tuple
+from typing import Any, Tuple
 
+from tornado.httputil import HTTPHeaders
 from tornado.web import RequestHandler
 
-from pait.plugin.cache_response import CacheRespExtraParam
+from pait.plugin.cache_response import CachedResponse, CacheRespExtraParam
 from pait.plugin.cache_response import CacheResponsePlugin as _CacheResponsePlugin
 
 __all__ = ["CacheResponsePlugin", "CacheRespExtraParam"]
 
 
 class CacheResponsePlugin(_CacheResponsePlugin):
+    # The result of the route function is written to the handler, it can not be refreshed after the request is over
+    background_refresh = False
+
     def _gen_key(self, *args: Any, **kwargs: Any) -> Tuple[str, str]:
         return super()._gen_key(*args[1:], **kwargs)
 
-    def _dumps(self, response: Any, *args: Any, **kwargs: Any) -> Any:
+    def _dumps(self, response: Any, *args: Any, **kwargs: Any) -> bytes:
         tornado_handle: RequestHandler = args[0]
-        if isinstance(response, Exception):
+        if response is not None and response is not tornado_handle:
+            # The exception, or the value that is written to the handler by the outer plugin
+            # (e.g. the unified response plugin), is cached as is
             return super()._dumps(response, *args, **kwargs)
-        cache_dict: Dict[str, Any] = {
-            "write_buffer": tornado_handle._write_buffer,
-            "status_code": tornado_handle._status_code,
-            "headers": tornado_handle._headers,
-        }
-        return super()._dumps(cache_dict, *args, **kwargs)
-
-    def _loads(self, response: Any, *args: Any, **kwargs: Any) -> Any:
-        response = super()._loads(response, *args, **kwargs)
-        if isinstance(response, Exception):
-            return response
+        cached_response = CachedResponse(
+            tornado_handle._status_code,
+            list(tornado_handle._headers.get_all()),
+            b"".join(tornado_handle._write_buffer),
+        )
+        return super()._dumps(cached_response, *args, **kwargs)
+
+    def _loads(self, response: bytes, *args: Any, **kwargs: Any) -> Any:
+        value: Any = super()._loads(response, *args, **kwargs)
+        if not isinstance(value, CachedResponse):
+            return value
+        cached_response: CachedResponse = value
         tornado_handle: RequestHandler = args[0]
-        tornado_handle._write_buffer = response["write_buffer"]
-        tornado_handle._status_code = response["status_code"]
-        tornado_handle._headers = response["headers"]
+        headers = HTTPHeaders()
+        for key, header_value in cached_response.headers:
+            headers.add(key, header_value)
+        tornado_handle._write_buffer = [cached_response.body] if cached_response.body else []
+        tornado_handle._status_code = cached_response.status_code
+        tornado_handle._headers = headers
         return tornado_handle
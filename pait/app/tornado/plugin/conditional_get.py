@@ -0,0 +1,50 @@
+import asyncio
+from contextvars import copy_context
+from functools import partial
+from typing import Any, Dict, Optional
+
+from tornado.web import RequestHandler
+
+from pait.app.tornado.plugin.unified_response import UnifiedResponsePluginProtocol
+from pait.model.context import ContextModel as PluginContext
+from pait.plugin.conditional_get import CacheControl
+from pait.plugin.conditional_get import ConditionalGetPlugin as _ConditionalGetPlugin
+
+__all__ = ["ConditionalGetPlugin", "CacheControl"]
+
+
+class ConditionalGetPlugin(UnifiedResponsePluginProtocol, _ConditionalGetPlugin):
+    """The response is written to the tornado handler, so the plugin modifies the handler directly"""
+
+    async def __call__(self, context: PluginContext) -> Any:
+        # Compatible with tornado cannot call sync routing function
+        if self._is_async_func:
+            return await self._async_call(context)
+        else:
+            return await asyncio.get_event_loop().run_in_executor(
+                None, partial(copy_context().run, partial(self._sync_call, context))
+            )
+
+    def _gen_response(self, return_value: Any, context: PluginContext) -> Any:
+        # The response has been written to the handler (e.g. the cache hit or the route function writes it)
+        if return_value is None or return_value is context.cbv_instance:
+            return None
+        return super()._gen_response(return_value, context)
+
+    def _get_body(self, response: Any, context: PluginContext) -> Optional[bytes]:
+        tornado_handle: RequestHandler = context.cbv_instance  # type: ignore[assignment]
+        if tornado_handle.get_status() != 200:
+            return None
+        return b"".join(tornado_handle._write_buffer)
+
+    def _set_headers(self, response: Any, headers: Dict[str, str], context: PluginContext) -> Any:
+        tornado_handle: RequestHandler = context.cbv_instance  # type: ignore[assignment]
+        for key, value in headers.items():
+            tornado_handle.set_header(key, value)
+        return response
+
+    def _gen_not_modified_response(self, headers: Dict[str, str], context: PluginContext) -> Any:
+        tornado_handle: RequestHandler = context.cbv_instance  # type: ignore[assignment]
+        tornado_handle._write_buffer = []
+        tornado_handle.set_status(304)
+        return self._set_headers(None, headers, context)
@@ -1,33 +1,17 @@
-from typing import Any
+from typing import Any, Dict
 
-import aiofiles  # type: ignore
 from tornado.web import RequestHandler
 
-from pait.app.tornado.adapter.response import gen_response, set_info_to_response
 from pait.model.context import ContextModel as PluginContext
 from pait.plugin.mock_response import MockPluginProtocol
 
 
 class MockPlugin(MockPluginProtocol[None]):
-    tornado_handle: RequestHandler
-
-    def get_response(self) -> None:
-        return gen_response(
-            self.pait_response_model.get_example_value(example_column_name=self.example_column_name),
-            self.pait_response_model,
-            self.tornado_handle,
-        )
-
-    def set_info_to_response(self, resp: None) -> None:
-        set_info_to_response(self.tornado_handle, self.pait_response_model)
-
-    async def async_get_file_response(self, temporary_file: Any, f: Any) -> None:
-        await f.write(self.pait_response_model.get_example_value(example_column_name=self.example_column_name))
-        await f.seek(0)
-        async for line in f:
-            self.tornado_handle.write(line)
-        await temporary_file.__aexit__(None, None, None)
-
-    async def __call__(self, context: PluginContext) -> Any:
-        self.tornado_handle = context.args[0]
-        await super().__call__(context)
+    def get_payload_response(self, body: bytes, header_dict: Dict[str, Any], context: PluginContext) -> None:
+        tornado_handle: RequestHandler = context.args[0]
+        tornado_handle.set_status(self.pait_response_model.status_code[0])
+        for k, v in header_dict.items():
+            tornado_handle.set_header(k, v)
+        tornado_handle.set_header("Content-Type", self.pait_response_model.media_type)
+        tornado_handle.write(body)
+        return None
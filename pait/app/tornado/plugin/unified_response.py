@@ -3,18 +3,21 @@ from contextvars import copy_context
 from functools import partial
 from typing import Any
 
-from pait.app.tornado.adapter.response import gen_response
+from pait.app.tornado.adapter.response import gen_response_builder
 from pait.model.context import ContextModel as PluginContext
 from pait.plugin.unified_response import UnifiedResponsePlugin as BaseUnifiedResponsePlugin
 from pait.plugin.unified_response import UnifiedResponsePluginProtocol as BaseUnifiedResponsePluginProtocol
 
 
 def _gen_response(self: BaseUnifiedResponsePluginProtocol, return_value: Any, context: PluginContext) -> Any:
-    return gen_response(return_value, self.response_model_class, context.cbv_instance, *context.args, **context.kwargs)
+    return self.response_builder(  # type: ignore[misc]
+        return_value, context.cbv_instance, *context.args, **context.kwargs
+    )
 
 
 class UnifiedResponsePlugin(BaseUnifiedResponsePlugin):
     _gen_response = _gen_response
+    _gen_response_builder = staticmethod(gen_response_builder)
 
     async def __call__(self, context: PluginContext) -> Any:
         # Compatible with tornado cannot call sync routing function
@@ -28,3 +31,4 @@ class UnifiedResponsePlugin(BaseUnifiedResponsePlugin):
 
 class UnifiedResponsePluginProtocol(BaseUnifiedResponsePluginProtocol):
     _gen_response = _gen_response
+    _gen_response_builder = staticmethod(gen_response_builder)
@@ -1,6 +1,7 @@
 import inspect
+from contextvars import Token
 from functools import wraps
-from typing import TYPE_CHECKING, Any, Callable, List, Optional, Tuple, Type, TypeVar
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, List, Optional, Tuple, Type, TypeVar
 
 from pait.app.base import BaseAppHelper
 from pait.extra.util import sync_config_data_to_pait_core_model
@@ -22,6 +23,16 @@ _PaitT = TypeVar("_PaitT", bound="Pait")
 _PluginT = TypeVar("_PluginT", bound="PluginProtocol")
 
 
+async def _release_context_after_await(
+    awaitable: Awaitable, context: ContextModel, token: "Token[ContextModel]"
+) -> Any:
+    try:
+        return await awaitable
+    finally:
+        pait_context.reset(token)
+        context.release()
+
+
 class Pait(object):
     app_helper_class: "Type[BaseAppHelper]"
     param_handler_plugin_class: Type[ParamHandler] = ParamHandler
@@ -206,14 +217,13 @@ class Pait(object):
     def init_context(pait_core_model: "PaitCoreModel", args: Any, kwargs: Any) -> ContextModel:
         """Inject App Helper into context"""
         app_helper: "BaseAppHelper" = pait_core_model.app_helper_class(args, kwargs)
-        context: ContextModel = ContextModel(
+        context: ContextModel = ContextModel.create(
             cbv_instance=app_helper.cbv_instance,
             app_helper=app_helper,
             pait_core_model=pait_core_model,
             args=args,
             kwargs=kwargs,
         )
-        pait_context.set(context)
         return context
 
     def __call__(
@@ -289,9 +299,6 @@ class Pait(object):
         )
 
         def wrapper(func: Callable) -> Callable:
-            # Pre-parsing function signatures
-            get_func_sig(func)
-
             # load param handler plugin
             _param_handler_plugin = param_handler_plugin or self._param_handler_plugin
             if _param_handler_plugin is None:
@@ -320,6 +327,9 @@ class Pait(object):
                 default_field_class=default_field_class or self._default_field_class,
                 **(kwargs or self.extra),
             )
+            if not pait_core_model.lazy_load:
+                # Pre-parsing function signatures
+                get_func_sig(func)
             sync_config_data_to_pait_core_model(config, pait_core_model)
             pait_data.register(app_name, pait_core_model)
             if inspect.iscoroutinefunction(func):
@@ -327,7 +337,13 @@ class Pait(object):
                 @wraps(func)
                 async def dispatch(*args: Any, **kwargs: Any) -> Callable:
                     context: ContextModel = self.init_context(pait_core_model, args, kwargs)
-                    return await pait_core_model.main_plugin(context)
+                    token = pait_context.set(context)
+                    try:
+                        return await pait_core_model.main_plugin(context)
+                    finally:
+                        # The context may be reused after it is released, so it can not be got by `get_ctx`
+                        pait_context.reset(token)
+                        context.release()
 
                 return dispatch
             else:
@@ -335,7 +351,20 @@ class Pait(object):
                 @wraps(func)
                 def dispatch(*args: Any, **kwargs: Any) -> Callable:
                     context = self.init_context(pait_core_model, args, kwargs)
-                    return pait_core_model.main_plugin(context)
+                    token = pait_context.set(context)
+                    is_awaitable: bool = False
+                    try:
+                        result = pait_core_model.main_plugin(context)
+                        if inspect.isawaitable(result):
+                            # e.g. tornado runs the sync route function in the executor,
+                            # the context is released after the awaitable is done
+                            is_awaitable = True
+                            return _release_context_after_await(result, context, token)  # type: ignore[return-value]
+                        return result
+                    finally:
+                        if not is_awaitable:
+                            pait_context.reset(token)
+                            context.release()
 
                 return dispatch
 
@@ -1,6 +1,8 @@
 import copy
 import logging
-from typing import TYPE_CHECKING, Any, Dict, Optional, Set, Union
+import threading
+from bisect import bisect_left
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterator, List, Optional, Set, Tuple, Union
 
 if TYPE_CHECKING:
     from pait.model.core import PaitCoreModel
@@ -31,9 +33,31 @@ class PaitCoreProxyModel(object):
         return core_model  # type: ignore
 
 
+# The key is the attribute of the core model, the value is the key of the index affected by the attribute
+_index_attr_dict: Dict[str, str] = {
+    "status": "status",
+    "group": "group",
+    "tag": "tag",
+    "method_list": "method_list",
+    "block_http_method_set": "method_list",
+    "path": "path",
+}
+# Get the values of the core model used as the key of the index
+_index_value_func_dict: Dict[str, Callable[["PaitCoreModel"], Any]] = {
+    "status": lambda core_model: (core_model.status,),
+    "group": lambda core_model: (core_model.group,),
+    "tag": lambda core_model: tuple(i.name for i in core_model.tag),
+    "method_list": lambda core_model: tuple(core_model.method_list),
+}
+
+
 class PaitData(object):
     def __init__(self) -> None:
         self.pait_id_dict: Dict[str, Dict[str, "PaitCoreModel"]] = {}
+        # The index of the core model by the attribute used by MatchRule, it is built when it is used for the first
+        # time and is dropped when the attribute of any core model is changed
+        self._index_dict: Dict[str, Dict[Any, Set["PaitCoreModel"]]] = {}
+        self._path_index: Optional[Tuple[List[str], List["PaitCoreModel"]]] = None
 
     def register(self, app_name: str, pait_info_model: "PaitCoreModel") -> None:
         """Store the data of each routing handle"""
@@ -41,6 +65,58 @@ class PaitData(object):
         if app_name not in self.pait_id_dict:
             self.pait_id_dict[app_name] = {}
         self.pait_id_dict[app_name][pait_id] = pait_info_model
+        if self._on_core_model_change not in pait_info_model._change_notify_list:
+            pait_info_model.add_change_notify(self._on_core_model_change)
+        self._clear_index()
+
+    def iter_core_model(self) -> Iterator["PaitCoreModel"]:
+        for real_pait_id_dict in self.pait_id_dict.values():
+            yield from real_pait_id_dict.values()
+
+    def _clear_index(self) -> None:
+        self._index_dict.clear()
+        self._path_index = None
+
+    def _on_core_model_change(self, core_model: "PaitCoreModel", key: str, value: Any) -> None:
+        index_key: Optional[str] = _index_attr_dict.get(key, None)
+        if index_key == "path":
+            self._path_index = None
+        elif index_key:
+            self._index_dict.pop(index_key, None)
+
+    def get_index_set(self, key: str, value: Any) -> Optional[Set["PaitCoreModel"]]:
+        """Get the core models whose attribute(status, group, tag name or method) contains the value,
+        return None if the key or value is not supported by the index"""
+        index: Optional[Dict[Any, Set["PaitCoreModel"]]] = self._index_dict.get(key, None)
+        if index is None:
+            value_func = _index_value_func_dict.get(key, None)
+            if value_func is None:
+                return None
+            index = {}
+            for core_model in self.iter_core_model():
+                for index_value in value_func(core_model):
+                    index.setdefault(index_value, set()).add(core_model)
+            self._index_dict[key] = index
+        try:
+            return index.get(value, set())
+        except TypeError:
+            # unhashable value
+            return None
+
+    def get_path_prefix_set(self, prefix: str) -> Optional[Set["PaitCoreModel"]]:
+        """Get the core models whose path starts with the prefix, return None if the prefix is empty"""
+        if not prefix:
+            return None
+        if self._path_index is None:
+            sorted_list = sorted(((i.path, i) for i in self.iter_core_model()), key=lambda x: x[0])
+            self._path_index = ([i[0] for i in sorted_list], [i[1] for i in sorted_list])
+        path_list, core_model_list = self._path_index
+        result_set: Set["PaitCoreModel"] = set()
+        index: int = bisect_left(path_list, prefix)
+        while index < len(path_list) and path_list[index].startswith(prefix):
+            result_set.add(core_model_list[index])
+            index += 1
+        return result_set
 
     def get_pait_data(self, app_name: str, pait_id: str) -> "PaitCoreModel":
         """Get route handle data"""
@@ -82,5 +158,31 @@ class PaitData(object):
             operation_id = model.operation_id
         return PaitCoreProxyModel(core_model=model, operation_id=operation_id)  # type: ignore
 
+    def warm_up(self, app_name: Optional[str] = None) -> Dict[str, Exception]:
+        """Load the plugin stack of each route (the deferred pre-check is executed in lazy load mode),
+        return the exception of the route that failed to load, the key is pait id"""
+        error_dict: Dict[str, Exception] = {}
+        for _app_name, real_pait_id_dict in self.pait_id_dict.items():
+            if app_name and app_name != _app_name:
+                continue
+            for pait_id, pait_core_model in list(real_pait_id_dict.items()):
+                try:
+                    pait_core_model.load()
+                except Exception as e:
+                    error_dict[pait_id] = e
+        return error_dict
+
+    def warm_up_in_background(self, app_name: Optional[str] = None) -> threading.Thread:
+        """Warm up the routes in the daemon thread, so the worker can start serving without waiting for the
+        pre-check, the exception of the route is logged and raised again at the first call of the route"""
+
+        def _warm_up() -> None:
+            for pait_id, exc in self.warm_up(app_name).items():
+                logging.error(f"warm up pait id:{pait_id} fail: {exc}")
+
+        thread: threading.Thread = threading.Thread(target=_warm_up, name="pait-warm-up", daemon=True)
+        thread.start()
+        return thread
+
     def __bool__(self) -> bool:
         return bool(self.pait_id_dict)
@@ -0,0 +1,53 @@
+"""Run the pre-check of all routes of the app, e.g:
+
+    python -m pait.extra.cli example.flask_example.main_example:create_app()
+
+It is suitable for the CI, so that the worker can start in lazy load mode (`PAIT_LAZY_LOAD=1`)
+without executing the pre-check of the route at startup
+"""
+import argparse
+import os
+import sys
+from typing import Dict, Optional, Sequence
+
+from pait.g import pait_data
+from pait.model import core
+from pait.openapi.cli import import_app
+
+__all__ = ["check_app", "main"]
+
+
+def check_app(app_path: str) -> Dict[str, Exception]:
+    """Import the app and load all routes, return the exception of the route that failed to pass the pre-check.
+
+    The routes are declared in lazy load mode, so the pre-check of every route is executed
+    instead of stopping at the first failed route
+    """
+    raw_lazy_load: bool = core.default_lazy_load
+    core.default_lazy_load = True
+    try:
+        import_app(app_path)
+    finally:
+        core.default_lazy_load = raw_lazy_load
+    return pait_data.warm_up()
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Run the pre-check of all routes of the app")
+    parser.add_argument("app", help="The app path, `module:attr` or `module:factory()`")
+    args = parser.parse_args(argv)
+
+    # Support importing the app from the current working directory
+    if os.getcwd() not in sys.path:
+        sys.path.insert(0, os.getcwd())
+    error_dict: Dict[str, Exception] = check_app(args.app)
+    for pait_id, exc in error_dict.items():
+        print(f"{pait_id}: {exc}", file=sys.stderr)
+    route_cnt: int = sum(len(i) for i in pait_data.pait_id_dict.values())
+    print(f"check {route_cnt} routes, {len(error_dict)} failed")
+    if error_dict:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
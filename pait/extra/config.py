@@ -1,5 +1,5 @@
 import re
-from typing import TYPE_CHECKING, Any, Callable, List, Optional, Set, Tuple, Type
+from typing import TYPE_CHECKING, Any, Callable, Iterable, List, Optional, Pattern, Set, Tuple, Type
 
 from pydantic import BaseModel
 
@@ -9,6 +9,7 @@ from pait.types import Literal
 from pait.util import http_method_tuple
 
 if TYPE_CHECKING:
+    from pait.data import PaitData
     from pait.model.config import APPLY_FN
     from pait.model.core import PaitCoreModel
     from pait.param_handle import BaseParamHandler
@@ -21,6 +22,7 @@ __all__ = [
     "apply_block_http_method_set",
     "apply_pre_depend",
     "MatchRule",
+    "ApplyFunc",
 ]
 
 
@@ -39,12 +41,38 @@ MatchKeyLiteral = Literal[
 ]
 
 
+_regex_special_char_set: Set[str] = set(".^$*+?{}[]\\|()")
+
+
+def _get_literal_prefix(pattern: str) -> str:
+    """Get the literal prefix of the regex, e.g. `/api/user/\\d+` -> `/api/user/`"""
+    if "|" in pattern:
+        # The alternative branches have different prefixes
+        return ""
+    prefix_list: List[str] = []
+    for char in pattern:
+        if char in _regex_special_char_set:
+            # The char before the quantifier is optional
+            if char in "*?{" and prefix_list:
+                prefix_list.pop()
+            break
+        prefix_list.append(char)
+    return "".join(prefix_list)
+
+
 class MatchRule(object):
     def __init__(self, key: MatchKeyLiteral = "all", target: Any = None):
         self.key: MatchKeyLiteral = key
         self.target: Any = target
         self._match_rule_list: List[Tuple[str, "MatchRule"]] = []
 
+        # The key and target are parsed once instead of every match
+        self._is_reverse: bool = key.startswith("!")
+        self._real_key: str = key[1:] if self._is_reverse else key
+        self._pattern: Optional[Pattern] = None
+        if self._real_key == "path":
+            self._pattern = re.compile(target)
+
     def match(self, pait_core_model: "PaitCoreModel") -> bool:
         result: bool = self._match(pait_core_model)
         for method, match_rule in self._match_rule_list:
@@ -59,14 +87,10 @@ class MatchRule(object):
         if the key is `all` then match
         if the key is prefixed with ! then the result will be reversed
         """
-        key: MatchKeyLiteral = self.key
+        key: str = self._real_key
         target: Any = self.target
         if key == "all":
             return True
-        is_reverse: bool = False
-        if key.startswith("!"):
-            key = key[1:]  # type: ignore
-            is_reverse = True
 
         value: Any = getattr(pait_core_model, key, ...)
         if value is ...:
@@ -76,15 +100,55 @@ class MatchRule(object):
         elif key in ("tag", "method_list"):
             result = target in value
         elif key == "path":
-            result = bool(re.match(target, value))
+            result = bool(self._pattern.match(value))  # type: ignore[union-attr]
         else:
             raise KeyError(f"Not support key:{key}")
 
-        if is_reverse:
+        if self._is_reverse:
             return not result
         else:
             return result
 
+    def _get_candidate_set(self, pait_data: "PaitData") -> "Optional[Set[PaitCoreModel]]":
+        """Get the core models that may be matched through the index of pait data,
+        return None if the rule can not be narrowed by the index (e.g. `all` or the reversed key)"""
+        if self._is_reverse or self._real_key == "all":
+            return None
+        if self._real_key in ("status", "group"):
+            return pait_data.get_index_set(self._real_key, self.target)
+        elif self._real_key == "tag":
+            return pait_data.get_index_set(self._real_key, getattr(self.target, "name", self.target))
+        elif self._real_key == "method_list":
+            return pait_data.get_index_set(self._real_key, self.target)
+        elif self._real_key == "path":
+            return pait_data.get_path_prefix_set(_get_literal_prefix(self.target))
+        return None
+
+    def get_candidate_set(self, pait_data: "PaitData") -> "Optional[Set[PaitCoreModel]]":
+        """Get the superset of the core models matched by the rule (including the combined rules)"""
+        candidate_set: "Optional[Set[PaitCoreModel]]" = self._get_candidate_set(pait_data)
+        for method, match_rule in self._match_rule_list:
+            other_candidate_set = match_rule.get_candidate_set(pait_data)
+            if method == "or":
+                if candidate_set is None or other_candidate_set is None:
+                    candidate_set = None
+                else:
+                    candidate_set = candidate_set | other_candidate_set
+            elif method == "and" and other_candidate_set is not None:
+                if candidate_set is None:
+                    candidate_set = other_candidate_set
+                else:
+                    candidate_set = candidate_set & other_candidate_set
+        return candidate_set
+
+    def filter(self, pait_data: "PaitData") -> "List[PaitCoreModel]":
+        """Get the matched core models of pait data, only the candidates found by the index are matched"""
+        core_model_list: "Iterable[PaitCoreModel]" = pait_data.iter_core_model()
+        candidate_set = self.get_candidate_set(pait_data)
+        if candidate_set is not None:
+            core_model_list = (i for i in core_model_list if i in candidate_set)
+        return [i for i in core_model_list if self.match(i)]
+
     def __or__(self, other: "MatchRule") -> "MatchRule":
         self._match_rule_list.append(("or", other))
         return self
@@ -101,6 +165,30 @@ def _is_match(pait_core_model: "PaitCoreModel", match_rule: Optional["MatchRule"
     return not match_rule or match_rule.match(pait_core_model)
 
 
+class ApplyFunc(object):
+    """The apply func that only applies to the core model matched by the match rule.
+
+    When the config data is synchronized to pait data,
+    the matched core models are found by the index of pait data instead of matching every core model
+    """
+
+    def __init__(self, func: Callable[["PaitCoreModel"], None], match_rule: Optional[MatchRule] = None) -> None:
+        self.func: Callable[["PaitCoreModel"], None] = func
+        self.match_rule: Optional[MatchRule] = match_rule
+
+    def __call__(self, pait_core_model: "PaitCoreModel") -> None:
+        if _is_match(pait_core_model, self.match_rule):
+            self.func(pait_core_model)
+
+    def apply_to_pait_data(self, pait_data: "PaitData") -> None:
+        if self.match_rule is None:
+            core_model_list: "Iterable[PaitCoreModel]" = list(pait_data.iter_core_model())
+        else:
+            core_model_list = self.match_rule.filter(pait_data)
+        for pait_core_model in core_model_list:
+            self.func(pait_core_model)
+
+
 def apply_extra_openapi_model(
     extra_openapi_model: Type[BaseModel], match_rule: Optional["MatchRule"] = None
 ) -> "APPLY_FN":
@@ -109,10 +197,9 @@ def apply_extra_openapi_model(
     """
 
     def _apply(pait_core_model: "PaitCoreModel") -> None:
-        if _is_match(pait_core_model, match_rule):
-            pait_core_model.extra_openapi_model_list = [extra_openapi_model]
+        pait_core_model.extra_openapi_model_list = [extra_openapi_model]
 
-    return _apply
+    return ApplyFunc(_apply, match_rule)
 
 
 def apply_response_model(
@@ -123,10 +210,9 @@ def apply_response_model(
     """
 
     def _apply(pait_core_model: "PaitCoreModel") -> None:
-        if _is_match(pait_core_model, match_rule):
-            pait_core_model.add_response_model_list(response_model_list)
+        pait_core_model.add_response_model_list(response_model_list)
 
-    return _apply
+    return ApplyFunc(_apply, match_rule)
 
 
 def apply_block_http_method_set(
@@ -143,44 +229,40 @@ def apply_block_http_method_set(
             raise ValueError(f"Error http method: {block_http_method}")
 
     def _apply(pait_core_model: "PaitCoreModel") -> None:
-        if _is_match(pait_core_model, match_rule):
-            pait_core_model.block_http_method_set = block_http_method_set
-            pait_core_model.method_list = pait_core_model.method_list
+        pait_core_model.block_http_method_set = block_http_method_set
+        pait_core_model.method_list = pait_core_model.method_list
 
-    return _apply
+    return ApplyFunc(_apply, match_rule)
 
 
 def apply_multi_plugin(
     plugin_manager_fn_list: List[Callable[[], PluginManager]], match_rule: Optional["MatchRule"] = None
 ) -> "APPLY_FN":
     def _apply(pait_core_model: "PaitCoreModel") -> None:
-        if _is_match(pait_core_model, match_rule):
-            pre_plugin_manager_list: List[PluginManager] = []
-            post_plugin_manager_list: List[PluginManager] = []
-            for plugin_manager_fn in plugin_manager_fn_list:
-                plugin_manager: PluginManager = plugin_manager_fn()
-                if issubclass(plugin_manager.plugin_class, PrePluginProtocol):
-                    pre_plugin_manager_list.append(plugin_manager)
-                else:
-                    post_plugin_manager_list.append(plugin_manager)
-            pait_core_model.add_plugin(pre_plugin_manager_list, post_plugin_manager_list)
+        pre_plugin_manager_list: List[PluginManager] = []
+        post_plugin_manager_list: List[PluginManager] = []
+        for plugin_manager_fn in plugin_manager_fn_list:
+            plugin_manager: PluginManager = plugin_manager_fn()
+            if issubclass(plugin_manager.plugin_class, PrePluginProtocol):
+                pre_plugin_manager_list.append(plugin_manager)
+            else:
+                post_plugin_manager_list.append(plugin_manager)
+        pait_core_model.add_plugin(pre_plugin_manager_list, post_plugin_manager_list)
 
-    return _apply
+    return ApplyFunc(_apply, match_rule)
 
 
 def apply_pre_depend(pre_depend: Callable, match_rule: Optional["MatchRule"] = None) -> "APPLY_FN":
     def _apply(pait_core_model: "PaitCoreModel") -> None:
-        if _is_match(pait_core_model, match_rule):
-            pait_core_model.pre_depend_list.append(pre_depend)
+        pait_core_model.pre_depend_list.append(pre_depend)
 
-    return _apply
+    return ApplyFunc(_apply, match_rule)
 
 
 def apply_param_handler(
     param_handler_plugin: "Type[BaseParamHandler]", match_rule: Optional["MatchRule"] = None
 ) -> "APPLY_FN":
     def _apply(pait_core_model: "PaitCoreModel") -> None:
-        if _is_match(pait_core_model, match_rule):
-            pait_core_model.param_handler_plugin = param_handler_plugin
+        pait_core_model.param_handler_plugin = param_handler_plugin
 
-    return _apply
+    return ApplyFunc(_apply, match_rule)
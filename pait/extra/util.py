@@ -1,17 +1,18 @@
-from typing import TYPE_CHECKING, Any
+from contextlib import ExitStack
+from typing import TYPE_CHECKING, Any, List
 
 from pait.model.status import PaitStatus
 
 if TYPE_CHECKING:
+    from pait.data import PaitData
     from pait.model.config import Config
     from pait.model.core import PaitCoreModel
 
 
-__all__ = ["sync_config_data_to_pait_core_model"]
+__all__ = ["sync_config_data_to_pait_core_model", "sync_config_data_to_pait_data"]
 
 
-def sync_config_data_to_pait_core_model(config: "Config", pait_core_model: "PaitCoreModel", **kwargs: Any) -> None:
-    """Synchronize the config data to the corresponding pait core model"""
+def _sync_base_config_data(config: "Config", pait_core_model: "PaitCoreModel") -> None:
     if not pait_core_model.author:
         pait_core_model.author = config.author
     if not pait_core_model.status or pait_core_model.status is PaitStatus.undefined:
@@ -19,6 +20,37 @@ def sync_config_data_to_pait_core_model(config: "Config", pait_core_model: "Pait
     if not pait_core_model.response_model_list:
         pait_core_model.add_response_model_list(config.default_response_model_list)
 
+
+def sync_config_data_to_pait_core_model(config: "Config", pait_core_model: "PaitCoreModel", **kwargs: Any) -> None:
+    """Synchronize the config data to the corresponding pait core model"""
+    _sync_base_config_data(config, pait_core_model)
+
     if config.apply_func_list:
+        with pait_core_model.defer_build_plugin_stack():
+            for apply_func in config.apply_func_list:
+                apply_func(pait_core_model)
+
+
+def sync_config_data_to_pait_data(config: "Config", pait_data: "PaitData") -> None:
+    """Synchronize the config data to all pait core models of pait data.
+
+    The apply func created by `pait.extra.config` only touches the core models found by the index of pait data,
+    and the plugin stack of each core model is only rebuilt once after all apply funcs are applied
+    """
+    from pait.extra.config import ApplyFunc
+
+    core_model_list: List["PaitCoreModel"] = list(pait_data.iter_core_model())
+    for pait_core_model in core_model_list:
+        _sync_base_config_data(config, pait_core_model)
+    if not config.apply_func_list:
+        return
+
+    with ExitStack() as stack:
+        for pait_core_model in core_model_list:
+            stack.enter_context(pait_core_model.defer_build_plugin_stack())
         for apply_func in config.apply_func_list:
-            apply_func(pait_core_model)
+            if isinstance(apply_func, ApplyFunc):
+                apply_func.apply_to_pait_data(pait_data)
+            else:
+                for pait_core_model in core_model_list:
+                    apply_func(pait_core_model)
@@ -1,20 +1,36 @@
 from typing import Any, Callable, TypeVar
 
+from typing_extensions import Literal
+
 from pait.field.base import BaseField
 from pait.types import CallType, ParamSpec
 
 P = ParamSpec("P")
 R_T = TypeVar("R_T")
+DependScopeType = Literal["request", "app"]
 
 
 class Depends(BaseField):
-    def __init__(self, func: CallType):
+    def __init__(self, func: CallType, use_cache: bool = True, scope: DependScopeType = "request"):
+        """
+        :param func: depend callable
+        :param use_cache: If True, the result of the callable is cached in the request,
+            and the callable is only called once even if it is depended on by multiple places of the route
+        :param scope: If it is `app`, the callable is only called once in the life of the app,
+            and the result is saved in the app attribute.
+        """
+        if scope not in ("request", "app"):
+            raise ValueError(f"Depends scope must be `request` or `app`, not {scope}")
         self.func: CallType = func
+        self.use_cache: bool = use_cache
+        self.scope: DependScopeType = scope
 
     @classmethod
-    def i(cls, func: CallType) -> Any:
-        return cls(func)
+    def i(cls, func: CallType, use_cache: bool = True, scope: DependScopeType = "request") -> Any:
+        return cls(func, use_cache=use_cache, scope=scope)
 
     @classmethod
-    def t(cls, func: Callable[P, R_T]) -> R_T:  # type: ignore
-        return cls(func)  # type: ignore
+    def t(
+        cls, func: Callable[P, R_T], use_cache: bool = True, scope: DependScopeType = "request"
+    ) -> R_T:  # type: ignore
+        return cls(func, use_cache=use_cache, scope=scope)  # type: ignore
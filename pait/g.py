@@ -2,7 +2,7 @@ from contextvars import ContextVar
 from typing import TYPE_CHECKING, Any
 
 from pait.data import PaitData
-from pait.extra.util import sync_config_data_to_pait_core_model
+from pait.extra.util import sync_config_data_to_pait_data
 from pait.model import config as config_model
 from pait.model import tag
 
@@ -30,9 +30,7 @@ _real_config_init_config_method = config.init_config
 
 def _after_config_init(*args: Any, **kwargs: Any) -> None:
     _real_config_init_config_method(*args, **kwargs)
-    for app_name, real_pait_id_dict in pait_data.pait_id_dict.items():
-        for pait_id, pait_info_model in real_pait_id_dict.items():
-            sync_config_data_to_pait_core_model(config, pait_info_model)
+    sync_config_data_to_pait_data(config, pait_data)
 
 
 setattr(config, config.init_config.__name__, _after_config_init)
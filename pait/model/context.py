@@ -1,5 +1,5 @@
-from dataclasses import MISSING, dataclass, field
-from typing import TYPE_CHECKING, Any, Dict, Optional, Sequence
+from dataclasses import MISSING
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Sequence
 
 if TYPE_CHECKING:
     from pait.app.base import BaseAppHelper
@@ -9,25 +9,94 @@ if TYPE_CHECKING:
 __all__ = ["ContextModel"]
 
 
-@dataclass
 class ContextModel(object):
-    cbv_instance: Optional[Any]
-    app_helper: "BaseAppHelper"
-    pait_core_model: "PaitCoreModel"
-    # If it is a pre plugin,
-    #   args and kwargs are the parameters for the corresponding web framework to call the route.
-    # If it is a post plugin,
-    #   args and kwargs are the parameters filled in by the developer to write the routing function.
-    args: Sequence
-    kwargs: dict
-
-    # If it is not used, then it is not initialized, saving memory footprint
-    state: Dict[str, Any] = field(init=False)
+    # Use `__slots__` to reduce the memory footprint and creation time of the context of each request
+    __slots__ = (
+        "cbv_instance",
+        "app_helper",
+        "pait_core_model",
+        "args",
+        "kwargs",
+        "state",
+        "depend_cache",
+        "contextmanager_list",  # use by param handler
+        "is_retained",
+    )
+    # The max number of the released context that can be reused, if it is 0, the context will not be reused.
+    # Note: If the context is still used after the request is over (e.g. background task), call `retain` first
+    free_list_max_size: int = 0
+    _free_list: List["ContextModel"] = []
+
+    def __init__(
+        self,
+        cbv_instance: Optional[Any],
+        app_helper: "BaseAppHelper",
+        pait_core_model: "PaitCoreModel",
+        args: Sequence,
+        kwargs: dict,
+    ) -> None:
+        self.cbv_instance: Optional[Any] = cbv_instance
+        self.app_helper: "BaseAppHelper" = app_helper
+        self.pait_core_model: "PaitCoreModel" = pait_core_model
+        # If it is a pre plugin,
+        #   args and kwargs are the parameters for the corresponding web framework to call the route.
+        # If it is a post plugin,
+        #   args and kwargs are the parameters filled in by the developer to write the routing function.
+        self.args: Sequence = args
+        self.kwargs: dict = kwargs
+
+    if TYPE_CHECKING:
+        # If it is not used, then it is not initialized, saving memory footprint
+        state: Dict[str, Any]
+        # The result of the depends resolved in the current request, key is the depend callable
+        depend_cache: Dict[Any, Any]
+        # Whether the context is still used after the request is over
+        is_retained: bool
+
+    @classmethod
+    def create(
+        cls,
+        cbv_instance: Optional[Any],
+        app_helper: "BaseAppHelper",
+        pait_core_model: "PaitCoreModel",
+        args: Sequence,
+        kwargs: dict,
+    ) -> "ContextModel":
+        """Create the context, if there is a released context, reuse it"""
+        if cls._free_list:
+            try:
+                context = cls._free_list.pop()
+            except IndexError:  # pragma: no cover
+                # Other threads have taken the last context
+                pass
+            else:
+                context.__init__(cbv_instance, app_helper, pait_core_model, args, kwargs)  # type: ignore[misc]
+                return context
+        return cls(cbv_instance, app_helper, pait_core_model, args, kwargs)
+
+    def retain(self) -> None:
+        """Mark the context as still used after the request is over (e.g. it is handed over to the background task),
+        the retained context is not cleaned and reused by the next request when it is released"""
+        self.is_retained = True
+
+    def release(self) -> None:
+        """Clean the context and put it into the free list, it can not be used after release"""
+        if len(self._free_list) >= self.free_list_max_size or hasattr(self, "is_retained"):
+            return
+        for key in self.__slots__:
+            if hasattr(self, key):
+                delattr(self, key)
+        self._free_list.append(self)
 
     def _init_state(self) -> None:
         if not hasattr(self, "state"):
             self.state = {}
 
+    def get_depend_cache(self) -> Dict[Any, Any]:
+        if not hasattr(self, "depend_cache"):
+            self.depend_cache = {}
+        return self.depend_cache
+
     def set_to_state(self, key: str, value: Any) -> None:
         self._init_state()
         self.state[key] = value
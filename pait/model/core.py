@@ -1,7 +1,9 @@
 import copy
 import logging
+import threading
 import traceback
-from typing import TYPE_CHECKING, Any, Callable, List, Optional, Set, Tuple, Type
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Any, Callable, Iterator, List, Optional, Set, Tuple, Type
 from urllib.parse import quote_plus
 
 from pydantic import BaseModel
@@ -10,8 +12,9 @@ from pait.model.response import BaseResponseModel, PaitResponseModel
 from pait.model.status import PaitStatus
 from pait.model.tag import Tag
 from pait.param_handle import BaseParamHandler
-from pait.plugin import PluginManager, PluginProtocol, PostPluginProtocol, PrePluginProtocol
+from pait.plugin import PluginManager, PluginProtocol, PostPluginProtocol, PrePluginProtocol, fuse_plugin
 from pait.util import ImmutableDict, gen_tip_exc, ignore_pre_check
+from pait.util import lazy_load as default_lazy_load
 
 if TYPE_CHECKING:
     from pait.app.base import BaseAppHelper
@@ -20,6 +23,8 @@ if TYPE_CHECKING:
 
 __all__ = ["PaitCoreModel", "get_core_model"]
 ChangeNotifyType = Callable[["PaitCoreModel", str, Any], None]
+# The plugin stack of the route is only loaded once, the lock does not affect the request after loading
+_load_lock: threading.Lock = threading.Lock()
 
 
 def get_core_model(route: Callable) -> "PaitCoreModel":
@@ -31,7 +36,7 @@ def get_core_model(route: Callable) -> "PaitCoreModel":
 
 class PaitCoreModel(object):
     _param_handler_plugin: PluginManager["BaseParamHandler"]
-    _main_plugin: PluginProtocol
+    _main_plugin: Optional[PluginProtocol]
 
     def __init__(
         self,
@@ -55,6 +60,7 @@ class PaitCoreModel(object):
         plugin_list: Optional[List[PluginManager[PrePluginProtocol]]] = None,
         post_plugin_list: Optional[List[PluginManager[PostPluginProtocol]]] = None,
         feature_code: str = "",
+        lazy_load: Optional[bool] = None,
         **kwargs: Any,
     ):
         # pait
@@ -91,9 +97,14 @@ class PaitCoreModel(object):
             self.add_response_model_list(response_model_list)
 
         # pait plugin
+        # If lazy load, the hooks of the plugin are not executed until the plugin stack is loaded
+        self._lazy_load: bool = default_lazy_load if lazy_load is None else lazy_load
+        self._pending_plugin_manager_list: List[PluginManager] = []
+        self._defer_build_cnt: int = 0
+        self._main_plugin = None
         self._plugin_list: List[PluginManager] = []
         self._post_plugin_list: List[PluginManager] = []
-        self.param_handler_plugin = param_handler_plugin  # type: ignore
+        self._set_param_handler_plugin(param_handler_plugin)
         self.add_plugin(plugin_list, post_plugin_list)
 
         # change notify
@@ -134,17 +145,20 @@ class PaitCoreModel(object):
 
     @param_handler_plugin.setter
     def param_handler_plugin(self, param_handler_plugin: Type[BaseParamHandler]) -> None:
-        self._param_handler_plugin = PluginManager(param_handler_plugin)
+        self._set_param_handler_plugin(param_handler_plugin)
+        self._reload_plugin_stack()
 
+    def _set_param_handler_plugin(self, param_handler_plugin: Type[BaseParamHandler]) -> None:
+        self._param_handler_plugin = PluginManager(param_handler_plugin)
+        if self._lazy_load:
+            self._pending_plugin_manager_list.append(self._param_handler_plugin)
+            return
         try:
-            if not ignore_pre_check:
-                self._param_handler_plugin.pre_check_hook(self)
-            self._param_handler_plugin.pre_load_hook(self)
+            self._run_plugin_manager_hook(self._param_handler_plugin)
         except Exception as e:
             raise gen_tip_exc(
                 self.func, RuntimeError(f"set param plugin error: {e}" + "\n\n" + traceback.format_exc())
             ) from e
-        self.add_plugin([], [])
 
     @property
     def method_list(self) -> List[str]:
@@ -182,46 +196,109 @@ class PaitCoreModel(object):
     def extra_openapi_model_list(self, item: List[Type[BaseModel]]) -> None:
         self._extra_openapi_model_list.extend(item)
 
+    @property
+    def lazy_load(self) -> bool:
+        return self._lazy_load
+
     @property
     def main_plugin(self) -> PluginProtocol:
-        return self._main_plugin
+        main_plugin = self._main_plugin
+        if main_plugin is None:
+            main_plugin = self.load()
+        return main_plugin
+
+    def _get_plugin_manager_list(self) -> List[PluginManager]:
+        return [i for i in self._plugin_list] + [self._param_handler_plugin] + [i for i in self._post_plugin_list]
+
+    def _run_plugin_manager_hook(self, plugin_manager: PluginManager) -> None:
+        if not ignore_pre_check:
+            plugin_manager.pre_check_hook(self)
+        plugin_manager.pre_load_hook(self)
+
+    def _add_plugin_manager(self, plugin_manager: PluginManager) -> None:
+        if self._lazy_load:
+            self._pending_plugin_manager_list.append(plugin_manager)
+        else:
+            self._run_plugin_manager_hook(plugin_manager)
+
+    def _reload_plugin_stack(self) -> None:
+        if self._lazy_load or self._defer_build_cnt:
+            # The plugin stack is rebuilt at the next call (or at the end of defer_build_plugin_stack)
+            self._main_plugin = None
+        else:
+            self.build_plugin_stack()
+
+    @contextmanager
+    def defer_build_plugin_stack(self) -> Iterator[None]:
+        """The plugin stack is built once when exiting, instead of being rebuilt every time the plugin is changed
+        (e.g. multiple apply funcs add plugins to the route)"""
+        self._defer_build_cnt += 1
+        try:
+            yield
+        finally:
+            self._defer_build_cnt -= 1
+            if not self._defer_build_cnt and not self._lazy_load and self._main_plugin is None:
+                self.build_plugin_stack()
 
     def build_plugin_stack(self) -> None:
-        plugin_manager_list: List[PluginManager] = (
-            [i for i in self._plugin_list] + [self._param_handler_plugin] + [i for i in self._post_plugin_list]
-        )
-        self._main_plugin = self.func  # type: ignore
-        for plugin_manager in reversed(plugin_manager_list):
-            self._main_plugin = plugin_manager.get_plugin(self._main_plugin, self)
+        """Build the plugin stack, the plugins that only declare hooks are fused into one plugin"""
+        self._main_plugin = fuse_plugin(self._get_plugin_manager_list(), self.func, self)  # type: ignore[assignment]
+
+    def load(self) -> PluginProtocol:
+        """Execute the deferred hooks of the plugin and build the plugin stack, return the main plugin.
+
+        In lazy load mode, it is called at the first call of the route,
+        or it can be called in advance to warm up (e.g. `PaitData.warm_up`)
+        """
+        with _load_lock:
+            if self._main_plugin is not None:
+                return self._main_plugin
+            plugin_manager_list: List[PluginManager] = self._get_plugin_manager_list()
+            try:
+                while self._pending_plugin_manager_list:
+                    plugin_manager: PluginManager = self._pending_plugin_manager_list[0]
+                    # Ignore the plugin that has been replaced(e.g. param handler plugin)
+                    if any(plugin_manager is i for i in plugin_manager_list):
+                        self._run_plugin_manager_hook(plugin_manager)
+                    self._pending_plugin_manager_list.pop(0)
+            except Exception as e:
+                raise gen_tip_exc(
+                    self.func, RuntimeError(f"{self.func} load plugin error" + "\n\n" + traceback.format_exc())
+                ) from e
+            self.build_plugin_stack()
+            return self._main_plugin  # type: ignore[return-value]
 
     def add_plugin(
         self,
         plugin_list: Optional[List[PluginManager[PrePluginProtocol]]],
         post_plugin_list: Optional[List[PluginManager[PostPluginProtocol]]],
     ) -> None:
-        raw_plugin_list: List[PluginManager] = copy.deepcopy(self._plugin_list)
-        raw_post_plugin_list: List[PluginManager] = copy.deepcopy(self._post_plugin_list)
+        if self._lazy_load:
+            # The hooks have not been executed, the shallow copy is enough to roll back
+            raw_plugin_list: List[PluginManager] = self._plugin_list.copy()
+            raw_post_plugin_list: List[PluginManager] = self._post_plugin_list.copy()
+        else:
+            raw_plugin_list = copy.deepcopy(self._plugin_list)
+            raw_post_plugin_list = copy.deepcopy(self._post_plugin_list)
+        raw_pending_plugin_manager_list: List[PluginManager] = self._pending_plugin_manager_list.copy()
         try:
             for plugin_manager in plugin_list or []:
                 if issubclass(plugin_manager.plugin_class, PostPluginProtocol):
                     raise ValueError(f"{plugin_manager.plugin_class} is post plugin")
-                if not ignore_pre_check:
-                    plugin_manager.pre_check_hook(self)
-                plugin_manager.pre_load_hook(self)
+                self._add_plugin_manager(plugin_manager)
                 self._plugin_list.append(plugin_manager)
 
             for post_plugin_manager in post_plugin_list or []:
                 if issubclass(post_plugin_manager.plugin_class, PrePluginProtocol):
                     raise ValueError(f"{post_plugin_manager.plugin_class} is pre plugin")
-                if not ignore_pre_check:
-                    post_plugin_manager.pre_check_hook(self)
-                post_plugin_manager.pre_load_hook(self)
+                self._add_plugin_manager(post_plugin_manager)
                 self._post_plugin_list.append(post_plugin_manager)
         except Exception as e:
             self._plugin_list = raw_plugin_list
             self._post_plugin_list = raw_post_plugin_list
+            self._pending_plugin_manager_list = raw_pending_plugin_manager_list
             raise gen_tip_exc(
                 self.func, RuntimeError(f"{self.func} add plugin error" + "\n\n" + traceback.format_exc())
             ) from e
         else:
-            self.build_plugin_stack()
+            self._reload_plugin_stack()
@@ -0,0 +1,101 @@
+"""Export the OpenAPI document of the app at build time, e.g:
+
+    python -m pait.openapi.cli example.flask_example.main_example:create_app() -o ./openapi --gzip
+
+The exported file can be served by the doc route through the `openapi_file` param of `AddDocRoute`,
+so the worker does not need to generate the OpenAPI document
+"""
+import argparse
+import gzip
+import importlib
+import os
+import re
+import sys
+from typing import Any, List, Optional, Sequence
+
+from pait.openapi.openapi import OpenAPI, ServerModel
+
+__all__ = ["import_app", "gen_openapi_file_name", "export_openapi", "main"]
+
+
+def import_app(app_path: str) -> Any:
+    """Import the app by `module:attr`, if the path ends with `()`, the attr is the factory of the app
+    (e.g. `example.flask_example.main_example:create_app()`)"""
+    module_name, _, attr = app_path.partition(":")
+    if not module_name or not attr:
+        raise ValueError(f"app path must be `module:attr`, not {app_path}")
+    is_factory: bool = attr.endswith("()")
+    if is_factory:
+        attr = attr[:-2]
+    app: Any = importlib.import_module(module_name)
+    for name in attr.split("."):
+        app = getattr(app, name)
+    return app() if is_factory else app
+
+
+def gen_openapi_file_name(title: str, is_gzip: bool = False) -> str:
+    """Generate the file name of the doc title, e.g. `Pait Api Doc(private)` -> `pait_api_doc_private.json`"""
+    file_name: str = re.sub(r"[^0-9a-zA-Z]+", "_", title).strip("_").lower() or "openapi"
+    return f"{file_name}.json.gz" if is_gzip else f"{file_name}.json"
+
+
+def export_openapi(
+    app: Any,
+    output_dir: str,
+    title_list: Sequence[str] = ("Pait Doc",),
+    server_url_list: Optional[Sequence[str]] = None,
+    is_gzip: bool = False,
+) -> List[str]:
+    """Generate the OpenAPI document of the app once and write the json file of each doc title
+
+    :param app: The app instance
+    :param output_dir: The directory of the exported file
+    :param title_list: The titles of the doc route, each title is written to a file
+    :param server_url_list: The server urls of the OpenAPI document
+    :param is_gzip: Whether to compress the file by gzip
+    :return: The paths of the exported file
+    """
+    pait_openapi: OpenAPI = OpenAPI(
+        app, server_model_list=[ServerModel(url=url) for url in server_url_list] if server_url_list else None
+    )
+    os.makedirs(output_dir, exist_ok=True)
+    path_list: List[str] = []
+    for title in title_list:
+        pait_openapi.model.info.title = title
+        content: bytes = pait_openapi.content().encode()
+        path: str = os.path.join(output_dir, gen_openapi_file_name(title, is_gzip))
+        with open(path, "wb") as f:
+            # mtime is fixed, so the same document is always exported to the same file
+            f.write(gzip.compress(content, mtime=0) if is_gzip else content)
+        path_list.append(path)
+    return path_list
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Export the OpenAPI document of the app")
+    parser.add_argument("app", help="The app path, `module:attr` or `module:factory()`")
+    parser.add_argument("-o", "--output-dir", default=".", help="The directory of the exported file")
+    parser.add_argument(
+        "-t", "--title", action="append", dest="title_list", help="The title of the doc route, can be repeated"
+    )
+    parser.add_argument(
+        "-s", "--server-url", action="append", dest="server_url_list", help="The server url, can be repeated"
+    )
+    parser.add_argument("--gzip", action="store_true", help="Compress the exported file by gzip")
+    args = parser.parse_args(argv)
+
+    # Support importing the app from the current working directory
+    if os.getcwd() not in sys.path:
+        sys.path.insert(0, os.getcwd())
+    for path in export_openapi(
+        import_app(args.app),
+        args.output_dir,
+        title_list=args.title_list or ("Pait Doc",),
+        server_url_list=args.server_url_list,
+        is_gzip=args.gzip,
+    ):
+        print(path)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,7 +1,10 @@
+import gzip
 import json
 import logging
+import re
+import threading
 from enum import Enum
-from typing import Any, Callable, Dict, Optional, Type
+from typing import Any, Callable, Dict, List, Optional, Set, Type, Union
 from urllib.parse import urlencode
 
 from any_api.openapi import web_ui
@@ -10,18 +13,20 @@ from pydantic import BaseModel, Field
 from pait.app.any.util import import_func_from_app
 from pait.app.base.simple_route import SimpleRoute
 from pait.core import Pait
+from pait.data import PaitCoreProxyModel
 from pait.field import Depends, Path, Query
 from pait.g import config, get_ctx
 from pait.model.response import HtmlResponseModel, JsonResponseModel
 from pait.model.status import PaitStatus
 from pait.model.tag import Tag
-from pait.model.template import TemplateContext
+from pait.model.template import TemplateContext, TemplateVar
 from pait.openapi.openapi import InfoModel, OpenAPI, ServerModel
 
 logger: logging.Logger = logging.getLogger(__name__)
 __all__ = [
     "DocHtmlRespModel",
     "OpenAPIRespModel",
+    "OpenAPIContent",
     "AddDocRoute",
     "default_doc_fn_dict",
     "OpenAPI",
@@ -55,6 +60,50 @@ class DocEnum(str, Enum):
     pass
 
 
+_PLACEHOLDER_PREFIX: str = "pait-doc-placeholder-"
+_SERVER_URL_PLACEHOLDER: str = _PLACEHOLDER_PREFIX + "server-url"
+_placeholder_re: "re.Pattern[str]" = re.compile(rf'"{_PLACEHOLDER_PREFIX}(\d+|server-url)"')
+
+
+class OpenAPIContent(object):
+    """The pre-serialized OpenAPI document.
+
+    The template variables and the server url in the document are serialized as placeholders,
+    so each request only needs to fill in the placeholders with the value of the request
+    """
+
+    def __init__(self, openapi: OpenAPI) -> None:
+        template_var_list: List[TemplateVar] = []
+
+        class _PlaceholderJSONEncoder(config.json_encoder):  # type: ignore
+            def default(self, obj: Any) -> Any:
+                if isinstance(obj, TemplateVar):
+                    template_var_list.append(obj)
+                    return f"{_PLACEHOLDER_PREFIX}{len(template_var_list) - 1}"
+                return super().default(obj)
+
+        openapi.model.servers.insert(0, ServerModel(url=_SERVER_URL_PLACEHOLDER))
+        content: str = openapi.content(cls=_PlaceholderJSONEncoder)
+        # The element is the bytes of the document, the TemplateVar, or None (the server url)
+        self._part_list: List[Union[bytes, TemplateVar, None]] = []
+        index: int = 0
+        for match in _placeholder_re.finditer(content):
+            self._part_list.append(content[index : match.start()].encode())
+            key: str = match.group(1)
+            self._part_list.append(None if key == "server-url" else template_var_list[int(key)])
+            index = match.end()
+        self._part_list.append(content[index:].encode())
+
+    def render(self, server_url: str, template_dict: Dict[str, Any]) -> bytes:
+        with TemplateContext(template_dict):
+            return b"".join(
+                part
+                if isinstance(part, bytes)
+                else json.dumps(server_url if part is None else part, cls=config.json_encoder).encode()
+                for part in self._part_list
+            )
+
+
 class AddDocRoute(object):
     not_found_exc: Exception
     pait: Pait
@@ -73,6 +122,7 @@ class AddDocRoute(object):
         pait: Optional[Pait] = None,
         add_multi_simple_route: Optional[Callable] = None,
         not_found_exc: Optional[Exception] = None,
+        openapi_file: str = "",
     ):
         """
         :param app: The app instance to which the doc route is bound
@@ -97,6 +147,9 @@ class AddDocRoute(object):
         :param pait: instance of pait
         :param add_multi_simple_route: add_multi_simple_route
         :param not_found_exc:  not_found_exc
+        :param openapi_file: The path of the OpenAPI document exported by `pait.openapi.cli`,
+            if it is set, the doc route serves the file (read once, and decompressed if it ends with `.gz`)
+            instead of generating the document, the template variable and server url of the request are not applied
         """
         if pin_code:
             logging.info(f"doc route start pin code:{pin_code}")
@@ -107,6 +160,10 @@ class AddDocRoute(object):
         self.title: str = title or "Pait Doc"
         self.openapi: Type[OpenAPI] = openapi or OpenAPI
         self._doc_fn_dict: Dict[str, Callable] = doc_fn_dict or default_doc_fn_dict
+        self._openapi_content: Optional[OpenAPIContent] = None
+        self._openapi_file_content: Optional[bytes] = self._load_openapi_file(openapi_file) if openapi_file else None
+        self._openapi_content_lock: threading.Lock = threading.Lock()
+        self._change_notify_pait_id_set: Set[str] = set()
 
         # If empty, try to get an available Pait
         _pait: Pait = pait or getattr(self, "pait", None) or import_func_from_app("pait", app=app)  # type: ignore
@@ -205,6 +262,39 @@ class AddDocRoute(object):
         _doc_route.__qualname__ = _doc_route.__qualname__.replace("._doc_route", "." + _doc_route.__name__)
         return _doc_route
 
+    @staticmethod
+    def _load_openapi_file(openapi_file: str) -> bytes:
+        # The file is read once, and each request returns the same bytes object without copying
+        with open(openapi_file, "rb") as f:
+            content: bytes = f.read()
+        return gzip.decompress(content) if openapi_file.endswith(".gz") else content
+
+    def invalidate_openapi_content(self, *args: Any) -> None:
+        """Discard the cached OpenAPI document, it will be regenerated on the next request.
+
+        It is called automatically when the PaitCoreModel of the route is changed,
+        if the route is added after the document is generated, it needs to be called manually
+        """
+        self._openapi_content = None
+
+    def _get_openapi_content(self, app: Any) -> OpenAPIContent:
+        openapi_content: Optional[OpenAPIContent] = self._openapi_content
+        if openapi_content is not None:
+            return openapi_content
+        with self._openapi_content_lock:
+            if self._openapi_content is None:
+                pait_openapi: OpenAPI = self.openapi(app)
+                pait_openapi.model.info.title = self.title
+                for pait_id, pait_core_model in pait_openapi._pait_dict.items():
+                    if pait_id in self._change_notify_pait_id_set:
+                        continue
+                    self._change_notify_pait_id_set.add(pait_id)
+                    PaitCoreProxyModel.get_core_model(pait_core_model).add_change_notify(
+                        self.invalidate_openapi_content
+                    )
+                self._openapi_content = OpenAPIContent(pait_openapi)
+            return self._openapi_content
+
     def _get_openapi_route(self, app: Any) -> Callable:
         @self._doc_pait(
             pre_depend_list=[self._get_request_pin_code],
@@ -213,14 +303,12 @@ class AddDocRoute(object):
         )
         def _openapi_route(
             url_dict: Dict[str, Any] = Depends.i(self._get_request_template_map(extra_key=True)),
-        ) -> dict:
+        ) -> bytes:
+            if self._openapi_file_content is not None:
+                return self._openapi_file_content
             re = get_ctx().app_helper.request.request_extend()
             _scheme: str = self.scheme or re.scheme
-            with TemplateContext(url_dict):
-                pait_openapi: OpenAPI = self.openapi(app)
-                pait_openapi.model.info.title = self.title
-                pait_openapi.model.servers.insert(0, ServerModel(url=f"{_scheme}://{re.hostname}"))
-                return json.loads(pait_openapi.content())
+            return self._get_openapi_content(app).render(f"{_scheme}://{re.hostname}", url_dict)
 
         return _openapi_route
 
@@ -237,6 +325,7 @@ def add_doc_route(
     pait: Optional[Pait] = None,
     add_multi_simple_route: Optional[Callable] = None,
     not_found_exc: Optional[Exception] = None,
+    openapi_file: str = "",
 ) -> None:
     AddDocRoute(
         scheme=scheme,
@@ -250,4 +339,5 @@ def add_doc_route(
         pait=pait,
         add_multi_simple_route=add_multi_simple_route,
         not_found_exc=not_found_exc,
+        openapi_file=openapi_file,
     )
@@ -1,7 +1,9 @@
+import hashlib
 import inspect
 import json
 import logging
-from typing import Any, Callable, Dict, List, Optional, Set, Tuple, Type, Union
+import re
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple, Type, Union, get_type_hints
 
 from any_api.openapi import ApiModel as _ApiModel
 from any_api.openapi import ExternalDocumentationModel, HttpParamTypeLiteral, InfoModel
@@ -12,7 +14,6 @@ from any_api.openapi.model.openapi import OpenAPIModel
 from any_api.openapi.model.requests import RequestModel
 from any_api.util.pydantic_adapter import create_pydantic_model
 from pydantic import BaseModel, Field
-from pydantic.fields import FieldInfo
 
 from pait import _pydanitc_adapter
 from pait.app.any.util import import_func_from_app
@@ -25,9 +26,87 @@ from pait.types import CallType
 from pait.util import FuncSig, get_func_sig
 
 HttpParamTypeDictType = Dict[HttpParamTypeLiteral, List[RequestModel]]
+AnnotationDictType = Dict[str, Tuple[Type, Any]]
 
 
-__all__ = ["LinksModel", "ApiModel", "ParsePaitModel", "OpenAPI"]
+__all__ = ["LinksModel", "ApiModel", "ParsePaitModel", "OpenAPI", "SharedModelCache"]
+
+_memory_address_re = re.compile(r" at 0x[0-9a-fA-F]+")
+
+
+def _gen_structural_key(annotation_dict: AnnotationDictType) -> Optional[Tuple[Any, ...]]:
+    # The repr of FieldInfo contains the class name and the pydantic attributes that affect the schema,
+    # the Pait attributes are not in it, they are added to the key separately
+    key = tuple(
+        (
+            name,
+            annotation,
+            field.__class__,
+            repr(field),
+            getattr(field, "media_type", None),
+            repr(getattr(field, "openapi_serialization", None)),
+            repr(getattr(field, "links", None)),
+            getattr(field, "openapi_include", None),
+        )
+        for name, (annotation, field) in annotation_dict.items()
+    )
+    try:
+        hash(key)
+    except TypeError:
+        return None
+    return key
+
+
+class SharedModelCache(object):
+    """Cache the models and the type hints used by one OpenAPI document build.
+
+    The annotation dicts with the same structure share the same model, so the identical parameter group of
+    different routes only appears once in the components of OpenAPI and is referenced by `$ref`,
+    and its schema is generated once.
+    """
+
+    def __init__(self) -> None:
+        # The key is the structure of the annotation dict
+        self.model_dict: Dict[Tuple[Any, ...], Type[BaseModel]] = {}
+        self.type_hints_dict: Dict[Type[BaseModel], Dict[str, Any]] = {}
+        self.class_name_set: Set[str] = set()
+
+    def _gen_class_name(self, key: Tuple[Any, ...], suffix: str) -> str:
+        # The name only depends on the structure of the annotation dict, not on the route that uses it,
+        # the memory address is removed from the repr so that the name is the same in each build
+        digest = hashlib.md5(_memory_address_re.sub("", repr(key)).encode()).hexdigest()[:8]
+        class_name = raw_class_name = f"{suffix}{digest.upper()}"
+        # The keys that only differ by the object identity (e.g. two `TemplateVar` examples) have the same digest,
+        # but the name of the model must be unique
+        index: int = 1
+        while class_name in self.class_name_set:
+            index += 1
+            class_name = f"{raw_class_name}_{index}"
+        self.class_name_set.add(class_name)
+        return class_name
+
+    def create_model(self, annotation_dict: AnnotationDictType, suffix: str, class_name: str) -> Type[BaseModel]:
+        """Get the shared model of the annotation dict, create it if it not exists
+
+        :param annotation_dict: The annotation dict of the model
+        :param suffix: The suffix of the shared model name
+        :param class_name: The name of the model if the annotation dict can not be shared
+        """
+        key = _gen_structural_key(annotation_dict)
+        if key is None:
+            return create_pydantic_model(annotation_dict, class_name=class_name)
+        model = self.model_dict.get(key, None)
+        if model is None:
+            model = self.model_dict[key] = create_pydantic_model(
+                annotation_dict, class_name=self._gen_class_name(key, suffix)
+            )
+        return model
+
+    def get_type_hints(self, model: Type[BaseModel]) -> Dict[str, Any]:
+        type_hints = self.type_hints_dict.get(model, None)
+        if type_hints is None:
+            type_hints = self.type_hints_dict[model] = get_type_hints(model)
+        return type_hints
 
 
 class ApiModel(_ApiModel):
@@ -52,14 +131,15 @@ class ApiModel(_ApiModel):
 
 
 class ParsePaitModel(object):
-    def __init__(self, pait_model: PaitCoreModel) -> None:
+    def __init__(self, pait_model: PaitCoreModel, model_cache: Optional[SharedModelCache] = None) -> None:
         self.pait_model: PaitCoreModel = pait_model
+        self.model_cache: SharedModelCache = model_cache or SharedModelCache()
         self.http_param_type_dict: HttpParamTypeDictType = {}
         self.security_dict: Dict[str, openapi_model.security.SecurityModelType] = {}
         self.http_param_type_alias_dict: Dict[str, HttpParamTypeLiteral] = {"multiquery": "query"}
 
         self.param_field_dict: Dict[str, BaseRequestResourceField] = {}
-        self.http_param_type_annotation_dict: Dict[HttpParamTypeLiteral, Dict[str, Tuple[Type, FieldInfo]]] = {}
+        self.http_param_type_annotation_dict: Dict[HttpParamTypeLiteral, AnnotationDictType] = {}
 
         for extra_openapi_model in self.pait_model.extra_openapi_model_list:
             self._parse_base_model(extra_openapi_model)
@@ -69,7 +149,17 @@ class ParsePaitModel(object):
 
         self.build()
 
+    def _create_model(self, annotation_dict: AnnotationDictType, suffix: str) -> Type[BaseModel]:
+        return self.model_cache.create_model(
+            annotation_dict,
+            suffix,
+            class_name=f"{self.pait_model.func_name.title()}{self.pait_model.pait_id.title()}{suffix}",
+        )
+
     def build(self) -> None:
+        # The schema of multiform is merged into the schema of the same media type(and the model is marked),
+        # so the models of the route that contains multiform can not be shared with other routes
+        is_shared: bool = "multiform" not in self.http_param_type_annotation_dict
         for http_param_type, annotation_dict in self.http_param_type_annotation_dict.items():
             http_param_type = self.http_param_type_alias_dict.get(http_param_type, http_param_type)
             if http_param_type not in self.http_param_type_dict:
@@ -79,12 +169,16 @@ class ParsePaitModel(object):
                     description="",
                     media_type_list=[self.param_field_dict[http_param_type].media_type],
                     openapi_serialization=self.param_field_dict[http_param_type].openapi_serialization,
-                    model=create_pydantic_model(
-                        annotation_dict,
-                        class_name=(
-                            f"{self.pait_model.func_name.title()}{self.pait_model.pait_id.title()}"
-                            f"{http_param_type.title()}HttpParamModel"
-                        ),
+                    model=(
+                        self._create_model(annotation_dict, f"{http_param_type.title()}HttpParamModel")
+                        if is_shared
+                        else create_pydantic_model(
+                            annotation_dict,
+                            class_name=(
+                                f"{self.pait_model.func_name.title()}{self.pait_model.pait_id.title()}"
+                                f"{http_param_type.title()}HttpParamModel"
+                            ),
+                        )
                     ),
                 )
             )
@@ -92,10 +186,9 @@ class ParsePaitModel(object):
     def _parse_base_model(
         self, _pydantic_model: Type[BaseModel], default_field_class: Optional[Type[BaseRequestResourceField]] = None
     ) -> None:
-        from typing import get_type_hints
-
+        type_hints = self.model_cache.get_type_hints(_pydantic_model)
         for field_name, model_field in _pydanitc_adapter.model_fields(_pydantic_model).items():
-            param_annotation = get_type_hints(_pydantic_model)[field_name]
+            param_annotation = type_hints[field_name]
             field = _pydanitc_adapter.get_field_info(model_field)
             if not isinstance(field, BaseRequestResourceField):
                 if self.pait_model.default_field_class:
@@ -135,12 +228,9 @@ class ParsePaitModel(object):
                         continue
                     if not pait_field.raw_return:
                         self._parse_base_model(
-                            create_pydantic_model(
+                            self._create_model(
                                 {parameter.name: (parameter.annotation, pait_field)},
-                                class_name=(
-                                    f"{self.pait_model.func_name.title()}{self.pait_model.pait_id.title()}"
-                                    f"{parameter.name.title()}RawReturnModel"
-                                ),
+                                f"{parameter.name.title()}RawReturnModel",
                             ),
                             pait_field.__class__,
                         )
@@ -187,7 +277,7 @@ class ParsePaitModel(object):
         self.parameter_list_handle(func_type_sig.param_list, single_field_list)
 
         if single_field_list:
-            annotation_dict: Dict[str, Tuple[Type, Any]] = {}
+            annotation_dict: AnnotationDictType = {}
             _column_name_set: Set[str] = set()
             for field_name, parameter in single_field_list:
                 field: BaseRequestResourceField = parameter.default
@@ -199,22 +289,15 @@ class ParsePaitModel(object):
                     #  class Demo(BaseModel):
                     #      header_token: str = Header(alias="token")
                     #      query_token: str = Query(alias="token")
-                    _pydantic_model: Type[BaseModel] = create_pydantic_model(
-                        {parameter.name: (parameter.annotation, field)},
-                        class_name=(
-                            f"{self.pait_model.func_name.title()}"
-                            f"{self.pait_model.pait_id.title()}{key.title()}SameNameModel"
-                        ),
+                    _pydantic_model: Type[BaseModel] = self._create_model(
+                        {parameter.name: (parameter.annotation, field)}, f"{key.title()}SameNameModel"
                     )
                     self._parse_base_model(_pydantic_model)
                 else:
                     _column_name_set.add(key)
                     annotation_dict[parameter.name] = (parameter.annotation, field)
 
-            _pydantic_model = create_pydantic_model(
-                annotation_dict,
-                class_name=(f"{self.pait_model.func_name.title()}{self.pait_model.pait_id.title()}SingleFieldModel"),
-            )
+            _pydantic_model = self._create_model(annotation_dict, "SingleFieldModel")
             self._parse_base_model(_pydantic_model)
 
 
@@ -244,10 +327,12 @@ class OpenAPI(object):
             load_app or getattr(self, "load_app", None) or import_func_from_app("load_app", app=app)  # type: ignore
         )(app)
         api_model_list: List[ApiModel] = []
+        # The models are only shared in this build, and are released with it
+        model_cache: SharedModelCache = SharedModelCache()
         for pait_id, pait_model in self._pait_dict.items():
             pait_model = PaitCoreProxyModel.get_core_model(pait_model)
             try:
-                parse_pait_model: ParsePaitModel = ParsePaitModel(pait_model)
+                parse_pait_model: ParsePaitModel = ParsePaitModel(pait_model, model_cache=model_cache)
                 api_model_list.append(
                     ApiModel(
                         path=pait_model.openapi_path,
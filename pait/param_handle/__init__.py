@@ -1,3 +1,9 @@
 from ._async import AsyncParamHandler
+from ._compiled import (
+    AsyncBatchValidateParamHandler,
+    AsyncCompiledParamHandler,
+    BatchValidateParamHandler,
+    CompiledParamHandler,
+)
 from ._sync import ParamHandler
 from .base import BaseParamHandler
@@ -2,23 +2,149 @@ import asyncio
 import inspect
 import sys
 from contextlib import AbstractAsyncContextManager, AbstractContextManager
-from typing import Any, Dict, List, Optional, Tuple, Union
+from contextvars import ContextVar
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Union
 
 from typing_extensions import Self  # type: ignore
 
+from pait import field
+from pait.app.base.app_depend import get_app_depend_container
 from pait.exceptions import PaitBaseException
 from pait.model.context import ContextModel
 from pait.param_handle import rule
 from pait.param_handle.base import BaseParamHandler, raise_multiple_exc
 from pait.util import gen_tip_exc, get_pait_handler
 
+if TYPE_CHECKING:
+    from pait.model.core import PaitCoreModel
+
+ContextManagerListType = List[Union[AbstractAsyncContextManager, AbstractContextManager]]
+# When the depends are resolved concurrently, each depend registers its context managers in its own list,
+# and then these lists are merged in the order of declaration, so that the exit order is the same as serial
+_depend_contextmanager_list: ContextVar[Optional[ContextManagerListType]] = ContextVar(
+    "_depend_contextmanager_list", default=None
+)
+
+
+def _is_async_depend(pr: rule.ParamRule) -> bool:
+    """Whether the depend (or the sub depend of it) needs to wait for the async IO"""
+    param_func, keywords = rule.unwrap_param_func(pr.param_func)
+    if param_func is not rule.request_depend_pr_func:
+        return False
+    pait_handler = get_pait_handler(pr.sub.pait_handler)
+    for func in (pait_handler, getattr(pait_handler, "__wrapped__", None)):
+        if asyncio.iscoroutinefunction(func) or inspect.isasyncgenfunction(func):
+            return True
+    sub_pr_list = list(pr.sub.param.values()) + list((keywords.get("func_class_prd") or {}).values())
+    return any(_is_async_depend(sub_pr) for sub_pr in sub_pr_list)
+
+
+def _get_request_field_name_list(prd: rule.ParamRuleDict, field_name_list: List[str]) -> List[str]:
+    for pr in prd.values():
+        if isinstance(pr.parameter.default, field.BaseRequestResourceField):
+            field_name = pr.parameter.default.get_field_name()
+            if field_name not in field_name_list:
+                field_name_list.append(field_name)
+        _get_request_field_name_list(pr.sub.param, field_name_list)
+        func_class_prd = rule.unwrap_param_func(pr.param_func)[1].get("func_class_prd")
+        if func_class_prd:
+            _get_request_field_name_list(func_class_prd, field_name_list)
+    return field_name_list
+
 
 class AsyncParamHandleContext(ContextModel):
-    contextmanager_list: List[Union[AbstractAsyncContextManager, AbstractContextManager]]
+    contextmanager_list: ContextManagerListType
 
 
 class AsyncParamHandler(BaseParamHandler[AsyncParamHandleContext]):
     _is_async = True
+    # If True, the adjacent async depends of the same object will be resolved concurrently by `asyncio.gather`
+    concurrent_depend: bool = True
+
+    @classmethod
+    def _gen_concurrent_depend_group(cls, prd: rule.ParamRuleDict) -> None:
+        """Group the async depends of prd, the depends in a group do not depend on each other.
+
+        A sync depend ends the current group, so that the order of the context managers registered by the depends
+        is the same as the order of declaration
+        """
+        pr_list_list: List[List[rule.ParamRule]] = [[]]
+        for pr in prd.values():
+            if rule.unwrap_param_func(pr.param_func)[0] is not rule.request_depend_pr_func:
+                continue
+            if _is_async_depend(pr):
+                pr_list_list[-1].append(pr)
+            elif pr_list_list[-1]:
+                pr_list_list.append([])
+        for pr_list in pr_list_list:
+            if len(pr_list) < 2:
+                continue
+            prd.concurrent_depend_group_dict[pr_list[0].name] = rule.ConcurrentDependGroup(
+                pr_list=pr_list,
+                request_field_name_list=_get_request_field_name_list(
+                    rule.ParamRuleDict({pr.name: pr for pr in pr_list}), []
+                ),
+            )
+            prd.concurrent_depend_name_set.update(pr.name for pr in pr_list)
+
+    @classmethod
+    def _param_field_pre_handle(
+        cls,
+        pait_core_model: "PaitCoreModel",
+        _object: Any,
+        param_list: List["inspect.Parameter"],
+    ) -> rule.ParamRuleDict:
+        prd = super()._param_field_pre_handle(pait_core_model, _object, param_list)
+        if cls.concurrent_depend:
+            cls._gen_concurrent_depend_group(prd)
+        return prd
+
+    async def concurrent_depend_handle(
+        self,
+        context: "AsyncParamHandleContext",
+        _object: Any,
+        group: rule.ConcurrentDependGroup,
+    ) -> Dict[str, Any]:
+        """Resolve the depends of the group concurrently, return the value of each depend by parameter name"""
+        request = context.app_helper.request
+        for field_name in group.request_field_name_list:
+            # Read the request value in advance, avoid the depends reading the request body stream at the same time.
+            try:
+                value: Any = getattr(request, field_name, lambda: {})()
+                if asyncio.iscoroutine(value) or asyncio.isfuture(value):
+                    await value
+            except Exception:
+                # The error will be thrown again when the depend reads the value
+                pass
+
+        parent_contextmanager_list = _depend_contextmanager_list.get()
+        if parent_contextmanager_list is None:
+            parent_contextmanager_list = context.contextmanager_list
+        contextmanager_list_list: List[ContextManagerListType] = [[] for _ in group.pr_list]
+
+        async def _depend_handle(pr: rule.ParamRule, contextmanager_list: ContextManagerListType) -> Any:
+            # Each task runs in a copy of the current context, so the var is only visible to this depend
+            _depend_contextmanager_list.set(contextmanager_list)
+            try:
+                return await pr.param_func(pr, context, self)
+            except PaitBaseException as e:
+                raise gen_tip_exc(_object, e, pr.parameter, tip_exception_class=self.tip_exception_class)
+
+        try:
+            result_list = await asyncio.gather(
+                *[_depend_handle(pr, cm_list) for pr, cm_list in zip(group.pr_list, contextmanager_list_list)],
+                return_exceptions=True,
+            )
+        finally:
+            for contextmanager_list in contextmanager_list_list:
+                parent_contextmanager_list.extend(contextmanager_list)
+
+        kwargs_param_dict: Dict[str, Any] = {}
+        for pr, result in zip(group.pr_list, result_list):
+            if isinstance(result, BaseException):
+                raise result
+            kwargs_param_dict[pr.name] = result
+        return kwargs_param_dict
 
     async def prd_handle(  # type: ignore[override]
         self,
@@ -30,6 +156,11 @@ class AsyncParamHandler(BaseParamHandler[AsyncParamHandleContext]):
         kwargs_param_dict: Dict[str, Any] = {}
 
         for param_name, pr in prd.items():
+            if param_name in prd.concurrent_depend_name_set:
+                group = prd.concurrent_depend_group_dict.get(param_name)
+                if group:
+                    kwargs_param_dict.update(await self.concurrent_depend_handle(context, _object, group))
+                continue
             try:
                 value = pr.param_func(pr, context, self)
                 if value is rule.MISSING:
@@ -50,12 +181,42 @@ class AsyncParamHandler(BaseParamHandler[AsyncParamHandleContext]):
         context: "AsyncParamHandleContext",
         pld: "rule.PreLoadDc",
         func_class_prd: Optional[rule.ParamRuleDict] = None,
+    ) -> Any:
+        if pld.scope == "app":
+            return await get_app_depend_container(context.app_helper).async_get(pld.pait_handler)
+        if not pld.use_cache:
+            return await self._depend_handle(context, pld, func_class_prd)
+        # The future is cached, so that the concurrent depends can wait for the same result
+        depend_cache = context.get_depend_cache()
+        future: Optional[asyncio.Future] = depend_cache.get(pld.pait_handler)
+        if future is not None:
+            return await future
+        future = asyncio.get_event_loop().create_future()
+        depend_cache[pld.pait_handler] = future
+        try:
+            result = await self._depend_handle(context, pld, func_class_prd)
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            # Mark the exception as retrieved, it is thrown by the current call
+            future.exception()
+            raise
+        future.set_result(result)
+        return result
+
+    async def _depend_handle(
+        self,
+        context: "AsyncParamHandleContext",
+        pld: "rule.PreLoadDc",
+        func_class_prd: Optional[rule.ParamRuleDict] = None,
     ) -> Any:
         pait_handler = pld.pait_handler
         if inspect.isclass(pait_handler):
             # support depend type is class
             assert (
-                func_class_prd
+                func_class_prd is not None
             ), f"`func_class_prd` param must not none, please check {self.__class__}.pre_load_hook method"
             _, kwargs = await self.prd_handle(context, pait_handler, func_class_prd)
             pait_handler = pait_handler()
@@ -67,11 +228,13 @@ class AsyncParamHandler(BaseParamHandler[AsyncParamHandleContext]):
         func_result: Any = pait_handler(*_func_args, **_func_kwargs)
         if asyncio.iscoroutine(func_result):
             func_result = await func_result
-        if isinstance(func_result, AbstractAsyncContextManager):
-            context.contextmanager_list.append(func_result)
-            return await func_result.__aenter__()
-        elif isinstance(func_result, AbstractContextManager):
-            context.contextmanager_list.append(func_result)
+        if isinstance(func_result, (AbstractAsyncContextManager, AbstractContextManager)):
+            contextmanager_list = _depend_contextmanager_list.get()
+            if contextmanager_list is None:
+                contextmanager_list = context.contextmanager_list
+            contextmanager_list.append(func_result)
+            if isinstance(func_result, AbstractAsyncContextManager):
+                return await func_result.__aenter__()
             return func_result.__enter__()
         else:
             return func_result
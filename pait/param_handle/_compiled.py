@@ -0,0 +1,323 @@
+import asyncio
+import inspect
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple
+
+from pydantic import BaseModel
+
+from pait import _pydanitc_adapter
+from pait._pydanitc_adapter import PydanticUndefined, is_v1
+from pait.exceptions import NotFoundValueException, PaitBaseException
+from pait.util import gen_tip_exc
+
+from . import rule
+from ._async import AsyncParamHandleContext, AsyncParamHandler
+from ._sync import ParamHandleContext, ParamHandler
+from .base import BaseParamHandler
+
+if TYPE_CHECKING:
+    from pait.model.context import ContextModel
+    from pait.model.core import PaitCoreModel
+
+__all__ = [
+    "CompiledParamHandler",
+    "AsyncCompiledParamHandler",
+    "BatchValidateParamHandler",
+    "AsyncBatchValidateParamHandler",
+    "compile_prd",
+]
+
+CompiledPrdFunc = Callable[["BaseParamHandler", "ContextModel", Any], Any]
+CompiledPrdDict = Dict[int, Tuple[rule.ParamRuleDict, CompiledPrdFunc]]
+
+
+def _is_awaitable(value: Any) -> bool:
+    return asyncio.iscoroutine(value) or asyncio.isfuture(value)
+
+
+def _not_found_value_exc_func(parameter: inspect.Parameter) -> Exception:
+    return NotFoundValueException(parameter.name, f"Can not found {parameter.name} value")
+
+
+class _PrdCodeGen(object):
+    """Convert the ParamRuleDict of a route into the source code of a function.
+
+    All branches that `prd_handle` and the `rule.xxx_pr_func` judge on each request
+    (field type, raw_return, validate by BaseModel or PaitModelField...) are resolved here,
+    so the generated function only does the work that is really needed by the current route.
+    """
+
+    def __init__(
+        self, prd: rule.ParamRuleDict, pait_core_model: "PaitCoreModel", is_async: bool, batch_validate: bool = False
+    ) -> None:
+        self.prd = prd
+        self.request_class = pait_core_model.app_helper_class.request_class
+        self.is_async = is_async
+        self.batch_validate = batch_validate
+        self.namespace: Dict[str, Any] = {
+            "MISSING": rule.MISSING,
+            "PydanticUndefined": PydanticUndefined,
+            "PaitBaseException": PaitBaseException,
+            "gen_tip_exc": gen_tip_exc,
+            "is_awaitable": _is_awaitable,
+        }
+        self.body: List[str] = []
+        self._loaded_request_value_set: set = set()
+        # Collect the fields that can be validated together by request field name(e.g: query, header)
+        self._batch_validate_dict: Dict[str, List[Tuple[int, _pydanitc_adapter.PaitModelField]]] = {}
+
+    def _await(self, var_name: str) -> None:
+        if self.is_async:
+            self.body.append(f"if is_awaitable({var_name}):")
+            self.body.append(f"    {var_name} = await {var_name}")
+
+    def _gen_get_request_value(self, index: int, pr: rule.ParamRule) -> str:
+        pait_field = pr.parameter.default
+        field_name: str = pait_field.get_field_name()
+        if pait_field.raw_return:
+            # The raw value may be modified by the route function, so it can not be shared with other params
+            var_name = f"raw_value_{index}"
+        else:
+            var_name = f"request_value_{field_name}"
+            if var_name in self._loaded_request_value_set:
+                return var_name
+            self._loaded_request_value_set.add(var_name)
+        if getattr(self.request_class, field_name, None):
+            self.body.append(f"{var_name} = request.{field_name}()")
+            self._await(var_name)
+        else:
+            self.body.append(f"{var_name} = {{}}")
+        return var_name
+
+    def _gen_get_real_request_value(self, index: int, pr: rule.ParamRule) -> None:
+        pait_field = pr.parameter.default
+        request_value_var = self._gen_get_request_value(index, pr)
+        if pait_field.raw_return:
+            self.body.append(f"value_{index} = {request_value_var}")
+            return
+        self.namespace[f"request_value_handle_{index}"] = pait_field.request_value_handle
+        self.namespace[f"not_value_exc_func_{index}"] = pait_field.not_value_exception_func or _not_found_value_exc_func
+        self.body.append(f"value_{index} = request_value_handle_{index}({request_value_var})")
+        self.body.append(f"if value_{index} is PydanticUndefined:")
+        self.body.append(f"    raise not_value_exc_func_{index}(pr_{index}.parameter)")
+
+    def _gen_validate(self, index: int, pr: rule.ParamRule, keywords: Dict[str, Any]) -> None:
+        annotation: Any = pr.parameter.annotation
+        validate_request_value_cb = keywords.get("validate_request_value_cb", rule.validate_request_value)
+        pait_model_field = keywords["pait_model_field"]
+        if validate_request_value_cb not in (rule.validate_request_value, rule.flask_validate_request_value):
+            # Customized validation functions can only be called as is
+            self.namespace[f"validate_cb_{index}"] = validate_request_value_cb
+            self.namespace[f"pait_model_field_{index}"] = pait_model_field
+            self.body.append(
+                f"value_{index} = validate_cb_{index}(pr_{index}.parameter, value_{index}, pait_model_field_{index})"
+            )
+        elif inspect.isclass(annotation) and issubclass(annotation, BaseModel):
+            self.namespace[f"annotation_{index}"] = annotation
+            self.body.append(f"value_{index} = annotation_{index}(**value_{index})")
+        else:
+            if validate_request_value_cb is rule.flask_validate_request_value and not is_v1:
+                self.body.append(f"if isinstance(value_{index}, dict):")
+                self.body.append(f"    value_{index} = dict(value_{index})")
+            if self.batch_validate:
+                # The value will be validated after all values are obtained
+                field_name: str = pr.parameter.default.get_field_name()
+                self._batch_validate_dict.setdefault(field_name, []).append((index, pait_model_field))
+                return
+            self.namespace[f"validate_{index}"] = pait_model_field.validate
+            self.body.append(f"value_{index} = validate_{index}(value_{index})")
+
+    def _gen_batch_validate(self) -> None:
+        for field_name, item_list in self._batch_validate_dict.items():
+            if len(item_list) == 1:
+                index, pait_model_field = item_list[0]
+                self.namespace[f"validate_{index}"] = pait_model_field.validate
+                self.body.append(f"value_{index} = validate_{index}(value_{index})")
+                continue
+            self.namespace[f"batch_validate_{field_name}"] = _pydanitc_adapter.PaitBatchModelField(
+                [pait_model_field for _, pait_model_field in item_list]
+            ).validate
+            value_var_code = ", ".join(f"value_{index}" for index, _ in item_list)
+            self.body.append(f"{value_var_code}, = batch_validate_{field_name}(({value_var_code},))")
+
+    def _gen_value(self, index: int, pr: rule.ParamRule) -> bool:
+        """gen the code that get param value, return False if the value may be `MISSING`"""
+        param_func, keywords = rule.unwrap_param_func(pr.param_func)
+        maybe_await = "await " if self.is_async else ""
+        if param_func is rule.cbv_pr_func:
+            self.body.append(f"value_{index} = context.app_helper.cbv_instance")
+        elif param_func is rule.request_pr_func:
+            self.body.append(f"value_{index} = request.request")
+        elif param_func in (rule.request_field_get_value_pr_func, rule.async_request_field_get_value_pr_func):
+            self._gen_get_real_request_value(index, pr)
+        elif param_func in (rule.request_field_pr_func, rule.async_request_field_pr_func):
+            self._gen_get_real_request_value(index, pr)
+            self._gen_validate(index, pr, keywords)
+        elif param_func in (rule.pait_model_pr_func, rule.async_pait_model_pr_func):
+            self.namespace[f"annotation_{index}"] = pr.parameter.annotation
+            self.body.append(
+                f"value_{index} = annotation_{index}("
+                f"**({maybe_await}param_plugin.prd_handle(context, annotation_{index}, pr_{index}.sub.param))[1]"
+                f")"
+            )
+        elif param_func is rule.request_depend_pr_func:
+            self.namespace[f"func_class_prd_{index}"] = keywords.get("func_class_prd", None)
+            self.body.append(
+                f"value_{index} = {maybe_await}param_plugin.depend_handle("
+                f"context, pr_{index}.sub, func_class_prd=func_class_prd_{index})"
+            )
+        else:
+            # Unknown param func, It needs to be called as is
+            self.body.append(f"value_{index} = pr_{index}.param_func(pr_{index}, context, param_plugin)")
+            self._await(f"value_{index}")
+            return False
+        return True
+
+    def gen(self) -> str:
+        self.body.append("request = context.app_helper.request")
+        save_value_body: List[str] = ["args_param_list = []", "kwargs_param_dict = {}"]
+        for index, (param_name, pr) in enumerate(self.prd.items()):
+            if rule.unwrap_param_func(pr.param_func)[0] is rule.empty_pr_func:
+                continue
+            if self.is_async and param_name in self.prd.concurrent_depend_name_set:
+                group = self.prd.concurrent_depend_group_dict.get(param_name)
+                if group:
+                    # The exception has been converted by `concurrent_depend_handle`
+                    self.namespace[f"concurrent_depend_group_{index}"] = group
+                    self.body.append("pr = None")
+                    self.body.append(
+                        f"value_{index} = await param_plugin.concurrent_depend_handle("
+                        f"context, _object, concurrent_depend_group_{index})"
+                    )
+                    save_value_body.append(f"kwargs_param_dict.update(value_{index})")
+                continue
+            self.namespace[f"pr_{index}"] = pr
+            self.body.append(f"pr = pr_{index}")
+            if pr.parameter.default is pr.parameter.empty:
+                save_value_code = f"args_param_list.append(value_{index})"
+            else:
+                save_value_code = f"kwargs_param_dict[{param_name!r}] = value_{index}"
+            if self._gen_value(index, pr):
+                save_value_body.append(save_value_code)
+            else:
+                save_value_body.append(f"if value_{index} is not MISSING:")
+                save_value_body.append(f"    {save_value_code}")
+        self._gen_batch_validate()
+        self.body.extend(save_value_body)
+        self.body.append("return args_param_list, kwargs_param_dict")
+
+        code_list: List[str] = [
+            f"{'async ' if self.is_async else ''}def compiled_prd_handle(param_plugin, context, _object):",
+            "    pr = None",
+            "    try:",
+        ]
+        code_list.extend(f"        {line}" for line in self.body)
+        code_list.extend(
+            [
+                "    except PaitBaseException as e:",
+                "        if pr is None:",
+                "            raise",
+                "        raise gen_tip_exc(",
+                "            _object, e, pr.parameter, tip_exception_class=param_plugin.tip_exception_class",
+                "        )",
+            ]
+        )
+        return "\n".join(code_list)
+
+
+def compile_prd(
+    prd: rule.ParamRuleDict, pait_core_model: "PaitCoreModel", is_async: bool, batch_validate: bool = False
+) -> CompiledPrdFunc:
+    """Compile the ParamRuleDict into a function, the function has the same behavior as `prd_handle`
+
+    :param prd: ParamRuleDict
+    :param pait_core_model: PaitCoreModel
+    :param is_async: If True, the compiled function is a coroutine function
+    :param batch_validate: If True, the values of the same request field type(e.g: query, header) will be
+        validated together after they are all obtained.
+    """
+    code_gen = _PrdCodeGen(prd, pait_core_model, is_async, batch_validate=batch_validate)
+    source = code_gen.gen()
+    namespace = code_gen.namespace
+    exec(compile(source, f"<pait compiled prd handle: {pait_core_model.pait_id}>", "exec"), namespace)
+    return namespace["compiled_prd_handle"]
+
+
+class _CompiledParamHandlerMixin(object):
+    """Compile all ParamRuleDict of the route during the preload phase,
+    and then the param handler will execute the compiled function instead of traversing the ParamRuleDict
+    """
+
+    _is_async: bool
+    # If True, the values of the same request field type will be validated together through one pydantic call,
+    # and the validation errors of these values will be thrown together.
+    batch_validate: bool = False
+    _pait_compiled_prd_dict: CompiledPrdDict
+    pait_core_model: "PaitCoreModel"
+
+    @classmethod
+    def _compile_prd(
+        cls, pait_core_model: "PaitCoreModel", prd: rule.ParamRuleDict, compiled_prd_dict: CompiledPrdDict
+    ) -> CompiledPrdFunc:
+        compiled_prd_func = compile_prd(prd, pait_core_model, cls._is_async, batch_validate=cls.batch_validate)
+        # Save the prd together, ensuring that the id of prd will not be reused
+        compiled_prd_dict[id(prd)] = (prd, compiled_prd_func)
+        return compiled_prd_func
+
+    @classmethod
+    def _compile_pld(
+        cls, pait_core_model: "PaitCoreModel", pld: rule.PreLoadDc, compiled_prd_dict: CompiledPrdDict
+    ) -> None:
+        for pre_depend_pld in pld.pre_depend:
+            cls._compile_pld(pait_core_model, pre_depend_pld, compiled_prd_dict)
+        cls._compile_prd(pait_core_model, pld.param, compiled_prd_dict)
+        for pr in pld.param.values():
+            if pr.sub.param or pr.sub.pait_handler is not rule.empty_pr_func:
+                cls._compile_pld(pait_core_model, pr.sub, compiled_prd_dict)
+            func_class_prd: Optional[rule.ParamRuleDict] = rule.unwrap_param_func(pr.param_func)[1].get(
+                "func_class_prd"
+            )
+            if func_class_prd:
+                cls._compile_prd(pait_core_model, func_class_prd, compiled_prd_dict)
+
+    @classmethod
+    def pre_hook(cls, pait_core_model: "PaitCoreModel", kwargs: Dict) -> None:
+        super().pre_hook(pait_core_model, kwargs)  # type: ignore[misc]
+        compiled_prd_dict: CompiledPrdDict = {}
+        cls._compile_pld(pait_core_model, kwargs["_pait_pre_load_dc"], compiled_prd_dict)
+        kwargs["_pait_compiled_prd_dict"] = compiled_prd_dict
+
+    def get_compiled_prd_func(self, prd: rule.ParamRuleDict) -> CompiledPrdFunc:
+        compiled_item = self._pait_compiled_prd_dict.get(id(prd))
+        if compiled_item is None:
+            # e.g: cbv prd, it is generated on the first request
+            return self._compile_prd(self.pait_core_model, prd, self._pait_compiled_prd_dict)
+        return compiled_item[1]
+
+
+class CompiledParamHandler(_CompiledParamHandlerMixin, ParamHandler):
+    def prd_handle(
+        self,
+        context: "ParamHandleContext",
+        _object: Any,
+        prd: rule.ParamRuleDict,
+    ) -> Tuple[List[Any], Dict[str, Any]]:
+        return self.get_compiled_prd_func(prd)(self, context, _object)
+
+
+class AsyncCompiledParamHandler(_CompiledParamHandlerMixin, AsyncParamHandler):
+    def prd_handle(  # type: ignore[override]
+        self,
+        context: "AsyncParamHandleContext",
+        _object: Any,
+        prd: rule.ParamRuleDict,
+    ) -> Any:
+        # Return the coroutine of the compiled function directly, reducing a layer of coroutine call
+        return self.get_compiled_prd_func(prd)(self, context, _object)
+
+
+class BatchValidateParamHandler(CompiledParamHandler):
+    batch_validate = True
+
+
+class AsyncBatchValidateParamHandler(AsyncCompiledParamHandler):
+    batch_validate = True
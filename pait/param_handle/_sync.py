@@ -5,6 +5,7 @@ from typing import Any, Dict, List, Optional, Tuple
 
 from typing_extensions import Self  # type: ignore
 
+from pait.app.base.app_depend import get_app_depend_container
 from pait.exceptions import PaitBaseException
 from pait.model.context import ContextModel
 from pait.param_handle.base import BaseParamHandler, raise_multiple_exc, rule
@@ -41,12 +42,26 @@ class ParamHandler(BaseParamHandler[ParamHandleContext]):
 
     def depend_handle(
         self, context: "ParamHandleContext", pld: "rule.PreLoadDc", func_class_prd: Optional[rule.ParamRuleDict] = None
+    ) -> Any:
+        if pld.scope == "app":
+            return get_app_depend_container(context.app_helper).get(pld.pait_handler)
+        if not pld.use_cache:
+            return self._depend_handle(context, pld, func_class_prd)
+        depend_cache = context.get_depend_cache()
+        if pld.pait_handler in depend_cache:
+            return depend_cache[pld.pait_handler]
+        result = self._depend_handle(context, pld, func_class_prd)
+        depend_cache[pld.pait_handler] = result
+        return result
+
+    def _depend_handle(
+        self, context: "ParamHandleContext", pld: "rule.PreLoadDc", func_class_prd: Optional[rule.ParamRuleDict] = None
     ) -> Any:
         pait_handler = pld.pait_handler
         if inspect.isclass(pait_handler):
             # support depend type is class
             assert (
-                func_class_prd
+                func_class_prd is not None
             ), f"`func_class_prd` param must not none, please check {self.__class__}.pre_load_hook method"
             _, kwargs = self.prd_handle(context, pait_handler, func_class_prd)
             pait_handler = pait_handler()
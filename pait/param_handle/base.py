@@ -6,6 +6,7 @@ from pydantic import BaseModel, Field
 from typing_extensions import Self  # type: ignore
 
 from pait import _pydanitc_adapter, field
+from pait.app.base.app_depend import AppDependContainer
 from pait.exceptions import (
     FieldValueTypeException,
     NotFoundFieldException,
@@ -44,6 +45,8 @@ class BaseParamHandler(PluginProtocol, Generic[_CtxT]):
     _is_async: bool = False
     tip_exception_class: Optional[Type[TipException]] = TipException
     _pait_pre_load_dc: rule.PreLoadDc
+    # The ParamRuleDict of the cbv class attributes, key is cbv class
+    _pait_cbv_prd_dict: Dict[type, rule.ParamRuleDict]
 
     @staticmethod
     def is_self_param(parameter: inspect.Parameter) -> bool:
@@ -55,15 +58,16 @@ class BaseParamHandler(PluginProtocol, Generic[_CtxT]):
         """
         Due to a problem with the Python decorator mechanism,
         the cbv prd cannot be obtained when the decorator is initialized,
-        so the prd data is obtained and cached on the first request.
+        so the prd data is obtained on the first request and cached by cbv class.
+        (some frameworks, such as tornado and starlette, will create a cbv instance for each request)
         """
-        cbv_prd: Optional[rule.ParamRuleDict] = getattr(context.cbv_instance, "_param_plugin_cbv_prd", None)
-        if cbv_prd:
-            return cbv_prd
-        param_list = get_parameter_list_from_class(context.cbv_instance.__class__)
-        prd = self._param_field_pre_handle(context.pait_core_model, context.cbv_instance.__class__, param_list)
-        setattr(context.cbv_instance, "_param_plugin_cbv_prd", prd)
-        return prd
+        cbv_class: type = context.cbv_instance.__class__
+        cbv_prd: Optional[rule.ParamRuleDict] = self._pait_cbv_prd_dict.get(cbv_class)
+        if cbv_prd is None:
+            param_list = get_parameter_list_from_class(cbv_class)
+            cbv_prd = self._param_field_pre_handle(context.pait_core_model, cbv_class, param_list)
+            self._pait_cbv_prd_dict[cbv_class] = cbv_prd
+        return cbv_prd
 
     def prd_handle(
         self,
@@ -158,14 +162,21 @@ class BaseParamHandler(PluginProtocol, Generic[_CtxT]):
                 raise TypeError(parameter.name, f"{parameter.name}'s type error")  # pragma: no cover
 
     @classmethod
-    def _depend_pre_handle(cls, pait_core_model: "PaitCoreModel", func: CallType) -> rule.PreLoadDc:
+    def _depend_pre_handle(
+        cls, pait_core_model: "PaitCoreModel", func: CallType, use_cache: bool = True, scope: str = "request"
+    ) -> rule.PreLoadDc:
         """gen depend's pre-load dataclass"""
         if inspect.ismethod(func) and not is_bounded_func(func):
             raise ValueError(f"Method: {func.__qualname__} is not a bounded function")  # pragma: no cover
+        if scope == "app":
+            # The app scope depend is resolved only once, so it can not use the request param
+            AppDependContainer.check_depend(func)
         func_sig: FuncSig = get_func_sig(func, cache_sig=False)
         _pre_load_obj_dc = rule.PreLoadDc(
             pait_handler=func,  # depend func gen pait handler in pre-load
             param=cls._param_field_pre_handle(pait_core_model, func_sig.func, func_sig.param_list),
+            use_cache=use_cache,
+            scope=scope,
         )
         return _pre_load_obj_dc
 
@@ -177,7 +188,7 @@ class BaseParamHandler(PluginProtocol, Generic[_CtxT]):
         param_list: List["inspect.Parameter"],
     ) -> rule.ParamRuleDict:
         """gen param rule dict"""
-        param_rule_dict: rule.ParamRuleDict = {}
+        param_rule_dict: rule.ParamRuleDict = rule.ParamRuleDict()
         for index, parameter in enumerate(param_list):
             field_type_enum: rule.FieldTypeEnum = rule.FieldTypeEnum.empty
             param_func: Optional[rule.ParamRuleFuncProtocol] = None
@@ -191,7 +202,12 @@ class BaseParamHandler(PluginProtocol, Generic[_CtxT]):
                         cls.check_param_field_by_parameter(pait_core_model, parameter)
 
                     if isinstance(parameter.default, field.Depends):
-                        sub_pld = cls._depend_pre_handle(pait_core_model, parameter.default.func)
+                        sub_pld = cls._depend_pre_handle(
+                            pait_core_model,
+                            parameter.default.func,
+                            use_cache=parameter.default.use_cache,
+                            scope=parameter.default.scope,
+                        )
                         field_type_enum = rule.FieldTypeEnum.request_depend
                         param_func = field_type_enum.value.async_func if cls._is_async else field_type_enum.value.func
                         depend_func = parameter.default.func
@@ -282,6 +298,7 @@ class BaseParamHandler(PluginProtocol, Generic[_CtxT]):
         # check and load param from func
         _pait_pre_load_dc.param = cls._param_field_pre_handle(pait_core_model, func_sig.func, func_sig.param_list)
         kwargs["_pait_pre_load_dc"] = _pait_pre_load_dc
+        kwargs["_pait_cbv_prd_dict"] = {}
         # TODO support cbv class Attribute in pre-load, now in first request
         # I don't know how to get the class of the decorated function at the initialization of the decorator,
         # which may be an unattainable feature
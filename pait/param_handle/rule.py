@@ -3,7 +3,8 @@ import inspect
 from dataclasses import MISSING, dataclass
 from dataclasses import field as dc_field
 from enum import Enum
-from typing import TYPE_CHECKING, Any, Callable, Coroutine, Dict, List, Mapping, Optional, Type, Union
+from functools import partial
+from typing import TYPE_CHECKING, Any, Callable, Coroutine, Dict, List, Mapping, Optional, Set, Tuple, Type, Union
 
 from pydantic import BaseModel
 
@@ -184,11 +185,40 @@ class ParamRule(object):
     sub: "PreLoadDc"
 
 
+@dataclass
+class ConcurrentDependGroup(object):
+    """A group of async depends that do not depend on each other and can be resolved concurrently"""
+
+    pr_list: List["ParamRule"]
+    # The request field names (e.g: body, form) that will be read by the depends of the group
+    request_field_name_list: List[str]
+
+
+class ParamRuleDict(Dict[str, "ParamRule"]):
+    """The ParamRule of each parameter of the object (func, class or pydantic.BaseModel), key is parameter name"""
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        # The groups of concurrent depends, key is the parameter name of the first depend in the group.
+        # They are generated by AsyncParamHandler in the preload phase
+        self.concurrent_depend_group_dict: Dict[str, ConcurrentDependGroup] = {}
+        # The parameter names of all depends in the groups
+        self.concurrent_depend_name_set: Set[str] = set()
+
+
 @dataclass
 class PreLoadDc(object):
     pait_handler: CallType
     pre_depend: List["PreLoadDc"] = dc_field(default_factory=list)
-    param: "ParamRuleDict" = dc_field(default_factory=dict)
-
-
-ParamRuleDict = Dict[str, "ParamRule"]
+    param: "ParamRuleDict" = dc_field(default_factory=ParamRuleDict)
+    # Only for depend, if True, the result of the depend is cached in the request
+    use_cache: bool = True
+    # Only for depend, if it is `app`, the result of the depend is cached in the app
+    scope: str = "request"
+
+
+def unwrap_param_func(param_func: Any) -> Tuple[Any, Dict[str, Any]]:
+    """Get the real param func and the keyword params bound by partial"""
+    if isinstance(param_func, partial):
+        return param_func.func, param_func.keywords
+    return param_func, {}
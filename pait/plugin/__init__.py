@@ -1 +1 @@
-from .base import PluginManager, PluginProtocol, PostPluginProtocol, PrePluginProtocol
+from .base import FusedPlugin, PluginManager, PluginProtocol, PostPluginProtocol, PrePluginProtocol, fuse_plugin
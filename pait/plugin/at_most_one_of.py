@@ -61,6 +61,5 @@ class AtMostOneOfPlugin(PostPluginProtocol):
     def build(cls, *, at_most_one_of_list: Optional[List[List[str]]] = None) -> "PluginManager":  # type: ignore
         return super().build(at_most_one_of_list=at_most_one_of_list or [])
 
-    def __call__(self, context: "PluginContext") -> Any:
+    def before_call(self, context: "PluginContext") -> None:
         self.check_param(context)
-        return super().__call__(context)
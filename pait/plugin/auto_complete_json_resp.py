@@ -1,5 +1,5 @@
 import copy
-from typing import TYPE_CHECKING, Any, Dict, Optional, Type
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple, Type
 
 from pait.model.response import BaseResponseModel, JsonResponseModel
 from pait.plugin.base import GetPaitResponseModelFuncType, PrePluginProtocol
@@ -10,27 +10,75 @@ if TYPE_CHECKING:
     from pait.model.core import PaitCoreModel
     from pait.plugin.base import PluginManager
 
+__all__ = ["AutoCompleteJsonRespPlugin", "gen_merge_func"]
+
+MergeFuncType = Callable[[dict], dict]
+_IMMUTABLE_TYPE_TUPLE: Tuple[type, ...] = (str, int, float, bool, bytes, type(None))
+
+
+def _gen_copy_func(value: Any) -> Callable[[], Any]:
+    """Generate the func that returns a new copy of the default value, the immutable value is not copied"""
+    if isinstance(value, dict):
+        copy_item_list: List[Tuple[Any, Callable[[], Any]]] = [(k, _gen_copy_func(v)) for k, v in value.items()]
+        return lambda: {k: copy_func() for k, copy_func in copy_item_list}
+    elif isinstance(value, list):
+        copy_func_list: List[Callable[[], Any]] = [_gen_copy_func(i) for i in value]
+        return lambda: [copy_func() for copy_func in copy_func_list]
+    elif isinstance(value, _IMMUTABLE_TYPE_TUPLE):
+        return lambda: value
+    return lambda: copy.deepcopy(value)
+
+
+def _gen_list_merge_func(value: list) -> Callable[[list], list]:
+    # The last element of the default list is the template of the element of the response list
+    copy_prefix_func = _gen_copy_func(value[:-1])
+    template = value[-1]
+    if not isinstance(template, dict):
+        return lambda target_list: copy_prefix_func() + list(target_list)
+    merge_item_func = gen_merge_func(template)
+    return lambda target_list: copy_prefix_func() + [merge_item_func(item) for item in target_list]
+
+
+def gen_merge_func(default_dict: dict) -> MergeFuncType:
+    """Compile the default dict into the func that completes the response dict by the default dict.
+
+    The result only contains the keys of the default dict, the value of the key that exists in the response dict
+    is used (the dict value and the element of the list value are completed recursively),
+    the value of the missing key is the copy of the default value.
+    """
+    plan_list: List[Tuple[Any, Optional[Callable[[Any], Any]], Callable[[], Any]]] = []
+    for key, value in default_dict.items():
+        merge_func: Optional[Callable[[Any], Any]] = None
+        if isinstance(value, dict):
+            merge_func = gen_merge_func(value)
+        elif value and isinstance(value, list):
+            merge_func = _gen_list_merge_func(value)
+        plan_list.append((key, merge_func, _gen_copy_func(value)))
+
+    def _merge(target_dict: dict) -> dict:
+        result_dict: dict = {}
+        for key, merge_func, copy_func in plan_list:
+            if key not in target_dict:
+                result_dict[key] = copy_func()
+            elif merge_func is None:
+                result_dict[key] = target_dict[key]
+            else:
+                result_dict[key] = merge_func(target_dict[key])
+        return result_dict
+
+    return _merge
+
 
 class AutoCompleteJsonRespPlugin(PrePluginProtocol):
     default_response_dict: dict
+    merge_func: Optional[MergeFuncType] = None
 
-    def _merge(self, source_dict: dict, target_dict: dict) -> None:
-        for key, value in source_dict.items():
-            if isinstance(value, dict) and key in target_dict:
-                self._merge(value, target_dict[key])
-            elif value and isinstance(value, list) and key in target_dict:
-                raw_value = value.pop()
-                for item in target_dict[key]:
-                    new_value = copy.deepcopy(raw_value)
-                    self._merge(new_value, item)
-                    value.append(new_value)
-            else:
-                source_dict[key] = target_dict.get(key, value)
+    def __post_init__(self, **kwargs: Any) -> None:
+        if self.merge_func is None:
+            self.merge_func = gen_merge_func(self.default_response_dict)
 
     def merge(self, response_dict: dict) -> dict:
-        default_response_dict: dict = copy.deepcopy(self.default_response_dict)
-        self._merge(default_response_dict, response_dict)
-        return default_response_dict
+        return self.merge_func(response_dict)  # type: ignore[misc]
 
     @classmethod
     def pre_check_hook(cls, pait_core_model: "PaitCoreModel", kwargs: Dict) -> None:
@@ -47,6 +95,8 @@ class AutoCompleteJsonRespPlugin(PrePluginProtocol):
         if not issubclass(pait_response_model, JsonResponseModel):
             raise ValueError(f"pait_response_model must `{JsonResponseModel.__name__}` not {pait_response_model}")
         kwargs["default_response_dict"] = pait_response_model.get_default_dict()
+        # The merge plan is compiled once, so each request does not need to deep copy the default response dict
+        kwargs["merge_func"] = gen_merge_func(kwargs["default_response_dict"])
         return kwargs
 
     def _sync_call(self, context: "PluginContext") -> Any:
@@ -1,6 +1,6 @@
 import inspect
 import logging
-from typing import TYPE_CHECKING, Any, Callable, Dict, Generic, List, Type, TypeVar, Union
+from typing import TYPE_CHECKING, Any, Callable, Dict, Generic, List, Tuple, Type, TypeVar, Union
 
 if TYPE_CHECKING:
     from pait.model.context import ContextModel as PluginContext
@@ -15,6 +15,26 @@ GetPaitResponseModelFuncType = Callable[[List[Type["BaseResponseModel"]]], Type[
 
 
 class PluginProtocol(object):
+    """The plugin wraps the next plugin(or route function) by `__call__`.
+
+    The plugin can also only declare the `before_call` and `after_call` hooks instead of overriding `__call__`,
+    then consecutive such plugins of the route are fused into a `FusedPlugin` when the plugin stack is built,
+    which calls all hooks in one frame instead of nesting a call per plugin.
+    """
+
+    # Whether the plugin only declares hooks and can be fused, it is set automatically when the subclass is created
+    _is_fusible: bool = False
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        has_hook: bool = (
+            cls.before_call is not PluginProtocol.before_call or cls.after_call is not PluginProtocol.after_call
+        )
+        cls._is_fusible = has_hook and cls.__call__ in (PluginProtocol.__call__, PluginProtocol._call_with_hook)
+        if has_hook and cls.__call__ is PluginProtocol.__call__:
+            # Called directly (not fused), the hooks still need to be executed
+            cls.__call__ = PluginProtocol._call_with_hook  # type: ignore[assignment]
+
     def __init__(self, next_plugin: _NextPluginT, pait_core_model: "PaitCoreModel", **kwargs: Any) -> None:
         """Direct init calls are not supported,
         so there is no need to write clearly in init what parameters are needed
@@ -55,6 +75,15 @@ class PluginProtocol(object):
         """Factory function for generating plugins"""
         return PluginManager(cls, **kwargs)  # type: ignore
 
+    def before_call(self, context: "PluginContext") -> None:
+        """The hook that runs before calling the next plugin, e.g. check the param of the route.
+        If the route function is a coroutine function, the hook can also be a coroutine function"""
+
+    def after_call(self, context: "PluginContext", result: Any) -> Any:
+        """The hook that runs after the next plugin returns, the return value replaces the result.
+        If the route function is a coroutine function, the hook can also be a coroutine function"""
+        return result
+
     def __call__(self, context: "PluginContext") -> Any:
         """The entry function called by the plugin."""
         if isinstance(self.next_plugin, PluginProtocol):
@@ -62,6 +91,22 @@ class PluginProtocol(object):
         else:
             return self.next_plugin(*context.args, **context.kwargs)
 
+    def _call_with_hook(self, context: "PluginContext") -> Any:
+        if self._is_async_func:
+            return self._async_call_with_hook(context)
+        self.before_call(context)
+        return self.after_call(context, PluginProtocol.__call__(self, context))
+
+    async def _async_call_with_hook(self, context: "PluginContext") -> Any:
+        before_result: Any = self.before_call(context)  # type: ignore[func-returns-value]
+        if inspect.isawaitable(before_result):
+            await before_result
+        result: Any = await PluginProtocol.__call__(self, context)
+        result = self.after_call(context, result)
+        if inspect.isawaitable(result):
+            result = await result
+        return result
+
 
 class PrePluginProtocol(PluginProtocol):
     """Pre Plugin"""
@@ -71,6 +116,103 @@ class PostPluginProtocol(PluginProtocol):
     """Post Plugin"""
 
 
+class FusedPlugin(PluginProtocol):
+    """Calls the hooks of multiple fusible plugins in one sync function:
+    the `before_call` hooks in order, then the next plugin, then the `after_call` hooks in reverse order.
+
+    Note: it is created by `fuse_plugin` when the plugin stack is built, the user does not need to use it directly
+    """
+
+    plugin_list: List[PluginProtocol]
+
+    def __post_init__(self, **kwargs: Any) -> None:
+        # The hook list is compiled once, so the request does not need to look up each plugin's hook
+        self._before_list: Tuple[Callable, ...] = tuple(
+            i.before_call for i in self.plugin_list if type(i).before_call is not PluginProtocol.before_call
+        )
+        self._after_list: Tuple[Callable, ...] = tuple(
+            i.after_call for i in reversed(self.plugin_list) if type(i).after_call is not PluginProtocol.after_call
+        )
+        self._next_is_plugin: bool = isinstance(self.next_plugin, PluginProtocol)
+
+    def __call__(self, context: "PluginContext") -> Any:
+        for before_call in self._before_list:
+            before_call(context)
+        if self._next_is_plugin:
+            result: Any = self.next_plugin(context)
+        else:
+            result = self.next_plugin(*context.args, **context.kwargs)
+        for after_call in self._after_list:
+            result = after_call(context, result)
+        return result
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__} {[i.__class__.__name__ for i in self.plugin_list]}>"
+
+
+class AsyncFusedPlugin(FusedPlugin):
+    """Calls the hooks of multiple fusible plugins in one coroutine, the hook can be a sync or coroutine function"""
+
+    def __post_init__(self, **kwargs: Any) -> None:
+        super().__post_init__(**kwargs)
+        self._async_before_list: Tuple[Tuple[Callable, bool], ...] = tuple(
+            (i, inspect.iscoroutinefunction(i)) for i in self._before_list
+        )
+        self._async_after_list: Tuple[Tuple[Callable, bool], ...] = tuple(
+            (i, inspect.iscoroutinefunction(i)) for i in self._after_list
+        )
+
+    async def __call__(self, context: "PluginContext") -> Any:  # type: ignore[override]
+        for before_call, is_async in self._async_before_list:
+            if is_async:
+                await before_call(context)
+            else:
+                before_call(context)
+        if self._next_is_plugin:
+            result: Any = await self.next_plugin(context)
+        else:
+            result = await self.next_plugin(*context.args, **context.kwargs)
+        for after_call, is_async in self._async_after_list:
+            if is_async:
+                result = await after_call(context, result)
+            else:
+                result = after_call(context, result)
+        return result
+
+
+def fuse_plugin(
+    plugin_manager_list: List["PluginManager"], next_plugin: _NextPluginT, pait_core_model: "PaitCoreModel"
+) -> _NextPluginT:
+    """Build the plugin stack from the plugin manager list, consecutive fusible plugins are fused into one plugin,
+    and the other plugins still wrap the next plugin"""
+    fusible_plugin_list: List[PluginProtocol] = []
+
+    def _fuse(_next_plugin: _NextPluginT) -> _NextPluginT:
+        if not fusible_plugin_list:
+            return _next_plugin
+        fusible_plugin_list.reverse()
+        fused_plugin_class: Type[FusedPlugin] = (
+            AsyncFusedPlugin if inspect.iscoroutinefunction(pait_core_model.func) else FusedPlugin
+        )
+        if fused_plugin_class is FusedPlugin:
+            for plugin in fusible_plugin_list:
+                if inspect.iscoroutinefunction(plugin.before_call) or inspect.iscoroutinefunction(plugin.after_call):
+                    raise TypeError(f"{plugin.__class__.__name__}'s hook can not be async, because the route is sync")
+        fused_plugin: FusedPlugin = fused_plugin_class(
+            _next_plugin, pait_core_model, plugin_list=fusible_plugin_list.copy()
+        )
+        fusible_plugin_list.clear()
+        return fused_plugin
+
+    for plugin_manager in reversed(plugin_manager_list):
+        if plugin_manager.plugin_class._is_fusible:
+            # The fused plugin's hooks do not call the next plugin, but it is still set to keep the plugin's attr
+            fusible_plugin_list.append(plugin_manager.get_plugin(next_plugin, pait_core_model))
+        else:
+            next_plugin = plugin_manager.get_plugin(_fuse(next_plugin), pait_core_model)
+    return _fuse(next_plugin)
+
+
 class PluginManager(Generic[_PluginT]):
     """
     A proxy for the Pait plugin, Ensure plugins referenced by each route function are isolated
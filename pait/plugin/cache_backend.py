@@ -0,0 +1,463 @@
+import asyncio
+import json
+import struct
+import threading
+import time
+import weakref
+from collections import OrderedDict
+from contextlib import asynccontextmanager, contextmanager
+from dataclasses import dataclass
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncContextManager,
+    AsyncIterator,
+    ContextManager,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Union,
+)
+
+if TYPE_CHECKING:
+    from redis import Redis  # type: ignore
+    from redis.asyncio import Redis as AsyncioRedis  # type: ignore
+
+__all__ = [
+    "CacheStats",
+    "BaseCacheBackend",
+    "RedisCacheBackend",
+    "MemoryCacheBackend",
+    "TwoTierCacheBackend",
+]
+# The header of the value in L2 of TwoTierCacheBackend: the expire timestamp (0 means never expire), tags length
+_l2_header_struct: struct.Struct = struct.Struct(">dI")
+
+
+@dataclass
+class CacheStats(object):
+    """The hit/miss counters of the cache backend.
+
+    Note: The counters are not protected by the lock, which may be slightly inaccurate in multi-threaded scenarios
+    """
+
+    hits: int = 0
+    misses: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def reset(self) -> None:
+        self.hits = 0
+        self.misses = 0
+
+
+class BaseCacheBackend(object):
+    """The storage of the CacheResponsePlugin, the value is the bytes dumped by the codec of the plugin.
+
+    The sync method is used by the sync route function and the method with the `async_` prefix is used by the
+    async route function, the backend only needs to implement the method required by the route function.
+    """
+
+    def __init__(self) -> None:
+        self.stats: CacheStats = CacheStats()
+
+    def get(self, key: str) -> Optional[bytes]:
+        """Get the value of the key, return None if the key does not exist or expired"""
+        raise NotImplementedError()
+
+    def set(self, key: str, value: bytes, ex: Optional[int] = None, tags: Sequence[str] = ()) -> None:
+        """Set the value of the key, `ex` is the expiration time (seconds).
+        The key is added to the index of each tag, and it will be deleted by `invalidate_tag`"""
+        raise NotImplementedError()
+
+    def delete(self, *key: str) -> None:
+        raise NotImplementedError()
+
+    def invalidate_tag(self, *tag: str) -> None:
+        """Delete all keys of the tags"""
+        raise NotImplementedError()
+
+    def lock(
+        self,
+        key: str,
+        timeout: Optional[float] = None,
+        sleep: Optional[float] = None,
+        blocking_timeout: Optional[float] = None,
+    ) -> ContextManager:
+        """Get the lock of the key, the param is the same as the lock of redis"""
+        raise NotImplementedError()
+
+    async def async_get(self, key: str) -> Optional[bytes]:
+        raise NotImplementedError()
+
+    async def async_set(self, key: str, value: bytes, ex: Optional[int] = None, tags: Sequence[str] = ()) -> None:
+        raise NotImplementedError()
+
+    async def async_delete(self, *key: str) -> None:
+        raise NotImplementedError()
+
+    async def async_invalidate_tag(self, *tag: str) -> None:
+        raise NotImplementedError()
+
+    def async_lock(
+        self,
+        key: str,
+        timeout: Optional[float] = None,
+        sleep: Optional[float] = None,
+        blocking_timeout: Optional[float] = None,
+    ) -> AsyncContextManager:
+        raise NotImplementedError()
+
+    def _record(self, value: Optional[bytes]) -> Optional[bytes]:
+        if value is None:
+            self.stats.misses += 1
+        else:
+            self.stats.hits += 1
+        return value
+
+
+# Add the key to the tag set, the expiry of the tag set is only extended, so it is kept as long as the longest key.
+# If the key never expires, the tag set never expires too (`EXPIRE ... GT` needs redis 7, so use the script)
+_redis_add_tag_script: str = """
+local is_exists = redis.call("EXISTS", KEYS[1])
+redis.call("SADD", KEYS[1], ARGV[1])
+local ex = tonumber(ARGV[2])
+if ex <= 0 then
+    redis.call("PERSIST", KEYS[1])
+    return
+end
+local ttl = redis.call("TTL", KEYS[1])
+if is_exists == 0 or (ttl >= 0 and ttl < ex) then
+    redis.call("EXPIRE", KEYS[1], ex)
+end
+"""
+
+
+class RedisCacheBackend(BaseCacheBackend):
+    """Use redis as the cache backend, the sync route function needs `redis.Redis`,
+    and the async route function needs `redis.asyncio.Redis`.
+
+    The client whose `decode_responses` is False is recommended, the value is saved as is.
+    Otherwise, the value is converted to str by latin1 (binary safe, but the non-ascii byte takes two bytes in redis)
+
+    :param redis: redis client
+    :param tag_prefix: The prefix of the redis set key that saves the keys of the tag
+    """
+
+    def __init__(self, redis: Union["Redis", "AsyncioRedis"], tag_prefix: str = "pait_cache_tag:") -> None:
+        super().__init__()
+        self.redis: Union["Redis", "AsyncioRedis"] = redis
+        self.tag_prefix: str = tag_prefix
+        self.decode_responses: bool = redis.connection_pool.connection_kwargs.get("decode_responses", False)
+
+    def _to_redis_value(self, value: bytes) -> Union[str, bytes]:
+        return value.decode("latin1") if self.decode_responses else value
+
+    def _from_redis_value(self, value: Union[str, bytes, None]) -> Optional[bytes]:
+        if not value:
+            return self._record(None)
+        return self._record(value.encode("latin1") if isinstance(value, str) else value)
+
+    def get(self, key: str) -> Optional[bytes]:
+        return self._from_redis_value(self.redis.get(key))
+
+    def _pipeline_set(self, pipeline: Any, key: str, value: bytes, ex: Optional[int], tags: Sequence[str]) -> None:
+        pipeline.set(key, self._to_redis_value(value), ex=ex)
+        for tag in tags:
+            pipeline.eval(_redis_add_tag_script, 1, self.tag_prefix + tag, key, ex or 0)
+
+    def set(self, key: str, value: bytes, ex: Optional[int] = None, tags: Sequence[str] = ()) -> None:
+        if not tags:
+            self.redis.set(key, self._to_redis_value(value), ex=ex)
+            return
+        pipeline = self.redis.pipeline(transaction=False)
+        self._pipeline_set(pipeline, key, value, ex, tags)
+        pipeline.execute()
+
+    def delete(self, *key: str) -> None:
+        if key:
+            self.redis.delete(*key)
+
+    def invalidate_tag(self, *tag: str) -> None:
+        for _tag in tag:
+            tag_key = self.tag_prefix + _tag
+            self.redis.delete(*self.redis.smembers(tag_key), tag_key)
+
+    def lock(
+        self,
+        key: str,
+        timeout: Optional[float] = None,
+        sleep: Optional[float] = None,
+        blocking_timeout: Optional[float] = None,
+    ) -> ContextManager:
+        return self.redis.lock(key, timeout=timeout, sleep=sleep or 0.1, blocking_timeout=blocking_timeout)
+
+    async def async_get(self, key: str) -> Optional[bytes]:
+        return self._from_redis_value(await self.redis.get(key))
+
+    async def async_set(self, key: str, value: bytes, ex: Optional[int] = None, tags: Sequence[str] = ()) -> None:
+        if not tags:
+            await self.redis.set(key, self._to_redis_value(value), ex=ex)
+            return
+        pipeline = self.redis.pipeline(transaction=False)
+        self._pipeline_set(pipeline, key, value, ex, tags)
+        await pipeline.execute()
+
+    async def async_delete(self, *key: str) -> None:
+        if key:
+            await self.redis.delete(*key)
+
+    async def async_invalidate_tag(self, *tag: str) -> None:
+        for _tag in tag:
+            tag_key = self.tag_prefix + _tag
+            await self.redis.delete(*(await self.redis.smembers(tag_key)), tag_key)
+
+    def async_lock(
+        self,
+        key: str,
+        timeout: Optional[float] = None,
+        sleep: Optional[float] = None,
+        blocking_timeout: Optional[float] = None,
+    ) -> AsyncContextManager:
+        return self.redis.lock(key, timeout=timeout, sleep=sleep or 0.1, blocking_timeout=blocking_timeout)
+
+
+class MemoryCacheBackend(BaseCacheBackend):
+    """In-process cache backend with LRU eviction and TTL expiration, it does not need the network round trip,
+    but the cache is not shared between processes.
+
+    :param max_size: The max number of keys, the least recently used key will be evicted when the size is exceeded
+    """
+
+    def __init__(self, max_size: int = 1024) -> None:
+        super().__init__()
+        if max_size <= 0:
+            raise ValueError("max_size must be greater than 0")
+        self.max_size: int = max_size
+        # key: (expire time, value, tags), the expire time is None means never expire
+        self._data: "OrderedDict[str, Tuple[Optional[float], bytes, Sequence[str]]]" = OrderedDict()
+        self._tag_dict: Dict[str, Set[str]] = {}
+        self._data_lock: threading.Lock = threading.Lock()
+        self._lock_dict: "weakref.WeakValueDictionary[str, Any]" = weakref.WeakValueDictionary()
+        self._async_lock_dict: "weakref.WeakValueDictionary[str, asyncio.Lock]" = weakref.WeakValueDictionary()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def get(self, key: str) -> Optional[bytes]:
+        with self._data_lock:
+            item = self._data.get(key)
+            if item is None:
+                return self._record(None)
+            expire_time, value, _ = item
+            if expire_time is not None and expire_time <= time.monotonic():
+                self._remove(key)
+                return self._record(None)
+            self._data.move_to_end(key)
+        return self._record(value)
+
+    def _remove(self, key: str) -> None:
+        """Remove the key and its tag index, the caller needs to hold the data lock"""
+        item = self._data.pop(key, None)
+        if item is None:
+            return
+        for tag in item[2]:
+            key_set = self._tag_dict.get(tag)
+            if key_set is not None:
+                key_set.discard(key)
+                if not key_set:
+                    del self._tag_dict[tag]
+
+    def set(self, key: str, value: bytes, ex: Optional[int] = None, tags: Sequence[str] = ()) -> None:
+        expire_time = time.monotonic() + ex if ex else None
+        with self._data_lock:
+            self._remove(key)
+            self._data[key] = (expire_time, value, tags)
+            for tag in tags:
+                self._tag_dict.setdefault(tag, set()).add(key)
+            while len(self._data) > self.max_size:
+                self._remove(next(iter(self._data)))
+
+    def delete(self, *key: str) -> None:
+        with self._data_lock:
+            for _key in key:
+                self._remove(_key)
+
+    def invalidate_tag(self, *tag: str) -> None:
+        with self._data_lock:
+            for _tag in tag:
+                for key in list(self._tag_dict.get(_tag, ())):
+                    self._remove(key)
+
+    def clear(self) -> None:
+        with self._data_lock:
+            self._data.clear()
+            self._tag_dict.clear()
+
+    @contextmanager
+    def lock(
+        self,
+        key: str,
+        timeout: Optional[float] = None,
+        sleep: Optional[float] = None,
+        blocking_timeout: Optional[float] = None,
+    ) -> Iterator[None]:
+        # The lock is only valid in the current process, so `timeout` and `sleep` are ignored.
+        # The lock object is kept by the weak reference, it will be released after all users exit
+        with self._data_lock:
+            lock = self._lock_dict.get(key)
+            if lock is None:
+                lock = threading.Lock()
+                self._lock_dict[key] = lock
+        if not lock.acquire(timeout=-1 if blocking_timeout is None else blocking_timeout):
+            raise TimeoutError(f"Unable to acquire lock:{key}")
+        try:
+            yield
+        finally:
+            lock.release()
+
+    async def async_get(self, key: str) -> Optional[bytes]:
+        return self.get(key)
+
+    async def async_set(self, key: str, value: bytes, ex: Optional[int] = None, tags: Sequence[str] = ()) -> None:
+        self.set(key, value, ex=ex, tags=tags)
+
+    async def async_delete(self, *key: str) -> None:
+        self.delete(*key)
+
+    async def async_invalidate_tag(self, *tag: str) -> None:
+        self.invalidate_tag(*tag)
+
+    @asynccontextmanager
+    async def async_lock(
+        self,
+        key: str,
+        timeout: Optional[float] = None,
+        sleep: Optional[float] = None,
+        blocking_timeout: Optional[float] = None,
+    ) -> AsyncIterator[None]:
+        lock = self._async_lock_dict.get(key)
+        if lock is None:
+            lock = asyncio.Lock()
+            self._async_lock_dict[key] = lock
+        try:
+            await asyncio.wait_for(lock.acquire(), blocking_timeout)
+        except asyncio.TimeoutError:
+            raise TimeoutError(f"Unable to acquire lock:{key}")
+        try:
+            yield
+        finally:
+            lock.release()
+
+
+class TwoTierCacheBackend(BaseCacheBackend):
+    """The local L1 backend is in front of the L2 backend(e.g. redis),
+    the hit of the hot key can be served by L1 without touching the network.
+
+    The value of L1 may be stale within `l1_cache_time` after the value of L2 is updated by other process,
+    so `l1_cache_time` should be less than the cache time of the plugin.
+
+    The expire time and tags are saved in front of the value of L2, so the value filled from L2 to L1 keeps its tags
+    and does not outlive the value of L2. Note: The value of L2 can only be read by TwoTierCacheBackend
+
+    :param l2: The shared backend, such as RedisCacheBackend
+    :param l1: The local backend, default is MemoryCacheBackend
+    :param l1_cache_time: The max cache time (seconds) of the value in L1
+    """
+
+    def __init__(self, l2: BaseCacheBackend, l1: Optional[BaseCacheBackend] = None, l1_cache_time: int = 5) -> None:
+        super().__init__()
+        self.l1: BaseCacheBackend = l1 or MemoryCacheBackend()
+        self.l2: BaseCacheBackend = l2
+        self.l1_cache_time: int = l1_cache_time
+
+    def _get_l1_ex(self, ex: Optional[int]) -> int:
+        return min(ex, self.l1_cache_time) if ex else self.l1_cache_time
+
+    @staticmethod
+    def _pack_l2(value: bytes, ex: Optional[int], tags: Sequence[str]) -> bytes:
+        tag_data: bytes = json.dumps(list(tags)).encode() if tags else b""
+        return _l2_header_struct.pack(time.time() + ex if ex else 0.0, len(tag_data)) + tag_data + value
+
+    def _unpack_l2(self, data: bytes) -> Tuple[bytes, int, List[str]]:
+        """Return the value, the cache time of L1 (the value does not fill L1 if it is not positive) and tags"""
+        expire_time, tag_length = _l2_header_struct.unpack_from(data)
+        tag_end: int = _l2_header_struct.size + tag_length
+        tags: List[str] = json.loads(data[_l2_header_struct.size : tag_end]) if tag_length else []
+        l1_ex: int = self.l1_cache_time
+        if expire_time:
+            # The remaining time is rounded down, so the value of L1 does not outlive the value of L2
+            l1_ex = min(l1_ex, int(expire_time - time.time()))
+        return data[tag_end:], l1_ex, tags
+
+    def get(self, key: str) -> Optional[bytes]:
+        value = self.l1.get(key)
+        if value is None:
+            data = self.l2.get(key)
+            if data is not None:
+                value, l1_ex, tags = self._unpack_l2(data)
+                if l1_ex > 0:
+                    self.l1.set(key, value, ex=l1_ex, tags=tags)
+        return self._record(value)
+
+    def set(self, key: str, value: bytes, ex: Optional[int] = None, tags: Sequence[str] = ()) -> None:
+        self.l2.set(key, self._pack_l2(value, ex, tags), ex=ex, tags=tags)
+        self.l1.set(key, value, ex=self._get_l1_ex(ex), tags=tags)
+
+    def delete(self, *key: str) -> None:
+        self.l2.delete(*key)
+        self.l1.delete(*key)
+
+    def invalidate_tag(self, *tag: str) -> None:
+        # Note: Only the L1 of the current process is invalidated,
+        #  the L1 of other processes is invalidated after `l1_cache_time`
+        self.l2.invalidate_tag(*tag)
+        self.l1.invalidate_tag(*tag)
+
+    def lock(
+        self,
+        key: str,
+        timeout: Optional[float] = None,
+        sleep: Optional[float] = None,
+        blocking_timeout: Optional[float] = None,
+    ) -> ContextManager:
+        # Only L2 can lock between processes
+        return self.l2.lock(key, timeout=timeout, sleep=sleep, blocking_timeout=blocking_timeout)
+
+    async def async_get(self, key: str) -> Optional[bytes]:
+        value = await self.l1.async_get(key)
+        if value is None:
+            data = await self.l2.async_get(key)
+            if data is not None:
+                value, l1_ex, tags = self._unpack_l2(data)
+                if l1_ex > 0:
+                    await self.l1.async_set(key, value, ex=l1_ex, tags=tags)
+        return self._record(value)
+
+    async def async_set(self, key: str, value: bytes, ex: Optional[int] = None, tags: Sequence[str] = ()) -> None:
+        await self.l2.async_set(key, self._pack_l2(value, ex, tags), ex=ex, tags=tags)
+        await self.l1.async_set(key, value, ex=self._get_l1_ex(ex), tags=tags)
+
+    async def async_delete(self, *key: str) -> None:
+        await self.l2.async_delete(*key)
+        await self.l1.async_delete(*key)
+
+    async def async_invalidate_tag(self, *tag: str) -> None:
+        await self.l2.async_invalidate_tag(*tag)
+        await self.l1.async_invalidate_tag(*tag)
+
+    def async_lock(
+        self,
+        key: str,
+        timeout: Optional[float] = None,
+        sleep: Optional[float] = None,
+        blocking_timeout: Optional[float] = None,
+    ) -> AsyncContextManager:
+        return self.l2.async_lock(key, timeout=timeout, sleep=sleep, blocking_timeout=blocking_timeout)
@@ -0,0 +1,110 @@
+import json
+import math
+import pickle
+from typing import Any, List, NamedTuple, Optional, Tuple
+
+__all__ = ["CachedResponse", "BaseCacheCodec", "PickleCacheCodec", "CacheCodec"]
+_json_scalar_type_set = {str, int, bool, type(None)}
+
+
+def _is_json_value(value: Any) -> bool:
+    """Whether the value is the same after the json round trip, it is checked by the type of each value,
+    e.g. the key of dict must be str, the tuple, subclass of str or NaN can not be restored"""
+    value_type = type(value)
+    if value_type in _json_scalar_type_set:
+        return True
+    elif value_type is float:
+        return math.isfinite(value)
+    elif value_type is dict:
+        return all(type(k) is str and _is_json_value(v) for k, v in value.items())
+    elif value_type is list:
+        return all(_is_json_value(i) for i in value)
+    return False
+
+
+class CachedResponse(NamedTuple):
+    """The framework independent value of the response, only contains the data that needs to be sent to the client"""
+
+    status_code: int
+    headers: List[Tuple[str, str]]
+    body: bytes
+
+
+class BaseCacheCodec(object):
+    """Convert the result of the route function to the bytes that can be saved by the cache backend"""
+
+    def dumps(self, value: Any) -> bytes:
+        raise NotImplementedError()
+
+    def loads(self, data: bytes) -> Any:
+        raise NotImplementedError()
+
+
+class PickleCacheCodec(BaseCacheCodec):
+    """Pickle the whole value, it supports all picklable values, but it is slow for the framework response"""
+
+    def dumps(self, value: Any) -> bytes:
+        return pickle.dumps(value)
+
+    def loads(self, data: bytes) -> Any:
+        return pickle.loads(data)
+
+
+class CacheCodec(BaseCacheCodec):
+    """The default codec, the first byte of the data is the tag of the encoding:
+
+    - `j`: dict or list value, it is encoded by json.
+        Note: The value must be the same after the json round trip (e.g. the key of dict is str),
+            otherwise it will be encoded by pickle
+    - `r`: the framework response, only status code, headers and raw body are saved,
+        the framework codec needs to implement `dump_response` and `load_response`
+    - `p`: other values (e.g. the exception in `include_exc`), it is encoded by pickle
+    """
+
+    _json_tag: bytes = b"j"
+    _response_tag: bytes = b"r"
+    _pickle_tag: bytes = b"p"
+
+    def dump_response(self, response: Any) -> Optional[CachedResponse]:
+        """Convert the framework response to CachedResponse, return None if it is not supported"""
+        return None
+
+    def load_response(self, cached_response: CachedResponse) -> Any:
+        """Convert the CachedResponse to the framework response"""
+        return cached_response
+
+    def _dumps_json(self, value: Any) -> Optional[bytes]:
+        try:
+            if not _is_json_value(value):
+                return None
+            data = json.dumps(value, separators=(",", ":"), ensure_ascii=False)
+        except (RecursionError, TypeError, ValueError):
+            # e.g. the value contains itself
+            return None
+        return self._json_tag + data.encode()
+
+    def dumps(self, value: Any) -> bytes:
+        value_type = type(value)
+        if value_type is dict or value_type is list:
+            data = self._dumps_json(value)
+            if data is not None:
+                return data
+        cached_response = value if value_type is CachedResponse else self.dump_response(value)
+        if cached_response is not None:
+            meta = json.dumps([cached_response.status_code, cached_response.headers], separators=(",", ":")).encode()
+            return self._response_tag + len(meta).to_bytes(4, "big") + meta + cached_response.body
+        return self._pickle_tag + pickle.dumps(value)
+
+    def loads(self, data: bytes) -> Any:
+        tag = data[:1]
+        if tag == self._json_tag:
+            return json.loads(data[1:])
+        elif tag == self._response_tag:
+            meta_end = 5 + int.from_bytes(data[1:5], "big")
+            status_code, headers = json.loads(data[5:meta_end])
+            return self.load_response(
+                CachedResponse(status_code, [(key, value) for key, value in headers], data[meta_end:])
+            )
+        elif tag == self._pickle_tag:
+            return pickle.loads(data[1:])
+        raise ValueError(f"Unknown cache data tag:{tag!r}")
@@ -1,14 +1,34 @@
-import pickle
-from typing import TYPE_CHECKING, Any, Dict, Optional, Set, Tuple, Type, Union
+import asyncio
+import dataclasses
+import hashlib
+import json
+import logging
+import string
+import struct
+import time
+from concurrent.futures import Future
+from enum import Enum
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Sequence, Set, Tuple, Type, Union
 
 from redis.asyncio import Redis  # type: ignore
 from redis.asyncio import Redis as AsyncioRedis
 
+from pait._pydanitc_adapter import BaseModel, model_dump
 from pait.app.any import set_app_attribute
 from pait.field import BaseRequestResourceField, ExtraParam
 from pait.g import get_ctx
+from pait.model.context import ContextModel
 from pait.model.response import FileResponseModel
 from pait.plugin.base import PostPluginProtocol
+from pait.plugin.cache_backend import (
+    BaseCacheBackend,
+    CacheStats,
+    MemoryCacheBackend,
+    RedisCacheBackend,
+    TwoTierCacheBackend,
+)
+from pait.plugin.cache_codec import BaseCacheCodec, CacheCodec, CachedResponse, PickleCacheCodec
+from pait.plugin.compress_response import get_cache_prepare, set_cache_prepare
 from pait.util import FuncSig, get_func_sig
 
 if TYPE_CHECKING:
@@ -17,20 +37,69 @@ if TYPE_CHECKING:
     from pait.plugin.base import PluginManager
 
 
+__all__ = [
+    "CacheRespExtraParam",
+    "CacheResponsePlugin",
+    "BaseCacheBackend",
+    "BaseCacheCodec",
+    "CacheCodec",
+    "CachedResponse",
+    "PickleCacheCodec",
+    "CacheStats",
+    "MemoryCacheBackend",
+    "RedisCacheBackend",
+    "TwoTierCacheBackend",
+]
+
+
+logger: logging.Logger = logging.getLogger(__name__)
+_stale_struct: struct.Struct = struct.Struct(">d")
+
+
+def _key_json_default(value: Any) -> Any:
+    """Convert the value that json does not support to the canonical value of the cache key"""
+    if isinstance(value, BaseModel):
+        return model_dump(value)
+    elif isinstance(value, (set, frozenset)):
+        return sorted(json.dumps(i, sort_keys=True, default=_key_json_default) for i in value)
+    elif isinstance(value, Enum):
+        return value.value
+    elif isinstance(value, bytes):
+        return value.hex()
+    elif dataclasses.is_dataclass(value) and not isinstance(value, type):
+        return dataclasses.asdict(value)
+    elif type(value).__repr__ is object.__repr__ and type(value).__str__ is object.__str__:
+        # The default repr contains the id of the object, it is different in each request
+        return f"{type(value).__module__}.{type(value).__qualname__}"
+    return str(value)
+
+
 class CacheRespExtraParam(ExtraParam):
-    pass
+    """The param with CacheRespExtraParam is used to generate the cache key(need `enable_cache_name_merge_param`),
+    e.g. `field.Header.i(alias="Accept-Language", extra_param_list=[CacheRespExtraParam()])` vary on the header"""
 
 
 class CacheResponsePlugin(PostPluginProtocol):
     _cache_plugin_redis_key: str = "_cache_plugin_redis"
+    _cache_plugin_backend_key: str = "_cache_plugin_backend"
     _cache_name_param_set: Set[str] = set()
+    # The codec used when the plugin does not set codec, the framework plugin will replace it with the framework codec
+    default_codec: BaseCacheCodec = CacheCodec()
+    # Whether the stale value of the async route function is refreshed by the background task,
+    # if False, it is refreshed by the request that finds the value is stale (same as the sync route function)
+    background_refresh: bool = True
 
     name: str
     lock_name: str
     include_exc: Optional[Tuple[Type[Exception]]] = None
     redis: Union[Redis, AsyncioRedis, None] = None
+    backend: Optional[BaseCacheBackend] = None
+    codec: Optional[BaseCacheCodec] = None
     enable_cache_name_merge_param: bool
+    vary_header_list: Optional[Sequence[str]] = None
+    tag_list: Optional[Sequence[str]] = None
     cache_time: Optional[int]
+    stale_time: Optional[int]
     timeout: Optional[float]
     sleep: Optional[float]
     blocking_timeout: Optional[float]
@@ -38,16 +107,24 @@ class CacheResponsePlugin(PostPluginProtocol):
     def __post_init__(self, **kwargs: Any) -> None:
         self.lock_name: str = self.name + ":" + "lock"
         self._cache_name_param_set = kwargs.pop("_cache_name_param_set")
-
-    @classmethod
-    def check_redis(cls, redis: Union[Redis, AsyncioRedis]) -> None:
-        if redis.connection_pool.connection_kwargs["decode_responses"] is False:
-            raise ValueError("Please set redis`s param:decode_responses to True")
+        if self.backend is None and self.redis is not None:
+            self.backend = RedisCacheBackend(self.redis)
+        if self.codec is None:
+            self.codec = self.default_codec
+        # The key is being generated in the current process, value is the future of the dumped value
+        # (asyncio.Future for the async route function, concurrent.futures.Future for the sync route function)
+        self._flight_dict: Dict[str, Any] = {}
+        self._background_task_set: Set[asyncio.Future] = set()
 
     @classmethod
     def set_redis_to_app(cls, app: Any, redis: Union[Redis, AsyncioRedis]) -> None:
-        cls.check_redis(redis)
         set_app_attribute(app, cls._cache_plugin_redis_key, redis)
+        cls.set_backend_to_app(app, RedisCacheBackend(redis))
+
+    @classmethod
+    def set_backend_to_app(cls, app: Any, backend: BaseCacheBackend) -> None:
+        """Set the default cache backend of the app, it will be used when the plugin does not set redis or backend"""
+        set_app_attribute(app, cls._cache_plugin_backend_key, backend)
 
     @classmethod
     def pre_check_hook(cls, pait_core_model: "PaitCoreModel", kwargs: Dict) -> None:
@@ -59,10 +136,26 @@ class CacheResponsePlugin(PostPluginProtocol):
                 f"Not use {cls.__name__} in {pait_core_model.func.__name__}, "
                 f"{cls.__name__} not support {FileResponseModel.__class__.__name__}"
             )
-        if kwargs.get("redis", None) is not None:
-            cls.check_redis(kwargs["redis"])
+        if kwargs.get("redis", None) is not None and kwargs.get("backend", None) is not None:
+            raise ValueError("Only one of redis and backend can be set")
+        cls._check_tag_list(pait_core_model, kwargs.get("tag_list", None) or [])
         return None
 
+    @staticmethod
+    def _check_tag_list(pait_core_model: "PaitCoreModel", tag_list: Sequence[str]) -> None:
+        """The tag is formatted by the kwargs of the route function, so the placeholder must be the param name"""
+        param_name_set: Set[str] = set(get_func_sig(pait_core_model.func).sig.parameters)
+        for tag in tag_list:
+            for _, field_name, _, _ in string.Formatter().parse(tag):
+                if field_name is None:
+                    continue
+                # e.g. `{user.uid}` or `{uid_list[0]}`, the root is the param name
+                param_name: str = field_name.split(".", 1)[0].split("[", 1)[0]
+                if param_name not in param_name_set:
+                    raise ValueError(
+                        f"The placeholder:{field_name!r} of tag:{tag!r} is not a param of {pait_core_model.func}"
+                    )
+
     @classmethod
     def pre_load_hook(cls, pait_core_model: "PaitCoreModel", kwargs: Dict) -> Dict:
         super().pre_load_hook(pait_core_model, kwargs)
@@ -79,102 +172,281 @@ class CacheResponsePlugin(PostPluginProtocol):
             for extra_param in default.extra_param_list:
                 if not isinstance(extra_param, CacheRespExtraParam):
                     continue
-                cache_name_param_set.add(default.alias or param.name)
+                # The kwargs of the route function is keyed by the param name, not the alias
+                cache_name_param_set.add(param.name)
         kwargs["_cache_name_param_set"] = cache_name_param_set
         return kwargs
 
-    def _get_redis(self) -> Union[Redis, AsyncioRedis]:
-        redis: Union[Redis, AsyncioRedis, None] = self.redis or get_ctx().app_helper.get_attributes(
-            self._cache_plugin_redis_key, None
-        )
-        if not redis:
-            raise ValueError("Not found redis client")  # pragma: no cover
-        return redis
+    def _get_backend(self) -> BaseCacheBackend:
+        if self.backend is not None:
+            return self.backend
+        backend: Optional[BaseCacheBackend] = get_ctx().app_helper.get_attributes(self._cache_plugin_backend_key, None)
+        if backend is None:
+            raise ValueError("Not found cache backend or redis client")  # pragma: no cover
+        return backend
 
-    def _loads(self, response: Any, *args: Any, **kwargs: Any) -> Any:
-        return pickle.loads(response.encode("latin1"))
+    def _loads(self, response: bytes, *args: Any, **kwargs: Any) -> Any:
+        return self.codec.loads(response)  # type: ignore[union-attr]
 
-    def _dumps(self, response: Any, *args: Any, **kwargs: Any) -> Any:
-        return pickle.dumps(response).decode("latin1")
+    def _dumps(self, response: Any, *args: Any, **kwargs: Any) -> bytes:
+        return self.codec.dumps(response)  # type: ignore[union-attr]
 
     def _gen_key(self, *args: Any, **kwargs: Any) -> Tuple[str, str]:
-        real_key: str = self.name
-        real_lock_key: str = self.lock_name
+        """The key is `{name}:{hash}`, the hash is generated by the canonical json of the key params,
+        so the length of the key is bounded and the key is the same in different processes"""
+        key_param_list: list = []
         if self.enable_cache_name_merge_param:
-            args_key_list: list = [str(i) for i in args] if args else []
+            if args:
+                key_param_list.append(args)
             if kwargs:
                 if self._cache_name_param_set:
-                    for key in self._cache_name_param_set:
-                        args_key_list.append(str(kwargs[key]))
+                    key_param_list.append({key: kwargs[key] for key in self._cache_name_param_set})
                 else:
-                    for value in kwargs.values():
-                        args_key_list.append(str(value))
-            if args_key_list:
-                key_join_str = ":".join(args_key_list)
-                real_key = f"{self.name}:{key_join_str}"
-                real_lock_key = f"{self.lock_name}:{key_join_str}"
-        return real_key, real_lock_key
+                    key_param_list.append(kwargs)
+        if self.vary_header_list:
+            header = get_ctx().app_helper.request.header()
+            key_param_list.append({key: header.get(key) for key in self.vary_header_list})
+        if not key_param_list:
+            return self.name, self.lock_name
+        key_hash = hashlib.blake2b(
+            json.dumps(key_param_list, sort_keys=True, separators=(",", ":"), default=_key_json_default).encode(),
+            digest_size=16,
+        ).hexdigest()
+        return f"{self.name}:{key_hash}", f"{self.lock_name}:{key_hash}"
 
-    async def _async_cache(self, context: "PluginContext") -> Any:
+    def _gen_real_key(self, context: "PluginContext") -> Tuple[str, str]:
         real_key, real_lock_key = self._gen_key(*context.args, **context.kwargs)
-        redis: AsyncioRedis = self._get_redis()
-        result: Any = await redis.get(real_key)
-        if result:
-            result = self._loads(result, *context.args, **context.kwargs)
-        else:
-            async with redis.lock(
-                real_lock_key,
-                timeout=self.timeout,
-                sleep=self.sleep,
-                blocking_timeout=self.blocking_timeout,
-            ):
-                result = await redis.get(real_key)
-                if result:
-                    result = self._loads(result, *context.args, **context.kwargs)
-                else:
-                    try:
-                        result = await super().__call__(context)
-                    except Exception as e:
-                        if self.include_exc and isinstance(e, self.include_exc):
-                            result = e
-                        else:
-                            raise e
-                    await redis.set(  # type: ignore
-                        real_key, self._dumps(result, *context.args, **context.kwargs), ex=self.cache_time
-                    )
+        cache_prepare = get_cache_prepare(context)
+        if cache_prepare is not None:
+            # The response compressed by CompressResponsePlugin is cached separately for each encoding
+            return f"{real_key}:{cache_prepare[0]}", f"{real_lock_key}:{cache_prepare[0]}"
+        return real_key, real_lock_key
+
+    def _gen_tags(self, *args: Any, **kwargs: Any) -> List[str]:
+        """The tag can use the param of the route function, e.g. `user:{uid}`"""
+        if not self.tag_list:
+            return []
+        return [tag.format(**kwargs) for tag in self.tag_list]
+
+    def _pack(self, data: bytes) -> bytes:
+        """If stale_time is set, the time when the value becomes stale is saved in front of the value"""
+        if not self.stale_time:
+            return data
+        return _stale_struct.pack(time.time() + self.cache_time) + data  # type: ignore[operator]
+
+    def _unpack(self, data: bytes) -> Tuple[bytes, bool]:
+        """Return the value and whether the value is fresh"""
+        if not self.stale_time:
+            return data, True
+        return data[_stale_struct.size :], _stale_struct.unpack_from(data)[0] > time.time()
+
+    def _get_ex(self) -> Optional[int]:
+        if self.stale_time:
+            return self.cache_time + self.stale_time  # type: ignore[operator]
+        return self.cache_time
+
+    def _prepare_result(self, result: Any, context: "PluginContext") -> Any:
+        """Convert the result of the route function by the outer plugin (e.g. compress the response),
+        so the converted result is cached and the cache hit does not need to convert it again"""
+        cache_prepare = get_cache_prepare(context)
+        if cache_prepare is None or isinstance(result, Exception):
+            return result
+        return cache_prepare[1](result, context=context)
+
+    def _get_result(self, result: Any) -> Any:
         if isinstance(result, Exception):
             raise result
         return result
 
-    def _cache(self, context: "PluginContext") -> Any:
-        real_key, real_lock_key = self._gen_key(*context.args, **context.kwargs)
-        redis: Redis = self._get_redis()
-        result: Any = redis.get(real_key)
-        if result:
-            result = self._loads(result, *context.args, **context.kwargs)
-        else:
-            with redis.lock(
-                real_lock_key,
-                timeout=self.timeout,
-                sleep=self.sleep,
-                blocking_timeout=self.blocking_timeout,
-            ):
-                result = redis.get(real_key)
-                if result:
-                    result = self._loads(result, *context.args, **context.kwargs)
+    async def _async_gen(
+        self, context: "PluginContext", backend: BaseCacheBackend, real_key: str, real_lock_key: str
+    ) -> Tuple[Any, bytes]:
+        """Call the route function and save the result to the backend, the lock of the backend is used to prevent
+        multiple processes from calling the route function at the same time"""
+        async with backend.async_lock(
+            real_lock_key,
+            timeout=self.timeout,
+            sleep=self.sleep,
+            blocking_timeout=self.blocking_timeout,
+        ):
+            data: Optional[bytes] = await backend.async_get(real_key)
+            if data is not None:
+                data, is_fresh = self._unpack(data)
+                if is_fresh:
+                    # The value has been generated by other process
+                    return self._loads(data, *context.args, **context.kwargs), data
+            try:
+                result = await super().__call__(context)
+            except Exception as e:
+                if self.include_exc and isinstance(e, self.include_exc):
+                    result = e
                 else:
-                    try:
-                        result = super().__call__(context)
-                    except Exception as e:
-                        if self.include_exc and isinstance(e, self.include_exc):
-                            result = e
-                        else:
-                            raise e
-                    redis.set(real_key, self._dumps(result, *context.args, **context.kwargs), ex=self.cache_time)
-        if isinstance(result, Exception):
-            raise result
+                    raise e
+            result = self._prepare_result(result, context)
+            data = self._dumps(result, *context.args, **context.kwargs)
+            await backend.async_set(
+                real_key,
+                self._pack(data),
+                ex=self._get_ex(),
+                tags=self._gen_tags(*context.args, **context.kwargs),
+            )
+            return result, data
+
+    async def _async_flight(
+        self,
+        future: asyncio.Future,
+        context: "PluginContext",
+        backend: BaseCacheBackend,
+        real_key: str,
+        real_lock_key: str,
+    ) -> Any:
+        try:
+            result, data = await self._async_gen(context, backend, real_key, real_lock_key)
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            # Mark the exception as retrieved, it is thrown by the current call
+            future.exception()
+            raise
+        else:
+            future.set_result(data)
+        finally:
+            self._flight_dict.pop(real_key, None)
         return result
 
+    async def _async_background_flight(
+        self,
+        future: asyncio.Future,
+        context: "PluginContext",
+        backend: BaseCacheBackend,
+        real_key: str,
+        real_lock_key: str,
+    ) -> None:
+        try:
+            await self._async_flight(future, context, backend, real_key, real_lock_key)
+        except Exception as e:
+            logger.warning(f"{self.__class__.__name__} refresh {real_key} error: {e}")
+
+    def _gen_refresh_context(self, context: "PluginContext") -> "PluginContext":
+        """The background task runs after the request is over, the framework may have torn down the request,
+        so the task uses a new context that only has a copy of the resolved args and kwargs of the route function
+        (no request, app helper and contextmanager state of the finished request)"""
+        refresh_context: PluginContext = ContextModel(
+            None, None, self.pait_core_model, tuple(context.args), dict(context.kwargs)  # type: ignore[arg-type]
+        )
+        cache_prepare = get_cache_prepare(context)
+        if cache_prepare is not None:
+            set_cache_prepare(refresh_context, cache_prepare)
+        return refresh_context
+
+    def _start_background_flight(
+        self, context: "PluginContext", backend: BaseCacheBackend, real_key: str, real_lock_key: str
+    ) -> None:
+        future: asyncio.Future = asyncio.get_event_loop().create_future()
+        self._flight_dict[real_key] = future
+        task = asyncio.ensure_future(
+            self._async_background_flight(future, self._gen_refresh_context(context), backend, real_key, real_lock_key)
+        )
+        # Keep the reference of the task, avoid it being garbage collected
+        self._background_task_set.add(task)
+        task.add_done_callback(self._background_task_set.discard)
+
+    async def _async_cache(self, context: "PluginContext") -> Any:
+        real_key, real_lock_key = self._gen_real_key(context)
+        backend: BaseCacheBackend = self._get_backend()
+        data: Optional[bytes] = await backend.async_get(real_key)
+        if data is not None:
+            data, is_fresh = self._unpack(data)
+            if not is_fresh and real_key not in self._flight_dict and self.background_refresh:
+                self._start_background_flight(context, backend, real_key, real_lock_key)
+            if is_fresh or real_key in self._flight_dict:
+                # Serve the stale value while the value is being refreshed by other request or background task
+                return self._get_result(self._loads(data, *context.args, **context.kwargs))
+
+        while True:
+            future: Optional[asyncio.Future] = self._flight_dict.get(real_key)
+            if future is None:
+                # The first request of the key in current process, other requests will wait for its result
+                future = asyncio.get_event_loop().create_future()
+                self._flight_dict[real_key] = future
+                result = await self._async_flight(future, context, backend, real_key, real_lock_key)
+                break
+            try:
+                flight_data: bytes = await asyncio.wait_for(asyncio.shield(future), self.blocking_timeout)
+            except asyncio.CancelledError:
+                if future.cancelled():
+                    # The request that generates the value is cancelled, try again
+                    continue
+                raise
+            result = self._loads(flight_data, *context.args, **context.kwargs)
+            break
+        return self._get_result(result)
+
+    def _gen(
+        self, context: "PluginContext", backend: BaseCacheBackend, real_key: str, real_lock_key: str
+    ) -> Tuple[Any, bytes]:
+        with backend.lock(
+            real_lock_key,
+            timeout=self.timeout,
+            sleep=self.sleep,
+            blocking_timeout=self.blocking_timeout,
+        ):
+            data: Optional[bytes] = backend.get(real_key)
+            if data is not None:
+                data, is_fresh = self._unpack(data)
+                if is_fresh:
+                    return self._loads(data, *context.args, **context.kwargs), data
+            try:
+                result = super().__call__(context)
+            except Exception as e:
+                if self.include_exc and isinstance(e, self.include_exc):
+                    result = e
+                else:
+                    raise e
+            result = self._prepare_result(result, context)
+            data = self._dumps(result, *context.args, **context.kwargs)
+            backend.set(
+                real_key, self._pack(data), ex=self._get_ex(), tags=self._gen_tags(*context.args, **context.kwargs)
+            )
+            return result, data
+
+    def _cache(self, context: "PluginContext") -> Any:
+        real_key, real_lock_key = self._gen_real_key(context)
+        backend: BaseCacheBackend = self._get_backend()
+        data: Optional[bytes] = backend.get(real_key)
+        stale_data: Optional[bytes] = None
+        if data is not None:
+            data, is_fresh = self._unpack(data)
+            if is_fresh or real_key in self._flight_dict:
+                return self._get_result(self._loads(data, *context.args, **context.kwargs))
+            stale_data = data
+
+        future: Future = Future()
+        # `setdefault` is atomic, only one thread can set the future of the key
+        flight_future: Future = self._flight_dict.setdefault(real_key, future)
+        if flight_future is not future:
+            if stale_data is None:
+                result = self._loads(
+                    flight_future.result(timeout=self.blocking_timeout), *context.args, **context.kwargs
+                )
+            else:
+                result = self._loads(stale_data, *context.args, **context.kwargs)
+        else:
+            # The sync route function can not be called after the request is over,
+            # so the stale value is refreshed by the current request
+            try:
+                result, data = self._gen(context, backend, real_key, real_lock_key)
+            except BaseException as e:
+                future.set_exception(e)
+                raise
+            else:
+                future.set_result(data)
+            finally:
+                self._flight_dict.pop(real_key, None)
+        return self._get_result(result)
+
     def __call__(self, context: "PluginContext") -> Any:
         if self._is_async_func:
             return self._async_cache(context)
@@ -186,21 +458,34 @@ class CacheResponsePlugin(PostPluginProtocol):
         cls,
         *,
         redis: Union[Redis, AsyncioRedis, None] = None,
+        backend: Optional[BaseCacheBackend] = None,
+        codec: Optional[BaseCacheCodec] = None,
         include_exc: Optional[Tuple[Type[Exception]]] = None,
         name: str = "",
         enable_cache_name_merge_param: bool = False,
+        vary_header_list: Optional[Sequence[str]] = None,
+        tag_list: Optional[Sequence[str]] = None,
         cache_time: Optional[int] = None,
+        stale_time: Optional[int] = None,
         timeout: Optional[float] = None,
         sleep: Optional[float] = None,
         blocking_timeout: Optional[float] = None,
     ) -> "PluginManager":  # type: ignore
         """
-        :param redis: redis client
+        :param redis: redis client, it is a shortcut of `backend=RedisCacheBackend(redis)`
+        :param backend: cache backend, e.g. MemoryCacheBackend, TwoTierCacheBackend.
+            If both redis and backend are not set, the backend or redis set to the app will be used
+        :param codec: Convert the response to bytes, default is the codec of the framework plugin
         :param include_exc: Exception types that support caching
         :param name: cache key name
         :param enable_cache_name_merge_param:
             Whether to distinguish between different caches by the parameters received by the routing function
+        :param vary_header_list: Distinguish between different caches by the value of these request headers
+        :param tag_list: The tags of the cache, the tag can use the param of the route function (e.g. `user:{uid}`),
+            all caches of the tag can be deleted by `backend.invalidate_tag(tag)`
         :param cache_time: cache time
+        :param stale_time: The grace time (seconds) of the stale value after the cache time, during which the stale
+            value is returned and only one request (or background task) in the process refreshes it
         :param timeout: redis lock timeout param
         :param sleep: redis lock sleep param
         :param blocking_timeout: redis lock blocking_timeout param
@@ -208,9 +493,14 @@ class CacheResponsePlugin(PostPluginProtocol):
         return super().build(
             name=name,
             redis=redis,
+            backend=backend,
+            codec=codec,
             include_exc=include_exc,
             enable_cache_name_merge_param=enable_cache_name_merge_param,
+            vary_header_list=vary_header_list,
+            tag_list=tag_list,
             cache_time=cache_time or 5 * 60,
+            stale_time=stale_time,
             timeout=timeout,
             sleep=sleep,
             blocking_timeout=blocking_timeout,
@@ -1,5 +1,10 @@
-from typing import TYPE_CHECKING, Any, Callable, Dict, Optional, Type
+import logging
+import queue
+import random
+import threading
+from typing import TYPE_CHECKING, Any, Callable, Dict, Optional, Tuple, Type, Union
 
+from pait._pydanitc_adapter import get_validate_func
 from pait.model.response import BaseResponseModel, JsonResponseModel
 from pait.plugin.base import GetPaitResponseModelFuncType, PrePluginProtocol
 from pait.util import get_pait_response_model as _get_pait_response_model
@@ -9,11 +14,104 @@ if TYPE_CHECKING:
     from pait.model.core import PaitCoreModel
     from pait.plugin.base import PluginManager
 
+__all__ = ["CheckJsonRespPlugin", "CheckJsonRespStats"]
+
+logger: logging.Logger = logging.getLogger(__name__)
+# The second param is the context, or the route name if the check is offloaded
+CheckErrorCallbackType = Callable[[Exception, Union["PluginContext", str]], Any]
+# The max number of the offloaded checks waiting to run, the check is dropped when the queue is full
+offload_queue_max_size: int = 1000
+
+
+class _OffloadWorker(object):
+    """Run the offloaded check in a background thread, the thread is started when it is used for the first time"""
+
+    def __init__(self, max_size: int) -> None:
+        self._queue: "queue.Queue[Tuple[Callable, Tuple[Any, ...]]]" = queue.Queue(max_size)
+        self._thread: Optional[threading.Thread] = None
+        self._lock: threading.Lock = threading.Lock()
+
+    def _run(self) -> None:
+        while True:
+            func, args = self._queue.get()
+            try:
+                func(*args)
+            except Exception as e:  # pragma: no cover
+                logger.warning(f"run offloaded check error: {e}")
+            finally:
+                self._queue.task_done()
+
+    def submit(self, func: Callable, *args: Any) -> bool:
+        """Submit the check, return False if the queue is full and the check is dropped"""
+        if self._thread is None:
+            with self._lock:
+                if self._thread is None:
+                    self._thread = threading.Thread(target=self._run, name="pait-check-json-resp", daemon=True)
+                    self._thread.start()
+        try:
+            self._queue.put_nowait((func, args))
+        except queue.Full:
+            return False
+        return True
+
+    def join(self) -> None:
+        """Wait for all submitted checks to finish"""
+        self._queue.join()
+
+
+_offload_worker: Optional[_OffloadWorker] = None
+_offload_worker_lock: threading.Lock = threading.Lock()
+
+
+def _get_offload_worker() -> _OffloadWorker:
+    global _offload_worker
+    if _offload_worker is None:
+        with _offload_worker_lock:
+            if _offload_worker is None:
+                _offload_worker = _OffloadWorker(offload_queue_max_size)
+    return _offload_worker
+
+
+class CheckJsonRespStats(object):
+    """The statistics of the response check, it can be shared by the plugins of multiple routes"""
+
+    def __init__(self) -> None:
+        self.check_count: int = 0
+        self.error_count: int = 0
+        # The number of the offloaded checks that are dropped because the queue is full
+        self.drop_count: int = 0
+        self._lock: threading.Lock = threading.Lock()
+
+    def __deepcopy__(self, memo: dict) -> "CheckJsonRespStats":
+        # The statistics is shared, so the copied plugin (e.g. PaitCoreModel.add_plugin) still uses it
+        return self
+
+    def incr(self, is_error: bool = False) -> None:
+        with self._lock:
+            self.check_count += 1
+            if is_error:
+                self.error_count += 1
+
+    def incr_drop(self) -> None:
+        with self._lock:
+            self.drop_count += 1
+
 
 class CheckJsonRespPlugin(PrePluginProtocol):
-    """Check if the json response result is legal"""
+    """Check if the json response result is legal
+
+    In order to keep the check running in production, the plugin supports:
+    - Only check the sampled response by `sample_rate`.
+    - Offload the validation to the background thread by `offload`, the response is returned without waiting for it.
+    - Report the illegal response through `error_callback` and `stats` instead of raising the exception.
+    """
 
     check_resp_fn: Callable[[Any, "PluginContext"], None]
+    validate_resp_fn: Callable[[Any], Any]
+    sample_rate: float
+    offload: bool
+    error_callback: Optional[CheckErrorCallbackType]
+    stats: CheckJsonRespStats
 
     @staticmethod
     def get_json(response_data: Any, context: "PluginContext") -> dict:
@@ -24,6 +122,9 @@ class CheckJsonRespPlugin(PrePluginProtocol):
         super().pre_check_hook(pait_core_model, kwargs)
         if "check_resp_fn" in kwargs:
             raise RuntimeError("Please use response_model_list param")
+        sample_rate = kwargs.get("sample_rate", 1.0)
+        if not 0 < sample_rate <= 1:
+            raise ValueError(f"sample_rate must be greater than 0 and less than or equal to 1, not {sample_rate}")
 
     @classmethod
     def pre_load_hook(cls, pait_core_model: "PaitCoreModel", kwargs: Dict) -> Dict:
@@ -34,22 +135,73 @@ class CheckJsonRespPlugin(PrePluginProtocol):
         if not issubclass(pait_response_model, JsonResponseModel):
             raise ValueError(f"pait_response_model must {JsonResponseModel} not {pait_response_model}")
 
+        # The validator is created once per response data model, rather than on every check
+        validate_func = get_validate_func(pait_response_model.response_data)
+
         def check_resp_by_dict(response_data: Any, context: "PluginContext") -> None:
             if not isinstance(response_data, dict):
                 response_data = cls.get_json(response_data, context)
-            pait_response_model.response_data(**response_data)  # type: ignore
+            validate_func(response_data)
 
         kwargs["check_resp_fn"] = check_resp_by_dict
+        kwargs["validate_resp_fn"] = validate_func
+        if kwargs.get("stats", None) is None:
+            kwargs["stats"] = CheckJsonRespStats()
         return kwargs
 
+    def _report_error(self, e: Exception, context: Union["PluginContext", str]) -> None:
+        self.stats.incr(is_error=True)
+        if self.error_callback is not None:
+            self.error_callback(e, context)
+        elif self.offload:
+            route_name: str = context if isinstance(context, str) else context.pait_core_model.operation_id
+            logger.warning(f"{self.__class__.__name__} check {route_name} error: {e}")
+        else:
+            raise e
+
+    def _run_check(self, response: Any, context: "PluginContext") -> None:
+        try:
+            self.check_resp_fn(response, context)
+        except Exception as e:
+            self._report_error(e, context)
+        else:
+            self.stats.incr()
+
+    def _run_offload_check(self, response_dict: dict, route_name: str) -> None:
+        try:
+            self.validate_resp_fn(response_dict)
+        except Exception as e:
+            self._report_error(e, route_name)
+        else:
+            self.stats.incr()
+
+    def _check_resp(self, response: Any, context: "PluginContext") -> None:
+        if self.sample_rate < 1 and random.random() >= self.sample_rate:
+            return
+        if not self.offload:
+            self._run_check(response, context)
+            return
+        # The response may not be readable after it is sent (e.g. the write buffer of tornado),
+        # so only the validation is offloaded, the json of the response is got here.
+        # The context is not passed to the background thread, it may be reused by the next request
+        try:
+            response_dict = response if isinstance(response, dict) else self.get_json(response, context)
+        except Exception as e:
+            self._report_error(e, context)
+            return
+        if not _get_offload_worker().submit(
+            self._run_offload_check, response_dict, context.pait_core_model.operation_id
+        ):
+            self.stats.incr_drop()
+
     def _sync_call(self, context: "PluginContext") -> Any:
         response: Any = super().__call__(context)
-        self.check_resp_fn(response, context)
+        self._check_resp(response, context)
         return response
 
     async def _async_call(self, context: "PluginContext") -> Any:
         response: Any = await super().__call__(context)
-        self.check_resp_fn(response, context)
+        self._check_resp(response, context)
         return response
 
     def __call__(self, context: "PluginContext") -> Any:
@@ -62,7 +214,25 @@ class CheckJsonRespPlugin(PrePluginProtocol):
     def build(  # type: ignore
         cls,  # type: ignore
         get_pait_response_model: Optional[GetPaitResponseModelFuncType] = None,  # type: ignore
+        sample_rate: float = 1.0,
+        offload: bool = False,
+        error_callback: Optional[CheckErrorCallbackType] = None,
+        stats: Optional[CheckJsonRespStats] = None,
     ) -> "PluginManager":  # type: ignore
+        """
+        :param get_pait_response_model: Get the response model from the response model list of the route
+        :param sample_rate: The rate of the checked response, from 0 (exclusive) to 1 (check all response)
+        :param offload: If True, the validation runs in the background thread after the response is returned,
+            the illegal response is reported through `error_callback` (or the log if it is None) and `stats`.
+            If there are more than `offload_queue_max_size` checks waiting to run, the check is dropped
+        :param error_callback: The func that receives the exception and the context of the illegal response
+            (the route name if the check is offloaded), if it is set, the exception will not be raised
+        :param stats: The statistics of the check, if it is None, each route uses its own statistics
+        """
         return super().build(
             get_pait_response_model=get_pait_response_model or _get_pait_response_model,
+            sample_rate=sample_rate,
+            offload=offload,
+            error_callback=error_callback,
+            stats=stats,
         )
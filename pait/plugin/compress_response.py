@@ -0,0 +1,156 @@
+import gzip
+import zlib
+from functools import lru_cache, partial
+from typing import TYPE_CHECKING, Any, Callable, Dict, Optional, Sequence, Tuple
+
+from pait.plugin.base import GetPaitResponseModelFuncType
+from pait.plugin.unified_response import UnifiedResponsePluginProtocol
+from pait.util import get_pait_response_model as _get_pait_response_model
+
+if TYPE_CHECKING:
+    from pait.model.context import ContextModel as PluginContext
+    from pait.model.core import PaitCoreModel
+    from pait.plugin.base import PluginManager
+
+__all__ = ["CompressResponsePlugin", "negotiate_encoding", "get_cache_prepare", "set_cache_prepare"]
+
+# The key of the context state, the value is `(encoding, prepare func)`, it is used by CacheResponsePlugin
+_CACHE_PREPARE_STATE_KEY: str = "_pait_compress_cache_prepare"
+_compress_func_dict: Dict[str, Callable[..., bytes]] = {
+    # mtime is fixed, so the same body is always compressed to the same bytes
+    "gzip": lambda body, level: gzip.compress(body, compresslevel=level, mtime=0),
+    "deflate": lambda body, level: zlib.compress(body, level),
+}
+
+
+@lru_cache(maxsize=256)
+def negotiate_encoding(accept_encoding: str, encoding_tuple: Tuple[str, ...]) -> Optional[str]:
+    """Select the encoding with the highest q-value in the `Accept-Encoding`,
+    if the q-value is the same, the encoding in front of encoding_tuple is preferred.
+    (The value of `Accept-Encoding` sent by the client is almost fixed, so the result is cached)
+    """
+    q_dict: Dict[str, float] = {}
+    for item in accept_encoding.split(","):
+        coding, _, params = item.partition(";")
+        coding = coding.strip().lower()
+        q = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                q = float(params[2:])
+            except ValueError:
+                continue
+        q_dict[coding] = q
+
+    result: Optional[str] = None
+    result_q: float = 0.0
+    for encoding in encoding_tuple:
+        q = q_dict.get(encoding, q_dict.get("*", 0.0))
+        if q > result_q:
+            result, result_q = encoding, q
+    return result
+
+
+def get_cache_prepare(context: "PluginContext") -> Optional[Tuple[str, Callable[..., Any]]]:
+    """Get the `(encoding, prepare func)` set by CompressResponsePlugin.
+
+    CacheResponsePlugin uses the encoding as part of the cache key, and the result of the route function is converted
+    to the compressed response by `prepare_func(result, context=context)` before being cached,
+    so the cache hit does not need to compress
+    """
+    state: Optional[dict] = getattr(context, "state", None)
+    if not state:
+        return None
+    return state.get(_CACHE_PREPARE_STATE_KEY, None)
+
+
+def set_cache_prepare(context: "PluginContext", cache_prepare: Tuple[str, Callable[..., Any]]) -> None:
+    context.set_to_state(_CACHE_PREPARE_STATE_KEY, cache_prepare)
+
+
+class CompressResponsePlugin(UnifiedResponsePluginProtocol):
+    """Compress the body of the response by the encoding (gzip or deflate) that negotiated with `Accept-Encoding`.
+
+    The body whose size is less than `minimum_size` is not compressed. The response that already has
+    `Content-Encoding` (e.g. the compressed response cached by CacheResponsePlugin) is not compressed again.
+    """
+
+    minimum_size: int
+    level: int
+    encoding_tuple: Tuple[str, ...]
+
+    def _get_body(self, response: Any, context: "PluginContext") -> Optional[bytes]:
+        """Get the body of the response, return None if the response can not be compressed
+        (e.g. stream response or the response already has `Content-Encoding`)"""
+        raise NotImplementedError
+
+    def _set_body(self, response: Any, body: Optional[bytes], encoding: Optional[str], context: "PluginContext") -> Any:
+        """Add `Vary: Accept-Encoding` to the response, if the encoding is not None, replace the body and
+        set `Content-Encoding`"""
+        raise NotImplementedError
+
+    @classmethod
+    def pre_check_hook(cls, pait_core_model: "PaitCoreModel", kwargs: Dict) -> None:
+        super().pre_check_hook(pait_core_model, kwargs)
+        for encoding in kwargs["encoding_tuple"]:
+            if encoding not in _compress_func_dict:
+                raise ValueError(f"Not support encoding:{encoding}, only support {list(_compress_func_dict)}")
+
+    def _negotiate(self, context: "PluginContext") -> Optional[str]:
+        accept_encoding: Optional[str] = context.app_helper.request.header().get("Accept-Encoding")
+        if not accept_encoding:
+            return None
+        return negotiate_encoding(accept_encoding, self.encoding_tuple)
+
+    def _compress_response(self, response: Any, encoding: Optional[str], context: "PluginContext") -> Any:
+        body = self._get_body(response, context)
+        if body is None or len(body) < self.minimum_size:
+            return response
+        if encoding is None:
+            return self._set_body(response, None, None, context)
+        return self._set_body(response, _compress_func_dict[encoding](body, self.level), encoding, context)
+
+    def _prepare(self, return_value: Any, encoding: Optional[str], context: "PluginContext") -> Any:
+        return self._compress_response(self._gen_response(return_value, context), encoding, context)
+
+    def _before_call(self, context: "PluginContext") -> Optional[str]:
+        encoding = self._negotiate(context)
+        if encoding is not None:
+            # The prepare func does not bind the context, it is passed in when it is called
+            set_cache_prepare(context, (encoding, partial(self._prepare, encoding=encoding)))
+        return encoding
+
+    def __call__(self, context: "PluginContext") -> Any:
+        if self._is_async_func:
+            return self._async_call(context)
+        return self._sync_call(context)
+
+    def _sync_call(self, context: "PluginContext") -> Any:
+        encoding = self._before_call(context)
+        return self._prepare(super().__call__(context), encoding, context)
+
+    async def _async_call(self, context: "PluginContext") -> Any:
+        encoding = self._before_call(context)
+        return self._prepare(await super().__call__(context), encoding, context)
+
+    @classmethod
+    def build(  # type: ignore
+        cls,
+        *,
+        minimum_size: int = 500,
+        level: int = 6,
+        encoding_list: Sequence[str] = ("gzip", "deflate"),
+        get_pait_response_model: Optional[GetPaitResponseModelFuncType] = None,
+    ) -> "PluginManager":  # type: ignore
+        """
+        :param minimum_size: The body whose size (bytes) is less than it is not compressed
+        :param level: The compression level, from 1 (fastest) to 9 (smallest)
+        :param encoding_list: The supported encodings in order of preference, only support gzip and deflate
+        :param get_pait_response_model: Get the response model from the response model list of the route
+        """
+        return super().build(
+            minimum_size=minimum_size,
+            level=level,
+            encoding_tuple=tuple(encoding_list),
+            get_pait_response_model=get_pait_response_model or _get_pait_response_model,
+        )
@@ -0,0 +1,245 @@
+import hashlib
+import inspect
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Dict, List, Optional, Tuple, Union
+
+from pait.plugin.base import GetPaitResponseModelFuncType
+from pait.plugin.unified_response import UnifiedResponsePluginProtocol
+from pait.util import get_pait_response_model as _get_pait_response_model
+
+if TYPE_CHECKING:
+    from pait.model.context import ContextModel as PluginContext
+    from pait.model.core import PaitCoreModel
+    from pait.plugin.base import PluginManager
+
+__all__ = ["CacheControl", "ConditionalGetPlugin", "gen_etag", "match_etag"]
+
+EtagFuncType = Callable[["PluginContext"], Union[Optional[str], Awaitable[Optional[str]]]]
+LastModifiedFuncType = Callable[["PluginContext"], Union[Optional[datetime], Awaitable[Optional[datetime]]]]
+# Only the safe methods support conditional GET, other methods are passed through
+_SUPPORT_METHOD_SET = {"GET", "HEAD"}
+
+
+@dataclass(frozen=True)
+class CacheControl(object):
+    """The declarative policy of the `Cache-Control` header, it can be set to the `cache_control` attribute
+    of the response model, e.g:
+
+    >>> class UserResponseModel(JsonResponseModel):
+    ...     cache_control = CacheControl(max_age=60, private=True)
+    """
+
+    max_age: Optional[int] = None
+    s_maxage: Optional[int] = None
+    stale_while_revalidate: Optional[int] = None
+    public: bool = False
+    private: bool = False
+    no_cache: bool = False
+    no_store: bool = False
+    must_revalidate: bool = False
+    immutable: bool = False
+
+    def __post_init__(self) -> None:
+        if self.public and self.private:
+            raise ValueError("The public and private of CacheControl can not be set at the same time")
+
+    def to_header(self) -> str:
+        directive_list: List[str] = []
+        for key in ("public", "private", "no_cache", "no_store", "must_revalidate", "immutable"):
+            if getattr(self, key):
+                directive_list.append(key.replace("_", "-"))
+        for key in ("max_age", "s_maxage", "stale_while_revalidate"):
+            value = getattr(self, key)
+            if value is not None:
+                directive_list.append(f"{key.replace('_', '-')}={value}")
+        return ", ".join(directive_list)
+
+
+def gen_etag(body: bytes, weak: bool = False) -> str:
+    """Generate the ETag of the serialized body"""
+    etag = '"' + hashlib.blake2b(body, digest_size=16).hexdigest() + '"'
+    return "W/" + etag if weak else etag
+
+
+def _strip_weak(etag: str) -> str:
+    return etag[2:] if etag.startswith("W/") else etag
+
+
+def match_etag(if_none_match: str, etag: str) -> bool:
+    """Whether the ETag matches the `If-None-Match` header, the weak comparison is used (RFC 7232 3.2)"""
+    if_none_match = if_none_match.strip()
+    if if_none_match == "*":
+        return True
+    etag = _strip_weak(etag)
+    for item in if_none_match.split(","):
+        if _strip_weak(item.strip()) == etag:
+            return True
+    return False
+
+
+def _to_utc(value: datetime) -> datetime:
+    # Naive datetime is regarded as UTC time, the HTTP date has no microsecond
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc).replace(microsecond=0)
+
+
+def _match_last_modified(if_modified_since: str, last_modified: datetime) -> bool:
+    try:
+        return _to_utc(last_modified) <= _to_utc(parsedate_to_datetime(if_modified_since))
+    except (TypeError, ValueError):
+        return False
+
+
+class ConditionalGetPlugin(UnifiedResponsePluginProtocol):
+    """Support HTTP conditional GET (RFC 7232), the plugin generates the response through the response model.
+
+    - The `ETag` is computed from the serialized body of the response, or obtained from the `etag_func`
+    - The `Last-Modified` is obtained from the `last_modified_func`
+    - If the validator of the request (`If-None-Match` or `If-Modified-Since`) matches, return 304 without body.
+      When the validator is obtained from the func and matches, the route function will not be called.
+    - The `Cache-Control` header is generated from the `cache_control` attribute of the response model
+      or the `cache_control` param of the plugin
+    """
+
+    weak: bool
+    etag_func: Optional[EtagFuncType]
+    last_modified_func: Optional[LastModifiedFuncType]
+    cache_control: Optional[CacheControl]
+    cache_control_header: Optional[str] = None
+
+    def _get_body(self, response: Any, context: "PluginContext") -> Optional[bytes]:
+        """Get the serialized body of the response, return None if the response does not support ETag
+        (e.g. not 200 status code or stream response)"""
+        raise NotImplementedError
+
+    def _set_headers(self, response: Any, headers: Dict[str, str], context: "PluginContext") -> Any:
+        raise NotImplementedError
+
+    def _gen_not_modified_response(self, headers: Dict[str, str], context: "PluginContext") -> Any:
+        raise NotImplementedError
+
+    @classmethod
+    def pre_load_hook(cls, pait_core_model: "PaitCoreModel", kwargs: Dict) -> Dict:
+        kwargs = super().pre_load_hook(pait_core_model, kwargs)
+        # The policy of the response model takes precedence over the policy of the plugin
+        cache_control: Optional[CacheControl] = getattr(kwargs["response_model_class"], "cache_control", None)
+        if cache_control is None:
+            cache_control = kwargs.get("cache_control", None)
+        if cache_control is not None:
+            if not isinstance(cache_control, CacheControl):
+                raise TypeError(f"cache_control must be {CacheControl.__name__}, not {type(cache_control)}")
+            kwargs["cache_control_header"] = cache_control.to_header()
+        return kwargs
+
+    def __call__(self, context: "PluginContext") -> Any:
+        if self._is_async_func:
+            return self._async_call(context)
+        return self._sync_call(context)
+
+    def _get_request_validator(self, context: "PluginContext") -> Tuple[Optional[str], Optional[str]]:
+        """Return the `If-None-Match` and `If-Modified-Since` of the request,
+        return (None, None) if the request method does not support conditional GET"""
+        request = context.app_helper.request
+        if request.request.method not in _SUPPORT_METHOD_SET:
+            return None, None
+        header = request.header()
+        return header.get("If-None-Match"), header.get("If-Modified-Since")
+
+    def _gen_validator_headers(self, etag: Optional[str], last_modified: Optional[datetime]) -> Dict[str, str]:
+        headers: Dict[str, str] = {}
+        if etag is not None:
+            headers["ETag"] = etag
+        if last_modified is not None:
+            headers["Last-Modified"] = format_datetime(_to_utc(last_modified), usegmt=True)
+        if self.cache_control_header:
+            headers["Cache-Control"] = self.cache_control_header
+        return headers
+
+    @staticmethod
+    def _is_not_modified(
+        if_none_match: Optional[str],
+        if_modified_since: Optional[str],
+        etag: Optional[str],
+        last_modified: Optional[datetime],
+    ) -> bool:
+        if if_none_match is not None:
+            # If-Modified-Since is ignored when the request contains If-None-Match (RFC 7232 3.3)
+            return etag is not None and match_etag(if_none_match, etag)
+        if if_modified_since is not None and last_modified is not None:
+            return _match_last_modified(if_modified_since, last_modified)
+        return False
+
+    def _handle_response(
+        self,
+        response: Any,
+        context: "PluginContext",
+        if_none_match: Optional[str],
+        if_modified_since: Optional[str],
+        etag: Optional[str],
+        last_modified: Optional[datetime],
+    ) -> Any:
+        body = self._get_body(response, context)
+        if body is None:
+            return response
+        if etag is None:
+            etag = gen_etag(body, self.weak)
+        headers = self._gen_validator_headers(etag, last_modified)
+        if self._is_not_modified(if_none_match, if_modified_since, etag, last_modified):
+            return self._gen_not_modified_response(headers, context)
+        return self._set_headers(response, headers, context)
+
+    def _sync_call(self, context: "PluginContext") -> Any:
+        if_none_match, if_modified_since = self._get_request_validator(context)
+        # The sync route only supports sync func
+        etag: Any = self.etag_func(context) if self.etag_func else None
+        last_modified: Any = self.last_modified_func(context) if self.last_modified_func else None
+        if self._is_not_modified(if_none_match, if_modified_since, etag, last_modified):
+            return self._gen_not_modified_response(self._gen_validator_headers(etag, last_modified), context)
+
+        response = self._gen_response(super().__call__(context), context)
+        return self._handle_response(response, context, if_none_match, if_modified_since, etag, last_modified)
+
+    async def _async_call(self, context: "PluginContext") -> Any:
+        if_none_match, if_modified_since = self._get_request_validator(context)
+        # The func of the async route can be sync or async func
+        etag: Any = self.etag_func(context) if self.etag_func else None
+        if inspect.isawaitable(etag):
+            etag = await etag
+        last_modified: Any = self.last_modified_func(context) if self.last_modified_func else None
+        if inspect.isawaitable(last_modified):
+            last_modified = await last_modified
+        if self._is_not_modified(if_none_match, if_modified_since, etag, last_modified):
+            return self._gen_not_modified_response(self._gen_validator_headers(etag, last_modified), context)
+
+        response = self._gen_response(await super().__call__(context), context)
+        return self._handle_response(response, context, if_none_match, if_modified_since, etag, last_modified)
+
+    @classmethod
+    def build(  # type: ignore
+        cls,
+        *,
+        weak: bool = False,
+        etag_func: Optional[EtagFuncType] = None,
+        last_modified_func: Optional[LastModifiedFuncType] = None,
+        cache_control: Optional[CacheControl] = None,
+        get_pait_response_model: Optional[GetPaitResponseModelFuncType] = None,
+    ) -> "PluginManager":  # type: ignore
+        """
+        :param weak: Whether to generate the weak ETag, the weak ETag is suitable for the semantically equivalent body
+        :param etag_func: Get the ETag (e.g. version of the resource) before calling the route function,
+            if the ETag matches, the route function will not be called. Support sync and async func (async route only)
+        :param last_modified_func: Get the last modified time of the resource before calling the route function,
+            it is used like `etag_func`
+        :param cache_control: The default `Cache-Control` policy, it is overridden by the policy of the response model
+        :param get_pait_response_model: Get the response model from the response model list of the route
+        """
+        return super().build(
+            weak=weak,
+            etag_func=etag_func,
+            last_modified_func=last_modified_func,
+            cache_control=cache_control,
+            get_pait_response_model=get_pait_response_model or _get_pait_response_model,
+        )
@@ -1,12 +1,13 @@
-import sys
-from tempfile import NamedTemporaryFile
-from typing import IO, TYPE_CHECKING, Any, Dict, Generic, Optional, Type, TypeVar
+import itertools
+from typing import TYPE_CHECKING, Any, Dict, Generic, Iterator, List, Optional, Tuple, Type, TypeVar
 
 from typing_extensions import Literal
 
+from pait.g import config
 from pait.model import response
 from pait.plugin.base import GetPaitResponseModelFuncType, PluginManager, PrePluginProtocol
 from pait.util import get_pait_response_model as _get_pait_response_model
+from pait.util.encoder import get_json_dumps_func
 
 if TYPE_CHECKING:
     from pait.model.context import ContextModel as PluginContext
@@ -14,20 +15,31 @@ if TYPE_CHECKING:
 
 
 RESP_T = TypeVar("RESP_T")
+# The body and headers of the mock response
+MockPayloadType = Tuple[bytes, Dict[str, Any]]
 
 
 class MockPluginProtocol(PrePluginProtocol, Generic[RESP_T]):
     """Automatically return a json response with sample values based on the response object
     Note: the code logic of the routing function will not be executed
+
+    The example body and headers are generated once when the plugin is loaded and served from memory,
+    if `rotate_count` is greater than 1, the plugin rotates between the multiple generated examples.
     """
 
     pait_response_model: Type[response.BaseResponseModel]
     example_column_name: Literal["example", "mock"]
+    rotate_count: int
+    payload_list: List[MockPayloadType]
+    _payload_iter: Iterator[MockPayloadType]
+
+    def __post_init__(self, **kwargs: Any) -> None:
+        self._payload_iter = itertools.cycle(self.payload_list)
 
     def __call__(self, context: "PluginContext") -> Any:
         if self._is_async_func:
-            return self.async_mock_response()
-        return self.mock_response()
+            return self.async_mock_response(context)
+        return self.mock_response(context)
 
     @classmethod
     def pre_check_hook(cls, pait_core_model: "PaitCoreModel", kwargs: Dict) -> None:
@@ -36,68 +48,64 @@ class MockPluginProtocol(PrePluginProtocol, Generic[RESP_T]):
             raise RuntimeError(f"{pait_core_model.func} can not found response model")
         if "pait_response_model" in kwargs:
             raise RuntimeError("Please use response_model_list param")
+        if kwargs.get("rotate_count", 1) < 1:
+            raise ValueError(f"rotate_count must be greater than 0, not {kwargs['rotate_count']}")
 
     @classmethod
     def pre_load_hook(cls, pait_core_model: "PaitCoreModel", kwargs: Dict) -> Dict:
         kwargs = super().pre_load_hook(pait_core_model, kwargs)
-        kwargs["pait_response_model"] = kwargs["get_pait_response_model"](pait_core_model.response_model_list)
+        pait_response_model: Type[response.BaseResponseModel] = kwargs["get_pait_response_model"](
+            pait_core_model.response_model_list
+        )
+        kwargs["pait_response_model"] = pait_response_model
+        kwargs["payload_list"] = [
+            cls.gen_payload(pait_response_model, kwargs.get("example_column_name", "example"))
+            for _ in range(kwargs.get("rotate_count", 1))
+        ]
         return kwargs
 
-    def get_response(self) -> RESP_T:
-        raise NotImplementedError()
-
-    def get_file_response(self, temporary_file: IO[bytes], f: Any) -> RESP_T:
-        raise RuntimeError("Not Implemented")  # pragma: no cover
-
-    async def async_get_file_response(self, temporary_file: Any, f: Any) -> RESP_T:
-        raise RuntimeError("Not Implemented")  # pragma: no cover
-
-    def set_info_to_response(self, resp: RESP_T) -> None:
-        raise NotImplementedError()
-
-    def mock_response(self) -> RESP_T:
-        if issubclass(self.pait_response_model, response.FileResponseModel):
-            named_temporary_file: IO[bytes] = NamedTemporaryFile()
-            f: Any = named_temporary_file.__enter__()
-            try:
-                resp: RESP_T = self.get_file_response(named_temporary_file, f)
-            except Exception as e:
-                exc_type, exc_val, exc_tb = sys.exc_info()
-                named_temporary_file.__exit__(exc_type, exc_val, exc_tb)
-                raise e
-            self.set_info_to_response(resp)
-        elif not issubclass(self.pait_response_model, response.BaseResponseModel):
-            raise NotImplementedError(f"make_mock_response not support {self.pait_response_model}")
-        else:
-            resp = self.get_response()
-        return resp
-
-    async def async_mock_response(self) -> RESP_T:
-        if issubclass(self.pait_response_model, response.FileResponseModel):
-            import aiofiles  # type: ignore
-
-            tf: aiofiles.tempfile.AsyncContextManager = aiofiles.tempfile.NamedTemporaryFile()  # type: ignore
-            f: Any = await tf.__aenter__()
-            try:
-                resp: RESP_T = await self.async_get_file_response(tf, f)
-            except Exception as e:
-                exc_type, exc_val, exc_tb = sys.exc_info()
-                await tf.__aexit__(exc_type, exc_val, exc_tb)
-                raise e
-            self.set_info_to_response(resp)
-        elif not issubclass(self.pait_response_model, response.BaseResponseModel):
-            raise NotImplementedError(f"make_mock_response not support {self.pait_response_model}")
+    @staticmethod
+    def gen_payload(
+        pait_response_model: Type[response.BaseResponseModel], example_column_name: str = "example"
+    ) -> MockPayloadType:
+        """Generate the serialized example body and the example headers of the response model"""
+        if not issubclass(pait_response_model, response.BaseResponseModel):
+            raise NotImplementedError(f"make_mock_response not support {pait_response_model}")
+        example_value: Any = pait_response_model.get_example_value(example_column_name=example_column_name)
+        if isinstance(example_value, bytes):
+            body: bytes = example_value
+        elif isinstance(example_value, str):
+            body = example_value.encode()
         else:
-            resp = self.get_response()
-        return resp
+            body = get_json_dumps_func(config.json_encoder)(example_value)
+        return body, pait_response_model.get_header_example_dict()
+
+    def get_payload_response(self, body: bytes, header_dict: Dict[str, Any], context: "PluginContext") -> RESP_T:
+        """Generate the response by the status code and media type of the response model and the payload"""
+        raise RuntimeError("Not Implemented")
+
+    def mock_response(self, context: "PluginContext") -> RESP_T:
+        body, header_dict = next(self._payload_iter)
+        return self.get_payload_response(body, header_dict, context)
+
+    async def async_mock_response(self, context: "PluginContext") -> RESP_T:
+        return self.mock_response(context)
 
     @classmethod
     def build(  # type: ignore
         cls,  # type: ignore
         example_column_name: Literal["example", "mock"] = "example",  # type: ignore
         get_pait_response_model: Optional[GetPaitResponseModelFuncType] = None,  # type: ignore
+        rotate_count: int = 1,
     ) -> "PluginManager":  # type: ignore
+        """
+        :param example_column_name: The column name of the example value of the field
+        :param get_pait_response_model: Get the response model from the response model list of the route
+        :param rotate_count: The number of the generated examples,
+            the mock response rotates between them so that the cache does not get a constant payload
+        """
         return super().build(
             example_column_name=example_column_name,
             get_pait_response_model=get_pait_response_model or _get_pait_response_model,
+            rotate_count=rotate_count,
         )
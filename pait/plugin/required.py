@@ -86,6 +86,5 @@ class RequiredPlugin(PostPluginProtocol):
     def build(cls, *, required_dict: Optional[Dict[str, List[str]]] = None) -> "PluginManager":  # type: ignore
         return super().build(required_dict=required_dict or {})
 
-    def __call__(self, context: "PluginContext") -> Any:
+    def before_call(self, context: "PluginContext") -> None:
         self.check_param(context)
-        return super().__call__(context)
@@ -1,5 +1,5 @@
 from abc import ABCMeta
-from typing import TYPE_CHECKING, Any, Dict, Optional, Type
+from typing import TYPE_CHECKING, Any, Callable, Dict, Optional, Type
 
 from pait.model.core import PaitCoreModel
 from pait.model.response import BaseResponseModel, FileResponseModel
@@ -12,10 +12,17 @@ if TYPE_CHECKING:
 
 class UnifiedResponsePluginProtocol(PrePluginProtocol):
     response_model_class: Type[BaseResponseModel]
+    # The func compiled by `_gen_response_builder` in pre_load_hook, it generates the response of the route
+    response_builder: Optional[Callable[..., Any]] = None
 
     def _gen_response(self, return_value: Any, context: "PluginContext") -> Any:
         raise NotImplementedError
 
+    @classmethod
+    def _gen_response_builder(cls, response_model_class: Type[BaseResponseModel]) -> Optional[Callable[..., Any]]:
+        """Compile the response builder of the response model, the framework plugin needs to implement it"""
+        return None
+
     @classmethod
     def pre_load_hook(cls, pait_core_model: "PaitCoreModel", kwargs: Dict) -> Dict:
         kwargs = super().pre_load_hook(pait_core_model, kwargs)
@@ -27,6 +34,7 @@ class UnifiedResponsePluginProtocol(PrePluginProtocol):
             if issubclass(pait_response, FileResponseModel):
                 raise ValueError(f"Not Support {FileResponseModel.__name__}")
             kwargs["response_model_class"] = pait_response
+            kwargs["response_builder"] = cls._gen_response_builder(pait_response)
         else:
             raise ValueError(
                 f"The response model list cannot be empty, please add a response model to"
@@ -1,9 +1,19 @@
 import asyncio
 import inspect
-from concurrent import futures
-from typing import Any, Callable, Optional
+from functools import partial
+from typing import Any, Callable, Dict, Optional, Type
 
-__all__ = ["LazyProperty"]
+__all__ = ["LazyProperty", "MemoMethod"]
+
+_CACHE_ATTR_NAME: str = "_memo_cache"
+
+
+def _get_cache_dict(class_: Any) -> Dict[str, Any]:
+    cache_dict: Optional[Dict[str, Any]] = getattr(class_, _CACHE_ATTR_NAME, None)
+    if cache_dict is None:
+        cache_dict = {}
+        setattr(class_, _CACHE_ATTR_NAME, cache_dict)
+    return cache_dict
 
 
 class LazyProperty:
@@ -12,13 +22,16 @@ class LazyProperty:
     ...     @LazyProperty()
     ...     def value(self, value):
     ...         return value * value
+
+    Note: The result is saved in the `_memo_cache` attribute of the instance,
+        if the class uses `__slots__`, it needs to declare the attribute.
     """
 
     def __init__(self, class_: Any = None) -> None:
         self.class_ = class_
 
     def __call__(self, func: Callable) -> Callable:
-        key: str = f"{self.__class__.__name__}_{func.__name__}_future"
+        key: str = f"{self.__class__.__name__}_{func.__name__}"
 
         sig = inspect.signature(func)
         if "self" not in sig.parameters and not self.class_:
@@ -27,28 +40,105 @@ class LazyProperty:
         if not asyncio.iscoroutinefunction(func):
 
             def wrapper(*args: Any, **kwargs: Any) -> Any:
-                class_ = self.class_ or args[0]
-                future: Optional[futures.Future] = getattr(class_, key, None)
-                if not future:
-                    future = futures.Future()
-                    result: Any = func(*args, **kwargs)
-                    future.set_result(result)
-                    setattr(class_, key, future)
-                    return result
-                return future.result()
+                cache_dict = _get_cache_dict(self.class_ or args[0])
+                if key in cache_dict:
+                    return cache_dict[key]
+                result: Any = func(*args, **kwargs)
+                cache_dict[key] = result
+                return result
 
             return wrapper
         else:
 
             async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
-                class_ = self.class_ or args[0]
-                future: Optional[asyncio.Future] = getattr(class_, key, None)
-                if not future:
-                    future = asyncio.Future()
-                    result: Any = await func(*args, **kwargs)
-                    future.set_result(result)
-                    setattr(class_, key, future)
-                    return result
-                return future.result()
+                cache_dict = _get_cache_dict(self.class_ or args[0])
+                if key in cache_dict:
+                    return cache_dict[key]
+                result: Any = await func(*args, **kwargs)
+                cache_dict[key] = result
+                return result
 
             return async_wrapper
+
+
+class MemoMethod(object):
+    """Cache the result of the method(no param) of the instance, support async method.
+    >>> class Demo:
+    ...     @MemoMethod
+    ...     def value(self):
+    ...         return 1
+
+    Unlike LazyProperty, it is a descriptor, after the first call,
+    the cached value getter is returned directly without any wrapper call.
+    The concurrent calls of the async method will wait for the result of the first call.
+
+    Note: The result is saved in the `_memo_cache` attribute of the instance,
+        if the class uses `__slots__`, it needs to declare the attribute.
+    """
+
+    def __init__(self, func: Callable) -> None:
+        self.func: Callable = func
+        self.name: str = func.__name__
+        self.is_async: bool = asyncio.iscoroutinefunction(func)
+        self.__doc__ = func.__doc__
+        self.__wrapped__ = func
+
+    def __set_name__(self, owner: Type, name: str) -> None:
+        self.name = name
+
+    def __get__(self, instance: Any, owner: Optional[Type] = None) -> Any:
+        if instance is None:
+            return self
+        try:
+            # Hit path: only one attribute access and one dict lookup
+            return instance._memo_cache[self.name]
+        except KeyError:
+            cache_dict: Dict[str, Any] = instance._memo_cache
+        except AttributeError:
+            cache_dict = {}
+            setattr(instance, _CACHE_ATTR_NAME, cache_dict)
+        return partial(self._async_load if self.is_async else self._load, instance, cache_dict)
+
+    def _load(self, instance: Any, cache_dict: Dict[str, Any]) -> Any:
+        value = self.func(instance)
+
+        def _getter() -> Any:
+            return value
+
+        cache_dict[self.name] = _getter
+        return value
+
+    async def _async_load(self, instance: Any, cache_dict: Dict[str, Any]) -> Any:
+        getter: Optional[Callable] = cache_dict.get(self.name, None)
+        if getter is not None:
+            # The method is being called by other coroutine (or has been called), wait for its result
+            return await getter()
+        # The waiter is registered when the coroutine starts (not when the method is called),
+        # so a coroutine that is never awaited does not leave a waiter that is never resolved.
+        # The concurrent calls during the first call will wait for the future instead of calling the method again
+        future: asyncio.Future = asyncio.get_event_loop().create_future()
+
+        async def _waiter() -> Any:
+            return await future
+
+        cache_dict[self.name] = _waiter
+        try:
+            value = await self.func(instance)
+        except Exception as e:
+            cache_dict.pop(self.name, None)
+            future.set_exception(e)
+            # Mark the exception as retrieved, it is thrown by the current call
+            future.exception()
+            raise
+        except BaseException:
+            # The coroutine is cancelled, or closed before it is done
+            cache_dict.pop(self.name, None)
+            future.cancel()
+            raise
+
+        async def _getter() -> Any:
+            return value
+
+        cache_dict[self.name] = _getter
+        future.set_result(value)
+        return value
@@ -48,6 +48,7 @@ __all__ = [
     "get_pait_response_model",
     "example_value_handle",
     "ignore_pre_check",
+    "lazy_load",
     "gen_example_value_from_python",
     "get_real_annotation",
     "create_factory",
@@ -58,6 +59,8 @@ __all__ = [
     "ImmutableDict",
 ]
 ignore_pre_check: bool = bool(os.environ.get("PAIT_IGNORE_PRE_CHECK", False))
+# Defer the pre-check, pre-load and plugin stack construction of the route to the first call (or the warm-up)
+lazy_load: bool = bool(os.environ.get("PAIT_LAZY_LOAD", False))
 http_method_tuple: Tuple[str, ...] = ("get", "post", "head", "options", "delete", "put", "trace", "patch")
 
 json_type_default_value_dict: Dict[str, Any] = {
@@ -1,32 +1,103 @@
 from datetime import date, datetime
 from enum import Enum
 from json import JSONEncoder
-from typing import Any
+from typing import Any, Callable, Dict, Optional, Type
 
 from _decimal import Decimal
 from any_api.openapi.model import LinksModel
+from pydantic import BaseModel
 
-from pait._pydanitc_adapter import PydanticUndefinedType
+from pait._pydanitc_adapter import PydanticUndefinedType, model_dump
 from pait.model.template import TemplateVar
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore[assignment]
+
+__all__ = ["CustomJSONEncoder", "get_json_default_func", "json_default", "get_json_dumps_func"]
+
+JsonDefaultFuncType = Callable[[Any], Any]
+
+
+def _template_var_default(obj: TemplateVar) -> Any:
+    value = obj.get_value_from_template_context()
+    if isinstance(value, PydanticUndefinedType):
+        value = None
+    return value
+
+
+# The key is the type supported by the encoder, the subclass of the key uses the func of the nearest type in its MRO
+_json_default_dict: Dict[type, JsonDefaultFuncType] = {
+    datetime: lambda obj: int(obj.timestamp()),
+    date: lambda obj: obj.strftime("%Y-%m-%d"),
+    Decimal: float,
+    Enum: lambda obj: obj.value,
+    TemplateVar: _template_var_default,
+    # TODO Now I don't know how to remove the Links Model from Field(pydantic v2)
+    LinksModel: lambda obj: None,
+    BaseModel: lambda obj: model_dump(obj, by_alias=True),
+}
+_json_default_cache_dict: Dict[type, Optional[JsonDefaultFuncType]] = {}
+_json_dumps_func_dict: Dict[Type[JSONEncoder], Callable[[Any], bytes]] = {}
+
+
+def get_json_default_func(obj_type: type) -> Optional[JsonDefaultFuncType]:
+    """Get the func that converts the value of the type to the json native value, return None if not support.
+    The result is cached by type, so each type only needs to search the MRO once instead of the isinstance chain"""
+    try:
+        return _json_default_cache_dict[obj_type]
+    except KeyError:
+        pass
+    func: Optional[JsonDefaultFuncType] = None
+    for base_type in obj_type.__mro__:
+        func = _json_default_dict.get(base_type, None)
+        if func is not None:
+            break
+    _json_default_cache_dict[obj_type] = func
+    return func
+
+
+def json_default(obj: Any) -> Any:
+    """The `default` param of json.dumps(or orjson.dumps)"""
+    func = get_json_default_func(type(obj))
+    if func is None:
+        raise TypeError(f"Object of type {obj.__class__.__name__} is not JSON serializable")
+    return func(obj)
+
 
 class CustomJSONEncoder(JSONEncoder):
     def default(self, obj: Any) -> Any:
-        if isinstance(obj, datetime):
-            return int(obj.timestamp())
-        elif isinstance(obj, date):
-            return obj.strftime("%Y-%m-%d")
-        elif isinstance(obj, Decimal):
-            return float(obj)
-        elif isinstance(obj, Enum):
-            return obj.value
-        elif isinstance(obj, TemplateVar):
-            obj = obj.get_value_from_template_context()
-            if isinstance(obj, PydanticUndefinedType):
-                obj = None
-            return obj
-        elif isinstance(obj, LinksModel):
-            # TODO Now I don't know how to remove the Links Model from Field(pydantic v2)
-            return None
-        else:
+        func = get_json_default_func(type(obj))
+        if func is None:
             return super().default(obj)  # pragma: no cover
+        return func(obj)
+
+
+def get_json_dumps_func(json_encoder: Type[JSONEncoder] = CustomJSONEncoder) -> Callable[[Any], bytes]:
+    """Get the func that serializes the value to compact json bytes.
+
+    If the json encoder is CustomJSONEncoder and orjson is installed, the value is serialized by orjson,
+    otherwise the encoder instance is created once and reused
+    """
+    json_dumps_func = _json_dumps_func_dict.get(json_encoder, None)
+    if json_dumps_func is None:
+        json_dumps_func = _json_dumps_func_dict[json_encoder] = _gen_json_dumps_func(json_encoder)
+    return json_dumps_func
+
+
+def _gen_json_dumps_func(json_encoder: Type[JSONEncoder]) -> Callable[[Any], bytes]:
+    encoder = json_encoder(ensure_ascii=False, separators=(",", ":"))
+    if json_encoder is not CustomJSONEncoder or orjson is None:
+        return lambda obj: encoder.encode(obj).encode()
+
+    option = orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS
+
+    def _dumps(obj: Any) -> bytes:
+        try:
+            return orjson.dumps(obj, default=json_default, option=option)
+        except orjson.JSONEncodeError:
+            # e.g. the int that exceeds 64-bit, fallback to the json encoder
+            return encoder.encode(obj).encode()
+
+    return _dumps
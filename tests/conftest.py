@@ -52,8 +52,8 @@ def enable_plugin(
         if is_replace:
             for _plugin in plugin_list + post_plugin_list:
                 if not ignore_pre_check:
-                    plugin_manager.pre_check_hook(route_handler.pait_core_model)  # type: ignore[attr-defined]
-                plugin_manager.pre_load_hook(route_handler.pait_core_model)  # type: ignore[attr-defined]
+                    _plugin.pre_check_hook(route_handler.pait_core_model)  # type: ignore[attr-defined]
+                _plugin.pre_load_hook(route_handler.pait_core_model)  # type: ignore[attr-defined]
 
             pait_core_model._plugin_list = plugin_list
             pait_core_model._post_plugin_list = post_plugin_list
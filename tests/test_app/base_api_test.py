@@ -1,14 +1,26 @@
+import json
+import zlib
+from datetime import datetime
 from tempfile import NamedTemporaryFile
-from typing import TYPE_CHECKING, Any, Callable, Optional, Type
+from typing import TYPE_CHECKING, Any, Callable, Mapping, Optional, Tuple, Type
+from unittest import mock
 
 import pytest
+from pydantic import BaseModel, Field
 from pytest_mock import MockFixture
 from redis import Redis  # type: ignore
 
 from pait.app.base import BaseTestHelper, CheckResponseException
+from pait.g import config
 from pait.model.response import BaseResponseModel, FileResponseModel, HtmlResponseModel, TextResponseModel
-from pait.plugin.cache_response import CacheResponsePlugin
+from pait.plugin import check_json_resp
+from pait.plugin.base import PostPluginProtocol
+from pait.plugin.cache_response import CacheResponsePlugin, MemoryCacheBackend, TwoTierCacheBackend
+from pait.plugin.compress_response import CompressResponsePlugin, _compress_func_dict
+from pait.plugin.conditional_get import CacheControl, ConditionalGetPlugin
 from pait.plugin.mock_response import MockPluginProtocol
+from pait.plugin.unified_response import UnifiedResponsePlugin
+from pait.util.encoder import CustomJSONEncoder
 from tests.conftest import enable_plugin, enable_resp_model
 
 if TYPE_CHECKING:
@@ -519,6 +531,268 @@ class BaseTest(object):
             with enable_plugin(route_handler, cache_plugin.build(name=key, cache_time=5)):
                 assert _handler(route_handler) == _handler(route_handler)
 
+    def cache_response_backend(self, route: Callable, cache_plugin: Type[CacheResponsePlugin]) -> None:
+        l2_backend = MemoryCacheBackend()
+        backend = TwoTierCacheBackend(l2_backend)
+        with enable_plugin(
+            route,
+            cache_plugin.build(
+                backend=backend, name="test_cache_response_backend", enable_cache_name_merge_param=True, cache_time=5
+            ),
+        ):
+            body_dict: dict = {"uid": 123, "user_name": "appl", "age": 2, "sex": "man"}
+            result1 = self.test_helper(self.client, route, body_dict=body_dict).json()
+            result2 = self.test_helper(self.client, route, body_dict=body_dict).json()
+            assert result1 == result2
+            assert backend.stats.hits == 1
+            # The first get and the get after the lock is acquired are both miss
+            assert backend.stats.misses == 2
+            assert l2_backend.stats.hits == 0
+            # The dict or framework response is not saved by pickle
+            assert [value[:1] for _, value, _ in backend.l1._data.values()] in ([b"j"], [b"r"])  # type: ignore
+
+            # L1 expired, get the value from L2
+            backend.l1.clear()  # type: ignore[attr-defined]
+            assert self.test_helper(self.client, route, body_dict=body_dict).json() == result1
+            assert l2_backend.stats.hits == 1
+
+    def compress_response(
+        self,
+        route: Callable,
+        compress_plugin: Type[CompressResponsePlugin],
+        cache_plugin: Type[CacheResponsePlugin],
+    ) -> None:
+        def _request(accept_encoding: str) -> Tuple[Optional[str], Mapping]:
+            test_helper = self.test_helper(
+                self.client, route, header_dict={"Accept-Encoding": accept_encoding}, enable_assert_response=False
+            )
+            resp = test_helper.request("GET")
+            headers = test_helper._get_headers(resp)
+            # Some test clients decompress the body automatically
+            encoding = headers.get("Content-Encoding", None) or headers.get("X-Consumed-Content-Encoding", None)
+            body = test_helper._get_bytes(resp)
+            if body[:1] != b"{":
+                body = zlib.decompress(body, 16 + zlib.MAX_WBITS if encoding == "gzip" else zlib.MAX_WBITS)
+            assert json.loads(body) == {"data": "Demo"}
+            return encoding, headers
+
+        gzip_call_list: list = []
+        raw_gzip_func = _compress_func_dict["gzip"]
+
+        def _gzip(body: bytes, level: int) -> bytes:
+            gzip_call_list.append(body)
+            return raw_gzip_func(body, level)
+
+        with mock.patch.dict(_compress_func_dict, {"gzip": _gzip}):
+            with enable_plugin(
+                route,
+                compress_plugin.build(minimum_size=1),
+                cache_plugin.build(backend=MemoryCacheBackend(), cache_time=5),
+                is_replace=True,
+            ):
+                encoding, headers = _request("gzip, deflate")
+                assert encoding == "gzip"
+                assert "Accept-Encoding" in headers["Vary"]
+                # The compressed response is cached, so the cache hit does not compress again
+                assert _request("gzip, deflate")[0] == "gzip"
+                assert len(gzip_call_list) == 1
+                assert _request("gzip;q=0.5, deflate")[0] == "deflate"
+                assert _request("deflate, *;q=0")[0] == "deflate"
+
+                encoding, headers = _request("identity")
+                assert encoding is None
+                assert "Accept-Encoding" in headers["Vary"]
+                assert len(gzip_call_list) == 1
+
+            # The body is less than minimum_size
+            with enable_plugin(route, compress_plugin.build(), is_replace=True):
+                encoding, headers = _request("gzip")
+                assert encoding is None
+                assert "Vary" not in headers
+                assert len(gzip_call_list) == 1
+
+    def conditional_get(
+        self,
+        route: Callable,
+        conditional_get_plugin: Type[ConditionalGetPlugin],
+        cache_plugin: Type[CacheResponsePlugin],
+    ) -> None:
+        class CallCountPlugin(PostPluginProtocol):
+            call_count: int = 0
+
+            def __call__(self, context: Any) -> Any:
+                CallCountPlugin.call_count += 1
+                return super().__call__(context)
+
+        def _request(header_dict: Optional[dict] = None) -> Tuple[int, Mapping]:
+            test_helper = self.test_helper(self.client, route, header_dict=header_dict, enable_assert_response=False)
+            resp = test_helper.request("GET")
+            return test_helper._get_status_code(resp), test_helper._get_headers(resp)
+
+        # The ETag is computed from the body
+        with enable_plugin(
+            route,
+            conditional_get_plugin.build(cache_control=CacheControl(max_age=60, public=True)),
+            CallCountPlugin.build(),
+            is_replace=True,
+        ):
+            status_code, headers = _request()
+            assert status_code == 200
+            etag = headers["ETag"]
+            assert etag.startswith('"')
+            assert headers["Cache-Control"] == "public, max-age=60"
+
+            status_code, headers = _request({"If-None-Match": f'"other", {etag}'})
+            assert status_code == 304
+            assert headers["ETag"] == etag
+            assert headers["Cache-Control"] == "public, max-age=60"
+            assert _request({"If-None-Match": '"other"'})[0] == 200
+            assert CallCountPlugin.call_count == 3
+
+        # The validator is obtained from the func, the route function is not called if it matches
+        CallCountPlugin.call_count = 0
+        last_modified = datetime(2023, 1, 1)
+        with enable_plugin(
+            route,
+            conditional_get_plugin.build(
+                weak=True, etag_func=lambda context: 'W/"v1"', last_modified_func=lambda context: last_modified
+            ),
+            CallCountPlugin.build(),
+            is_replace=True,
+        ):
+            status_code, headers = _request({"If-None-Match": '"v1"'})
+            assert status_code == 304
+            assert headers["ETag"] == 'W/"v1"'
+            assert _request({"If-Modified-Since": "Mon, 02 Jan 2023 00:00:00 GMT"})[0] == 304
+            assert CallCountPlugin.call_count == 0
+
+            status_code, headers = _request({"If-Modified-Since": "Sat, 31 Dec 2022 00:00:00 GMT"})
+            assert status_code == 200
+            assert headers["ETag"] == 'W/"v1"'
+            assert headers["Last-Modified"] == "Sun, 01 Jan 2023 00:00:00 GMT"
+            assert CallCountPlugin.call_count == 1
+
+        # The cache hit response also has the ETag
+        CallCountPlugin.call_count = 0
+        with enable_plugin(
+            route,
+            conditional_get_plugin.build(),
+            cache_plugin.build(backend=MemoryCacheBackend(), cache_time=5),
+            CallCountPlugin.build(),
+            is_replace=True,
+        ):
+            status_code, headers = _request()
+            assert status_code == 200
+            etag = headers["ETag"]
+            status_code, headers = _request()
+            assert status_code == 200
+            assert headers["ETag"] == etag
+            assert _request({"If-None-Match": etag})[0] == 304
+            assert CallCountPlugin.call_count == 1
+
+    def unified_response_builder(
+        self,
+        route: Callable,
+        unified_plugin: Type[UnifiedResponsePlugin],
+        create_time: Any = 1600000000,
+        use_json_encoder: bool = True,
+    ) -> None:
+        class DemoModel(BaseModel):
+            uid: int = Field(alias="user_id")
+            create_time: datetime
+
+        class ReturnModelPlugin(PostPluginProtocol):
+            def __call__(self, context: Any) -> Any:
+                model = DemoModel(user_id=1, create_time=datetime.fromtimestamp(1600000000))
+                if self._is_async_func:
+
+                    async def _return() -> DemoModel:
+                        return model
+
+                    return _return()
+                return model
+
+        # The pydantic model is serialized by the response builder
+        with enable_plugin(route, unified_plugin.build(), ReturnModelPlugin.build(), is_replace=True):
+            assert self.test_helper(self.client, route).json() == {"user_id": 1, "create_time": create_time}
+            if not use_json_encoder:
+                return
+
+            class IsoJSONEncoder(CustomJSONEncoder):
+                def default(self, obj: Any) -> Any:
+                    if isinstance(obj, datetime):
+                        return obj.isoformat()
+                    return super().default(obj)
+
+            # The json encoder set after the route is loaded also takes effect
+            raw_json_encoder = config.json_encoder
+            config.json_encoder = IsoJSONEncoder
+            try:
+                create_time_str: str = self.test_helper(self.client, route).json()["create_time"]
+                assert datetime.fromisoformat(create_time_str) == datetime.fromtimestamp(1600000000)
+            finally:
+                config.json_encoder = raw_json_encoder
+
+    def check_json_resp_sample_and_offload(
+        self, route: Callable, check_json_plugin: Type[check_json_resp.CheckJsonRespPlugin]
+    ) -> None:
+        error_list: list = []
+        context_list: list = []
+        stats = check_json_resp.CheckJsonRespStats()
+
+        def error_callback(e: Exception, context: Any) -> None:
+            error_list.append(e)
+            context_list.append(context)
+
+        def _request() -> dict:
+            # The response miss `age`, so the response is illegal
+            return self.test_helper(
+                self.client,
+                route,
+                query_dict={"uid": "123", "user_name": "so1n", "age": "18"},
+                enable_assert_response=False,
+            ).json(method="GET")
+
+        # The illegal response is reported through the callback instead of raising the exception
+        with enable_plugin(route, check_json_plugin.build(error_callback=error_callback, stats=stats), is_replace=True):
+            assert _request()["code"] == 0
+        assert stats.check_count == 1 and stats.error_count == 1
+        assert len(error_list) == 1
+
+        # The response that is not sampled is not checked
+        with enable_plugin(
+            route, check_json_plugin.build(sample_rate=0.1, error_callback=error_callback, stats=stats), is_replace=True
+        ):
+            with mock.patch("pait.plugin.check_json_resp.random.random", return_value=0.5):
+                assert _request()["code"] == 0
+            assert stats.check_count == 1
+            with mock.patch("pait.plugin.check_json_resp.random.random", return_value=0.05):
+                assert _request()["code"] == 0
+            assert stats.check_count == 2 and stats.error_count == 2
+
+        # The offloaded check is run in the background, the illegal response is logged
+        with enable_plugin(route, check_json_plugin.build(offload=True, stats=stats), is_replace=True):
+            with mock.patch.object(check_json_resp.logger, "warning") as patch:
+                assert _request()["code"] == 0
+                # Wait for the check to finish
+                check_json_resp._get_offload_worker().join()
+            assert stats.check_count == 3 and stats.error_count == 3
+            assert patch.call_count == 1
+        assert len(error_list) == 2
+
+        # The offloaded check is dropped when the queue is full
+        with enable_plugin(
+            route, check_json_plugin.build(offload=True, error_callback=error_callback, stats=stats), is_replace=True
+        ):
+            with mock.patch.object(check_json_resp._OffloadWorker, "submit", return_value=False):
+                assert _request()["code"] == 0
+            assert stats.drop_count == 1 and stats.check_count == 3
+            assert _request()["code"] == 0
+            check_json_resp._get_offload_worker().join()
+            assert stats.check_count == 4
+            # The offloaded check only has the route name instead of the context
+            assert len(error_list) == 3 and context_list[-1].endswith(route.__name__)
+
     def unified_html_response(self, route: Callable) -> None:
         assert self.test_helper(self.client, route).text() == "<html>Demo</html>"
 
@@ -178,6 +178,16 @@ class TestAttribute(BaseTestApp):
             patch.assert_called()
 
 
+class TestRegisterAppDepend(BaseTestApp):
+    def test_register_app_depend(self, mocker: MockFixture) -> None:
+        for i in app_list:
+            patch = mocker.patch(f"pait.app.{i}.register_app_depend")
+            any.register_app_depend(
+                importlib.import_module(f"example.{i}_example.main_example").create_app(), demo  # type: ignore
+            )
+            patch.assert_called()
+
+
 class TestAddSimpleRoute(BaseTestApp):
     def test_add_simple_route(self, mocker: MockFixture) -> None:
         for i in app_list:
@@ -369,6 +379,38 @@ class TestPlugin(BaseTestApp):
             plugin_class(lambda *args, **kwargs: None, self.FakePluginCoreModel())
             patch.assert_called()
 
+    def test_compress_response(self, mocker: MockFixture) -> None:
+        for i in app_list:
+            self._clean_app_from_sys_module()
+            # import web app
+            importlib.import_module(i)
+            from pait.app.any.plugin import compress_response
+
+            importlib.reload(compress_response)
+            patch = mocker.patch(f"pait.app.{i}.plugin.compress_response.CompressResponsePlugin.__post_init__")
+            plugin_class = getattr(
+                importlib.import_module("pait.app.any.plugin.compress_response"),
+                "CompressResponsePlugin",
+            )
+            plugin_class(lambda *args, **kwargs: None, self.FakePluginCoreModel())
+            patch.assert_called()
+
+    def test_conditional_get(self, mocker: MockFixture) -> None:
+        for i in app_list:
+            self._clean_app_from_sys_module()
+            # import web app
+            importlib.import_module(i)
+            from pait.app.any.plugin import conditional_get
+
+            importlib.reload(conditional_get)
+            patch = mocker.patch(f"pait.app.{i}.plugin.conditional_get.ConditionalGetPlugin.__post_init__")
+            plugin_class = getattr(
+                importlib.import_module("pait.app.any.plugin.conditional_get"),
+                "ConditionalGetPlugin",
+            )
+            plugin_class(lambda *args, **kwargs: None, self.FakePluginCoreModel())
+            patch.assert_called()
+
     def test_unified_response(self, mocker: MockFixture) -> None:
         for i in app_list:
             self._clean_app_from_sys_module()
@@ -1,10 +1,13 @@
+import datetime
 import difflib
+import gzip
 import json
+import pathlib
 import random
 import sys
 from contextlib import contextmanager
 from functools import partial
-from typing import Callable, Generator, Type
+from typing import Any, Callable, Generator, Iterator, List, Type
 from unittest import mock
 
 import pytest
@@ -13,17 +16,22 @@ from flask.ctx import AppContext
 from flask.testing import FlaskClient
 from pydantic import BaseModel, Field
 from pytest_mock import MockFixture
+from werkzeug.http import http_date
 
 from example.common import response_model
 from example.flask_example import main_example
+from pait import field
 from pait.app import auto_load_app
 from pait.app.any import get_app_attribute, set_app_attribute
 from pait.app.base.simple_route import SimpleRoute
 from pait.app.flask import TestHelper as _TestHelper
-from pait.app.flask import add_multi_simple_route, add_simple_route, load_app, pait
+from pait.app.flask import add_multi_simple_route, add_simple_route, load_app, pait, register_app_depend
+from pait.app.flask.plugin import unified_response as flask_unified_response
+from pait.exceptions import TipException
+from pait.g import get_ctx, pait_context
 from pait.model import response
 from pait.model.context import ContextModel
-from pait.openapi.doc_route import default_doc_fn_dict
+from pait.openapi.doc_route import AddDocRoute, default_doc_fn_dict
 from pait.openapi.openapi import InfoModel, OpenAPI, ServerModel
 from tests.conftest import enable_plugin
 from tests.test_app.base_api_test import BaseTest
@@ -174,6 +182,54 @@ class TestFlask:
                 > 0.95
             )
 
+    def test_doc_route_cache_openapi_content(self) -> None:
+        class CountOpenAPI(OpenAPI):
+            init_cnt: int = 0
+
+            def __init__(self, *args: Any, **kwargs: Any) -> None:
+                CountOpenAPI.init_cnt += 1
+                super().__init__(*args, **kwargs)
+
+        with client_ctx() as client:
+            doc_route = AddDocRoute(client.application, prefix="/cache-doc", title="Cache Doc", openapi=CountOpenAPI)
+            openapi_dict = json.loads(client.get("/cache-doc/openapi.json").get_data())
+            assert openapi_dict["info"]["title"] == "Cache Doc"
+            assert openapi_dict["servers"][0]["url"] == "http://localhost"
+            assert openapi_dict["paths"]["/api/user"]["get"]["parameters"][0]["example"] is None
+
+            # The cached document is reused, and the template variable is filled in by the request
+            openapi_dict = json.loads(client.get("/cache-doc/openapi.json?template-token=xxx").get_data())
+            assert openapi_dict["paths"]["/api/user"]["get"]["parameters"][0]["example"] == "xxx"
+            assert CountOpenAPI.init_cnt == 1
+
+            # The document is regenerated after the route is changed
+            pait_core_model = main_example.get_user_route.pait_core_model
+            pait_core_model.desc = pait_core_model.desc
+            client.get("/cache-doc/openapi.json")
+            assert CountOpenAPI.init_cnt == 2
+            doc_route.invalidate_openapi_content()
+            client.get("/cache-doc/openapi.json")
+            client.get("/cache-doc/openapi.json")
+            assert CountOpenAPI.init_cnt == 3
+
+    def test_doc_route_serve_openapi_file(self, tmp_path: pathlib.Path) -> None:
+        from pait.openapi.cli import export_openapi
+
+        with client_ctx() as client:
+            for index, is_gzip in enumerate([False, True]):
+                (openapi_file,) = export_openapi(
+                    client.application, str(tmp_path), title_list=[f"File Doc{index}"], is_gzip=is_gzip
+                )
+                AddDocRoute(
+                    client.application, prefix=f"/file-doc{index}", title=f"File Doc{index}", openapi_file=openapi_file
+                )
+                with (gzip.open if is_gzip else open)(openapi_file, "rb") as f:  # type: ignore
+                    content = f.read()
+                resp = client.get(f"/file-doc{index}/openapi.json")
+                assert resp.get_data() == content
+                assert resp.mimetype == "application/json"
+                assert json.loads(content)["info"]["title"] == f"File Doc{index}"
+
     def test_auto_load_app_class(self) -> None:
         for i in auto_load_app.app_list:
             sys.modules.pop(i, None)
@@ -196,6 +252,101 @@ class TestFlask:
             client.application.add_url_rule(url, view_func=demo_route)
             assert client.get(url).json == {}
 
+    def test_app_depend(self) -> None:
+        call_list: List[str] = []
+
+        @contextmanager
+        def get_client() -> Iterator[str]:
+            call_list.append("enter client")
+            yield "client"
+            call_list.append("exit client")
+
+        def get_config() -> dict:
+            call_list.append("config")
+            return {"a": 1}
+
+        @pait()
+        def demo_route(
+            client: str = field.Depends.i(get_client, scope="app"),
+            config: dict = field.Depends.i(get_config, scope="app"),
+        ) -> dict:
+            return {"client": client, "config": config}
+
+        app: Flask = Flask("test_app_depend")
+        app.add_url_rule("/api/demo", view_func=demo_route)
+        container = register_app_depend(app, get_config)
+        assert call_list == ["config"]
+
+        test_client = app.test_client()
+        for _ in range(2):
+            assert test_client.get("/api/demo").json == {"client": "client", "config": {"a": 1}}
+        assert call_list == ["config", "enter client"]
+
+        container.teardown()
+        assert call_list == ["config", "enter client", "exit client"]
+
+    def test_context_free_list(self) -> None:
+        ctx_list: List[ContextModel] = []
+
+        @pait()
+        def demo_route(uid: str = field.Query.i()) -> dict:
+            ctx_list.append(get_ctx())
+            return {"uid": uid}
+
+        app: Flask = Flask("test_context_free_list")
+        app.add_url_rule("/api/demo", view_func=demo_route)
+        test_client = app.test_client()
+        with mock.patch.object(ContextModel, "free_list_max_size", 1), mock.patch.object(
+            ContextModel, "_free_list", []
+        ):
+            for uid in ("1", "2"):
+                assert test_client.get(f"/api/demo?uid={uid}").json == {"uid": uid}
+                # The released context is in the free list, so it can not be got by `get_ctx` after the dispatch
+                assert ContextModel._free_list == [ctx_list[-1]]
+                assert pait_context.get(None) is None
+            assert ctx_list[0] is ctx_list[1]
+
+    def test_app_depend_check(self) -> None:
+        call_list: List[str] = []
+
+        @contextmanager
+        def get_session() -> Iterator[str]:
+            call_list.append("enter session")
+            yield "session"
+            call_list.append("exit session")
+
+        def get_db(session: str = field.Depends.i(get_session)) -> str:
+            return f"db-{session}"
+
+        @pait()
+        def demo_route(db: str = field.Depends.i(get_db, scope="app")) -> dict:
+            return {"db": db}
+
+        app: Flask = Flask("test_app_depend_check")
+        app.add_url_rule("/api/demo", view_func=demo_route)
+        container = register_app_depend(app)
+        test_client = app.test_client()
+        for _ in range(2):
+            assert test_client.get("/api/demo").json == {"db": "db-session"}
+        # The context manager of the sub depend is exited with the app, not the request
+        assert call_list == ["enter session"]
+        container.teardown()
+        assert call_list == ["enter session", "exit session"]
+
+        def get_uid(uid: str = field.Query.i()) -> str:
+            return uid
+
+        def get_user(uid: str = field.Depends.i(get_uid)) -> str:
+            return uid
+
+        with pytest.raises(TipException) as e:
+
+            @pait()
+            def demo_user_route(user: str = field.Depends.i(get_user, scope="app")) -> dict:
+                return {"user": user}
+
+        assert "can not use the param:uid obtained from the request" in str(e.value)
+
     def test_text_response(self, client: FlaskClient) -> None:
         response_test_helper(client, main_example.text_response_route, response.TextResponseModel)
 
@@ -292,10 +443,39 @@ class TestFlask:
             main_example.post_route, main_example.CacheResponsePlugin, main_example.Redis(decode_responses=True)
         )
 
+    def test_cache_response_backend(self, base_test: BaseTest) -> None:
+        base_test.cache_response_backend(main_example.post_route, main_example.CacheResponsePlugin)
+
+    def test_compress_response(self, base_test: BaseTest) -> None:
+        from pait.app.flask.plugin.compress_response import CompressResponsePlugin
+
+        base_test.compress_response(
+            main_example.unified_json_response, CompressResponsePlugin, main_example.CacheResponsePlugin
+        )
+
+    def test_conditional_get(self, base_test: BaseTest) -> None:
+        from pait.app.flask.plugin.conditional_get import ConditionalGetPlugin
+
+        base_test.conditional_get(
+            main_example.unified_json_response, ConditionalGetPlugin, main_example.CacheResponsePlugin
+        )
+
     def test_unified_response(self, base_test: BaseTest) -> None:
         base_test.unified_json_response(main_example.unified_json_response)
         base_test.unified_text_response(main_example.unified_text_response)
         base_test.unified_html_response(main_example.unified_html_response)
+        # The json value is serialized by the json provider of Flask
+        base_test.unified_response_builder(
+            main_example.unified_json_response,
+            flask_unified_response.UnifiedResponsePlugin,
+            create_time=http_date(datetime.datetime.fromtimestamp(1600000000)),
+            use_json_encoder=False,
+        )
+
+    def test_check_json_resp_sample_and_offload(self, base_test: BaseTest) -> None:
+        from pait.app.flask.plugin.check_json_resp import CheckJsonRespPlugin
+
+        base_test.check_json_resp_sample_and_offload(main_example.check_json_plugin_route, CheckJsonRespPlugin)
 
     def test_check_json_resp_plugin(self, pait_context: ContextModel, base_test: BaseTest) -> None:
         # if not use base_test, flask can not find ctx
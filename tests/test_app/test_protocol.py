@@ -147,6 +147,12 @@ class TestPluginProtocol(BaseTestProtocol):
     def test_plugin_check_json_resp(self) -> None:
         self._check_func_type_hint_by_other_module("plugin.check_json_resp", "CheckJsonRespPlugin")
 
+    def test_plugin_compress_response(self) -> None:
+        self._check_func_type_hint_by_other_module("plugin.compress_response", "CompressResponsePlugin")
+
+    def test_plugin_conditional_get(self) -> None:
+        self._check_func_type_hint_by_other_module("plugin.conditional_get", "ConditionalGetPlugin")
+
     def test_plugin_mock_response(self) -> None:
         self._check_func_type_hint_by_other_module("plugin.mock_response", "MockPlugin")
 
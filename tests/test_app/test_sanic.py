@@ -3,9 +3,9 @@ import json
 import logging
 import random
 import sys
-from contextlib import contextmanager
+from contextlib import asynccontextmanager, contextmanager
 from functools import partial
-from typing import Callable, Generator, Type
+from typing import AsyncIterator, Callable, Generator, List, Type
 from unittest import mock
 
 import pytest
@@ -20,11 +20,13 @@ from sanic_testing.testing import TestingResponse as Response  # type: ignore
 
 from example.common import response_model
 from example.sanic_example import main_example
+from pait import field
 from pait.app import auto_load_app
 from pait.app.any import get_app_attribute, set_app_attribute
 from pait.app.base.simple_route import SimpleRoute
 from pait.app.sanic import TestHelper as _TestHelper
-from pait.app.sanic import add_multi_simple_route, add_simple_route, load_app, pait
+from pait.app.sanic import add_multi_simple_route, add_simple_route, load_app, pait, register_app_depend
+from pait.app.sanic.plugin import unified_response as sanic_unified_response
 from pait.model import response
 from pait.model.context import ContextModel
 from pait.openapi.doc_route import default_doc_fn_dict
@@ -194,6 +196,31 @@ class TestSanic:
         set_app_attribute(client.app, key, value)
         assert get_app_attribute(client.app, key) == value
 
+    def test_app_depend(self) -> None:
+        call_list: List[str] = []
+
+        @asynccontextmanager
+        async def get_client() -> AsyncIterator[str]:
+            call_list.append("enter client")
+            yield "client"
+            call_list.append("exit client")
+
+        from sanic.response import HTTPResponse
+        from sanic.response import json as json_resp
+
+        @pait()
+        async def demo_route(request: Request, client: str = field.Depends.i(get_client, scope="app")) -> HTTPResponse:
+            return json_resp({"client": client})
+
+        app: Sanic = Sanic("test_app_depend", configure_logging=False)
+        app.add_route(demo_route, "/api/demo", methods=["GET"])
+        register_app_depend(app, get_client)
+        with client_ctx(app) as client:
+            request, resp = client.get("/api/demo")
+            assert resp.json == {"client": "client"}
+        # The test client starts the server before the request and stops the server after the request
+        assert call_list == ["enter client", "exit client"]
+
     def test_raise_tip_route(self, base_test: BaseTest, mocker: MockFixture) -> None:
         base_test.raise_tip_route(main_example.raise_tip_route, mocker=mocker)
 
@@ -290,10 +317,35 @@ class TestSanic:
                 main_example.post_route, main_example.CacheResponsePlugin, main_example.Redis(decode_responses=True)
             )
 
+    def test_cache_response_backend(self, base_test: BaseTest) -> None:
+        base_test.cache_response_backend(main_example.post_route, main_example.CacheResponsePlugin)
+
+    def test_compress_response(self, base_test: BaseTest) -> None:
+        from pait.app.sanic.plugin.compress_response import CompressResponsePlugin
+
+        base_test.compress_response(
+            main_example.unified_json_response, CompressResponsePlugin, main_example.CacheResponsePlugin
+        )
+
+    def test_conditional_get(self, base_test: BaseTest) -> None:
+        from pait.app.sanic.plugin.conditional_get import ConditionalGetPlugin
+
+        base_test.conditional_get(
+            main_example.unified_json_response, ConditionalGetPlugin, main_example.CacheResponsePlugin
+        )
+
     def test_unified_response(self, base_test: BaseTest) -> None:
         base_test.unified_json_response(main_example.unified_json_response)
         base_test.unified_text_response(main_example.unified_text_response)
         base_test.unified_html_response(main_example.unified_html_response)
+        base_test.unified_response_builder(
+            main_example.unified_json_response, sanic_unified_response.UnifiedResponsePlugin
+        )
+
+    def test_check_json_resp_sample_and_offload(self, base_test: BaseTest) -> None:
+        from pait.app.sanic.plugin.check_json_resp import CheckJsonRespPlugin
+
+        base_test.check_json_resp_sample_and_offload(main_example.check_json_plugin_route, CheckJsonRespPlugin)
 
     def test_check_json_resp_plugin(self, pait_context: ContextModel) -> None:
         from sanic.response import HTTPResponse
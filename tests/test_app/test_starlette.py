@@ -3,9 +3,9 @@ import difflib
 import json
 import random
 import sys
-from contextlib import contextmanager
+from contextlib import asynccontextmanager, contextmanager
 from functools import partial
-from typing import Any, Callable, Generator, Type
+from typing import Any, AsyncIterator, Callable, Generator, List, Type
 from unittest import mock
 
 import pytest
@@ -20,11 +20,13 @@ from starlette.testclient import TestClient
 
 from example.common import response_model
 from example.starlette_example import main_example
+from pait import field
 from pait.app import auto_load_app
 from pait.app.any import get_app_attribute, set_app_attribute
 from pait.app.base.simple_route import SimpleRoute
 from pait.app.starlette import TestHelper as _TestHelper
-from pait.app.starlette import add_multi_simple_route, add_simple_route, load_app, pait
+from pait.app.starlette import add_multi_simple_route, add_simple_route, load_app, pait, register_app_depend
+from pait.app.starlette.plugin import unified_response as starlette_unified_response
 from pait.app.starlette.plugin.mock_response import MockPlugin
 from pait.model import response
 from pait.model.context import ContextModel
@@ -224,6 +226,37 @@ class TestStarlette:
         set_app_attribute(client.app, key, value)
         assert get_app_attribute(client.app, key) == value
 
+    def test_app_depend(self) -> None:
+        call_list: List[str] = []
+
+        @asynccontextmanager
+        async def get_client() -> AsyncIterator[str]:
+            call_list.append("enter client")
+            yield "client"
+            call_list.append("exit client")
+
+        class GetConfig(object):
+            async def __call__(self, client: str = field.Depends.i(get_client, scope="app")) -> dict:
+                call_list.append("config")
+                return {"client": client}
+
+        @pait()
+        async def demo_route(
+            client: str = field.Depends.i(get_client, scope="app"),
+            config: dict = field.Depends.i(GetConfig, scope="app"),
+        ) -> JSONResponse:
+            return JSONResponse({"client": client, "config": config})
+
+        app: Starlette = Starlette()
+        app.add_route("/api/demo", demo_route, methods=["GET"])
+        register_app_depend(app, GetConfig)
+        with client_ctx(app) as client:
+            assert call_list == ["enter client", "config"]
+            for _ in range(2):
+                assert client.get("/api/demo").json() == {"client": "client", "config": {"client": "client"}}
+            assert call_list == ["enter client", "config"]
+        assert call_list == ["enter client", "config", "exit client"]
+
     def test_raise_tip_route(self, base_test: BaseTest, mocker: MockFixture) -> None:
         base_test.raise_tip_route(main_example.raise_tip_route, mocker=mocker)
 
@@ -319,10 +352,35 @@ class TestStarlette:
             main_example.Redis(decode_responses=True),
         )
 
+    def test_cache_response_backend(self, base_test: BaseTest) -> None:
+        base_test.cache_response_backend(main_example.post_route, main_example.CacheResponsePlugin)
+
+    def test_compress_response(self, base_test: BaseTest) -> None:
+        from pait.app.starlette.plugin.compress_response import CompressResponsePlugin
+
+        base_test.compress_response(
+            main_example.unified_json_response, CompressResponsePlugin, main_example.CacheResponsePlugin
+        )
+
+    def test_conditional_get(self, base_test: BaseTest) -> None:
+        from pait.app.starlette.plugin.conditional_get import ConditionalGetPlugin
+
+        base_test.conditional_get(
+            main_example.unified_json_response, ConditionalGetPlugin, main_example.CacheResponsePlugin
+        )
+
     def test_unified_response(self, base_test: BaseTest) -> None:
         base_test.unified_json_response(main_example.unified_json_response)
         base_test.unified_text_response(main_example.unified_text_response)
         base_test.unified_html_response(main_example.unified_html_response)
+        base_test.unified_response_builder(
+            main_example.unified_json_response, starlette_unified_response.UnifiedResponsePlugin
+        )
+
+    def test_check_json_resp_sample_and_offload(self, base_test: BaseTest) -> None:
+        from pait.app.starlette.plugin.check_json_resp import CheckJsonRespPlugin
+
+        base_test.check_json_resp_sample_and_offload(main_example.async_check_json_plugin_route, CheckJsonRespPlugin)
 
     def test_load_app_by_mount_route(self, client: TestClient) -> None:
         from starlette.responses import JSONResponse
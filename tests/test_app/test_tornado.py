@@ -4,24 +4,29 @@ import random
 import sys
 from functools import partial
 from tempfile import NamedTemporaryFile
-from typing import Any, Callable, Type
+from typing import Any, Callable, List, Type
 from unittest import mock
 
 import pytest
 from redis import Redis  # type: ignore
 from tornado.testing import AsyncHTTPTestCase, HTTPResponse
-from tornado.web import Application
+from tornado.web import Application, RequestHandler
 
 from example.common import response_model
 from example.tornado_example import main_example
+from pait import field
 from pait.app import auto_load_app
 from pait.app.any import get_app_attribute, set_app_attribute
 from pait.app.base.simple_route import SimpleRoute
 from pait.app.tornado import TestHelper as _TestHelper
-from pait.app.tornado import add_multi_simple_route, add_simple_route, load_app, pait
+from pait.app.tornado import add_multi_simple_route, add_simple_route, load_app, pait, register_app_depend
+from pait.app.tornado.plugin import unified_response as tornado_unified_response
+from pait.g import get_ctx, pait_context
 from pait.model import response
+from pait.model.context import ContextModel
 from pait.openapi.doc_route import default_doc_fn_dict
 from pait.openapi.openapi import InfoModel, OpenAPI, ServerModel
+from pait.plugin.cache_backend import MemoryCacheBackend
 from tests.conftest import enable_plugin
 from tests.test_app.base_api_test import BaseTest
 from tests.test_app.base_doc_example_test import BaseTestDocExample
@@ -148,6 +153,46 @@ class TestTornado(BaseTestTornado):
         set_app_attribute(app, key, value)
         assert get_app_attribute(app, key) == value
 
+    def test_app_depend(self) -> None:
+        call_list: List[str] = []
+
+        async def get_config() -> dict:
+            call_list.append("config")
+            return {"a": 1}
+
+        class DemoHandler(RequestHandler):
+            @pait()
+            async def get(self, config: dict = field.Depends.i(get_config, scope="app")) -> None:
+                self.write({"config": config})
+
+        self._app.add_handlers(r".*$", [(r"/api/app-depend-demo", DemoHandler)])
+        container = register_app_depend(self._app, get_config)
+        for _ in range(2):
+            assert json.loads(self.fetch("/api/app-depend-demo").body.decode()) == {"config": {"a": 1}}
+        assert call_list == ["config"]
+        assert container.value_dict == {get_config: {"a": 1}}
+
+    def test_context_free_list(self) -> None:
+        ctx_list: List[ContextModel] = []
+
+        class DemoHandler(RequestHandler):
+            @pait()
+            def get(self) -> None:
+                ctx_list.append(get_ctx())
+                self.write({"uid": get_ctx().cbv_instance.get_query_argument("uid")})
+
+        self._app.add_handlers(r".*$", [(r"/api/context-free-list-demo", DemoHandler)])
+        with mock.patch.object(ContextModel, "free_list_max_size", 1), mock.patch.object(
+            ContextModel, "_free_list", []
+        ):
+            for uid in ("1", "2"):
+                resp = self.fetch(f"/api/context-free-list-demo?uid={uid}")
+                assert json.loads(resp.body.decode()) == {"uid": uid}
+                # The context is released after the sync route function is run by the executor
+                assert ContextModel._free_list == [ctx_list[-1]]
+                assert pait_context.get(None) is None
+            assert ctx_list[0] is ctx_list[1]
+
     def test_pait_base_field_route(self) -> None:
         file_content: str = "Hello Word!"
 
@@ -318,10 +363,51 @@ class TestTornado(BaseTestTornado):
             main_example.Redis(decode_responses=True),
         )
 
+    def test_cache_response_backend(self) -> None:
+        self.base_test.cache_response_backend(main_example.PostHandler.post, main_example.CacheResponsePlugin)
+
+    def test_compress_response(self) -> None:
+        from pait.app.tornado.plugin.compress_response import CompressResponsePlugin
+
+        self.base_test.compress_response(
+            main_example.UnifiedJsonResponseHandler.get, CompressResponsePlugin, main_example.CacheResponsePlugin
+        )
+
+    def test_conditional_get(self) -> None:
+        from pait.app.tornado.plugin.conditional_get import ConditionalGetPlugin
+
+        self.base_test.conditional_get(
+            main_example.UnifiedJsonResponseHandler.get, ConditionalGetPlugin, main_example.CacheResponsePlugin
+        )
+
+        # The route writes the response to the handler, so the cache hit returns the handler
+        url: str = "/api/plugin/unified-json-response"
+        with enable_plugin(
+            main_example.UnifiedJsonResponseHandler.get,
+            ConditionalGetPlugin.build(),
+            main_example.CacheResponsePlugin.build(backend=MemoryCacheBackend(), cache_time=5),
+            tornado_unified_response.UnifiedResponsePlugin.build(),
+            is_replace=True,
+        ):
+            etag = self.fetch(url).headers["ETag"]
+            resp: HTTPResponse = self.fetch(url)
+            assert resp.code == 200
+            assert json.loads(resp.body) == {"data": "Demo"}
+            assert resp.headers["ETag"] == etag
+            assert self.fetch(url, headers={"If-None-Match": etag}).code == 304
+
     def test_unified_response(self) -> None:
         self.base_test.unified_json_response(main_example.UnifiedJsonResponseHandler.get)
         self.base_test.unified_text_response(main_example.UnifiedTextResponseHandler.get)
         self.base_test.unified_html_response(main_example.UnifiedHtmlResponseHandler.get)
+        self.base_test.unified_response_builder(
+            main_example.UnifiedJsonResponseHandler.get, tornado_unified_response.UnifiedResponsePlugin
+        )
+
+    def test_check_json_resp_sample_and_offload(self) -> None:
+        from pait.app.tornado.plugin.check_json_resp import CheckJsonRespPlugin
+
+        self.base_test.check_json_resp_sample_and_offload(main_example.CheckJsonPluginHandler.get, CheckJsonRespPlugin)
 
     def test_check_json_resp_plugin(self) -> None:
         pass
@@ -1,10 +1,16 @@
+from typing import Dict, List
+
 import pytest
 from pytest_mock import MockFixture
 
 from pait import core, g
 from pait.app.base import BaseAppHelper
+from pait.data import PaitData
+from pait.exceptions import TipException
+from pait.model import core as core_model_module
 from pait.model.core import PaitCoreModel
 from pait.param_handle import ParamHandler
+from pait.plugin import PluginManager, PrePluginProtocol
 
 
 def demo() -> None:
@@ -84,3 +90,106 @@ class TestPaitCore:
         assert not demo_core.response_model_list
         demo_core.response_model_list.append(BaseResponseModel)
         assert len(demo_core.response_model_list) == 1
+
+
+class HookCountPlugin(PrePluginProtocol):
+    hook_list: List[str]
+    is_raise: bool = False
+
+    @classmethod
+    def pre_check_hook(cls, pait_core_model: PaitCoreModel, kwargs: Dict) -> None:
+        super().pre_check_hook(pait_core_model, kwargs)
+        kwargs["hook_list"].append("pre_check")
+        if kwargs.get("is_raise", False):
+            raise ValueError("pre check error")
+
+    @classmethod
+    def pre_load_hook(cls, pait_core_model: PaitCoreModel, kwargs: Dict) -> Dict:
+        kwargs = super().pre_load_hook(pait_core_model, kwargs)
+        kwargs["hook_list"].append("pre_load")
+        return kwargs
+
+
+class TestLazyLoad:
+    def test_lazy_load(self) -> None:
+        hook_list: List[str] = []
+        pait_core_model: PaitCoreModel = PaitCoreModel(
+            demo,
+            FakeAppHelper,
+            ParamHandler,
+            plugin_list=[PluginManager(HookCountPlugin, hook_list=hook_list)],
+            lazy_load=True,
+        )
+        assert pait_core_model.lazy_load
+        assert pait_core_model._main_plugin is None
+        assert not hook_list
+
+        main_plugin = pait_core_model.main_plugin
+        assert isinstance(main_plugin, HookCountPlugin)
+        assert hook_list == ["pre_check", "pre_load"]
+        assert pait_core_model.main_plugin is main_plugin
+        assert hook_list == ["pre_check", "pre_load"]
+
+        # The plugin stack is rebuilt at the next call after adding the plugin
+        other_hook_list: List[str] = []
+        pait_core_model.add_plugin([PluginManager(HookCountPlugin, hook_list=other_hook_list)], [])
+        assert pait_core_model._main_plugin is None
+        assert not other_hook_list
+        assert pait_core_model.load() is not main_plugin
+        assert other_hook_list == ["pre_check", "pre_load"]
+        assert hook_list == ["pre_check", "pre_load"]
+
+        pait_core_model.param_handler_plugin = ParamHandler
+        assert pait_core_model._main_plugin is None
+        assert isinstance(pait_core_model.main_plugin, HookCountPlugin)
+
+    def test_lazy_load_error(self) -> None:
+        pait_core_model: PaitCoreModel = PaitCoreModel(
+            demo,
+            FakeAppHelper,
+            ParamHandler,
+            plugin_list=[PluginManager(HookCountPlugin, hook_list=[], is_raise=True)],
+            lazy_load=True,
+        )
+        for _ in range(2):
+            with pytest.raises(TipException) as e:
+                pait_core_model.main_plugin
+            assert "pre check error" in str(e.value)
+
+        # The type of plugin is still checked when adding
+        with pytest.raises(TipException):
+            pait_core_model.add_plugin([], [PluginManager(HookCountPlugin, hook_list=[])])  # type: ignore[list-item]
+        assert not pait_core_model._post_plugin_list
+
+    def test_warm_up(self) -> None:
+        pait_data: PaitData = PaitData()
+        hook_list: List[str] = []
+        ok_core_model: PaitCoreModel = PaitCoreModel(
+            demo, FakeAppHelper, ParamHandler, plugin_list=[PluginManager(HookCountPlugin, hook_list=hook_list)]
+        )
+        error_core_model: PaitCoreModel = PaitCoreModel(
+            lambda: None,
+            FakeAppHelper,
+            ParamHandler,
+            plugin_list=[PluginManager(HookCountPlugin, hook_list=[], is_raise=True)],
+            lazy_load=True,
+        )
+        pait_data.register(app_name, ok_core_model)
+        pait_data.register(app_name, error_core_model)
+        assert list(pait_data.warm_up("other_app_name")) == []
+        assert list(pait_data.warm_up(app_name)) == [error_core_model.pait_id]
+        assert hook_list == ["pre_check", "pre_load"]
+
+        pait_data = PaitData()
+        lazy_core_model: PaitCoreModel = PaitCoreModel(demo, FakeAppHelper, ParamHandler, lazy_load=True)
+        pait_data.register(app_name, lazy_core_model)
+        pait_data.warm_up_in_background().join()
+        assert lazy_core_model._main_plugin is not None
+
+    def test_check_cli(self, capsys: pytest.CaptureFixture) -> None:
+        from pait.extra import cli
+
+        assert not cli.check_app("example.flask_example.main_example:create_app()")
+        assert not core_model_module.default_lazy_load
+        cli.main(["example.flask_example.main_example:create_app()"])
+        assert capsys.readouterr().out.endswith(" 0 failed\n")
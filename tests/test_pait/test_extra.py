@@ -1,10 +1,14 @@
-from typing import TYPE_CHECKING, List, Optional, Type
+from typing import TYPE_CHECKING, List, Optional, Tuple, Type
 
 import pytest
 from pydantic import BaseConfig, BaseModel, Field
+from pytest_mock import MockFixture
 
 from pait.app.base import BaseAppHelper
+from pait.data import PaitData
 from pait.extra import config
+from pait.extra.util import sync_config_data_to_pait_data
+from pait.model.config import Config
 from pait.model.core import PaitCoreModel
 from pait.model.response import BaseResponseModel, JsonResponseModel
 from pait.model.status import PaitStatus
@@ -264,3 +268,88 @@ class TestApplyFun:
                 config.apply_param_handler(BaseParamHandler, config.MatchRule(key="main_plugin"))(i)  # type: ignore
         exec_msg = e.value.args[0]
         assert exec_msg == "Not support key:main_plugin"
+
+
+class TestIndexMatch:
+    @staticmethod
+    def _gen_pait_data() -> Tuple[PaitData, List[PaitCoreModel]]:
+        def demo() -> None:
+            pass
+
+        pait_data = PaitData()
+        core_model_list: List[PaitCoreModel] = []
+        for index, (group, status, tag, path, method_list) in enumerate(
+            [
+                ("user", PaitStatus.release, (Tag("index_user"),), "/api/user/info", ["GET"]),
+                ("user", PaitStatus.test, (Tag("index_user"), Tag("index_test")), "/api/user/login", ["POST"]),
+                ("root", PaitStatus.release, (Tag("index_test"),), "/api/other", ["GET", "POST"]),
+                ("root", PaitStatus.test, (Tag("index_default"),), "/health", ["GET"]),
+            ]
+        ):
+            core_model = PaitCoreModel(
+                demo, FakeAppHelper, ParamHandler, group=group, status=status, tag=tag, feature_code=str(index)
+            )
+            core_model.path = path
+            core_model.method_list = method_list
+            pait_data.register("fake", core_model)
+            core_model_list.append(core_model)
+        return pait_data, core_model_list
+
+    def test_get_literal_prefix(self) -> None:
+        assert config._get_literal_prefix("/api/user/\\d+") == "/api/user/"
+        assert config._get_literal_prefix("/api/users?") == "/api/user"
+        assert config._get_literal_prefix("/api/user|/health") == ""
+        assert config._get_literal_prefix("(?i)/api") == ""
+
+    def test_filter(self) -> None:
+        pait_data, core_model_list = self._gen_pait_data()
+        for match_rule_fn in [
+            lambda: config.MatchRule(),
+            lambda: config.MatchRule(key="group", target="user"),
+            lambda: config.MatchRule(key="!group", target="user"),
+            lambda: config.MatchRule(key="status", target=PaitStatus.test),
+            lambda: config.MatchRule(key="tag", target=Tag("index_test")),
+            lambda: config.MatchRule(key="method_list", target="POST"),
+            lambda: config.MatchRule(key="path", target="/api/user/"),
+            lambda: config.MatchRule(key="path", target="/api/.*/info"),
+            lambda: config.MatchRule(key="path", target="/api/user|/health"),
+            lambda: config.MatchRule(key="group", target="user") & config.MatchRule(key="method_list", target="POST"),
+            lambda: config.MatchRule(key="group", target="user") | config.MatchRule(key="path", target="/health"),
+            lambda: config.MatchRule(key="!tag", target=Tag("index_test"))
+            & config.MatchRule(key="path", target="/api"),
+        ]:
+            match_rule = match_rule_fn()
+            assert match_rule.filter(pait_data) == [i for i in core_model_list if match_rule.match(i)]
+
+        assert pait_data.get_index_set("group", "user") == set(core_model_list[:2])
+        assert pait_data.get_path_prefix_set("/api/user") == set(core_model_list[:2])
+        # The index is rebuilt after the attribute of the core model is changed
+        core_model_list[3].group = "user"
+        core_model_list[3].path = "/api/user/health"
+        assert pait_data.get_index_set("group", "user") == set(core_model_list[:2] + core_model_list[3:])
+        assert pait_data.get_path_prefix_set("/api/user") == set(core_model_list[:2] + core_model_list[3:])
+        config.apply_block_http_method_set({"GET"})(core_model_list[2])
+        assert pait_data.get_index_set("method_list", "GET") == {core_model_list[0], core_model_list[3]}
+
+    def test_sync_config_data_to_pait_data(self, mocker: MockFixture) -> None:
+        class PrePlugin(PrePluginProtocol):
+            pass
+
+        pait_data, core_model_list = self._gen_pait_data()
+        raw_main_plugin_list = [i.main_plugin for i in core_model_list]
+        apply_core_model_list: List[PaitCoreModel] = []
+        pait_config = Config()
+        pait_config.apply_func_list = [
+            config.apply_multi_plugin([PrePlugin.build], config.MatchRule(key="group", target="user")),
+            config.apply_multi_plugin([PrePlugin.build], config.MatchRule(key="path", target="/api/user/info")),
+            apply_core_model_list.append,
+        ]
+        spy = mocker.spy(PaitCoreModel, "build_plugin_stack")
+        sync_config_data_to_pait_data(pait_config, pait_data)
+
+        assert apply_core_model_list == core_model_list
+        assert [len(i._plugin_list) for i in core_model_list] == [2, 1, 0, 0]
+        # The plugin stack of the changed core model is only rebuilt once
+        assert spy.call_count == 2
+        for core_model, raw_main_plugin in zip(core_model_list, raw_main_plugin_list):
+            assert (core_model.main_plugin is raw_main_plugin) is (not core_model._plugin_list)
@@ -6,6 +6,7 @@ from typing import Any, Dict, List, Type, Union
 
 import pytest
 from pydantic import BaseModel, Field
+from pytest_mock import MockFixture
 
 from example.common.request_model import SexEnum
 from pait.app.base import BaseAppHelper
@@ -90,6 +91,28 @@ class TestContextModel:
         ctx.set_to_state("aaa", 123)
         assert ctx.get_form_state("aaa") == 123
 
+    def test_free_list(self, mocker: MockFixture) -> None:
+        ctx = context.ContextModel.create(None, None, None, [], {})  # type: ignore[arg-type]
+        ctx.set_to_state("aaa", 123)
+        # The free list is disabled by default
+        ctx.release()
+        assert context.ContextModel.create(None, None, None, [], {}) is not ctx  # type: ignore[arg-type]
+
+        mocker.patch.object(context.ContextModel, "free_list_max_size", 1)
+        mocker.patch.object(context.ContextModel, "_free_list", [])
+        ctx.release()
+        new_ctx = context.ContextModel.create(None, None, None, [1], {"a": 1})  # type: ignore[arg-type]
+        assert new_ctx is ctx
+        assert new_ctx.args == [1] and new_ctx.kwargs == {"a": 1}
+        assert not hasattr(new_ctx, "state")
+        assert not hasattr(new_ctx, "__dict__")
+
+        # The retained context is still used by other work, so it is not cleaned and reused
+        new_ctx.retain()
+        new_ctx.release()
+        assert new_ctx.kwargs == {"a": 1}
+        assert context.ContextModel.create(None, None, None, [], {}) is not new_ctx  # type: ignore[arg-type]
+
 
 def demo() -> None:
     pass
@@ -1,4 +1,7 @@
+import gzip
 import importlib
+import json
+import pathlib
 from typing import Dict
 
 import pytest
@@ -9,7 +12,10 @@ from pait.app.auto_load_app import app_list
 from pait.app.base import BaseAppHelper
 from pait.app.base.security.api_key import BaseAPIKey
 from pait.model.core import PaitCoreModel
-from pait.openapi.openapi import HttpParamTypeLiteral, ParsePaitModel
+from pait.model.template import TemplateVar
+from pait.openapi import cli
+from pait.openapi.cli import gen_openapi_file_name, import_app
+from pait.openapi.openapi import HttpParamTypeLiteral, OpenAPI, ParsePaitModel, SharedModelCache
 from pait.param_handle import ParamHandler
 
 
@@ -121,6 +127,87 @@ class TestParsePaitModel:
         with pytest.raises(ValueError):
             ParsePaitModel(core_model)
 
+    def test_share_same_param_model(self) -> None:
+        def demo(a: int = field.Body.i(description="a"), b: str = field.Body.i(description="b")) -> None:
+            pass
+
+        def demo1(a: int = field.Body.i(description="a"), b: str = field.Body.i(description="b")) -> None:
+            pass
+
+        def demo2(a: int = field.Body.i(description="other a"), b: str = field.Body.i(description="b")) -> None:
+            pass
+
+        core_model_list = [
+            PaitCoreModel(func, BaseAppHelper, ParamHandler, openapi_path=f"/{func.__name__}", method_set={"POST"})
+            for func in (demo, demo1, demo2)
+        ]
+        model_cache = SharedModelCache()
+        model_list = [
+            ParsePaitModel(i, model_cache=model_cache).http_param_type_dict["body"][0].model for i in core_model_list
+        ]
+        assert model_list[0] is model_list[1]
+        assert model_list[0] is not model_list[2]
+        # The name of the shared model does not depend on the route
+        assert "demo" not in model_list[0].__name__.lower()
+        # The model is only shared in one build
+        assert ParsePaitModel(core_model_list[0]).http_param_type_dict["body"][0].model is not model_list[0]
+
+        openapi_dict = OpenAPI(None, load_app=lambda _: {i.pait_id: i for i in core_model_list}).dict
+        ref_list = [
+            openapi_dict["paths"][f"/{i}"]["post"]["requestBody"]["content"]["application/json"]["schema"]["$ref"]
+            for i in ("demo", "demo1", "demo2")
+        ]
+        assert ref_list[0] == ref_list[1] != ref_list[2]
+        assert {i.split("/")[-1] for i in ref_list} <= set(openapi_dict["components"]["schemas"])
+
+    def test_share_param_model_with_object_example(self) -> None:
+        def demo(uid: str = field.Query.i(example=TemplateVar("uid"))) -> None:
+            pass
+
+        def demo1(uid: str = field.Query.i(example=TemplateVar("uid"))) -> None:
+            pass
+
+        def demo2(uid: str = field.Query.i(example=lambda: "uid")) -> None:
+            pass
+
+        def demo3(uid: str = field.Query.i(example=lambda: "uid")) -> None:
+            pass
+
+        core_model_list = [
+            PaitCoreModel(func, BaseAppHelper, ParamHandler, openapi_path=f"/{func.__name__}", method_set={"GET"})
+            for func in (demo, demo1, demo2, demo3)
+        ]
+        model_cache = SharedModelCache()
+        model_name_set = {
+            ParsePaitModel(i, model_cache=model_cache).http_param_type_dict["query"][0].model.__name__
+            for i in core_model_list
+        }
+        # The examples are different objects, so the models are not shared, and their names are unique
+        assert len(model_name_set) == 4
+        assert OpenAPI(None, load_app=lambda _: {i.pait_id: i for i in core_model_list}).dict["paths"]
+        assert OpenAPI(None, load_app=lambda _: {i.pait_id: i for i in core_model_list[:2]}).content()
+
+    def test_not_share_param_model_with_other_media_type(self) -> None:
+        def demo(a: int = field.Body.i(description="a")) -> None:
+            pass
+
+        def demo1(a: int = field.Body.i(description="a", media_type="application/xml")) -> None:
+            pass
+
+        core_model_list = [
+            PaitCoreModel(func, BaseAppHelper, ParamHandler, openapi_path=f"/{func.__name__}", method_set={"POST"})
+            for func in (demo, demo1)
+        ]
+        model_cache = SharedModelCache()
+        model_list = [
+            ParsePaitModel(i, model_cache=model_cache).http_param_type_dict["body"][0].model for i in core_model_list
+        ]
+        assert model_list[0] is not model_list[1]
+
+        openapi_dict = OpenAPI(None, load_app=lambda _: {i.pait_id: i for i in core_model_list}).dict
+        assert list(openapi_dict["paths"]["/demo"]["post"]["requestBody"]["content"]) == ["application/json"]
+        assert list(openapi_dict["paths"]["/demo1"]["post"]["requestBody"]["content"]) == ["application/xml"]
+
 
 class TestApiDoc:
     """Now, ignore test api doc"""
@@ -136,3 +223,44 @@ class TestApiDoc:
             OpenAPI(app).content()  # type: ignore
             OpenAPI(app).content(serialization_callback=my_serialization)  # type: ignore
             OpenAPI(app).dict  # type: ignore
+
+
+class TestOpenAPICli:
+    def test_import_app(self) -> None:
+        from flask import Flask
+
+        from example.flask_example import main_example
+
+        assert isinstance(import_app("example.flask_example.main_example:create_app()"), Flask)
+        assert import_app("example.flask_example.main_example:get_user_route") is main_example.get_user_route
+        with pytest.raises(ValueError):
+            import_app("example.flask_example.main_example")
+
+    def test_gen_openapi_file_name(self) -> None:
+        assert gen_openapi_file_name("Pait Api Doc(private)") == "pait_api_doc_private.json"
+        assert gen_openapi_file_name("Pait Doc", is_gzip=True) == "pait_doc.json.gz"
+        assert gen_openapi_file_name("()") == "openapi.json"
+
+    def test_main(self, tmp_path: pathlib.Path, capsys: pytest.CaptureFixture) -> None:
+        cli.main(
+            [
+                "example.flask_example.main_example:create_app()",
+                "-o",
+                str(tmp_path),
+                "-t",
+                "Pait Doc",
+                "-t",
+                "Other Doc",
+                "-s",
+                "http://127.0.0.1:8000",
+                "--gzip",
+            ]
+        )
+        path_list = capsys.readouterr().out.split()
+        assert path_list == [str(tmp_path / "pait_doc.json.gz"), str(tmp_path / "other_doc.json.gz")]
+        for path, title in zip(path_list, ["Pait Doc", "Other Doc"]):
+            with gzip.open(path) as f:
+                openapi_dict = json.load(f)
+            assert openapi_dict["info"]["title"] == title
+            assert openapi_dict["servers"][0]["url"] == "http://127.0.0.1:8000"
+            assert "/api/user" in openapi_dict["paths"]
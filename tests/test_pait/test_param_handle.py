@@ -1,17 +1,29 @@
+import asyncio
 import datetime
 import inspect
 import traceback
-from typing import Any, List
+import tracemalloc
+from contextlib import asynccontextmanager, contextmanager
+from typing import Any, AsyncIterator, Callable, Dict, Iterator, List, Optional, Tuple, Type
 
 import pytest
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, ValidationError
 
 from pait import _pydanitc_adapter, field
 from pait.app.base import BaseAppHelper
 from pait.exceptions import NotFoundValueException
 from pait.model import response
+from pait.model.context import ContextModel
 from pait.model.core import PaitCoreModel
-from pait.param_handle import ParamHandler, rule
+from pait.param_handle import (
+    AsyncBatchValidateParamHandler,
+    AsyncCompiledParamHandler,
+    AsyncParamHandler,
+    BatchValidateParamHandler,
+    CompiledParamHandler,
+    ParamHandler,
+    rule,
+)
 from pait.param_handle import util as param_handle_util
 
 
@@ -113,6 +125,466 @@ class TestParamPlugin:
         else:
             raise RuntimeError("Test Fail")
 
+    @pytest.mark.parametrize("param_handler_plugin", [ParamHandler, CompiledParamHandler])
+    def test_cbv_prd_cached_by_class(self, param_handler_plugin: Type[ParamHandler]) -> None:
+        class Demo(object):
+            a: int = field.Query.i()
+
+            def demo(self) -> None:
+                pass
+
+        pait_core_model = PaitCoreModel(Demo.demo, BaseAppHelper, param_handler_plugin)
+        param_handler = pait_core_model.main_plugin
+        assert isinstance(param_handler, param_handler_plugin)
+
+        prd_list = []
+        for _ in range(2):
+            cbv_instance = Demo()
+            context = ContextModel(
+                cbv_instance=cbv_instance, app_helper=None, pait_core_model=pait_core_model, args=[], kwargs={}
+            )
+            prd_list.append(param_handler.get_cbv_prd(context))
+            assert not hasattr(cbv_instance, "_param_plugin_cbv_prd")
+        assert prd_list[0] is prd_list[1]
+        assert list(prd_list[0]) == ["a"]
+
+
+class UserModel(BaseModel):
+    uid: int = field.Query.i()
+    user_name: str = field.Query.i(alias="user-name")
+
+
+def get_token(token: str = field.Header.i(default="")) -> str:
+    return token
+
+
+class GetAge(object):
+    age: int = field.Query.i(default=18)
+
+    def __call__(self, sex: str = field.Query.i(default="man")) -> dict:
+        return {"age": self.age, "sex": sex}
+
+
+def gen_route_func(is_async: bool) -> Callable:
+    def route(
+        user: UserModel,
+        token: str = field.Depends.i(get_token),
+        age_info: dict = field.Depends.i(GetAge),
+        uid: int = field.Query.i(),
+        desc: str = field.Query.i(default="desc"),
+        raw_query: dict = field.Query.i(raw_return=True),
+    ) -> dict:
+        return {
+            "user": user.dict(),
+            "token": token,
+            "age_info": age_info,
+            "uid": uid,
+            "desc": desc,
+            "raw_query": dict(raw_query),
+        }
+
+    if not is_async:
+        return route
+
+    async def async_route(
+        user: UserModel,
+        token: str = field.Depends.i(get_token),
+        age_info: dict = field.Depends.i(GetAge),
+        uid: int = field.Query.i(),
+        desc: str = field.Query.i(default="desc"),
+        raw_query: dict = field.Query.i(raw_return=True),
+    ) -> dict:
+        return route(user, token=token, age_info=age_info, uid=uid, desc=desc, raw_query=raw_query)
+
+    return async_route
+
+
+class BaseCompiledParamHandlerTest:
+    query_dict: Dict[str, Any] = {"uid": "10086", "user-name": "so1n", "age": "20"}
+
+    def _flask_request(self, param_handler_plugin: Type[ParamHandler], query_dict: Dict[str, Any]) -> Any:
+        from flask import Flask, jsonify
+
+        from pait.app.flask import pait
+
+        route = pait(param_handler_plugin=param_handler_plugin, feature_code=param_handler_plugin.__name__)(
+            gen_route_func(False)
+        )
+        app = Flask(__name__)
+        app.testing = True
+        app.add_url_rule("/api/demo", view_func=lambda: jsonify(route()), methods=["GET"])
+        return app.test_client().get("/api/demo", query_string=query_dict, headers={"token": "xxx"})
+
+    def _starlette_request(self, param_handler_plugin: Type[AsyncParamHandler], query_dict: Dict[str, Any]) -> Any:
+        from starlette.applications import Starlette
+        from starlette.requests import Request
+        from starlette.responses import JSONResponse
+        from starlette.testclient import TestClient
+
+        from pait.app.starlette import pait
+
+        route = pait(param_handler_plugin=param_handler_plugin, feature_code=param_handler_plugin.__name__)(
+            gen_route_func(True)
+        )
+
+        async def demo(request: Request) -> JSONResponse:
+            return JSONResponse(await route(request))
+
+        app = Starlette()
+        app.add_route("/api/demo", demo, methods=["GET"])
+        return TestClient(app).get("/api/demo", params=query_dict, headers={"token": "xxx"})
+
+
+class TestCompiledParamHandler(BaseCompiledParamHandlerTest):
+    def test_compiled_prd_handle(self) -> None:
+        def demo(a: int = field.Query.i()) -> None:
+            pass
+
+        pait_core_model = PaitCoreModel(demo, BaseAppHelper, CompiledParamHandler)
+        param_handler = pait_core_model.main_plugin
+        assert isinstance(param_handler, CompiledParamHandler)
+        prd = param_handler._pait_pre_load_dc.param
+        assert param_handler._pait_compiled_prd_dict[id(prd)][0] is prd
+
+    def test_sync_result_equal_param_handler(self) -> None:
+        resp = self._flask_request(CompiledParamHandler, self.query_dict)
+        assert resp.status_code == 200
+        assert resp.get_json() == self._flask_request(ParamHandler, self.query_dict).get_json()
+        assert resp.get_json() == {
+            "age_info": {"age": 20, "sex": "man"},
+            "desc": "desc",
+            "raw_query": {"age": "20", "uid": "10086", "user-name": "so1n"},
+            "token": "xxx",
+            "uid": 10086,
+            "user": {"uid": 10086, "user_name": "so1n"},
+        }
+
+    def test_async_result_equal_param_handler(self) -> None:
+        resp = self._starlette_request(AsyncCompiledParamHandler, self.query_dict)
+        assert resp.status_code == 200
+        assert resp.json() == self._starlette_request(AsyncParamHandler, self.query_dict).json()
+        assert resp.json()["age_info"] == {"age": 20, "sex": "man"}
+
+    def test_not_found_value(self) -> None:
+        query_dict = {"user-name": "so1n"}
+        with pytest.raises(Exception) as compiled_e:
+            self._flask_request(CompiledParamHandler, query_dict)
+        with pytest.raises(Exception) as e:
+            self._flask_request(ParamHandler, query_dict)
+        assert str(compiled_e.value) == str(e.value)
+
+        with pytest.raises(Exception) as compiled_e:
+            self._starlette_request(AsyncCompiledParamHandler, query_dict)
+        with pytest.raises(Exception) as e:
+            self._starlette_request(AsyncParamHandler, query_dict)
+        assert str(compiled_e.value) == str(e.value)
+
+
+class TestBatchValidateParamHandler(BaseCompiledParamHandlerTest):
+    def test_sync_result_equal_param_handler(self) -> None:
+        resp = self._flask_request(BatchValidateParamHandler, self.query_dict)
+        assert resp.status_code == 200
+        assert resp.get_json() == self._flask_request(ParamHandler, self.query_dict).get_json()
+
+    def test_async_result_equal_param_handler(self) -> None:
+        resp = self._starlette_request(AsyncBatchValidateParamHandler, self.query_dict)
+        assert resp.status_code == 200
+        assert resp.json() == self._starlette_request(AsyncParamHandler, self.query_dict).json()
+
+    def test_multi_validate_error(self) -> None:
+        def demo(a: int = field.Query.i(), b: int = field.Query.i(gt=10), c: str = field.Query.i()) -> None:
+            pass
+
+        pait_model_field_list = [
+            _pydanitc_adapter.PaitModelField(
+                value_name=parameter.name,
+                annotation=parameter.annotation,
+                field_info=parameter.default,
+                request_param="query",
+            )
+            for parameter in inspect.signature(demo).parameters.values()
+        ]
+        batch_model_field = _pydanitc_adapter.PaitBatchModelField(pait_model_field_list)
+        assert tuple(batch_model_field.validate(("1", "11", "c"))) == (1, 11, "c")
+
+        with pytest.raises(ValidationError) as e:
+            batch_model_field.validate(("a", "1", "c"))
+        assert [i["loc"] for i in e.value.errors()] == [("query", "a"), ("query", "b")]
+
+
+class TestValidatorRegistry:
+    @staticmethod
+    def _get_validator(pait_model_field: _pydanitc_adapter.PaitModelField) -> Any:
+        return getattr(pait_model_field, "_model_field", None) or getattr(pait_model_field, "_type_adapter")
+
+    def test_share_validator(self) -> None:
+        stats = _pydanitc_adapter.validator_registry.stats()
+        query_field = _pydanitc_adapter.PaitModelField(
+            "a", str, field.Query.i(max_length=3, description="a"), request_param="query"
+        )
+        header_field = _pydanitc_adapter.PaitModelField(
+            "b", str, field.Header.i(max_length=3, alias="B-B", example="b"), request_param="header"
+        )
+        other_field = _pydanitc_adapter.PaitModelField("c", str, field.Query.i(max_length=4), request_param="query")
+        assert self._get_validator(query_field) is self._get_validator(header_field)
+        assert self._get_validator(query_field) is not self._get_validator(other_field)
+        assert _pydanitc_adapter.validator_registry.stats()["hit_count"] >= stats["hit_count"] + 1
+
+        # The loc of the error belongs to the field
+        for pait_model_field, loc in ((query_field, ("query", "a")), (header_field, ("header", "b"))):
+            with pytest.raises(ValidationError) as e:
+                pait_model_field.validate("abcd")
+            assert e.value.errors()[0]["loc"] == loc
+        assert other_field.validate("abcd") == "abcd"
+
+    def test_registry(self) -> None:
+        registry = _pydanitc_adapter.ValidatorRegistry()
+        assert registry.get("a", lambda: [1]) is registry.get("a", lambda: [2])
+        # The validator of the None key is not interned
+        assert registry.get(None, lambda: [1]) is not registry.get(None, lambda: [1])
+        assert registry.stats() == {"size": 1, "hit_count": 1, "miss_count": 3, "memory_size": 0}
+
+        tracemalloc.start()
+        try:
+            registry.get("b", lambda: [i for i in range(1000)])
+        finally:
+            tracemalloc.stop()
+        assert registry.stats()["memory_size"] > 0
+        registry.clear()
+        assert registry.stats() == {"size": 0, "hit_count": 0, "miss_count": 0, "memory_size": 0}
+
+
+class TestConcurrentDepend:
+    def _gen_route_func(self, call_list: List[str], running_dict: Optional[Dict[str, int]] = None) -> Callable:
+        # Record the max number of the depends that are running at the same time
+        _running_dict: Dict[str, int] = running_dict if running_dict is not None else {"now": 0, "max": 0}
+
+        async def _run() -> None:
+            _running_dict["now"] += 1
+            _running_dict["max"] = max(_running_dict["max"], _running_dict["now"])
+            # Switch to other depends
+            await asyncio.sleep(0)
+            _running_dict["now"] -= 1
+
+        async def get_user(uid: int = field.Body.i()) -> int:
+            await _run()
+            return uid
+
+        async def get_flag(flag: str = field.Body.i(default="")) -> str:
+            await _run()
+            return flag
+
+        @asynccontextmanager
+        async def get_session(name: str = field.Query.i(default="session")) -> AsyncIterator[str]:
+            await _run()
+            call_list.append(f"enter {name}")
+            yield name
+            call_list.append(f"exit {name}")
+
+        @contextmanager
+        def get_sync_session() -> Iterator[str]:
+            call_list.append("enter sync session")
+            yield "sync session"
+            call_list.append("exit sync session")
+
+        class GetCache(object):
+            async def __call__(self, session: str = field.Depends.i(get_session, use_cache=False)) -> str:
+                return f"cache by {session}"
+
+        async def route(
+            uid: int = field.Depends.i(get_user),
+            flag: str = field.Depends.i(get_flag),
+            cache: str = field.Depends.i(GetCache),
+            session: str = field.Depends.i(get_session, use_cache=False),
+            sync_session: str = field.Depends.i(get_sync_session),
+            other_session: str = field.Depends.i(get_session, use_cache=False),
+        ) -> dict:
+            return {"uid": uid, "flag": flag, "cache": cache, "session": session, "sync_session": sync_session}
+
+        return route
+
+    def _starlette_request(self, param_handler_plugin: Type[AsyncParamHandler], body: dict) -> Any:
+        from starlette.applications import Starlette
+        from starlette.requests import Request
+        from starlette.responses import JSONResponse
+        from starlette.testclient import TestClient
+
+        from pait.app.starlette import pait
+
+        call_list: List[str] = []
+        running_dict: Dict[str, int] = {"now": 0, "max": 0}
+        route = pait(param_handler_plugin=param_handler_plugin, feature_code=param_handler_plugin.__name__)(
+            self._gen_route_func(call_list, running_dict)
+        )
+
+        async def demo(request: Request) -> JSONResponse:
+            return JSONResponse(await route(request))
+
+        app = Starlette()
+        app.add_route("/api/demo", demo, methods=["POST"])
+        resp = TestClient(app).post("/api/demo", json=body)
+        return resp, running_dict["max"], call_list
+
+    def test_concurrent_depend_group(self) -> None:
+        pait_core_model = PaitCoreModel(self._gen_route_func([]), BaseAppHelper, AsyncParamHandler)
+        prd = pait_core_model.main_plugin._pait_pre_load_dc.param  # type: ignore[attr-defined]
+        # The sync depend ends the group, `other_session` has no other async depend to be grouped with
+        assert list(prd.concurrent_depend_group_dict) == ["uid"]
+        assert [pr.name for pr in prd.concurrent_depend_group_dict["uid"].pr_list] == [
+            "uid",
+            "flag",
+            "cache",
+            "session",
+        ]
+        assert prd.concurrent_depend_group_dict["uid"].request_field_name_list == ["body", "query"]
+
+        class NotConcurrentAsyncParamHandler(AsyncParamHandler):
+            concurrent_depend = False
+
+        pait_core_model = PaitCoreModel(self._gen_route_func([]), BaseAppHelper, NotConcurrentAsyncParamHandler)
+        assert not pait_core_model.main_plugin._pait_pre_load_dc.param.concurrent_depend_group_dict  # type: ignore
+
+    @pytest.mark.parametrize("param_handler_plugin", [AsyncParamHandler, AsyncCompiledParamHandler])
+    def test_concurrent_depend(self, param_handler_plugin: Type[AsyncParamHandler]) -> None:
+        class SerialParamHandler(param_handler_plugin):  # type: ignore[valid-type,misc]
+            concurrent_depend = False
+
+        resp, max_running_cnt, call_list = self._starlette_request(param_handler_plugin, {"uid": 1, "flag": "a"})
+        serial_resp, serial_max_running_cnt, serial_call_list = self._starlette_request(
+            SerialParamHandler, {"uid": 1, "flag": "a"}
+        )
+        assert resp.json() == serial_resp.json()
+        assert resp.json() == {
+            "uid": 1,
+            "flag": "a",
+            "cache": "cache by session",
+            "session": "session",
+            "sync_session": "sync session",
+        }
+        # The order of context manager is the same as serial
+        assert call_list == serial_call_list
+        # The depends of the group are running at the same time
+        assert serial_max_running_cnt == 1
+        assert max_running_cnt > 1
+
+    @pytest.mark.parametrize("param_handler_plugin", [AsyncParamHandler, AsyncCompiledParamHandler])
+    def test_concurrent_depend_error(self, param_handler_plugin: Type[AsyncParamHandler]) -> None:
+        with pytest.raises(Exception) as e:
+            self._starlette_request(param_handler_plugin, {"flag": "a"})
+        assert "uid" in str(e.value)
+
+
+class TestDependCache:
+    def _gen_route_func(self, is_async: bool, call_list: List[str]) -> Tuple[Callable, Callable]:
+        if is_async:
+
+            async def get_user(uid: int = field.Query.i()) -> int:
+                await asyncio.sleep(0.01)
+                call_list.append("get_user")
+                return uid
+
+        else:
+
+            def get_user(uid: int = field.Query.i()) -> int:  # type: ignore[misc]
+                call_list.append("get_user")
+                return uid
+
+        def get_no_cache_user(uid: int = field.Query.i()) -> int:
+            call_list.append("get_no_cache_user")
+            return uid
+
+        class GetUserName(object):
+            prefix: str = field.Query.i(default="user")
+
+            def __call__(self, uid: int = field.Depends.i(get_user)) -> str:
+                call_list.append("get_user_name")
+                return f"{self.prefix}-{uid}"
+
+        def get_info(
+            uid: int = field.Depends.i(get_user),
+            user_name: str = field.Depends.i(GetUserName),
+            no_cache_uid: int = field.Depends.i(get_no_cache_user, use_cache=False),
+        ) -> dict:
+            return {"uid": uid, "user_name": user_name, "no_cache_uid": no_cache_uid}
+
+        def route(
+            uid: int = field.Depends.i(get_user),
+            user_name: str = field.Depends.i(GetUserName),
+            info: dict = field.Depends.i(get_info),
+            no_cache_uid: int = field.Depends.i(get_no_cache_user, use_cache=False),
+        ) -> dict:
+            return {"uid": uid, "user_name": user_name, "info": info, "no_cache_uid": no_cache_uid}
+
+        if not is_async:
+            return route, get_user
+
+        async def async_route(
+            uid: int = field.Depends.i(get_user),
+            user_name: str = field.Depends.i(GetUserName),
+            info: dict = field.Depends.i(get_info),
+            no_cache_uid: int = field.Depends.i(get_no_cache_user, use_cache=False),
+        ) -> dict:
+            return route(uid=uid, user_name=user_name, info=info, no_cache_uid=no_cache_uid)
+
+        return async_route, get_user
+
+    @pytest.mark.parametrize("param_handler_plugin", [ParamHandler, CompiledParamHandler])
+    def test_sync_depend_cache(self, param_handler_plugin: Type[ParamHandler]) -> None:
+        from flask import Flask, jsonify
+
+        from pait.app.flask import pait
+
+        call_list: List[str] = []
+        route_func, get_user = self._gen_route_func(False, call_list)
+        route = pait(
+            param_handler_plugin=param_handler_plugin,
+            pre_depend_list=[get_user],
+            feature_code=param_handler_plugin.__name__,
+        )(route_func)
+        app = Flask(__name__)
+        app.testing = True
+        app.add_url_rule("/api/demo", view_func=lambda: jsonify(route()), methods=["GET"])
+        resp = app.test_client().get("/api/demo", query_string={"uid": 1})
+        assert resp.get_json()["info"] == {"uid": 1, "user_name": "user-1", "no_cache_uid": 1}
+        assert call_list == ["get_user", "get_user_name", "get_no_cache_user", "get_no_cache_user"]
+
+        # The cache only works in the request
+        call_list.clear()
+        app.test_client().get("/api/demo", query_string={"uid": 1})
+        assert call_list.count("get_user_name") == 1
+
+    @pytest.mark.parametrize("param_handler_plugin", [AsyncParamHandler, AsyncCompiledParamHandler])
+    def test_async_depend_cache(self, param_handler_plugin: Type[AsyncParamHandler]) -> None:
+        from starlette.applications import Starlette
+        from starlette.requests import Request
+        from starlette.responses import JSONResponse
+        from starlette.testclient import TestClient
+
+        from pait.app.starlette import pait
+
+        call_list: List[str] = []
+        route_func, get_user = self._gen_route_func(True, call_list)
+        route = pait(
+            param_handler_plugin=param_handler_plugin,
+            pre_depend_list=[get_user],
+            feature_code=param_handler_plugin.__name__,
+        )(route_func)
+
+        async def demo(request: Request) -> JSONResponse:
+            return JSONResponse(await route(request))
+
+        app = Starlette()
+        app.add_route("/api/demo", demo, methods=["GET"])
+        resp = TestClient(app).get("/api/demo", params={"uid": 1})
+        assert resp.json() == {
+            "uid": 1,
+            "user_name": "user-1",
+            "info": {"uid": 1, "user_name": "user-1", "no_cache_uid": 1},
+            "no_cache_uid": 1,
+        }
+        # `uid` and `user_name` are resolved concurrently, but `get_user` is only called once
+        assert sorted(call_list) == ["get_no_cache_user", "get_no_cache_user", "get_user", "get_user_name"]
+
 
 class TestRule:
     def test_get_real_request_value_by_raw_return_is_true(self) -> None:
@@ -1,10 +1,18 @@
-from typing import Callable, Generator
+import asyncio
+import datetime
+import json
+import threading
+import time
+from typing import Any, Callable, Dict, Generator, List, Optional, Tuple
 
 import pytest
 from flask import Flask
 from flask.ctx import AppContext
 from flask.testing import FlaskClient
+from pydantic import BaseModel, Field
+from pytest_mock import MockFixture
 from redis import Redis  # type: ignore
+from redis.asyncio import Redis as AsyncioRedis  # type: ignore
 
 from example.flask_example import main_example
 from pait import field
@@ -15,10 +23,22 @@ from pait.model.context import PluginContext
 from pait.model.core import PaitCoreModel
 from pait.model.response import FileResponseModel
 from pait.param_handle import ParamHandler
+from pait.plugin import FusedPlugin, PluginProtocol, PostPluginProtocol, fuse_plugin
 from pait.plugin.at_most_one_of import AtMostOneOfExtraParam, AtMostOneOfPlugin
-from pait.plugin.auto_complete_json_resp import AutoCompleteJsonRespPlugin
-from pait.plugin.cache_response import CacheRespExtraParam, CacheResponsePlugin
+from pait.plugin.auto_complete_json_resp import AutoCompleteJsonRespPlugin, gen_merge_func
+from pait.plugin.cache_response import (
+    CacheCodec,
+    CachedResponse,
+    CacheRespExtraParam,
+    CacheResponsePlugin,
+    MemoryCacheBackend,
+    PickleCacheCodec,
+    RedisCacheBackend,
+    TwoTierCacheBackend,
+)
 from pait.plugin.check_json_resp import CheckJsonRespPlugin
+from pait.plugin.compress_response import CompressResponsePlugin, negotiate_encoding
+from pait.plugin.conditional_get import CacheControl, ConditionalGetPlugin, gen_etag, match_etag
 from pait.plugin.mock_response import MockPluginProtocol
 from pait.plugin.required import RequiredExtraParam, RequiredGroupExtraParam, RequiredPlugin
 from pait.plugin.unified_response import UnifiedResponsePluginProtocol
@@ -140,6 +160,13 @@ class TestAutoCompleteJsonPlugin:
         exec_msg: str = e.value.args[0]
         assert "Please use response_model_list param" in exec_msg
 
+        for sample_rate in (0, 1.1):
+            with pytest.raises(ValueError) as e:
+                CheckJsonRespPlugin.pre_check_hook(
+                    PaitCoreModel(demo, BaseAppHelper, ParamHandler), {"sample_rate": sample_rate}
+                )
+            assert "sample_rate must be greater than 0" in e.value.args[0]
+
     def test_response_model_is_not_json_resp(self) -> None:
         class DemoCoreTestResponseModel(response.TextResponseModel):
             pass
@@ -173,6 +200,178 @@ class TestAutoCompleteJsonPlugin:
             "data": {"uid": 100, "music_list": [{"name": "", "url": "", "singer": ""}], "image_list": [{}]},
         }
 
+    def test_merge_func(self) -> None:
+        default_dict: dict = {
+            "code": 0,
+            "data": {"uid": 0, "tag_list": [], "user_list": [{"name": "", "ext": {"age": 0}}], "id_list": [0]},
+        }
+        merge_func = gen_merge_func(default_dict)
+        result_dict = merge_func(
+            {"data": {"uid": 1, "user_list": [{"name": "so1n", "other": 1}, {"ext": {}}], "id_list": [1, 2]}, "a": 1}
+        )
+        assert result_dict == {
+            "code": 0,
+            "data": {
+                "uid": 1,
+                "tag_list": [],
+                "user_list": [{"name": "so1n", "ext": {"age": 0}}, {"name": "", "ext": {"age": 0}}],
+                "id_list": [1, 2],
+            },
+        }
+        # The result does not share the mutable value with the default dict
+        result_dict = merge_func({})
+        result_dict["data"]["user_list"][0]["ext"]["age"] = 1
+        result_dict["data"]["tag_list"].append(1)
+        assert merge_func({}) == default_dict
+
+
+class TestFusedPlugin:
+    @staticmethod
+    def gen_context(core_model: PaitCoreModel, **kwargs: Any) -> PluginContext:
+        return PluginContext(
+            cbv_instance=None,
+            app_helper=BaseAppHelper,  # type: ignore
+            pait_core_model=core_model,
+            args=[],
+            kwargs=kwargs,
+        )
+
+    @staticmethod
+    def gen_plugin_class(name: str, call_list: List[str], is_async: bool = False) -> type:
+        class HookPlugin(PostPluginProtocol):
+            def before_call(self, context: PluginContext) -> None:
+                call_list.append(f"{name} before")
+
+            def after_call(self, context: PluginContext, result: Any) -> Any:
+                call_list.append(f"{name} after")
+                return result + [name]
+
+        class AsyncHookPlugin(PostPluginProtocol):
+            async def before_call(self, context: PluginContext) -> None:
+                call_list.append(f"{name} before")
+
+            async def after_call(self, context: PluginContext, result: Any) -> Any:
+                call_list.append(f"{name} after")
+                return result + [name]
+
+        return AsyncHookPlugin if is_async else HookPlugin
+
+    @staticmethod
+    def gen_wrap_plugin_class(name: str, call_list: List[str]) -> type:
+        class WrapPlugin(PostPluginProtocol):
+            def __call__(self, context: PluginContext) -> Any:
+                call_list.append(f"{name} before")
+                result = super().__call__(context)
+                call_list.append(f"{name} after")
+                return result + [name]
+
+        return WrapPlugin
+
+    def test_is_fusible(self) -> None:
+        hook_plugin_class = self.gen_plugin_class("a", [])
+
+        class SubHookPlugin(hook_plugin_class):  # type: ignore
+            pass
+
+        class SubWrapPlugin(hook_plugin_class):  # type: ignore
+            def __call__(self, context: PluginContext) -> Any:
+                return super().__call__(context)
+
+        assert hook_plugin_class._is_fusible
+        assert SubHookPlugin._is_fusible
+        assert not SubWrapPlugin._is_fusible
+        assert not self.gen_wrap_plugin_class("a", [])._is_fusible
+        assert RequiredPlugin._is_fusible and AtMostOneOfPlugin._is_fusible
+        assert not AutoCompleteJsonRespPlugin._is_fusible
+
+    def test_sync_fuse(self) -> None:
+        def demo(a: int) -> list:
+            call_list.append("route")
+            return [a]
+
+        call_list: List[str] = []
+        core_model = PaitCoreModel(demo, BaseAppHelper, ParamHandler)
+        plugin_manager_list = [
+            self.gen_plugin_class("a", call_list).build(),
+            self.gen_plugin_class("b", call_list).build(),
+            self.gen_wrap_plugin_class("c", call_list).build(),
+            self.gen_plugin_class("d", call_list).build(),
+        ]
+        main_plugin = fuse_plugin(plugin_manager_list, demo, core_model)
+        assert isinstance(main_plugin, FusedPlugin)
+        assert len(main_plugin.plugin_list) == 2
+        assert isinstance(main_plugin.next_plugin, PluginProtocol)
+        assert isinstance(main_plugin.next_plugin.next_plugin, FusedPlugin)  # type: ignore[union-attr]
+
+        assert main_plugin(self.gen_context(core_model, a=1)) == [1, "d", "c", "b", "a"]
+        assert call_list == [
+            "a before",
+            "b before",
+            "c before",
+            "d before",
+            "route",
+            "d after",
+            "c after",
+            "b after",
+            "a after",
+        ]
+
+        # The result of the fused plugin is the same as the plugin that is called directly(not fused)
+        call_list.clear()
+        main_plugin = demo
+        for plugin_manager in reversed(plugin_manager_list):
+            main_plugin = plugin_manager.get_plugin(main_plugin, core_model)
+        assert main_plugin(self.gen_context(core_model, a=1)) == [1, "d", "c", "b", "a"]
+        assert call_list[0] == "a before" and call_list[-1] == "a after"
+
+    def test_async_fuse(self) -> None:
+        async def demo(a: int) -> list:
+            call_list.append("route")
+            return [a]
+
+        call_list: List[str] = []
+        core_model = PaitCoreModel(demo, BaseAppHelper, ParamHandler)
+        plugin_manager_list = [
+            self.gen_plugin_class("a", call_list, is_async=True).build(),
+            self.gen_plugin_class("b", call_list).build(),
+        ]
+        main_plugin = fuse_plugin(plugin_manager_list, demo, core_model)
+        assert asyncio.run(main_plugin(self.gen_context(core_model, a=1))) == [1, "b", "a"]
+        assert call_list == ["a before", "b before", "route", "b after", "a after"]
+
+        call_list.clear()
+        plugin = plugin_manager_list[0].get_plugin(demo, core_model)
+        assert asyncio.run(plugin(self.gen_context(core_model, a=1))) == [1, "a"]
+        assert call_list == ["a before", "route", "a after"]
+
+    def test_sync_route_not_support_async_hook(self) -> None:
+        def demo() -> None:
+            pass
+
+        core_model = PaitCoreModel(demo, BaseAppHelper, ParamHandler)
+        with pytest.raises(TypeError):
+            fuse_plugin([self.gen_plugin_class("a", [], is_async=True).build()], demo, core_model)
+
+    def test_core_model_stack(self) -> None:
+        def demo(a: int = field.Query.i(), b: Optional[int] = field.Query.i(default=None)) -> None:
+            pass
+
+        core_model = PaitCoreModel(
+            demo,
+            BaseAppHelper,
+            ParamHandler,
+            post_plugin_list=[
+                RequiredPlugin.build(required_dict={"a": ["b"]}),
+                AtMostOneOfPlugin.build(at_most_one_of_list=[["a", "b"]]),
+            ],
+        )
+        main_plugin = core_model.main_plugin
+        assert isinstance(main_plugin, ParamHandler)
+        assert isinstance(main_plugin.next_plugin, FusedPlugin)
+        assert [type(i) for i in main_plugin.next_plugin.plugin_list] == [RequiredPlugin, AtMostOneOfPlugin]
+        with pytest.raises(CheckValueError):
+            main_plugin.next_plugin(self.gen_context(core_model, a=1))
+
 
 class TestCacheResponsePlugin:
     def test_not_set_response_model(self) -> None:
@@ -203,27 +402,12 @@ class TestCacheResponsePlugin:
         exec_msg = e.value.args[0]
         assert f"Not use {CacheResponsePlugin.__name__} in " in exec_msg
 
-    def test_set_error_redis(self) -> None:
-        def demo() -> None:
-            pass
-
-        with pytest.raises(ValueError) as e:
-            CacheResponsePlugin.build(redis=Redis(decode_responses=False)).pre_check_hook(
-                PaitCoreModel(
-                    demo,
-                    BaseAppHelper,
-                    ParamHandler,
-                    response_model_list=[response.JsonResponseModel, response.TextResponseModel],
-                ),
-            )
-        exec_msg = e.value.args[0]
-        assert "Please set redis`s param:decode_responses to True" in exec_msg
-
     def test_cache_name_param_set_gen(self) -> None:
         def demo(
             a: int = field.Query.i(extra_param_list=[CacheRespExtraParam()]),
             b: int = field.Query.i(extra_param_list=[CacheRespExtraParam()]),
             c: int = field.Query.i(),
+            accept_language: str = field.Header.i(alias="Accept-Language", extra_param_list=[CacheRespExtraParam()]),
         ) -> None:
             pass
 
@@ -237,7 +421,184 @@ class TestCacheResponsePlugin:
                 response_model_list=[response.JsonResponseModel, response.TextResponseModel],
             ),
         )
-        assert CacheResponsePluginManager._kwargs["_cache_name_param_set"] == {"a", "b"}
+        assert CacheResponsePluginManager._kwargs["_cache_name_param_set"] == {"a", "b", "accept_language"}
+
+    @staticmethod
+    def _get_plugin(func: Callable, **kwargs: Any) -> Tuple[CacheResponsePlugin, PluginContext]:
+        pait_core_model = PaitCoreModel(
+            func, BaseAppHelper, ParamHandler, response_model_list=[response.JsonResponseModel]
+        )
+        plugin_manager = CacheResponsePlugin.build(backend=MemoryCacheBackend(), name=func.__name__, **kwargs)
+        plugin_manager.pre_check_hook(pait_core_model)
+        plugin_manager.pre_load_hook(pait_core_model)
+        plugin = plugin_manager.get_plugin(func, pait_core_model)
+        return plugin, PluginContext(None, BaseAppHelper, pait_core_model, [], {})  # type: ignore[arg-type]
+
+    def test_gen_key(self, mocker: MockFixture) -> None:
+        class DemoModel(BaseModel):
+            uid: int
+            name: str
+
+        class DemoObject(object):
+            pass
+
+        def demo() -> None:
+            pass
+
+        plugin, _ = self._get_plugin(demo, enable_cache_name_merge_param=True)
+        key, lock_key = plugin._gen_key(model=DemoModel(uid=1, name="a" * 1000), uid={3, 1, 2}, obj=DemoObject())
+        assert key.startswith("demo:") and lock_key.startswith("demo:lock:")
+        assert len(key) == len("demo:") + 32
+        # The key is canonical, it does not depend on the order of params and the id of the object
+        assert (key, lock_key) == plugin._gen_key(
+            obj=DemoObject(), uid={2, 1, 3}, model=DemoModel(name="a" * 1000, uid=1)
+        )
+        assert key != plugin._gen_key(model=DemoModel(uid=2, name="a" * 1000), uid={3, 1, 2}, obj=DemoObject())[0]
+
+        plugin, _ = self._get_plugin(demo)
+        assert plugin._gen_key(uid=1) == ("demo", "demo:lock")
+
+        # vary on header
+        header_dict = {"Accept-Language": "en"}
+        get_ctx = mocker.patch("pait.plugin.cache_response.get_ctx")
+        get_ctx.return_value.app_helper.request.header.return_value = header_dict
+        plugin, _ = self._get_plugin(demo, vary_header_list=["Accept-Language"])
+        key, _ = plugin._gen_key(uid=1)
+        assert key != "demo"
+        assert key == plugin._gen_key(uid=2)[0]
+        header_dict["Accept-Language"] = "zh"
+        assert key != plugin._gen_key(uid=1)[0]
+
+    def test_invalidate_tag(self) -> None:
+        call_list: List[int] = []
+
+        def demo(uid: int) -> dict:
+            call_list.append(1)
+            return {"uid": uid, "call_cnt": len(call_list)}
+
+        plugin, context = self._get_plugin(demo, enable_cache_name_merge_param=True, tag_list=["demo", "user:{uid}"])
+        backend: MemoryCacheBackend = plugin.backend  # type: ignore[assignment]
+        context_1 = PluginContext(None, BaseAppHelper, plugin.pait_core_model, [], {"uid": 1})  # type: ignore
+        context_2 = PluginContext(None, BaseAppHelper, plugin.pait_core_model, [], {"uid": 2})  # type: ignore
+        assert plugin(context_1) == {"uid": 1, "call_cnt": 1}
+        assert plugin(context_2) == {"uid": 2, "call_cnt": 2}
+
+        backend.invalidate_tag("user:1")
+        assert plugin(context_1) == {"uid": 1, "call_cnt": 3}
+        assert plugin(context_2) == {"uid": 2, "call_cnt": 2}
+
+        backend.invalidate_tag("demo")
+        assert len(backend) == 0
+        assert backend._tag_dict == {}
+
+    def test_tag_placeholder_check(self) -> None:
+        def demo(uid: int, user: dict) -> None:
+            pass
+
+        self._get_plugin(demo, tag_list=["demo", "user:{uid}", "name:{user[name]}"])
+        for tag in ("user:{user_id}", "user:{}", "user:{0}"):
+            with pytest.raises(ValueError) as e:
+                self._get_plugin(demo, tag_list=[tag])
+            assert f"of tag:{tag!r} is not a param of" in e.value.args[0]
+
+    def test_single_flight(self) -> None:
+        call_list: List[int] = []
+
+        def demo() -> dict:
+            call_list.append(1)
+            threading.Event().wait(0.1)
+            return {"call_cnt": len(call_list)}
+
+        plugin, context = self._get_plugin(demo)
+        result_list: List[dict] = []
+        thread_list = [threading.Thread(target=lambda: result_list.append(plugin(context))) for _ in range(5)]
+        for thread in thread_list:
+            thread.start()
+        for thread in thread_list:
+            thread.join()
+        assert len(call_list) == 1
+        assert result_list == [{"call_cnt": 1}] * 5
+        assert plugin._flight_dict == {}
+
+    @pytest.mark.asyncio
+    async def test_async_single_flight(self) -> None:
+        call_list: List[int] = []
+
+        async def demo() -> dict:
+            call_list.append(1)
+            await asyncio.sleep(0.1)
+            if len(call_list) == 1:
+                raise RuntimeError("demo error")
+            return {"call_cnt": len(call_list)}
+
+        plugin, context = self._get_plugin(demo)
+
+        # The error of the request that generates the value is shared by the waiting requests
+        result_list = await asyncio.gather(*[plugin(context) for _ in range(5)], return_exceptions=True)
+        assert len(call_list) == 1
+        assert all(isinstance(result, RuntimeError) for result in result_list)
+
+        result_list = await asyncio.gather(*[plugin(context) for _ in range(5)])
+        assert len(call_list) == 2
+        assert result_list == [{"call_cnt": 2}] * 5
+        assert plugin._flight_dict == {}
+
+    def test_stale_while_revalidate(self, mocker: MockFixture) -> None:
+        now = mocker.patch("pait.plugin.cache_response.time.time", return_value=100.0)
+        call_list: List[int] = []
+        refresh_event = threading.Event()
+        refresh_start_event = threading.Event()
+
+        def demo() -> dict:
+            call_list.append(1)
+            if len(call_list) > 1:
+                refresh_start_event.set()
+                refresh_event.wait()
+            return {"call_cnt": len(call_list)}
+
+        plugin, context = self._get_plugin(demo, cache_time=10, stale_time=10)
+        assert plugin(context) == {"call_cnt": 1}
+        now.return_value = 105.0
+        assert plugin(context) == {"call_cnt": 1}
+
+        # The value is stale, the current request refreshes it, other requests get the stale value
+        now.return_value = 115.0
+        result_list: List[dict] = []
+        thread = threading.Thread(target=lambda: result_list.append(plugin(context)))
+        thread.start()
+        refresh_start_event.wait()
+        assert plugin(context) == {"call_cnt": 1}
+        refresh_event.set()
+        thread.join()
+        assert result_list == [{"call_cnt": 2}]
+        assert plugin(context) == {"call_cnt": 2}
+        assert len(call_list) == 2
+
+    @pytest.mark.asyncio
+    async def test_async_stale_while_revalidate(self, mocker: MockFixture) -> None:
+        now = mocker.patch("pait.plugin.cache_response.time.time", return_value=100.0)
+        call_list: List[int] = []
+
+        async def demo() -> dict:
+            call_list.append(1)
+            await asyncio.sleep(0.01)
+            return {"call_cnt": len(call_list)}
+
+        plugin, context = self._get_plugin(demo, cache_time=10, stale_time=10)
+        spy = mocker.spy(plugin, "_async_background_flight")
+
+        assert await plugin(context) == {"call_cnt": 1}
+        # The stale value is returned immediately, and only one background task refreshes it
+        now.return_value = 115.0
+        assert await asyncio.gather(*[plugin(context) for _ in range(5)]) == [{"call_cnt": 1}] * 5
+        assert len(plugin._background_task_set) == 1
+        # The background task does not use the context of the finished request
+        refresh_context: PluginContext = spy.call_args[0][1]
+        assert refresh_context is not context and refresh_context.app_helper is None
+        assert refresh_context.args == tuple(context.args) and refresh_context.kwargs == context.kwargs
+        await asyncio.gather(*plugin._background_task_set)
+        assert await plugin(context) == {"call_cnt": 2}
+        assert len(call_list) == 2
 
     #
     # def test_not_found_redis(self) -> None:
@@ -259,6 +620,245 @@ class TestCacheResponsePlugin:
     #     assert exec_msg == "Not found redis client"
 
 
+class TestCacheBackend:
+    @pytest.mark.parametrize("decode_responses", [True, False])
+    def test_redis_backend_binary_safe(self, decode_responses: bool) -> None:
+        key = "test_redis_backend_binary_safe"
+        backend = RedisCacheBackend(Redis(decode_responses=decode_responses))
+        value = bytes(range(256))
+        backend.set(key, value, ex=5)
+        assert backend.get(key) == value
+        backend.delete(key)
+        assert backend.get(key) is None
+        assert backend.stats.hits == 1
+        assert backend.stats.misses == 1
+
+    def test_set_redis_and_backend(self) -> None:
+        def demo() -> None:
+            pass
+
+        with pytest.raises(ValueError) as e:
+            CacheResponsePlugin.build(redis=Redis(decode_responses=True), backend=MemoryCacheBackend()).pre_check_hook(
+                PaitCoreModel(demo, BaseAppHelper, ParamHandler, response_model_list=[response.JsonResponseModel]),
+            )
+        assert e.value.args[0] == "Only one of redis and backend can be set"
+
+    def test_memory_backend_lru(self) -> None:
+        backend = MemoryCacheBackend(max_size=2)
+        backend.set("a", "1")
+        backend.set("b", "2")
+        assert backend.get("a") == "1"
+        # b is the least recently used key
+        backend.set("c", "3")
+        assert len(backend) == 2
+        assert backend.get("b") is None
+        assert backend.get("a") == "1"
+        assert backend.get("c") == "3"
+        assert backend.stats.hits == 3
+        assert backend.stats.misses == 1
+        assert backend.stats.hit_rate == 0.75
+
+        backend.delete("a", "c")
+        assert len(backend) == 0
+
+        with pytest.raises(ValueError):
+            MemoryCacheBackend(max_size=0)
+
+    def test_memory_backend_ttl(self, mocker: MockFixture) -> None:
+        monotonic = mocker.patch("pait.plugin.cache_backend.time.monotonic", return_value=100.0)
+        backend = MemoryCacheBackend()
+        backend.set("a", "1", ex=10)
+        backend.set("b", "2")
+        monotonic.return_value = 109.0
+        assert backend.get("a") == "1"
+        monotonic.return_value = 110.0
+        assert backend.get("a") is None
+        assert backend.get("b") == "2"
+        assert len(backend) == 1
+
+    def test_memory_backend_lock(self) -> None:
+        backend = MemoryCacheBackend()
+        event = threading.Event()
+
+        def _hold_lock() -> None:
+            with backend.lock("lock"):
+                event.set()
+                with backend.lock("other_lock", blocking_timeout=0.01):
+                    pass
+                threading.Event().wait(0.2)
+
+        thread = threading.Thread(target=_hold_lock)
+        thread.start()
+        event.wait()
+        with pytest.raises(TimeoutError):
+            with backend.lock("lock", blocking_timeout=0.01):
+                pass
+        thread.join()
+        with backend.lock("lock", blocking_timeout=0.01):
+            pass
+
+    def test_memory_backend_tag(self) -> None:
+        backend = MemoryCacheBackend(max_size=2)
+        backend.set("a", b"1", tags=["tag1", "tag2"])
+        backend.set("b", b"2", tags=["tag1"])
+        backend.invalidate_tag("tag2")
+        assert backend.get("a") is None
+        assert backend.get("b") == b"2"
+
+        # The tag index of the evicted key is removed
+        backend.set("c", b"3", tags=["tag3"])
+        backend.set("d", b"4", tags=["tag3"])
+        assert backend._tag_dict == {"tag3": {"c", "d"}}
+        backend.invalidate_tag("tag3", "tag4")
+        assert len(backend) == 0
+
+    @pytest.mark.parametrize("decode_responses", [True, False])
+    def test_redis_backend_tag(self, decode_responses: bool) -> None:
+        backend = RedisCacheBackend(Redis(decode_responses=decode_responses), tag_prefix="test_redis_backend_tag:")
+        backend.set("test_redis_backend_tag_a", b"1", ex=5, tags=["tag1", "tag2"])
+        backend.set("test_redis_backend_tag_b", b"2", ex=5, tags=["tag1"])
+        backend.invalidate_tag("tag2")
+        assert backend.get("test_redis_backend_tag_a") is None
+        assert backend.get("test_redis_backend_tag_b") == b"2"
+        backend.invalidate_tag("tag1")
+        assert backend.get("test_redis_backend_tag_b") is None
+        assert not backend.redis.exists("test_redis_backend_tag:tag1")
+
+        # The expiry of the tag set is only extended
+        tag_key = "test_redis_backend_tag:tag3"
+        backend.set("test_redis_backend_tag_c", b"3", ex=60, tags=["tag3"])
+        backend.set("test_redis_backend_tag_d", b"4", ex=5, tags=["tag3"])
+        assert 5 < backend.redis.ttl(tag_key) <= 60
+        backend.set("test_redis_backend_tag_e", b"5", ex=120, tags=["tag3"])
+        assert 60 < backend.redis.ttl(tag_key) <= 120
+        # The key never expires, so the tag set never expires too
+        backend.set("test_redis_backend_tag_f", b"6", tags=["tag3"])
+        assert backend.redis.ttl(tag_key) == -1
+        backend.set("test_redis_backend_tag_g", b"7", ex=5, tags=["tag3"])
+        assert backend.redis.ttl(tag_key) == -1
+        backend.invalidate_tag("tag3")
+        for key in "cdefg":
+            assert backend.get(f"test_redis_backend_tag_{key}") is None
+        assert not backend.redis.exists(tag_key)
+
+    @pytest.mark.asyncio
+    async def test_async_redis_backend_tag(self) -> None:
+        backend = RedisCacheBackend(AsyncioRedis(), tag_prefix="test_async_redis_backend_tag:")
+        await backend.async_set("test_async_redis_backend_tag_a", bytes(range(256)), ex=5, tags=["tag1"])
+        assert await backend.async_get("test_async_redis_backend_tag_a") == bytes(range(256))
+        await backend.async_set("test_async_redis_backend_tag_b", b"1", ex=60, tags=["tag1"])
+        await backend.async_set("test_async_redis_backend_tag_c", b"1", ex=5, tags=["tag1"])
+        assert 5 < await backend.redis.ttl("test_async_redis_backend_tag:tag1") <= 60
+        await backend.async_invalidate_tag("tag1")
+        assert await backend.async_get("test_async_redis_backend_tag_a") is None
+        assert await backend.async_get("test_async_redis_backend_tag_b") is None
+        await backend.redis.close()
+
+    @pytest.mark.asyncio
+    async def test_memory_backend_async_lock(self) -> None:
+        backend = MemoryCacheBackend()
+
+        async with backend.async_lock("lock"):
+            with pytest.raises(TimeoutError):
+                async with backend.async_lock("lock", blocking_timeout=0.01):
+                    pass
+        async with backend.async_lock("lock", blocking_timeout=0.01):
+            await backend.async_set("a", "1")
+        assert await backend.async_get("a") == "1"
+        await backend.async_delete("a")
+        assert await backend.async_get("a") is None
+
+    def test_two_tier_backend(self) -> None:
+        l2 = MemoryCacheBackend()
+        backend = TwoTierCacheBackend(l2, l1_cache_time=5)
+        backend.set("a", b"1", ex=60)
+        assert backend.get("a") == b"1"
+        assert l2.stats.hits == 0
+
+        # Other process set the value to l2
+        TwoTierCacheBackend(l2).set("b", b"2")
+        assert backend.get("b") == b"2"
+        assert backend.get("b") == b"2"
+        assert l2.stats.hits == 1
+        assert backend.stats.hits == 3
+
+        backend.delete("a", "b")
+        assert backend.get("a") is None
+        assert l2.get("b") is None
+        assert backend.l1._data == {}  # type: ignore[attr-defined]
+
+    def test_two_tier_backend_fill_l1(self, mocker: MockFixture) -> None:
+        l2 = MemoryCacheBackend()
+        backend = TwoTierCacheBackend(l2, l1_cache_time=5)
+        other_backend = TwoTierCacheBackend(l2, l1_cache_time=5)
+        other_backend.set("a", b"1", ex=60, tags=["user:1"])
+        other_backend.set("b", b"2", ex=2, tags=["user:1"])
+
+        # The value filled from l2 keeps the tags and does not outlive the value of l2
+        assert backend.get("a") == b"1" and backend.get("b") == b"2"
+        l1: MemoryCacheBackend = backend.l1  # type: ignore[assignment]
+        assert l1._tag_dict == {"user:1": {"a", "b"}}
+        now = time.monotonic()
+        assert now + 4 < l1._data["a"][0] <= now + 5  # type: ignore[operator]
+        assert now < l1._data["b"][0] <= now + 2  # type: ignore[operator]
+
+        backend.invalidate_tag("user:1")
+        assert backend.get("a") is None and backend.get("b") is None
+
+        # The value that is about to expire does not fill l1
+        other_backend.set("c", b"3", ex=60)
+        mocker.patch("pait.plugin.cache_backend.time.time", return_value=time.time() + 59.5)
+        assert backend.get("c") == b"3"
+        assert "c" not in l1._data
+
+    @pytest.mark.asyncio
+    async def test_two_tier_backend_async(self) -> None:
+        l2 = MemoryCacheBackend()
+        backend = TwoTierCacheBackend(l2)
+
+        await TwoTierCacheBackend(l2).async_set("a", b"1", tags=["demo"])
+        assert await backend.async_get("a") == b"1"
+        assert await backend.async_get("a") == b"1"
+        assert l2.stats.hits == 1
+        assert backend.l1._tag_dict == {"demo": {"a"}}  # type: ignore[attr-defined]
+        await backend.async_set("b", b"2")
+        async with backend.async_lock("b_lock"):
+            assert await backend.async_get("b") == b"2"
+        await backend.async_delete("a", "b")
+        assert await backend.async_get("a") is None
+
+
+class TestCacheCodec:
+    def test_json(self) -> None:
+        codec = CacheCodec()
+        value = {"code": 0, "data": [{"uid": 1, "name": "中文"}]}
+        data = codec.dumps(value)
+        assert data[:1] == b"j"
+        assert codec.loads(data) == value
+
+        # The value can not be restored by json
+        for value in ({1: "a"}, {"a": (1, 2)}, {"a": datetime.date(2022, 1, 1)}, [float("inf")], {"a": [{"b": {1}}]}):
+            data = codec.dumps(value)
+            assert data[:1] == b"p"
+            assert codec.loads(data) == value
+
+    def test_response(self) -> None:
+        codec = CacheCodec()
+        cached_response = CachedResponse(201, [("Content-Type", "application/octet-stream")], bytes(range(256)))
+        data = codec.dumps(cached_response)
+        assert data[:1] == b"r"
+        assert codec.loads(data) == cached_response
+
+    def test_pickle(self) -> None:
+        for codec in (CacheCodec(), PickleCacheCodec()):
+            result = codec.loads(codec.dumps(RuntimeError("demo")))
+            assert isinstance(result, RuntimeError)
+            assert result.args == ("demo",)
+
+        with pytest.raises(ValueError):
+            CacheCodec().loads(b"xdemo")
+
+
 class TestCheckJsonPlugin:
     def test_pre_check_hook(self) -> None:
         def demo() -> None:
@@ -294,6 +894,87 @@ class TestCheckJsonPlugin:
         assert "pait_response_model must " in exec_msg
 
 
+class TestCompressResponsePlugin:
+    def test_negotiate_encoding(self) -> None:
+        encoding_tuple = ("gzip", "deflate")
+        assert negotiate_encoding("gzip, deflate, br", encoding_tuple) == "gzip"
+        assert negotiate_encoding("deflate, gzip", encoding_tuple) == "gzip"
+        assert negotiate_encoding("gzip;q=0.5, deflate", encoding_tuple) == "deflate"
+        assert negotiate_encoding("GZIP;q=0.8, deflate;q=0.1", encoding_tuple) == "gzip"
+        assert negotiate_encoding("*", encoding_tuple) == "gzip"
+        assert negotiate_encoding("gzip;q=0, *", encoding_tuple) == "deflate"
+        assert negotiate_encoding("gzip;q=0, deflate;q=0", encoding_tuple) is None
+        assert negotiate_encoding("gzip;q=abc, identity", encoding_tuple) is None
+        assert negotiate_encoding("br, deflate", ("deflate", "gzip")) == "deflate"
+
+    def test_pre_check_hook(self) -> None:
+        def demo() -> None:
+            pass
+
+        with pytest.raises(ValueError) as e:
+            CompressResponsePlugin.pre_check_hook(
+                PaitCoreModel(
+                    func=demo,
+                    app_helper_class=BaseAppHelper,
+                    param_handler_plugin=ParamHandler,
+                    response_model_list=[response.JsonResponseModel],
+                ),
+                kwargs={"encoding_tuple": ("gzip", "br")},
+            )
+        assert e.value.args[0] == "Not support encoding:br, only support ['gzip', 'deflate']"
+
+
+class TestConditionalGetPlugin:
+    def test_cache_control(self) -> None:
+        assert CacheControl().to_header() == ""
+        assert CacheControl(max_age=60, private=True, must_revalidate=True).to_header() == (
+            "private, must-revalidate, max-age=60"
+        )
+        assert CacheControl(public=True, s_maxage=10, stale_while_revalidate=5, immutable=True).to_header() == (
+            "public, immutable, s-maxage=10, stale-while-revalidate=5"
+        )
+        with pytest.raises(ValueError):
+            CacheControl(public=True, private=True)
+
+    def test_etag(self) -> None:
+        etag = gen_etag(b"demo")
+        assert etag == gen_etag(b"demo") != gen_etag(b"demo1")
+        assert gen_etag(b"demo", weak=True) == "W/" + etag
+
+        assert match_etag("*", etag)
+        assert match_etag(etag, etag)
+        assert match_etag(f'"a", W/{etag}', etag)
+        assert match_etag(etag, "W/" + etag)
+        assert not match_etag('"a", "b"', etag)
+
+    def test_pre_load_hook(self) -> None:
+        class DemoResponseModel(response.JsonResponseModel):
+            cache_control = CacheControl(no_cache=True)
+
+        def demo() -> None:
+            pass
+
+        def _get_kwargs(response_model: Any, **kwargs: Any) -> dict:
+            return ConditionalGetPlugin.pre_load_hook(
+                PaitCoreModel(
+                    func=demo,
+                    app_helper_class=BaseAppHelper,
+                    param_handler_plugin=ParamHandler,
+                    response_model_list=[response_model],
+                ),
+                kwargs={"get_pait_response_model": get_pait_response_model, **kwargs},
+            )
+
+        # The policy of the response model takes precedence over the policy of the plugin
+        kwargs = _get_kwargs(DemoResponseModel, cache_control=CacheControl(max_age=10))
+        assert kwargs["cache_control_header"] == "no-cache"
+        kwargs = _get_kwargs(response.JsonResponseModel, cache_control=CacheControl(max_age=10))
+        assert kwargs["cache_control_header"] == "max-age=10"
+        assert "cache_control_header" not in _get_kwargs(response.JsonResponseModel)
+        with pytest.raises(TypeError):
+            _get_kwargs(response.JsonResponseModel, cache_control="max-age=10")
+
+
 class TestMockPlugin:
     def test_not_found_response_model(self) -> None:
         def demo() -> None:
@@ -329,16 +1010,59 @@ class TestMockPlugin:
         def demo() -> None:
             pass
 
+        from example.common.response_model import UserSuccessRespModel2
+
         kwargs: dict = MockPluginProtocol.pre_load_hook(
             PaitCoreModel(
                 demo,
                 BaseAppHelper,
                 ParamHandler,
-                response_model_list=[response.JsonResponseModel, response.TextResponseModel],
+                response_model_list=[UserSuccessRespModel2, response.TextResponseModel],
             ),
             {"get_pait_response_model": get_pait_response_model},
         )
-        assert kwargs["pait_response_model"] == response.JsonResponseModel
+        assert kwargs["pait_response_model"] == UserSuccessRespModel2
+        # The example body is generated when the plugin is loaded
+        assert [(json.loads(body), header) for body, header in kwargs["payload_list"]] == [
+            (UserSuccessRespModel2.get_example_value(), {})
+        ]
+
+    def test_gen_payload(self) -> None:
+        class DemoHeader(BaseModel):
+            x_token: str = Field(alias="X-Token", example="abc")
+
+        class DemoTextResponseModel(response.TextResponseModel):
+            header = DemoHeader
+
+        assert MockPluginProtocol.gen_payload(DemoTextResponseModel) == (b"example data", {"X-Token": "abc"})
+        assert MockPluginProtocol.gen_payload(response.FileResponseModel) == (b" example bytes", {})
+        with pytest.raises(NotImplementedError):
+            MockPluginProtocol.gen_payload(object)  # type: ignore
+
+    def test_rotate(self) -> None:
+        def demo() -> None:
+            pass
+
+        with pytest.raises(ValueError) as e:
+            MockPluginProtocol.pre_check_hook(
+                PaitCoreModel(demo, BaseAppHelper, ParamHandler, response_model_list=[response.TextResponseModel]),
+                {"rotate_count": 0},
+            )
+        assert "rotate_count must be greater than 0" in e.value.args[0]
+
+        class FakePluginCoreModel:
+            func: Callable = lambda: None
+
+        class DemoMockPlugin(MockPluginProtocol[bytes]):
+            def get_payload_response(self, body: bytes, header_dict: Dict[str, Any], context: Any) -> bytes:
+                return body
+
+        plugin = DemoMockPlugin(
+            lambda *args, **kwargs: None,
+            FakePluginCoreModel(),  # type: ignore
+            payload_list=[(b"a", {}), (b"b", {})],
+        )
+        assert [plugin(None) for _ in range(3)] == [b"a", b"b", b"a"]  # type: ignore
 
 
 class TestRequiredPlugin:
@@ -1,3 +1,4 @@
+import asyncio
 import datetime
 import enum
 import inspect
@@ -12,7 +13,7 @@ from pytest_mock import MockFixture
 
 from pait import _pydanitc_adapter, field, util
 from pait.exceptions import ParseTypeError, TipException
-from pait.util.encoder import CustomJSONEncoder
+from pait.util.encoder import CustomJSONEncoder, get_json_default_func, get_json_dumps_func, json_default
 
 pytestmark = pytest.mark.asyncio
 
@@ -198,6 +199,78 @@ class TestLazyProperty:
                     pass
 
 
+class TestMemoMethod:
+    async def test_memo_method(self) -> None:
+        call_list: list = []
+
+        class Demo(object):
+            __slots__ = ("value", "_memo_cache")
+
+            def __init__(self, value: int) -> None:
+                self.value = value
+
+            @util.MemoMethod
+            def demo_func(self) -> int:
+                call_list.append("sync")
+                return self.value
+
+            @util.MemoMethod
+            async def async_demo_func(self) -> int:
+                call_list.append("async")
+                await asyncio.sleep(0.01)
+                return self.value + 1
+
+        demo: Demo = Demo(1)
+        demo1: Demo = Demo(2)
+        assert demo.demo_func() == demo.demo_func() == 1
+        assert demo1.demo_func() == 2
+        # The concurrent calls wait for the result of the first call
+        assert await asyncio.gather(demo.async_demo_func(), demo.async_demo_func()) == [2, 2]
+        assert await demo.async_demo_func() == 2
+        assert await demo1.async_demo_func() == 3
+        assert call_list == ["sync", "sync", "async", "async"]
+        assert isinstance(Demo.demo_func, util.MemoMethod)
+
+    async def test_memo_method_not_cache_exception(self) -> None:
+        call_list: list = []
+
+        class Demo(object):
+            @util.MemoMethod
+            async def demo_func(self) -> int:
+                call_list.append(1)
+                await asyncio.sleep(0.01)
+                if len(call_list) == 1:
+                    raise RuntimeError("demo error")
+                return len(call_list)
+
+        demo: Demo = Demo()
+        result_list = await asyncio.gather(demo.demo_func(), demo.demo_func(), return_exceptions=True)
+        assert all(isinstance(i, RuntimeError) for i in result_list)
+        assert await demo.demo_func() == 2
+        assert await demo.demo_func() == 2
+
+    async def test_memo_method_not_awaited(self) -> None:
+        call_list: list = []
+
+        class Demo(object):
+            @util.MemoMethod
+            async def demo_func(self) -> int:
+                call_list.append(1)
+                await asyncio.sleep(0.01)
+                return len(call_list)
+
+        demo: Demo = Demo()
+        # The coroutine is dropped before it starts
+        demo.demo_func().close()
+        # The coroutine is closed before it is done
+        coro = demo.demo_func()
+        coro.send(None)
+        coro.close()
+        assert await asyncio.wait_for(demo.demo_func(), 1) == 2
+        assert await demo.demo_func() == 2
+        assert call_list == [1, 1]
+
+
 class TestTypes:
     def test_parse_typing(self) -> None:
         assert [dict] == util.parse_typing(dict)
@@ -508,6 +581,52 @@ class TestEncoder:
             ' "template_var_2": null, "link": null}'
         )
 
+    def test_json_default(self) -> None:
+        from datetime import date, datetime
+
+        class DemoModel(BaseModel):
+            uid: int = Field(alias="user_id")
+
+        class DemoDatetime(datetime):
+            pass
+
+        # The subclass uses the func of the nearest type in its MRO
+        assert get_json_default_func(DemoDatetime) is get_json_default_func(datetime)
+        assert get_json_default_func(date) is not get_json_default_func(datetime)
+        assert get_json_default_func(object) is None
+        assert json_default(DemoModel(user_id=1)) == {"user_id": 1}
+        with pytest.raises(TypeError) as e:
+            json_default(object())
+        assert "Object of type object is not JSON serializable" in str(e.value)
+
+    def test_json_dumps_func(self) -> None:
+        from datetime import datetime
+
+        class DemoModel(BaseModel):
+            uid: int = Field(alias="user_id")
+            create_time: datetime
+
+        class DemoJSONEncoder(json.JSONEncoder):
+            pass
+
+        json_dumps = get_json_dumps_func()
+        assert json_dumps is get_json_dumps_func(CustomJSONEncoder)
+        value = {
+            "model": DemoModel(user_id=1, create_time=datetime.fromtimestamp(1600000000)),
+            "name": "中文",
+            1: 2**70,
+        }
+        assert json.loads(json_dumps(value)) == {
+            "model": {"user_id": 1, "create_time": 1600000000},
+            "name": "中文",
+            "1": 2**70,
+        }
+        assert json_dumps({"a": 1}) == b'{"a":1}'
+        # The custom json encoder is also supported
+        assert get_json_dumps_func(DemoJSONEncoder)({"uid": 2**70}) == ('{"uid":%d}' % 2**70).encode()
+        with pytest.raises(TypeError):
+            get_json_dumps_func(DemoJSONEncoder)({"create_time": datetime.now()})
+
 
 class TestImmutableDict(object):
     def test(self) -> None: